@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - AppCDS
+Sürüm + Java başına dinamik AppCDS arşivi: ilk açılışta JVM yüklediği
+sınıfları çıkışta arşive yazar, sonraki açılışlar sınıfları arşivden eşler
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from launch_fingerprint import classpath_fingerprint
+
+MODE_OFF = "off"
+MODE_RECORD = "record"
+MODE_USE = "use"
+
+# -XX:ArchiveClassesAtExit (dinamik arşiv) Java 13'te geldi;
+# -XX:+AutoCreateSharedArchive Java 19'da geçersiz arşivi kendisi yeniler
+MIN_JAVA_DYNAMIC = 13
+MIN_JAVA_AUTO_CREATE = 19
+
+# Dinamik arşiv başlığı (CDS_DYNAMIC_ARCHIVE_MAGIC, little-endian)
+_DYNAMIC_MAGIC = (0xf00baba8).to_bytes(4, "little")
+# JVM çıkışta yazarken yarım kalmış dosyaları ayırt etmek için alt sınır
+_MIN_ARCHIVE_BYTES = 64 * 1024
+
+# Hızlı açılışta AlwaysPreTouch bu boyuta kadar korunur
+FAST_START_PRETOUCH_MAX_HEAP_MB = 1024
+
+ARCHIVE_SUFFIX = ".jsa"
+INFO_FILE = "archive.json"
+
+
+class CdsPlan:
+    """Bu başlatma için CDS kararı"""
+
+    def __init__(self, mode: str = MODE_OFF, args: List[str] = None, archive: Path = None, reason: str = ""):
+        self.mode = mode
+        self.args = args or []
+        self.archive = archive
+        self.reason = reason
+
+    def summary(self) -> str:
+        if self.mode == MODE_USE:
+            size_mb = self.archive.stat().st_size / (1024 * 1024) if self.archive and self.archive.exists() else 0
+            return f"arşivden ({size_mb:.0f} MB)"
+        if self.mode == MODE_RECORD:
+            return "ilk açılış: sınıflar çıkışta arşivlenecek"
+        return f"kapalı ({self.reason})" if self.reason else "kapalı"
+
+
+def base_archive_available(java_path: str) -> bool:
+    """Dinamik arşivin üstüne kurulduğu JDK temel arşivi (lib/server/classes.jsa) var mı"""
+    java_home = Path(os.path.realpath(java_path)).parent.parent
+    server = java_home / "lib" / "server"
+    return (server / "classes.jsa").exists() or (server / "classes_nocoops.jsa").exists()
+
+
+def archive_valid(archive: Path) -> bool:
+    """Arşiv tamamlanmış bir dinamik CDS arşivi mi"""
+    try:
+        if archive.stat().st_size < _MIN_ARCHIVE_BYTES:
+            return False
+        with open(archive, 'rb') as f:
+            return f.read(4) == _DYNAMIC_MAGIC
+    except OSError:
+        return False
+
+
+class CdsStore:
+    """
+    cache/cds/<sürüm>/<anahtar>.jsa
+
+    Anahtar classpath JAR'larının ve Java ikilisinin parmak izidir; biri
+    değişince yeni anahtar oluşur ve sürümün eski arşivleri silinir.
+    """
+
+    def __init__(self, cds_dir: Path):
+        self.cds_dir = Path(cds_dir)
+
+    def _version_dir(self, version_id: str) -> Path:
+        return self.cds_dir / version_id
+
+    def plan(self, version_id: str, java_path: str, java_major: int, classpath: List[str], gc: str = "") -> CdsPlan:
+        """
+        Arşivi kullan ya da bu açılışta kaydet
+
+        Sürümün dizinini oluşturur ve eşleşmeyen (eski) arşivleri siler.
+
+        Args:
+            java_major: Java ana sürümü
+            classpath: Classpath JAR'ları
+            gc: Seçilen GC (arşiv anahtarına girer)
+        """
+        if java_major < MIN_JAVA_DYNAMIC:
+            return CdsPlan(reason=f"Java {java_major} dinamik arşivi desteklemiyor (13+)")
+        if not base_archive_available(java_path):
+            return CdsPlan(reason="JDK temel CDS arşivi yok (java -Xshare:dump)")
+
+        key = classpath_fingerprint(classpath, java_path, {"gc": gc})[:16]
+        version_dir = self._version_dir(version_id)
+        archive = version_dir / f"{key}{ARCHIVE_SUFFIX}"
+        try:
+            version_dir.mkdir(parents=True, exist_ok=True)
+            for stale in version_dir.glob(f"*{ARCHIVE_SUFFIX}"):
+                if stale != archive:
+                    stale.unlink()
+        except OSError as e:
+            return CdsPlan(reason=f"önbellek dizini yazılamıyor: {e}")
+
+        ready = archive_valid(archive)
+        if not ready and archive.exists():
+            # Yarım yazılmış arşiv
+            try:
+                archive.unlink()
+            except OSError:
+                pass
+
+        if java_major >= MIN_JAVA_AUTO_CREATE:
+            args = ["-XX:+AutoCreateSharedArchive", f"-XX:SharedArchiveFile={archive}"]
+        elif ready:
+            args = [f"-XX:SharedArchiveFile={archive}"]
+        else:
+            args = [f"-XX:ArchiveClassesAtExit={archive}"]
+        # Arşiv eşlenemezse JVM uyarı verip normal açılır
+        args.append("-Xshare:auto")
+
+        if not ready:
+            self._write_info(version_dir, {"key": key, "java": os.path.realpath(java_path), "gc": gc,
+                                           "jars": len(classpath), "planned_at": time.time()})
+        return CdsPlan(MODE_USE if ready else MODE_RECORD, args, archive)
+
+    @staticmethod
+    def _write_info(version_dir: Path, info: Dict):
+        try:
+            with open(version_dir / INFO_FILE, 'w') as f:
+                json.dump(info, f, indent=2)
+        except OSError:
+            pass
+
+    def invalidate(self, version_id: str):
+        """Sürümün arşivlerini sil (arşivle açılış başarısız olduğunda)"""
+        version_dir = self._version_dir(version_id)
+        for archive in version_dir.glob(f"*{ARCHIVE_SUFFIX}"):
+            try:
+                archive.unlink()
+            except OSError:
+                pass
+
+    def archives(self) -> List[Dict]:
+        """Tüm arşivler: sürüm, boyut (MB), geçerli mi"""
+        result = []
+        if not self.cds_dir.exists():
+            return result
+        for version_dir in sorted(self.cds_dir.iterdir()):
+            for archive in version_dir.glob(f"*{ARCHIVE_SUFFIX}"):
+                try:
+                    size_mb = archive.stat().st_size / (1024 * 1024)
+                except OSError:
+                    continue
+                result.append({"version": version_dir.name, "path": str(archive), "size_mb": size_mb,
+                               "valid": archive_valid(archive)})
+        return result
+
+    def clear(self) -> int:
+        """Tüm arşivleri sil; silinen arşiv sayısı"""
+        removed = 0
+        for entry in self.archives():
+            try:
+                os.unlink(entry["path"])
+                removed += 1
+            except OSError:
+                pass
+        return removed
+
+
+def drop_pretouch(args: List[str], heap_mb: int) -> List[str]:
+    """Hızlı açılışta 1 GB üstü heap'i önceden dokunmayı kaldır (büyük heap'te saniyeler sürer)"""
+    if heap_mb <= FAST_START_PRETOUCH_MAX_HEAP_MB:
+        return list(args)
+    return [arg for arg in args if arg != "-XX:+AlwaysPreTouch"]
+
+
+__all__ = [
+    'MODE_OFF', 'MODE_RECORD', 'MODE_USE', 'MIN_JAVA_DYNAMIC', 'MIN_JAVA_AUTO_CREATE', 'FAST_START_PRETOUCH_MAX_HEAP_MB',
+    'CdsPlan', 'CdsStore', 'base_archive_available', 'archive_valid', 'drop_pretouch'
+]
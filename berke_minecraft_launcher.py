@@ -19,6 +19,7 @@ import tty
 import termios
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
 from rich.console import Console
@@ -51,6 +52,47 @@ except ImportError:
     def i18n_t(key, **kwargs):
         return key
 
+from java_registry import JavaRegistry
+from java_runtimes import RuntimeStore, RuntimeChoice, runtime_requirement, select_runtime, RUNTIME_AUTO, RUNTIME_SYSTEM
+from classpath_builder import merge_version_chain
+from launch_fingerprint import GenerationCounter, FingerprintStore
+from page_cache import PageCachePrewarmer, resident_ratio, classify_ratio
+from jvm_flags import JvmFlagProbe
+from launch_builder import (
+    LauncherPaths, load_config, save_config, find_java, launch_environment, load_chain,
+    resolve_classpath, plan_version_heap, compile_jvm_args, fingerprint_version, build_launch_command
+)
+from cgroup_governor import (CgroupGovernor, limits_for, read_cgroup_stats, governed_cgroup, cgroup_v2_available,
+                             METHOD_OFF, METHOD_AUTO, METHOD_SYSTEMD, METHOD_DELEGATED)
+from launch_wrappers import (WRAPPER_AUTO, KNOWN_WRAPPERS, AUTO_WRAPPERS, WrapperProbe, detect_wrappers, parse_wrapper,
+                             validate_wrapper, wrapper_specs, resolve_chain)
+from gpu_profile import (PROFILE_AUTO, PROFILE_NATIVE, PROFILE_NVIDIA, PROFILE_HYBRID, PROFILE_ZINK, PROFILES,
+                         detect_gpu, select_profile, profile_for_config)
+from appcds import CdsStore, MODE_OFF as CDS_OFF, MODE_RECORD as CDS_RECORD, MODE_USE as CDS_USE
+from launch_script import export_launch_script, default_export_paths
+from metrics_sampler import MetricsSampler, WINDOWS, sparkline, DEFAULT_INTERVAL as METRICS_INTERVAL
+from gc_log import (GcLogParser, prepare_gc_log, save_summary as save_gc_summary, load_summary as load_gc_summary,
+                    histogram_labels, HISTOGRAM_BOUNDS_MS as GC_HISTOGRAM_BOUNDS_MS)
+from log_classifier import LogClassifier, load_rules, rule_files, read_tail
+from log_index import (LogIndex, LogIndexer, INDEX_FILE as LOG_INDEX_FILE, KIND_LOG, KIND_CRASH, fts_available,
+                       version_resolver, log_sources, parse_time)
+from session_history import (SessionStore, SessionRecorder, SESSIONS_FILE, OUTCOME_CLEAN, OUTCOME_CRASH, OUTCOME_KILLED,
+                             OUTCOME_FAILED, OUTCOME_HUNG, REGRESSION_RATIO, outcome_for, settings_snapshot)
+from parallel_download import STATS as DOWNLOAD_STATS, LATENCY_BOUNDS_S
+from metrics_exporter import (MetricsExporter, LaunchHistoryCollector, process_families, gc_families, download_families,
+                              render as render_metrics, DEFAULT_HOST as METRICS_HOST, DEFAULT_PORT as METRICS_PORT)
+from jfr_profiler import (PROFILES_DIR, TEMPLATES as JFR_TEMPLATES, DEFAULT_TEMPLATE as JFR_DEFAULT_TEMPLATE,
+                          DEFAULT_DURATION as JFR_DEFAULT_DURATION, ModMap, find_jdk_tool, jvm_pid, recording_path,
+                          start_recording, stop_recording, summarize as summarize_jfr, short_frame, save_meta as save_jfr_meta,
+                          load_meta as load_jfr_meta, list_recordings as list_jfr_recordings)
+from jvm_introspect import (JvmIntrospector, HEAP_DUMPS_DIR, HEAP_DUMP_CAP_MB, POLL_INTERVAL as JVM_POLL_INTERVAL,
+                            LEAK_MIN_HISTOGRAMS, prepare_heap_dumps, prune_heap_dumps, list_heap_dumps, new_heap_dump)
+from hang_watchdog import (HangWatchdog, HANGS_DIR, STALL_SECONDS as HANG_STALL_SECONDS, GRACEFUL_TIMEOUT, REASON_MANUAL,
+                           hang_dir, capture_thread_dumps, analyze_dumps, save_analysis, graceful_kill)
+from instance_manager import InstanceManager, ProcessRegistry, DEFAULT_INSTANCE, process_stats
+from launch_profiler import LaunchTimeline, MilestoneTracker, LaunchHistory, PHASE_ORDER, MILESTONE_ORDER, time_to_play_ms
+from log_follower import LogFollower, LaunchStateWatcher, STATE_READY, STATE_FAILED, STATE_EXITED, STATE_TIMEOUT
+
 # Colorama'yı başlat
 colorama.init(autoreset=True)
 
@@ -146,7 +188,19 @@ class MinecraftLauncher:
         self.skins_dir = self.launcher_dir / "skins"
         self.cache_dir = self.launcher_dir / "cache"
         self.config_file = self.launcher_dir / "config.json"
+        self.paths = LauncherPaths(self.home_dir)
         self.java_executable = self._find_java()
+        # Yönetilen runtime kullanılamadığında dönülecek sistem Java'sı
+        self.system_java = self.java_executable
+        
+        # Java sürüm bilgisi önbelleği (her menü çiziminde JVM başlatmamak için)
+        self.java_registry = JavaRegistry(self.cache_dir / "java_registry.json", extra_roots=[str(self.paths.runtimes_dir)])
+        self.runtime_store = RuntimeStore(self.paths.runtimes_dir, cache_dir=self.cache_dir)
+        self.jvm_flag_probe = JvmFlagProbe(self.cache_dir / "jvm_flags.json")
+        self.wrapper_probe = WrapperProbe(self.cache_dir / "wrapper_probe.json")
+        self.cds_store = CdsStore(self.cache_dir / "cds")
+        # Log sınıflandırma kuralları (paketteki + ~/.berke_minecraft_launcher/error_rules.json)
+        self.log_rules = load_rules(rule_files(self.launcher_dir))
         
         # Dizinleri oluştur
         self.minecraft_dir.mkdir(exist_ok=True)
@@ -171,204 +225,132 @@ class MinecraftLauncher:
         # Keyboard navigator
         self.navigator = KeyboardNavigator(self.console)
         
+        # Son oluşturulan classpath raporu (atılan tekrar kütüphaneler)
+        self.last_classpath_report = None
+        self.last_jvm_flag_plan = None
+        self.last_heap_plan = None
+        self.last_launch_spec = None
+        self.prewarmer = None
+        self.generations = GenerationCounter(self.launcher_dir / "generations.json")
+        self.launch_fingerprints = FingerprintStore(self.launcher_dir / "launch_fingerprints.json")
+        
+        # Instance'lar (ayrı oyun dizinleri) ve çalışan oyun süreçleri
+        self.instances = InstanceManager(self.launcher_dir / "instances")
+        self.running_games = ProcessRegistry(self.launcher_dir / "running.json")
+        
+        # Başlatma zaman çizelgesi geçmişi
+        self.launch_history = LaunchHistory(self.launcher_dir / "launch_history.jsonl")
+        self.last_launch_timeline = None
+        self.game_log_follower = None
+        # Son başlatılan oyunun GC logu ayrıştırıcısı (gc_logging açıksa)
+        self.game_gc_parser = None
+        # Son başlatılan oyunun log sınıflandırıcısı ve henüz gösterilmemiş olayları
+        self.game_log_classifier = None
+        self.game_log_events = deque(maxlen=50)
+        
+        # Loglar ve çökme raporları için tam metin dizini (arka planda güncellenir)
+        self.log_index = LogIndex(self.cache_dir / LOG_INDEX_FILE, self.launch_history,
+                                  version_resolver(self.paths.version_search_dirs()))
+        self.log_indexer = None
+        
+        # Başlatma başına oturum kaydı (açılış süresi, tepe RAM, sonuç, ayarlar) ve son oyunun örnekleyicisi
+        self.sessions = SessionStore(self.launcher_dir / SESSIONS_FILE)
+        self.game_sampler = None
+        
+        # İsteğe bağlı OpenMetrics uç noktası (config "metrics_exporter")
+        self.metrics_exporter = None
+        self.launch_metrics = LaunchHistoryCollector(self.launch_history, time_to_play_ms)
+        
+        # Flight Recorder: bir sonraki başlatmada kullanılacak şablon ve çalışan oyuna bağlanan son kayıt
+        self.profiles_dir = self.launcher_dir / PROFILES_DIR
+        self.pending_jfr_template = None
+        self.active_jfr = None
+        
+        # Son oyunun jcmd yoklayıcısı (heap/metaspace/code cache, sınıf histogramları) ve OOM dökümleri
+        self.game_jvm = None
+        self.heap_dumps_dir = self.launcher_dir / HEAP_DUMPS_DIR
+        
+        # Donma bekçisi ve son donmanın iş parçacığı dökümleri
+        self.game_watchdog = None
+        self.game_hang = None
+        self.hangs_dir = self.launcher_dir / HANGS_DIR
+    
     def _find_java(self) -> Optional[str]:
         """Sistemde Java'yı bul - Minecraft uyumlu sürümler öncelikli (17-21)"""
-        # Önce JAVA_HOME kontrol et
-        if os.environ.get('JAVA_HOME'):
-            java_home_bin = os.path.join(os.environ['JAVA_HOME'], 'bin', 'java')
-            if os.path.exists(java_home_bin):
-                print(f"🔍 JAVA_HOME'dan Java bulundu: {java_home_bin}")
-                return java_home_bin
-        
-        # Java yollarını dene (Minecraft uyumlu sürümler önce)
-        java_paths = [
-            "/usr/lib/jvm/java-21-openjdk/bin/java",
-            "/usr/lib/jvm/java-17-openjdk/bin/java",
-            "/usr/lib/jvm/java-25-openjdk/bin/java",
-            "/usr/lib/jvm/java-22-openjdk/bin/java",
-            "/usr/lib/jvm/java-23-openjdk/bin/java",
-            "/usr/lib/jvm/java-24-openjdk/bin/java",
-            "/usr/lib/jvm/default/bin/java",
-            "/usr/bin/java",
-            "java"
-        ]
-        
-        for java_path in java_paths:
-            # Tam yol ise dosya var mı kontrol et
-            if java_path.startswith("/"):
-                if os.path.exists(java_path):
-                    print(f"🔍 Java bulundu: {java_path}")
-                    return java_path
-            # Değilse which ile bul
-            elif shutil.which(java_path):
-                found_path = shutil.which(java_path)
-                print(f"🔍 Java bulundu (which): {found_path}")
-                return found_path
-                
-        print("❌ Java bulunamadı!")
-        return None
+        java_path = find_java()
+        if java_path:
+            print(f"🔍 Java bulundu: {java_path}")
+        else:
+            print("❌ Java bulunamadı!")
+        return java_path
     
     def _load_config(self) -> Dict:
         """Config dosyasını yükle"""
-        default_config = {
-            "username": "BerkePlayer",
-            "memory": "auto",
-            "java_args": [],
-            "current_skin": "default",
-            "window_width": 1280,
-            "window_height": 720,
-            "fullscreen": False,
-            "optimize_graphics": True,
-            "enable_mods": False,
-            "mod_loader": "none"
-        }
-        
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                # Eksik anahtarları ekle
-                for key, value in default_config.items():
-                    if key not in config:
-                        config[key] = value
-                return config
-            except json.JSONDecodeError:
-                return default_config
-        else:
-            self._save_config(default_config)
-            return default_config
+        return load_config(self.config_file)
     
     def _save_config(self, config: Dict = None):
         """Config dosyasını kaydet"""
-        if config is None:
-            config = self.config
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        save_config(self.config_file, self.config if config is None else config)
     
     def _check_java_version(self):
-        """Java sürümünü kontrol et"""
+        """Java sürümünü kontrol et (önbellekten, JVM başlatmadan)"""
         try:
-            result = subprocess.run([self.java_executable, "-version"], 
-                                  capture_output=True, text=True, timeout=10)
-            version_output = result.stderr  # Java version bilgisi stderr'da
-            
-            # Java sürümünü parse et
-            import re
-            version_match = re.search(r'version "(\d+)\.(\d+)\.(\d+)', version_output)
-            if version_match:
-                major = int(version_match.group(1))
-                minor = int(version_match.group(2))
-                patch = int(version_match.group(3))
-                return f"{major}.{minor}.{patch}"
-            return None
+            return self.java_registry.version(self.java_executable)
         except Exception as e:
             self.console.print(f"[red]Java sürüm kontrolü başarısız: {e}[/red]")
             return None
     
     def _get_available_java_versions(self):
         """Sistemdeki tüm Java sürümlerini bul"""
-        java_versions = []
-        java_dirs = [
-            "/usr/lib/jvm/",
-            "/usr/java/",
-            "/opt/java/"
-        ]
-        
-        # Önce sistemdeki Java sürümlerini bul
-        for java_dir in java_dirs:
-            if os.path.exists(java_dir):
-                try:
-                    for item in os.listdir(java_dir):
-                        java_path = os.path.join(java_dir, item, "bin", "java")
-                        if os.path.exists(java_path):
-                            version = self._check_java_version_at_path(java_path)
-                            if version:
-                                java_versions.append({
-                                    "path": java_path,
-                                    "version": version,
-                                    "name": item,
-                                    "installed": True
-                                })
-                except:
-                    continue
-        
-        return sorted(java_versions, key=lambda x: x["version"], reverse=True)
+        return self.java_registry.discover()
     
     def _get_installed_java_versions(self):
         """Sadece kurulu Java sürümlerini bul"""
-        java_versions = []
-        java_dirs = [
-            "/usr/lib/jvm/",
-            "/usr/java/",
-            "/opt/java/"
-        ]
-        
-        for java_dir in java_dirs:
-            if os.path.exists(java_dir):
-                try:
-                    for item in os.listdir(java_dir):
-                        # Sadece java- ile başlayan dizinleri kontrol et
-                        if item.startswith("java-") and os.path.isdir(os.path.join(java_dir, item)):
-                            java_path = os.path.join(java_dir, item, "bin", "java")
-                            if os.path.exists(java_path):
-                                version = self._check_java_version_at_path(java_path)
-                                if version:
-                                    java_versions.append({
-                                        "path": java_path,
-                                        "version": version,
-                                        "name": item,
-                                        "installed": True
-                                    })
-                except Exception as e:
-                    print(f"Java dizini okuma hatası: {e}")
-                    continue
-        
-        return sorted(java_versions, key=lambda x: x["version"], reverse=True)
+        try:
+            return self.java_registry.discover()
+        except Exception as e:
+            print(f"Java dizini okuma hatası: {e}")
+            return []
     
     def _get_recommended_java_for_version(self, version_id: str):
-        """Minecraft sürümü için önerilen Java'yı bul"""
+        """Minecraft sürümü için önerilen kurulu Java (sürüm JSON'undaki javaVersion'a göre)"""
         try:
-            # Sürüm numarasını parse et
-            if '.' in version_id:
-                parts = version_id.split('.')
-                if len(parts) >= 2:
-                    major = int(parts[0])
-                    minor = int(parts[1])
-                    
-                    # Minecraft sürümüne göre Java önerisi
-                    if major >= 21:
-                        recommended_major = 21
-                    elif major >= 19:
-                        recommended_major = 17
-                    elif major >= 17:
-                        recommended_major = 17
-                    elif major >= 12:
-                        recommended_major = 17
-                    else:
-                        recommended_major = 11
-                    
-                    # Kurulu Java'lardan önerilen sürümü bul
-                    installed_java = self._get_installed_java_versions()
-                    for java in installed_java:
-                        try:
-                            java_major = int(java["version"].split('.')[0])
-                            if java_major == recommended_major:
-                                return java
-                        except:
-                            continue
-                    
-                    # Önerilen sürüm yoksa en yakın uyumlu sürümü bul
-                    for java in installed_java:
-                        try:
-                            java_major = int(java["version"].split('.')[0])
-                            if java_major >= recommended_major:
-                                return java
-                        except:
-                            continue
-        except:
-            pass
+            _, required_major = runtime_requirement(merge_version_chain(load_chain(self.paths, version_id)))
+        except (OSError, ValueError):
+            return None
         
-        return None
+        # Kurulu Java'lar büyükten küçüğe sıralı: önce tam eşleşme, yoksa en yakın yeni sürüm
+        installed_java = self._get_installed_java_versions()
+        for java in installed_java:
+            if java.get("major") == required_major:
+                return java
+        newer = [java for java in installed_java if java.get("major", 0) > required_major]
+        return newer[-1] if newer else None
+    
+    def _select_runtime_for_version(self, version_id: str) -> RuntimeChoice:
+        """Sürümün javaVersion'ına göre Java seç; yönetilen runtime yoksa indir"""
+        fallback = self.config.get("java_path") or self.system_java
+        try:
+            version_data = merge_version_chain(load_chain(self.paths, version_id))
+        except (OSError, ValueError):
+            return RuntimeChoice(fallback, reason="sürüm JSON'u okunamadı")
+        
+        component, _ = runtime_requirement(version_data)
+        if self.config.get("java_runtime", RUNTIME_AUTO) == RUNTIME_SYSTEM or self.runtime_store.java_path(component):
+            choice = select_runtime(self.runtime_store, version_data, self.config, fallback, provision=False)
+        else:
+            with self.console.status(f"[blue]☕ {component} indiriliyor...[/blue]") as status:
+                done = [0]
+                def on_done(task, ok):
+                    done[0] += 1
+                    status.update(f"[blue]☕ {component} indiriliyor... {done[0]} dosya[/blue]")
+                choice = select_runtime(self.runtime_store, version_data, self.config, fallback, on_done=on_done)
+            if choice.managed:
+                self.console.print(f"[green]✅ Java runtime kuruldu: {component}[/green]")
+        
+        if choice.java_path:
+            self.java_executable = choice.java_path
+        return choice
     
     def _get_installable_java_versions(self):
         """Kurulabilir Java sürümlerini listele"""
@@ -408,17 +390,7 @@ class MinecraftLauncher:
     def _check_java_version_at_path(self, java_path):
         """Belirli bir Java yolundaki sürümü kontrol et"""
         try:
-            result = subprocess.run([java_path, "-version"], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                version_output = result.stderr
-                version_match = re.search(r'version "(\d+)\.(\d+)\.(\d+)', version_output)
-                if version_match:
-                    major = int(version_match.group(1))
-                    minor = int(version_match.group(2))
-                    patch = int(version_match.group(3))
-                    return f"{major}.{minor}.{patch}"
-            return None
+            return self.java_registry.version(java_path)
         except Exception as e:
             print(f"Java version check error: {e}")
             return None
@@ -431,9 +403,11 @@ class MinecraftLauncher:
             current_java = self._check_java_version()
             java_versions = self._get_installed_java_versions()
             
+            runtime_mode = self.config.get("java_runtime", RUNTIME_AUTO)
             self.console.print(Panel(
                 f"[bold cyan]☕ JAVA YÖNETİMİ[/bold cyan]\n"
-                f"[dim]Mevcut Java: {current_java or 'Bulunamadı'}[/dim]",
+                f"[dim]Mevcut Java: {current_java or 'Bulunamadı'}[/dim]\n"
+                f"[dim]Seçim: {'sürüme göre yönetilen runtime' if runtime_mode == RUNTIME_AUTO else 'sistem Java (elle)'}[/dim]",
                 border_style="cyan",
                 padding=(1, 2)
             ))
@@ -495,10 +469,11 @@ class MinecraftLauncher:
             self.console.print("  [cyan]4[/cyan]  Java Sürümü Sil")
             self.console.print("  [cyan]5[/cyan]  Java Test Et")
             self.console.print("  [cyan]6[/cyan]  Java Bilgileri")
+            self.console.print(f"  [cyan]7[/cyan]  Otomatik Java {'[green](açık)[/green]' if runtime_mode == RUNTIME_AUTO else '[dim](kapalı)[/dim]'}")
             self.console.print()
             self.console.print("  [dim]0[/dim]  Geri")
             
-            choice = Prompt.ask("\n[cyan]>[/cyan]", choices=["0", "1", "2", "3", "4", "5", "6"])
+            choice = Prompt.ask("\n[cyan]>[/cyan]", choices=["0", "1", "2", "3", "4", "5", "6", "7"])
             
             if choice == "0":
                 break
@@ -514,6 +489,10 @@ class MinecraftLauncher:
                 self._test_java()
             elif choice == "6":
                 self._show_java_info()
+            elif choice == "7":
+                # Otomatik: her sürüm javaVersion'daki Mojang runtime'ıyla açılır
+                self.config["java_runtime"] = RUNTIME_SYSTEM if runtime_mode == RUNTIME_AUTO else RUNTIME_AUTO
+                self._save_config()
     
     def _select_java_version(self, java_versions):
         """Java sürümü seç - sadece kurulu sürümler"""
@@ -534,6 +513,8 @@ class MinecraftLauncher:
                 
                 self.java_executable = selected_java["path"]
                 self.config["java_path"] = selected_java["path"]
+                # Elle seçilen Java yönetilen runtime'ın önüne geçer
+                self.config["java_runtime"] = RUNTIME_SYSTEM
                 self._save_config()
                 self.console.print(f"[green]✅ Java sürümü değiştirildi: {selected_java['name']}[/green]")
                 input("[dim]Enter...[/dim]")
@@ -554,41 +535,57 @@ class MinecraftLauncher:
             return False
     
     def _download_and_install_java(self):
-        """Java indir ve kur"""
+        """Mojang runtime'larından Java kur (launcher dizinine, root gerekmez)"""
         self.console.print("\n[bold]Java İndirme ve Kurulum[/bold]")
         
-        # Kurulabilir Java sürümlerini göster
-        installable_versions = self._get_installable_java_versions()
+        available = self.runtime_store.available()
+        if not available:
+            self.console.print("[red]❌ Runtime listesi alınamadı (ağ bağlantısı ya da desteklenmeyen işlemci)[/red]")
+            input("[dim]Enter...[/dim]")
+            return
         
-        self.console.print("\n[bold]Kurulabilir Java Sürümleri:[/bold]")
-        for i, java in enumerate(installable_versions, 1):
-            self.console.print(f"  [cyan]{i}[/cyan]  {java['name']} ({java['version']})")
+        installed = self.runtime_store.installed()
+        components = sorted(available)
+        self.console.print("\n[bold]Kurulabilir Java Runtime'ları:[/bold]")
+        for i, component in enumerate(components, 1):
+            marker = " [green]✓ Kurulu[/green]" if component in installed else ""
+            self.console.print(f"  [cyan]{i}[/cyan]  {component:28} {available[component]}{marker}")
         
         try:
-            choice = int(Prompt.ask("\n[cyan]Java sürümü seçin (0 = İptal)[/cyan]"))
+            choice = int(Prompt.ask("\n[cyan]Runtime seçin (0 = İptal)[/cyan]"))
             if choice == 0:
                 return
-            
-            if 1 <= choice <= len(installable_versions):
-                selected_java = installable_versions[choice-1]
-                self.console.print(f"\n[blue]📦 {selected_java['name']} kuruluyor...[/blue]")
-                
-                if self._install_java_package(selected_java["package"]):
-                    self.console.print(f"[green]✅ {selected_java['name']} başarıyla kuruldu![/green]")
-                    
-                    # Otomatik olarak bu sürümü seç
-                    java_path = f"/usr/lib/jvm/{selected_java['package']}/bin/java"
-                    if os.path.exists(java_path):
-                        self.java_executable = java_path
-                        self.config["java_path"] = java_path
-                        self._save_config()
-                        self.console.print(f"[green]✅ {selected_java['name']} aktif Java sürümü olarak ayarlandı![/green]")
-                else:
-                    self.console.print(f"[red]❌ {selected_java['name']} kurulumu başarısız![/red]")
-            else:
+            if not 1 <= choice <= len(components):
                 self.console.print("[red]❌ Geçersiz seçim![/red]")
+                input("[dim]Enter...[/dim]")
+                return
         except ValueError:
             self.console.print("[red]❌ Geçersiz giriş![/red]")
+            input("[dim]Enter...[/dim]")
+            return
+        
+        component = components[choice - 1]
+        try:
+            with self.console.status(f"[blue]📦 {component} kuruluyor...[/blue]") as status:
+                done = [0]
+                def on_done(task, ok):
+                    done[0] += 1
+                    status.update(f"[blue]📦 {component} kuruluyor... {done[0]} dosya[/blue]")
+                report = self.runtime_store.install(component, on_done=on_done)
+        except (OSError, ValueError) as e:
+            self.console.print(f"[red]❌ {component} kurulamadı: {e}[/red]")
+            input("[dim]Enter...[/dim]")
+            return
+        
+        if report.ok:
+            self.java_registry.discover()
+            self.console.print(f"[green]✅ {component} kuruldu: {self.runtime_store.java_path(component)} ({report.summary()})[/green]")
+            if self.config.get("java_runtime", RUNTIME_AUTO) == RUNTIME_SYSTEM:
+                self.console.print("[dim]Sürümlerin bu runtime'ı kullanması için 'Otomatik Java'yı açın.[/dim]")
+        else:
+            self.console.print(f"[red]❌ {len(report.failed)} dosya indirilemedi[/red]")
+            for failed in report.failed[:5]:
+                self.console.print(f"[dim]  {failed['name']}: {failed['error']}[/dim]")
         
         input("[dim]Enter...[/dim]")
     
@@ -738,6 +735,7 @@ class MinecraftLauncher:
             if version:
                 self.java_executable = java_path
                 self.config["java_path"] = java_path
+                self.config["java_runtime"] = RUNTIME_SYSTEM
                 self._save_config()
                 self.console.print(f"[green]✅ Java yolu ayarlandı: {java_path} ({version})[/green]")
             else:
@@ -1141,16 +1139,21 @@ class MinecraftLauncher:
                 task = progress.add_task(description, total=total_size)
                 
                 # Büyük chunk size (daha hızlı indirme)
+                written = 0
                 with open(filepath, 'wb') as f:
                     for chunk in response.iter_content(chunk_size=1024*1024):  # 1MB chunks
                         if chunk:
                             f.write(chunk)
+                            written += len(chunk)
                             progress.update(task, advance=len(chunk))
             
             session.close()
+            DOWNLOAD_STATS.record(url, written, response.elapsed.total_seconds())
+            self.generations.bump()
             return True
             
         except requests.RequestException as e:
+            DOWNLOAD_STATS.record(url, ok=False)
             self.console.print(f"[red]İndirme hatası: {e}[/red]")
             return False
     
@@ -1301,8 +1304,10 @@ class MinecraftLauncher:
                                 response.raise_for_status()
                                 with open(path, 'wb') as f:
                                     f.write(response.content)
+                                DOWNLOAD_STATS.record(url, len(response.content), response.elapsed.total_seconds())
                                 return True, name
                             except Exception as e:
+                                DOWNLOAD_STATS.record(url, ok=False)
                                 return False, name
                         
                         # 16 paralel thread ile indir (ultra hızlı)
@@ -1347,367 +1352,105 @@ class MinecraftLauncher:
                         versions.append(version_dir.name)
         return sorted(versions, reverse=True)
     
-    def _create_launch_command(self, version_id: str) -> List[str]:
-        """Oyun başlatma komutu oluştur"""
-        # Java executable'ı config'den al
-        if self.config.get("java_path"):
+    def _create_launch_command(self, version_id: str, instance=None) -> List[str]:
+        """Oyun başlatma komutu oluştur (instance verilirse onun oyun dizini ve ayarlarıyla)"""
+        # Java executable'ı config'den al (yönetilen runtime seçildiyse o kalır)
+        if self.config.get("java_runtime", RUNTIME_AUTO) == RUNTIME_SYSTEM and self.config.get("java_path"):
             self.java_executable = self.config["java_path"]
         
-        if not self.java_executable:
-            raise Exception("Java bulunamadı! Lütfen Java'yı yükleyin.")
-        
-        version_dir = self.versions_dir / version_id
-        version_json_path = version_dir / f"{version_id}.json"
-        
-        if not version_json_path.exists():
-            raise Exception(f"Sürüm JSON'u bulunamadı: {version_id}")
-        
-        with open(version_json_path, 'r') as f:
-            version_data = json.load(f)
-        
-        # JVM argümanları
-        system_info = self._get_system_info()
-        memory_gb = float(system_info["memory"].split()[0])
-        
-        # Bellek optimizasyonu (Java 17 için daha düşük)
-        if self.config["memory"] == "auto":
-            max_memory = min(int(memory_gb * 0.4), 4)  # Sistem belleğinin %40'ı, max 4GB
-        else:
-            max_memory = int(self.config["memory"])
-        
-        # Wayland/Hyprland desteği için environment değişkenleri
-        wayland_env = {
-            # X11/Wayland Environment
-            "GDK_BACKEND": "x11",  # XWayland kullan
-            "QT_QPA_PLATFORM": "xcb",  # Qt için X11
-            "SDL_VIDEODRIVER": "x11",  # SDL için X11
-            "MOZ_ENABLE_WAYLAND": "0",  # Firefox için X11
-            "DISPLAY": os.environ.get("DISPLAY", ":0"),  # X11 display
-            "WAYLAND_DISPLAY": "",  # Wayland'i devre dışı bırak
-            "HYPRLAND_INSTANCE_SIGNATURE": "",  # Hyprland'i devre dışı bırak
-            
-            # Java AWT Settings
-            "_JAVA_AWT_WM_NONREPARENTING": "1",  # Java AWT için
-            "AWT_TOOLKIT": "MToolkit",  # Java AWT toolkit
-            "JAVA_TOOL_OPTIONS": "-Djava.awt.headless=false",  # Headless modu kapat
-            
-            # Graphics Settings
-            "LIBGL_ALWAYS_SOFTWARE": "0",  # Hardware acceleration
-            "LIBGL_ALWAYS_INDIRECT": "0",  # Direct rendering
-            "MESA_GL_VERSION_OVERRIDE": "4.5",  # Mesa GL version
-            "MESA_GLSL_VERSION_OVERRIDE": "450",  # Mesa GLSL version
-            "MESA_NO_ERROR": "1",  # Mesa hata kontrolü
-            "DRI_PRIME": "1",  # GPU acceleration
-            "vblank_mode": "0",  # V-sync kapalı
-            "__GL_THREADED_OPTIMIZATIONS": "1",  # Threaded optimizations
-            
-            # Window Management
-            "GDK_SYNCHRONIZE": "1",  # X11 senkronizasyonu
-            "X11_FORCE_SOFTWARE": "0",  # Force hardware acceleration
-            "X11_NO_HARDWARE": "0",  # Allow hardware acceleration
-            "X11_SOFTWARE_CURSOR": "0",  # Use hardware cursor
-            "X11_VSYNC": "0",  # Disable VSync
-            "X11_NO_BACKING_STORE": "0",  # Enable backing store
-            "X11_NO_SAVE_UNDERS": "0",  # Enable save unders
-            "X11_NO_DAMAGE": "0",  # Enable damage extension
-            "X11_NO_GLX": "0",  # Enable GLX
-            "X11_NO_COMPOSITE": "0",  # Enable composite extension
-            "X11_NO_RENDER": "0",  # Enable render extension
-            "X11_NO_XFIXES": "0",  # Enable XFixes extension
-            "X11_NO_XINERAMA": "0",  # Enable Xinerama
-            "X11_NO_XRANDR": "0",  # Enable XRandR
-            "X11_NO_XSYNC": "0",  # Enable XSync
-            "X11_NO_XTEST": "0",  # Enable XTest
-            "X11_NO_XV": "0",  # Enable XVideo
-            "X11_NO_XINPUT": "0",  # Enable XInput
-            "X11_NO_XKB": "0",  # Enable XKB
-            "X11_NO_XCURSOR": "0",  # Enable XCursor
-            "X11_NO_XFONT": "0",  # Enable XFont
-            "X11_NO_XFT": "0",  # Enable Xft
-            "X11_NO_XPM": "0",  # Enable XPM
-            "X11_NO_XSHM": "0",  # Enable XShm
-            "X11_NO_XTST": "0",  # Enable XTst
-            "X11_NO_XVMC": "0",  # Enable XVMC
-            "X11_NO_XVMCLIB": "0",  # Enable XVMCLib
-            "MESA_GLSL_VERSION_OVERRIDE": "450",  # GLSL version override
-            
-            # Minecraft Window Fix
-            "MESA_VK_DEVICE_SELECT": "0",  # Mesa Vulkan device selection
-            "MESA_LOADER_DRIVER_OVERRIDE": "zink",  # Mesa loader override
-            "GALLIUM_DRIVER": "zink",  # Gallium driver
-            "LIBGL_DRIVERS_PATH": "/usr/lib/dri",  # OpenGL drivers path
-            "VK_ICD_FILENAMES": "/usr/share/vulkan/icd.d/intel_icd.x86_64.json",  # Vulkan ICD
-            
-            # Window Persistence Fix
-            "X11_FORCE_SOFTWARE": "0",  # Force hardware acceleration
-            "X11_NO_HARDWARE": "0",  # Allow hardware acceleration
-            "X11_SOFTWARE_CURSOR": "0",  # Use hardware cursor
-            "X11_VSYNC": "0",  # Disable VSync
-            "X11_NO_BACKING_STORE": "0",  # Enable backing store
-            "X11_NO_SAVE_UNDERS": "0",  # Enable save unders
-            "X11_NO_DAMAGE": "0",  # Enable damage extension
-            "X11_NO_GLX": "0",  # Enable GLX
-            "X11_NO_COMPOSITE": "0",  # Enable composite extension
-            "X11_NO_RENDER": "0",  # Enable render extension
-            "X11_NO_XFIXES": "0",  # Enable XFixes extension
-            "X11_NO_XINERAMA": "0",  # Enable Xinerama
-            "X11_NO_XRANDR": "0",  # Enable XRandR
-            "X11_NO_XSYNC": "0",  # Enable XSync
-            "X11_NO_XTEST": "0",  # Enable XTest
-            "X11_NO_XV": "0",  # Enable XVideo
-            "X11_NO_XINPUT": "0",  # Enable XInput
-            "X11_NO_XKB": "0",  # Enable XKB
-            "X11_NO_XCURSOR": "0",  # Enable XCursor
-            "X11_NO_XFONT": "0",  # Enable XFont
-            "X11_NO_XFT": "0",  # Enable Xft
-            "X11_NO_XPM": "0",  # Enable XPM
-            "X11_NO_XSHM": "0",  # Enable XShm
-            "X11_NO_XTST": "0",  # Enable XTst
-            "X11_NO_XVMC": "0",  # Enable XVMC
-            "X11_NO_XVMCLIB": "0",  # Enable XVMCLib
-        }
-        
-        # ULTRA PERFORMANS JVM ARGÜMANLARI (Java 21+ uyumlu + Online Server Support)
-        jvm_args = [
-            self.java_executable,
-            # Bellek Yönetimi (Agresif + Online Optimize)
-            f"-Xmx{max_memory}G",
-            f"-Xms{max_memory}G",  # Min=Max (daha hızlı başlangıç)
-            "-XX:+UseG1GC",  # G1 Garbage Collector (en iyi Minecraft için)
-            "-XX:+ParallelRefProcEnabled",
-            "-XX:MaxGCPauseMillis=100",  # Daha az lag spike (online için optimize)
-            "-XX:+UnlockExperimentalVMOptions",
-            "-XX:+DisableExplicitGC",
-            "-XX:+AlwaysPreTouch",  # Belleği önceden ayır
-            
-            # G1GC Tuning (Java 17 uyumlu)
-            "-XX:G1NewSizePercent=30",
-            "-XX:G1MaxNewSizePercent=40",
-            "-XX:G1HeapRegionSize=16M",
-            "-XX:G1ReservePercent=15",
-            "-XX:G1HeapWastePercent=5",
-            "-XX:InitiatingHeapOccupancyPercent=15",
-            
-            # Network Optimizasyonları (Online Server için)
-            "-Djava.net.preferIPv4Stack=true",
-            "-Djava.net.preferIPv6Addresses=false",
-            "-Dhttp.agent=BerkeMinecraftLauncher/2.3.0",
-            
-            # SSL Certificate Trust - Fix authentication issues
-            "-Dcom.sun.net.ssl.checkRevocation=false",
-            "-Dtrust_all_cert=true",
-            "-Djavax.net.ssl.trustStoreType=JKS",
-            "-Djavax.net.ssl.trustStore=",
-            "-Dcom.sun.net.ssl.checkRevocation=false",
-            
-            # CPU Optimizasyonları (Java 21+ uyumlu)
-            "-XX:+OptimizeStringConcat",
-            "-XX:+UseStringDeduplication",
-            "-XX:+UseCompressedOops",
-            "-XX:+UseCompressedClassPointers",
-            
-            # JIT Compiler Optimizasyonları
-            "-XX:+TieredCompilation",
-            "-XX:ReservedCodeCacheSize=400M",
-            "-XX:+SegmentedCodeCache",
-            "-XX:+UseCodeCacheFlushing",
-            
-            # Wayland/Hyprland + OpenGL Optimizasyonları
-            "-Dsun.java2d.opengl=true",
-            "-Dsun.java2d.d3d=false",
-            "-Djava.awt.graphicsenv=sun.awt.X11GraphicsEnvironment",
-            "-Dawt.useSystemAAFontSettings=on",
-            "-Dswing.aatext=true",
-            
-            # X11 Specific Settings (Wayland/Hyprland Fix)
-            "-Dsun.java2d.xrender=true",
-            "-Dsun.java2d.pmoffscreen=false",
-            "-Dsun.java2d.noddraw=true",
-            "-Djava.awt.headless=false",
-            "-Dsun.java2d.accthreshold=0",
-            "-Dsun.java2d.d3d=false",
-            "-Dsun.java2d.ddoffscreen=false",
-            "-Dsun.java2d.gdiblend=false",
-            "-Dsun.java2d.pisces=false",
-            "-Dsun.java2d.xrender=true",
-            
-            # LWJGL Native Library Path - Fixed for proper library loading
-            f"-Dorg.lwjgl.librarypath={self.launcher_dir / 'libraries' / 'natives' / 'linux' / 'x64'}",
-            "-Djava.library.path=" + str(self.launcher_dir / 'libraries' / 'natives' / 'linux' / 'x64'),
-            
-            # Minecraft Window Fix (Wayland/Hyprland)
-            "-Dminecraft.client.jar=client.jar",
-            "-Djava.awt.headless=false",
-            "-Dfile.encoding=UTF-8",
-            "-Duser.language=en",
-            "-Duser.country=US",
-            
-            # Window Persistence & Graphics Fix
-            "-Dsun.java2d.opengl=false",
-            "-Dsun.java2d.d3d=false",
-            "-Dsun.java2d.xrender=true",
-            "-Dsun.java2d.pmoffscreen=false",
-            "-Dsun.java2d.noddraw=true",
-            "-Dsun.java2d.ddoffscreen=false",
-            "-Dsun.java2d.gdiblend=false",
-            "-Dsun.java2d.pisces=false",
-            "-Dsun.java2d.accthreshold=0",
-            "-Dsun.java2d.ddoffscreen=false",
-            "-Dsun.java2d.gdiblend=false",
-            "-Dsun.java2d.pmoffscreen=false",
-            "-Dsun.java2d.pisces=false",
-            "-Dsun.java2d.xrender=true",
-            
-            # Window Management & Display
-            "-Djava.awt.Window.locationByPlatform=true",
-            "-Djava.awt.graphicsenv=sun.awt.X11GraphicsEnvironment",
-            "-Dawt.useSystemAAFontSettings=on",
-            "-Dswing.aatext=true",
-            "-Djava.awt.syncLWRequests=true",
-            "-Djava.awt.keepWorkingSetOnMinimize=true",
-            "-Djava.awt.Window.locationByPlatform=true",
-            "-Djava.awt.smartInvalidate=true",
-            "-Djava.awt.doublebuffered=true",
-            "-Djava.awt.headless=false",
-            "-Djava.awt.graphicsenv=sun.awt.X11GraphicsEnvironment",
-            "-Djava.awt.Window.locationByPlatform=true",
-            "-Djava.awt.syncLWRequests=true",
-            "-Djava.awt.keepWorkingSetOnMinimize=true",
-            "-Djava.awt.smartInvalidate=true",
-            "-Djava.awt.doublebuffered=true",
-            
-            # LWJGL Display Fixes
-            "-Dorg.lwjgl.util.Debug=false",
-            "-Dorg.lwjgl.util.DebugLoader=false",
-            "-Dorg.lwjgl.opengl.Display.allowSoftwareOpenGL=false",
-            "-Dorg.lwjgl.opengl.Display.swapInterval=0",
-            "-Dorg.lwjgl.opengl.Display.allowSoftwareOpenGL=false",
-            "-Dorg.lwjgl.opengl.Display.swapInterval=0",
-            "-Dorg.lwjgl.opengl.Display.allowSoftwareOpenGL=false",
-            "-Dorg.lwjgl.opengl.Display.swapInterval=0",
-            
-            # Minecraft Özel Optimizasyonlar + Online Server Support
-            "-Dminecraft.launcher.brand=berke-ultra-launcher",
-            "-Dminecraft.launcher.version=2.4.0",
-            "-Dfml.ignoreInvalidMinecraftCertificates=true",
-            "-Dfml.ignorePatchDiscrepancies=true",
-            "-Dfile.encoding=UTF-8",
-            "-Duser.language=en",
-            "-Duser.country=US",
-            
-            # Aikar's Flags
-            "-Dusing.aikars.flags=https://mcflags.emc.gs",
-            "-Daikars.new.flags=true",
-            
-            # I/O Optimizasyonları (Disk + Network)
-            "-Dio.netty.allocator.type=pooled",
-            "-Dio.netty.leakDetection.level=disabled",
-            "-Dio.netty.recycler.maxCapacityPerThread=0",
-            
-            # Thread Optimizasyonları (Java 17 uyumlu)
-            "-XX:ConcGCThreads=2",
-            "-XX:ParallelGCThreads=4"
-        ]
-        
-        # Özel JVM argümanlarını ekle
-        custom_jvm_args = self.config.get("custom_jvm_args", [])
-        if custom_jvm_args:
-            jvm_args.extend(custom_jvm_args)
-        
-        # Minecraft argümanları (eski sürüm uyumluluğu)
-        main_class = version_data.get("mainClass", "net.minecraft.client.main.Main")
-        
-        # Classpath oluştur (JAR + tüm kütüphaneler)
-        classpath_parts = [str(version_dir / f"{version_id}.jar")]
-        
-        # Kütüphaneleri classpath'e ekle (eski ve yeni format desteği)
-        libraries_dir = self.launcher_dir / "libraries"
-        if "libraries" in version_data:
-            for lib in version_data["libraries"]:
-                try:
-                    # Modern format
-                    if "downloads" in lib and "artifact" in lib["downloads"]:
-                        artifact = lib["downloads"]["artifact"]
-                        lib_path = libraries_dir / artifact["path"]
-                        if lib_path.exists():
-                            classpath_parts.append(str(lib_path))
-                    # Eski format (name + url)
-                    elif "name" in lib:
-                        lib_name = lib["name"]
-                        parts = lib_name.split(":")
-                        if len(parts) >= 3:
-                            group, artifact, version = parts[0], parts[1], parts[2]
-                            lib_path = libraries_dir / group.replace(".", "/") / artifact / version / f"{artifact}-{version}.jar"
-                            if lib_path.exists():
-                                classpath_parts.append(str(lib_path))
-                except Exception as e:
-                    # Eksik kütüphane varsa atla
-                    if self.config.get("debug", False):
-                        self.console.print(f"[yellow]⚠️ Kütüphane atlandı: {lib.get('name', 'unknown')}[/yellow]")
-                    continue
-        
-        # Classpath'i birleştir (Linux/Unix için ':' ayırıcı)
-        classpath = ":".join(classpath_parts)
-        
-        # Skin dosyası yolu
-        skin_path = self.skins_dir / f"{self.config['current_skin']}.png"
+        config = instance.apply(self.config) if instance else self.config
+        if self.pending_jfr_template:
+            # Tek seferlik: yalnız "Profil ile başlat" ile açılan oturum kaydedilir
+            config = dict(config, jfr_template=self.pending_jfr_template)
+            self.pending_jfr_template = None
+        spec = build_launch_command(self.paths, config, version_id, self.java_executable,
+                                    self.java_registry, self.jvm_flag_probe,
+                                    game_dir=instance.game_dir if instance else None)
+        
+        self.last_launch_spec = spec
+        if spec.heap_plan:
+            self.last_heap_plan = spec.heap_plan
+            self.console.print(f"[dim]💾 Otomatik bellek: {spec.heap_plan.summary()}[/dim]")
+        
+        flag_plan = spec.flag_plan
+        self.last_jvm_flag_plan = flag_plan
+        if self.config.get("debug", False):
+            self.console.print(f"[dim]⚙️ JVM: {flag_plan.summary()}[/dim]")
+            for note in flag_plan.notes:
+                self.console.print(f"[dim]   - {note}[/dim]")
+        for dropped in flag_plan.dropped:
+            self.console.print(f"[yellow]⚠️ Bu Java desteklemiyor, atlandı: {dropped}[/yellow]")
+        
+        if config.get("cds_fast_start", False):
+            self.console.print(f"[dim]⚡ CDS: {spec.cds_plan.summary()}[/dim]")
+        
+        if spec.jfr_recording:
+            save_jfr_meta(spec.jfr_recording, version=version_id, instance=instance.name if instance else DEFAULT_INSTANCE,
+                          game_dir=str(instance.game_dir if instance else self.minecraft_dir), template=config["jfr_template"],
+                          mode="launch", started_at=time.time())
+            self.console.print(f"[dim]🎯 JFR kaydı ({config['jfr_template']}): oyun kapanınca {spec.jfr_recording}[/dim]")
+        elif config.get("jfr_template"):
+            self.console.print(f"[yellow]⚠️ JFR kaydı başlatılamadı: {spec.jfr_skipped or 'Java desteklemiyor'}[/yellow]")
+        
+        profile = spec.gpu_profile
+        self.console.print(f"[dim]🖥️  GPU profili: {profile.name}{' (elle)' if profile.overridden else ''}[/dim]")
+        if self.config.get("debug", False):
+            for line in profile.explain()[1:]:
+                self.console.print(f"[dim]  {line}[/dim]")
+        
+        if spec.wrapper_chain:
+            self.console.print(f"[dim]🧰 Sarmalayıcılar: {', '.join(spec.wrapper_chain.names())}[/dim]")
+        for wrapper_spec, reason in spec.wrapper_chain.skipped:
+            self.console.print(f"[yellow]⚠️ Sarmalayıcı atlandı: {wrapper_spec} ({reason})[/yellow]")
+        
+        classpath_result = spec.classpath
+        self.last_classpath_report = classpath_result
+        if classpath_result.dropped:
+            self.console.print(f"[dim]🧹 Classpath: {classpath_result.summary()}[/dim]")
+            if self.config.get("debug", False):
+                for dropped in classpath_result.dropped:
+                    self.console.print(
+                        f"[dim]   - {dropped['key']} {dropped['version']} ({dropped['source']}) atlandı → "
+                        f"{dropped['kept_version']} ({dropped['kept_source']}) tutuldu: {dropped['reason']}[/dim]"
+                    )
         
-        # UUID generation (online sunucu desteği için)
-        player_uuid = self.config.get("uuid")
-        if not player_uuid:
-            # Username'den deterministic UUID oluştur (online sunucular için)
-            player_uuid = str(uuid.uuid5(uuid.NAMESPACE_DNS, self.config["username"]))
-            self.config["uuid"] = player_uuid
+        if spec.uuid_generated and config["username"] == self.config["username"]:
+            self.config["uuid"] = spec.player_uuid
             self._save_config()
         
-        # Minecraft argümanları (eski sürüm uyumluluğu)
-        minecraft_args = [
-            "-cp", classpath,
-            main_class,
-            "--username", self.config["username"],
-            "--version", version_id,
-            "--gameDir", str(self.minecraft_dir),
-            "--assetsDir", str(self.minecraft_dir / "assets"),
-        ]
-        
-        # Asset index (eski sürümlerde olmayabilir)
-        assets_dir = self.minecraft_dir / "assets"
-        assets_dir.mkdir(parents=True, exist_ok=True)
-        
-        if "assetIndex" in version_data:
-            minecraft_args.extend(["--assetIndex", version_data["assetIndex"]["id"]])
-            # Asset index dosyasını indir ve kaydet
+        # Asset index dosyasını indir ve kaydet
+        (self.minecraft_dir / "assets").mkdir(parents=True, exist_ok=True)
+        if spec.missing_asset_index:
+            index = spec.missing_asset_index
             try:
-                asset_index_path = assets_dir / "indexes" / f"{version_data['assetIndex']['id']}.json"
-                asset_index_path.parent.mkdir(parents=True, exist_ok=True)
-                if not asset_index_path.exists():
-                    self._download_file(version_data["assetIndex"]["url"], asset_index_path, f"Asset Index {version_data['assetIndex']['id']}")
+                index["path"].parent.mkdir(parents=True, exist_ok=True)
+                self._download_file(index["url"], index["path"], f"Asset Index {index['id']}")
             except Exception as e:
                 if self.config.get("debug", False):
                     self.console.print(f"[yellow]⚠️ Asset index indirilemedi: {e}[/yellow]")
-        else:
-            # Eski sürümler için fallback
-            minecraft_args.extend(["--assetIndex", "legacy"])
-        
-        # Online sunucu desteği (modern sürümler için)
-        minecraft_args.extend([
-            "--uuid", player_uuid,  # UUID ekle (online sunucu desteği)
-            "--accessToken", "null",
-            "--userType", "mojang",  # legacy yerine mojang (daha iyi uyumluluk)
-            "--versionType", "release",
-        ])
-        
-        # Pencere boyutu
-        minecraft_args.extend([
-            "--width", str(self.config["window_width"]),
-            "--height", str(self.config["window_height"])
-        ])
         
-        # Skin varsa ekle
-        if skin_path.exists():
-            minecraft_args.extend(["--skin", str(skin_path)])
-        
-        return jvm_args + minecraft_args, wayland_env
+        return spec.command, spec.display_env
+    
+    def _plan_heap(self, version_id: str, version_chain: List[Dict] = None):
+        """Otomatik bellek modeli ile -Xmx/-Xms hesapla"""
+        if version_chain is None:
+            version_chain = self._load_version_chain(version_id)
+        return plan_version_heap(self.paths, version_id, version_chain)
+    
+    def _compile_jvm_args(self, heap_mb: int, min_heap_mb: int = None):
+        """Bu Java runtime'ı için GC/tuning bayraklarını ve sistem özelliklerini derle"""
+        return compile_jvm_args(self.paths, self.config, self.java_executable, self.java_registry,
+                                self.jvm_flag_probe, heap_mb, min_heap_mb)
+    
+    def _load_version_chain(self, version_id: str) -> List[Dict]:
+        """Sürüm JSON'unu inheritsFrom zinciriyle birlikte yükle (loader → vanilla)"""
+        return load_chain(self.paths, version_id)
+    
+    def _resolve_classpath(self, version_id: str, version_chain: List[Dict] = None):
+        """Sürüm için tekilleştirilmiş classpath'i çöz"""
+        if version_chain is None:
+            version_chain = self._load_version_chain(version_id)
+        return resolve_classpath(self.paths, version_id, version_chain)
     
     def _download_native_libraries(self, version_data: dict):
         """Native libraries'ı indir ve çıkar"""
@@ -1859,8 +1602,10 @@ class MinecraftLauncher:
                         response.raise_for_status()
                         with open(path, 'wb') as f:
                             f.write(response.content)
+                        DOWNLOAD_STATS.record(url, len(response.content), response.elapsed.total_seconds())
                         return True, name
                     except Exception as e:
+                        DOWNLOAD_STATS.record(url, ok=False)
                         return False, name
                 
                 # 16 paralel thread ile indir
@@ -1884,6 +1629,7 @@ class MinecraftLauncher:
                 self.console.print(f"[yellow]⚠️ {failed_count} asset indirilemedi, devam ediliyor...[/yellow]")
             
             self.console.print(f"[green]✅ {len(assets_to_download) - failed_count} asset indirildi ({elapsed:.1f}s, {speed:.1f} dosya/s)[/green]")
+            self.generations.bump()
             return True
             
         except Exception as e:
@@ -2202,89 +1948,108 @@ class MinecraftLauncher:
             input("[dim]Enter ile devam...[/dim]")
             return False
     
-    def _launch_minecraft(self, version_id: str):
-        """Minecraft'ı başlat"""
+    def _launch_minecraft(self, version_id: str, deep_verify: bool = False, instance=None):
+        """Minecraft'ı başlat (deep_verify: parmak izi eşleşse de tüm kontrolleri yap)"""
         try:
             self.console.print(f"[yellow]🚀 Minecraft başlatılıyor: {version_id}[/yellow]")
             
-            # Minecraft sürümü için uygun Java kontrolü
-            recommended_java = self._get_recommended_java_for_version(version_id)
-            current_java = self._check_java_version()
+            # Aynı oyun dizinini iki süreç paylaşamaz (options.txt, saves/, kilit dosyaları)
+            game_dir = instance.game_dir if instance else self.minecraft_dir
+            running = self.running_games.find_game_dir(game_dir)
+            if running:
+                self.console.print(f"[red]❌ Bu oyun dizini zaten kullanımda: {running['instance']} (PID {running['pid']})[/red]")
+                input("[dim]Enter...[/dim]")
+                return
             
-            if recommended_java and current_java:
-                try:
-                    current_major = int(current_java.split('.')[0])
-                    recommended_major = int(recommended_java["version"].split('.')[0])
-                    
-                    if current_major < recommended_major:
-                        self.console.print(f"[red]⚠️ Java Uyumsuzluğu![/red]")
-                        self.console.print(f"[yellow]Mevcut Java: {current_java}[/yellow]")
-                        self.console.print(f"[cyan]Önerilen Java: {recommended_java['version']} ({recommended_java['name']})[/cyan]")
-                        if Confirm.ask("Önerilen Java'ya geçmek ister misiniz?", default=True):
-                            self.java_executable = recommended_java["path"]
-                            self.config["java_path"] = recommended_java["path"]
-                            self._save_config()
-                            self.console.print(f"[green]✅ Java değiştirildi: {recommended_java['name']}[/green]")
-                        else:
-                            self.console.print(f"[yellow]⚠️ Uyumsuz Java ile devam ediliyor...[/yellow]")
-                    elif current_major > recommended_major + 2:
-                        self.console.print(f"[yellow]💡 Daha uygun Java mevcut: {recommended_java['version']}[/yellow]")
-                        if Confirm.ask("Daha uygun Java'ya geçmek ister misiniz?", default=False):
-                            self.java_executable = recommended_java["path"]
-                            self.config["java_path"] = recommended_java["path"]
-                            self._save_config()
-                            self.console.print(f"[green]✅ Java değiştirildi: {recommended_java['name']}[/green]")
-                    else:
-                        self.console.print(f"[green]✅ Java sürümü uygun: {current_java}[/green]")
-                except ValueError:
-                    self.console.print(f"[green]✅ Java sürümü: {current_java}[/green]")
+            # Başlatma zaman çizelgesi (monoton saat)
+            timeline = LaunchTimeline(version_id)
+            
+            # Sürümün istediği runtime (parmak izi seçilen Java ile hesaplanır)
+            with timeline.phase("java_check"):
+                runtime = self._select_runtime_for_version(version_id)
+            timeline.set("java_runtime", runtime.component if runtime.managed else "system")
+            
+            # Kontroller sürerken bu sürümün dosyalarını önbelleğe almaya başla
+            self._start_prewarm(version_id)
+            if self.config.get("last_version") != version_id:
+                self.config["last_version"] = version_id
+                self._save_config()
+            
+            # Son başarılı başlatmadan beri hiçbir şey değişmediyse kontrolleri atla
+            deep_verify = deep_verify or self.config.get("always_verify", False)
+            fingerprint = self._install_fingerprint(version_id)
+            fast_path = not deep_verify and fingerprint is not None and fingerprint == self.launch_fingerprints.get(version_id)
+            timeline.set("fast_path", fast_path)
+            
+            if fast_path:
+                current_java = self._check_java_version()
+                self.console.print("[green]⚡ Kurulum değişmedi, kontroller atlanıyor[/green]")
             else:
-                self.console.print(f"[green]✅ Java sürümü: {current_java or 'Bulunamadı'}[/green]")
+                # Minecraft sürümü için uygun Java kontrolü
+                with timeline.phase("java_check"):
+                    recommended_java = None if runtime.managed else self._get_recommended_java_for_version(version_id)
+                    current_java = self._check_java_version()
+                    if runtime.managed:
+                        self.console.print(f"[green]✅ Java: {runtime.summary()}[/green]")
+                    elif runtime.reason and self.config.get("java_runtime", RUNTIME_AUTO) != RUNTIME_SYSTEM:
+                        self.console.print(f"[yellow]⚠️ Yönetilen Java kullanılamadı: {runtime.reason}[/yellow]")
+                
+                    if recommended_java and current_java:
+                        try:
+                            current_major = int(current_java.split('.')[0])
+                            recommended_major = int(recommended_java["version"].split('.')[0])
+                        
+                            if current_major < recommended_major:
+                                self.console.print(f"[red]⚠️ Java Uyumsuzluğu![/red]")
+                                self.console.print(f"[yellow]Mevcut Java: {current_java}[/yellow]")
+                                self.console.print(f"[cyan]Önerilen Java: {recommended_java['version']} ({recommended_java['name']})[/cyan]")
+                                if Confirm.ask("Önerilen Java'ya geçmek ister misiniz?", default=True):
+                                    self.java_executable = recommended_java["path"]
+                                    self.config["java_path"] = recommended_java["path"]
+                                    self._save_config()
+                                    current_java = recommended_java["version"]
+                                    self.console.print(f"[green]✅ Java değiştirildi: {recommended_java['name']}[/green]")
+                                else:
+                                    self.console.print(f"[yellow]⚠️ Uyumsuz Java ile devam ediliyor...[/yellow]")
+                            elif current_major > recommended_major + 2:
+                                self.console.print(f"[yellow]💡 Daha uygun Java mevcut: {recommended_java['version']}[/yellow]")
+                                if Confirm.ask("Daha uygun Java'ya geçmek ister misiniz?", default=False):
+                                    self.java_executable = recommended_java["path"]
+                                    self.config["java_path"] = recommended_java["path"]
+                                    self._save_config()
+                                    current_java = recommended_java["version"]
+                                    self.console.print(f"[green]✅ Java değiştirildi: {recommended_java['name']}[/green]")
+                            else:
+                                self.console.print(f"[green]✅ Java sürümü uygun: {current_java}[/green]")
+                        except ValueError:
+                            self.console.print(f"[green]✅ Java sürümü: {current_java}[/green]")
+                    else:
+                        self.console.print(f"[green]✅ Java sürümü: {current_java or 'Bulunamadı'}[/green]")
+                
+                # Önce sistem kontrolü yap
+                with timeline.phase("pre_launch_check"):
+                    self._pre_launch_check()
             
-            # Önce sistem kontrolü yap
-            self._pre_launch_check()
+                # Asset'leri doğrula ve eksikleri indir
+                with timeline.phase("asset_verify"):
+                    self.console.print(f"[blue]🔍 Asset'ler kontrol ediliyor...[/blue]")
+                    self._verify_and_repair_assets(version_id)
             
-            # Asset'leri doğrula ve eksikleri indir
-            self.console.print(f"[blue]🔍 Asset'ler kontrol ediliyor...[/blue]")
-            self._verify_and_repair_assets(version_id)
+            timeline.set("java_version", current_java)
             
-            command, env_vars = self._create_launch_command(version_id)
+            with timeline.phase("build_command"):
+                command, env_vars = self._create_launch_command(version_id, instance)
+            timeline.set("instance", instance.name if instance else DEFAULT_INSTANCE)
+            timeline.set("gpu_profile", self.last_launch_spec.gpu_profile.name)
+            timeline.set("cds", self.last_launch_spec.cds_plan.mode)
             
             # Mevcut environment'a Wayland ayarlarını ekle
             import os
-            current_env = os.environ.copy()
-            current_env.update(env_vars)
-            
-            # Hyprland için özel ayarlar
-            if os.environ.get("XDG_SESSION_TYPE") == "wayland" and self.config.get("wayland_support", True):
+            current_env, xwayland = launch_environment(os.environ, env_vars, self.config,
+                                                       self.last_launch_spec.wrapper_chain.environment())
+            if xwayland:
                 self.console.print("[blue]🖥️  Wayland/Hyprland tespit edildi, XWayland kullanılıyor...[/blue]")
-                current_env.update({
-                    "GDK_BACKEND": "x11",
-                    "QT_QPA_PLATFORM": "xcb",
-                    "SDL_VIDEODRIVER": "x11",
-                    "_JAVA_AWT_WM_NONREPARENTING": "1",
-                    "AWT_TOOLKIT": "MToolkit",
-                    "DISPLAY": ":0",
-                    "WAYLAND_DISPLAY": "",
-                    "GDK_SYNCHRONIZE": "1"
-                })
-            
-            # Minecraft için özel environment değişkenleri
-            current_env.update({
-                "MESA_GL_VERSION_OVERRIDE": "4.5",
-                "MESA_GLSL_VERSION_OVERRIDE": "450",
-                "LIBGL_ALWAYS_SOFTWARE": "0",
-                "LIBGL_ALWAYS_INDIRECT": "0",
-                "JAVA_TOOL_OPTIONS": "-Djava.awt.headless=false",
-                # Performance optimizations
-                "vblank_mode": "0",  # Disable VSync for better FPS
-                "__GL_THREADED_OPTIMIZATIONS": "1",
-                "MESA_NO_ERROR": "1"
-            })
-            
-            # Debug modu
             if self.config.get("debug", False):
-                current_env["JAVA_TOOL_OPTIONS"] += " -Djava.util.logging.config.file=logging.properties"
                 self.console.print("[yellow]🔍 Debug modu aktif[/yellow]")
             
             # Komut ve environment'ı göster
@@ -2292,6 +2057,14 @@ class MinecraftLauncher:
                 self.console.print(f"[blue]📋 Komut: {' '.join(command)}[/blue]")
                 self.console.print(f"[blue]🌍 Environment: {current_env}[/blue]")
             
+            # Başarılı açılışta kaydedilecek parmak izi (onarımlar ve UUID dahil)
+            if not fast_path:
+                fingerprint = self._install_fingerprint(version_id)
+            timeline.set("fingerprint", fingerprint)
+            
+            # Sayfa önbelleği durumunu kaydet (warm/cold karşılaştırması için)
+            self._record_page_cache(timeline, version_id)
+            
             # Oyunu başlat
             self.console.print("[blue]🚀 Minecraft başlatılıyor...[/blue]")
             
@@ -2303,56 +2076,26 @@ class MinecraftLauncher:
                 
                 import datetime
                 timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                log_file = log_dir / f"minecraft_{version_id}_{timestamp}.log"
+                log_name = f"{instance.name}_{version_id}" if instance else version_id
+                log_file = log_dir / f"minecraft_{log_name}_{timestamp}.log"
                 
                 # Minecraft'ı arka planda başlat (çıktıyı log dosyasına yaz)
-                with open(log_file, 'w') as log:
-                    process = subprocess.Popen(
-                        command,
-                        stdout=log,
-                        stderr=subprocess.STDOUT,
-                        env=current_env,
-                        start_new_session=True
-                    )
-                
-                # Progress bar ile bekleme
-                import time
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TimeElapsedColumn(),
-                    console=self.console
-                ) as progress:
-                    task = progress.add_task("[cyan]Minecraft başlatılıyor...", total=100)
-                    
-                    for i in range(100):
-                        time.sleep(0.05)  # 5 saniye toplam
-                        progress.update(task, advance=1)
-                        
-                        # Her 20 adımda process kontrolü
-                        if i % 20 == 0 and process.poll() is not None:
-                            # Process erken kapandı - hata var
-                            break
-                
-                # Process durumunu kontrol et
-                if process.poll() is None:
+                process = self._spawn_game(command, current_env, log_file, version_id, instance, timeline)
+                watcher = self._follow_game_log(timeline, process, log_file, instance)
+                
+                # Oyun hazır olana, hata verene ya da kapanana kadar bekle
+                state = self._wait_for_game_state(watcher, timeline, show_progress=True)
+                if state in (STATE_READY, STATE_TIMEOUT):
+                    if instance:
+                        # Instance'lar arka planda çalışır; launcher başka instance başlatabilir
+                        self._show_instance_started(instance, process, watcher)
+                        return
                     # Başarılı - Kaynak izleme ekranına geç
-                    self._show_game_monitor(process, version_id, log_file)
+                    self._show_game_monitor(process, version_id, log_file, watcher)
                     return  # Ana menüye dönme
-                else:
-                    # Hata oluştu - log dosyasını oku
-                    time.sleep(1)  # Log yazılması için bekle
-                    try:
-                        with open(log_file, 'r') as log:
-                            log_content = log.read()
-                    except:
-                        log_content = "Log dosyası okunamadı"
-                    
-                    self.console.print("[red]❌ Minecraft başlatılamadı![/red]")
-                    self._show_detailed_error("", log_content, command, current_env)
-                    input("[dim]Enter...[/dim]")
-                    return  # Ana menüye dön
+                
+                self._show_launch_failure(watcher, log_file, command, current_env)
+                return  # Ana menüye dön
             else:
                 # Log dosyası oluştur
                 log_dir = self.launcher_dir / "logs"
@@ -2360,17 +2103,12 @@ class MinecraftLauncher:
                 
                 import datetime
                 timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                log_file = log_dir / f"minecraft_{version_id}_{timestamp}.log"
+                log_name = f"{instance.name}_{version_id}" if instance else version_id
+                log_file = log_dir / f"minecraft_{log_name}_{timestamp}.log"
                 
                 # Minecraft'ı arka planda başlat (çıktıyı log dosyasına yaz)
-                with open(log_file, 'w') as log:
-                    process = subprocess.Popen(
-                        command,
-                        stdout=log,
-                        stderr=subprocess.STDOUT,
-                        env=current_env,
-                        start_new_session=True
-                    )
+                process = self._spawn_game(command, current_env, log_file, version_id, instance, timeline)
+                watcher = self._follow_game_log(timeline, process, log_file, instance)
                 
                 # Başlatma mesajı
                 self.console.print("[green]✅ Minecraft başlatıldı![/green]")
@@ -2379,11 +2117,17 @@ class MinecraftLauncher:
                 self.console.print("[yellow]💡 Minecraft penceresi açılmasını bekleyin...[/yellow]")
                 self.console.print("[dim]Oyunu kapatmak için Ctrl+C tuşlarına basın.[/dim]")
                 
-                # Kısa bekleme sonrası monitoring'e geç
-                import time
-                time.sleep(3)
-                self._show_game_monitor(process, version_id, log_file)
-                return  # Ana menüye dönme
+                # Oyunun durumu belli olunca monitoring'e geç
+                state = self._wait_for_game_state(watcher, timeline, show_progress=False)
+                if state in (STATE_READY, STATE_TIMEOUT):
+                    if instance:
+                        self._show_instance_started(instance, process, watcher)
+                        return
+                    self._show_game_monitor(process, version_id, log_file, watcher)
+                    return  # Ana menüye dönme
+                
+                self._show_launch_failure(watcher, log_file, command, current_env)
+                return  # Ana menüye dön
             
         except Exception as e:
             self.console.print(f"[red]❌ Başlatma hatası: {e}[/red]")
@@ -2391,6 +2135,794 @@ class MinecraftLauncher:
             input("[dim]Enter...[/dim]")
             return  # Ana menüye dön
     
+    def _install_fingerprint(self, version_id: str) -> Optional[str]:
+        """Sürüm, kütüphaneler, asset deposu, Java ve ayarların parmak izi"""
+        return fingerprint_version(self.paths, version_id, self.java_executable, self.config, self.generations.get())
+    
+    def _prewarm_paths(self, version_id: str) -> List[str]:
+        """JVM'in açılışta okuyacağı dosyalar: Java modülleri, classpath, native'ler"""
+        paths = []
+        java_info = self.java_registry.info(self.java_executable, allow_probe=False) if self.java_executable else None
+        if java_info:
+            paths.append(str(Path(java_info["home"]) / "lib" / "modules"))
+        paths.extend(self._resolve_classpath(version_id).entries)
+        natives_dir = self.launcher_dir / "libraries" / "natives" / "linux" / "x64"
+        if natives_dir.exists():
+            paths.extend(str(p) for p in sorted(natives_dir.glob("*.so")))
+        return paths
+    
+    def _start_prewarm(self, version_id: str = None):
+        """Son oynanan (veya seçilen) sürümün dosyalarını arka planda önbelleğe al"""
+        if not self.config.get("prewarm_page_cache", True):
+            return None
+        if version_id is None:
+            recent = [self.config.get("last_version")] + self.launch_history.versions()
+            version_id = next((v for v in recent if v and (self.versions_dir / v / f"{v}.json").exists()), None)
+            if not version_id:
+                return None
+        
+        if self.prewarmer and self.prewarmer.key == version_id:
+            return self.prewarmer
+        if self.prewarmer:
+            self.prewarmer.cancel()
+        
+        try:
+            paths = self._prewarm_paths(version_id)
+        except (OSError, ValueError):
+            return None
+        self.prewarmer = PageCachePrewarmer(version_id, paths).start()
+        return self.prewarmer
+    
+    def _log_index_sources(self):
+        """Dizinlenecek loglar ve tüm oyun dizinlerinin çökme raporları"""
+        game_dirs = {DEFAULT_INSTANCE: self.minecraft_dir}
+        game_dirs.update({instance.name: instance.game_dir for instance in self.instances.list()})
+        return log_sources(self.launcher_dir / "logs", game_dirs)
+    
+    def _start_log_indexer(self):
+        """Log dizinini arka planda güncel tut"""
+        if not self.config.get("log_index", True) or self.log_indexer or not fts_available():
+            return self.log_indexer
+        self.log_indexer = LogIndexer(self.log_index, self._log_index_sources).start()
+        return self.log_indexer
+    
+    def _collect_metrics(self):
+        """Dışa aktarılan ölçümler: son oyunun süreci ve GC'si, indirmeler, başlatma süreleri"""
+        timeline = self.last_launch_timeline
+        # "instance" Prometheus'un hedef etiketidir (çakışınca exported_instance olur); oyunun instance'ı ayrı adla
+        labels = {}
+        if timeline:
+            labels = {"version": timeline.version_id, "game_instance": timeline.meta.get("instance", DEFAULT_INSTANCE)}
+        families = process_families(self.game_sampler, labels)
+        if self.game_gc_parser:
+            families += gc_families(self.game_gc_parser.summary(), GC_HISTOGRAM_BOUNDS_MS, labels)
+        families += download_families(DOWNLOAD_STATS.snapshot(), LATENCY_BOUNDS_S)
+        families += self.launch_metrics.families()
+        return families
+    
+    def _start_metrics_exporter(self) -> Optional[str]:
+        """
+        Ölçüm uç noktasını aç (config "metrics_exporter")
+        
+        Returns:
+            Hata mesajı (port kullanımda vb.) ya da None
+        """
+        if not self.config.get("metrics_exporter", False) or self.metrics_exporter:
+            return None
+        exporter = MetricsExporter(self._collect_metrics, self.config.get("metrics_host", METRICS_HOST),
+                                   self.config.get("metrics_port", METRICS_PORT))
+        try:
+            self.metrics_exporter = exporter.start()
+        except OSError as e:
+            return f"{exporter.host}:{exporter.port} dinlenemedi: {e}"
+        return None
+    
+    def _stop_metrics_exporter(self):
+        if self.metrics_exporter:
+            self.metrics_exporter.stop()
+            self.metrics_exporter = None
+    
+    def _index_finished_log(self, log_file, exit_code):
+        """Oyun kapandı: çıkış kodunu dizine yaz, logu beklemeden dizinlet"""
+        try:
+            self.log_index.annotate(log_file, exit_code=exit_code)
+        except Exception:
+            pass
+        if self.log_indexer:
+            self.log_indexer.trigger()
+    
+    def _record_page_cache(self, timeline, version_id: str):
+        """Başlatma anında dosyaların ne kadarının önbellekte olduğunu ölç"""
+        if self.prewarmer and self.prewarmer.key == version_id:
+            paths = self.prewarmer.paths
+            timeline.set("prewarm", self.prewarmer.report())
+        else:
+            try:
+                paths = self._prewarm_paths(version_id)
+            except (OSError, ValueError):
+                return
+        ratio = resident_ratio(paths)
+        timeline.set("page_cache", classify_ratio(ratio))
+        if ratio is not None:
+            timeline.set("page_cache_ratio", round(ratio, 3))
+    
+    def _spawn_game(self, command, current_env, log_file, version_id: str, instance, timeline):
+        """Oyunu kendi cgroup'unda (açıksa) başlat ve çalışan oyunlara kaydet"""
+        config = instance.apply(self.config) if instance else self.config
+        name = instance.name if instance else DEFAULT_INSTANCE
+        heap_mb = self.last_launch_spec.max_heap_mb if self.last_launch_spec else 4096
+        governed = CgroupGovernor(config).prepare(name, limits_for(heap_mb, config))
+        if governed.method != METHOD_OFF:
+            self.console.print(f"[dim]🧩 Cgroup ({governed.describe()})[/dim]")
+        if governed.reason and config.get("cgroup_governor", METHOD_OFF) != METHOD_OFF:
+            self.console.print(f"[yellow]⚠️ Cgroup: {governed.reason}[/yellow]")
+        timeline.set("cgroup", dict(governed.limits.to_dict(), method=governed.method, unit=governed.unit))
+        
+        # Sarmalayıcıların kendi maliyeti (zincir değişmedikçe önbellekten)
+        wrapper_chain = self.last_launch_spec.wrapper_chain if self.last_launch_spec else None
+        if wrapper_chain:
+            with timeline.phase("wrapper_probe"):
+                timeline.set("wrapper_overhead_ms", self.wrapper_probe.overhead_ms(wrapper_chain))
+        timeline.set("wrappers", wrapper_chain.key() if wrapper_chain else "-")
+        if wrapper_chain and wrapper_chain.skipped:
+            timeline.set("wrappers_skipped", [f"{spec}: {reason}" for spec, reason in wrapper_chain.skipped])
+        
+        gc_log = self.last_launch_spec.gc_log if self.last_launch_spec else None
+        if gc_log:
+            prepare_gc_log(gc_log)
+            timeline.set("gc_log", str(gc_log))
+            timeline.set("gc_pause_target", self.last_launch_spec.gc_pause_target)
+        heap_dump_dir = self.last_launch_spec.heap_dump_dir if self.last_launch_spec else None
+        if heap_dump_dir:
+            prepare_heap_dumps(heap_dump_dir, self.config.get("heap_dump_cap_mb", HEAP_DUMP_CAP_MB),
+                               self.last_launch_spec.max_heap_mb)
+        
+        with timeline.phase("spawn"):
+            with open(log_file, 'w') as log:
+                process = subprocess.Popen(
+                    governed.wrap(command),
+                    stdout=log,
+                    stderr=subprocess.STDOUT,
+                    env=current_env,
+                    start_new_session=True
+                )
+        timeline.mark("spawned")
+        self._register_game(process, version_id, instance, log_file)
+        game_dir = instance.game_dir if instance else self.minecraft_dir
+        timeline.set("session_id", self.sessions.begin(version_id, name, settings_snapshot(config, self.last_launch_spec, game_dir),
+                                                        timeline.started_at, log_file, process.pid))
+        return process
+    
+    def _cgroup_status(self, pid: int) -> Optional[str]:
+        """Launcher'ın açtığı cgroup'un kısa durumu (bellek, high/oom olayları)"""
+        cgroup_dir = governed_cgroup(pid)
+        stats = read_cgroup_stats(cgroup_dir) if cgroup_dir else None
+        if not stats or stats["memory_mb"] is None:
+            return None
+        events = stats["events"]
+        limit = f"/{stats['memory_max_mb']:.0f}" if stats["memory_max_mb"] else ""
+        return f"cgroup {stats['memory_mb']:.0f}{limit} MB, high {events.get('high', 0)}, oom {events.get('oom_kill', 0)}"
+    
+    def _cgroup_usage(self, pid: int) -> str:
+        """Çalışan oyunlar tablosu için cgroup bellek kullanımı / sınırı"""
+        cgroup_dir = governed_cgroup(pid)
+        stats = read_cgroup_stats(cgroup_dir) if cgroup_dir else None
+        if not stats or stats["memory_mb"] is None:
+            return "-"
+        limit = f"/{stats['memory_max_mb']:.0f}" if stats["memory_max_mb"] else ""
+        high_events = stats["events"].get("high", 0)
+        return f"{stats['memory_mb']:.0f}{limit} MB" + (f" [red]⚠{high_events}[/red]" if high_events else "")
+    
+    def _register_game(self, process, version_id: str, instance, log_file):
+        """Başlatılan süreci çalışan oyunlar kaydına ekle"""
+        try:
+            self.running_games.register(
+                process.pid,
+                instance.name if instance else DEFAULT_INSTANCE,
+                version_id,
+                instance.game_dir if instance else self.minecraft_dir,
+                log_file
+            )
+        except OSError as e:
+            if self.config.get("debug", False):
+                self.console.print(f"[yellow]⚠️ Süreç kaydedilemedi: {e}[/yellow]")
+    
+    def _show_instance_started(self, instance, process, watcher):
+        """Instance başladı - launcher'ı bloklamadan menüye dön"""
+        if watcher.state == STATE_READY:
+            self.console.print(f"[green]🎮 {instance.name} hazır ({watcher.reason})[/green]")
+        else:
+            self.console.print(f"[yellow]💡 {instance.name} başlatıldı, pencere bekleniyor...[/yellow]")
+        self.console.print(f"[blue]🔢 Process ID: {process.pid}[/blue]")
+        self.console.print(f"[dim]📂 Oyun dizini: {instance.game_dir}[/dim]")
+        self.console.print("[cyan]Instance arka planda çalışıyor; 'Instance'lar → Çalışan Oyunlar' ile izleyebilirsiniz.[/cyan]")
+        input("[dim]Enter...[/dim]")
+    
+    def _show_instances_menu(self):
+        """Instance listesi: başlat, oluştur, düzenle, sil"""
+        while True:
+            os.system('clear')
+            instances = self.instances.list()
+            running = {r["instance"]: r for r in self.running_games.running()}
+            
+            menu_items = []
+            for i, instance in enumerate(instances, 1):
+                record = running.get(instance.name)
+                status = f"▶ çalışıyor (PID {record['pid']})" if record else "durdu"
+                menu_items.append({"key": str(i), "label": instance.name,
+                                   "description": f"{instance.version_id} - {status}",
+                                   "color": "green" if record else "cyan"})
+            menu_items.append({"key": "N", "label": "Yeni Instance", "description": "Ayrı oyun dizini oluştur", "color": "yellow"})
+            menu_items.append({"key": "R", "label": "Çalışan Oyunlar", "description": f"{len(running)} süreç", "color": "magenta"})
+            
+            choice = self.navigator.show_menu("INSTANCE'LAR", menu_items, show_exit=True)
+            if choice is None or choice == "0":
+                return
+            if choice == "N":
+                self._create_instance()
+            elif choice == "R":
+                self._show_running_games()
+            elif choice.isdigit() and 1 <= int(choice) <= len(instances):
+                self._show_instance_actions(instances[int(choice) - 1])
+    
+    def _create_instance(self):
+        """Yeni instance oluştur"""
+        installed = self._get_installed_versions()
+        if not installed:
+            self.console.print("[yellow]⚠️ Önce bir sürüm indirin[/yellow]")
+            input("[dim]Enter...[/dim]")
+            return
+        
+        name = Prompt.ask("Instance adı (harf, rakam, . _ -)").strip()
+        menu_items = [{"key": str(i), "label": v, "description": "", "color": "cyan"} for i, v in enumerate(installed[:20], 1)]
+        choice = self.navigator.show_menu("SÜRÜM SEÇ", menu_items, show_exit=True)
+        if not choice or choice == "0":
+            return
+        version_id = installed[int(choice) - 1]
+        
+        memory = Prompt.ask("Bellek (GB, boş = launcher ayarı)", default="").strip() or None
+        if memory and memory != "auto" and not memory.isdigit():
+            self.console.print("[red]❌ Bellek bir sayı ya da 'auto' olmalı[/red]")
+            input("[dim]Enter...[/dim]")
+            return
+        username = Prompt.ask("Oyuncu adı (boş = launcher ayarı)", default="").strip() or None
+        copy_from = self.minecraft_dir if Confirm.ask("options.txt ve sunucu listesi kopyalansın mı?", default=True) else None
+        
+        try:
+            instance = self.instances.create(name, version_id, memory, username, copy_from)
+        except (ValueError, OSError) as e:
+            self.console.print(f"[red]❌ {e}[/red]")
+        else:
+            self.console.print(f"[green]✅ Instance oluşturuldu: {instance.name} ({instance.game_dir})[/green]")
+        input("[dim]Enter...[/dim]")
+    
+    def _show_instance_actions(self, instance):
+        """Tek instance için işlemler"""
+        record = self.running_games.find(instance.name)
+        menu_items = [
+            {"key": "1", "label": "Başlat", "description": instance.version_id, "color": "green"},
+            {"key": "2", "label": "Düzenle", "description": f"Bellek: {instance.memory or 'varsayılan'}, Oyuncu: {instance.username or 'varsayılan'}", "color": "cyan"},
+            {"key": "3", "label": "Sil", "description": "Oyun dizini ve dünyalar silinir", "color": "red"},
+            {"key": "4", "label": "Sarmalayıcılar", "description": "launcher ayarı" if instance.wrappers is None else (", ".join(instance.wrappers) or "yok"), "color": "magenta"},
+            {"key": "5", "label": "Betik Dışa Aktar", "description": "Launcher'sız açılan sh betiği / masaüstü kısayolu", "color": "blue"},
+        ]
+        if record:
+            menu_items[0] = {"key": "1", "label": "Durdur", "description": f"PID {record['pid']}", "color": "yellow"}
+        choice = self.navigator.show_menu(f"INSTANCE: {instance.name}", menu_items, show_exit=True)
+        
+        if choice == "1" and record:
+            self._stop_game(record)
+        elif choice == "1":
+            self._launch_minecraft(instance.version_id, instance=instance)
+        elif choice == "2":
+            memory = Prompt.ask("Bellek (GB, boş = launcher ayarı)", default=instance.memory or "").strip() or None
+            username = Prompt.ask("Oyuncu adı (boş = launcher ayarı)", default=instance.username or "").strip() or None
+            installed = self._get_installed_versions()
+            version_id = Prompt.ask("Sürüm", default=instance.version_id).strip()
+            if version_id not in installed:
+                self.console.print(f"[yellow]⚠️ Sürüm kurulu değil, değiştirilmedi: {version_id}[/yellow]")
+                version_id = instance.version_id
+            instance.memory, instance.username, instance.version_id = memory, username, version_id
+            self.instances.update(instance)
+            self.console.print("[green]✅ Kaydedildi[/green]")
+            input("[dim]Enter...[/dim]")
+        elif choice == "3":
+            if record:
+                self.console.print("[red]❌ Çalışan instance silinemez[/red]")
+            elif Confirm.ask(f"{instance.name} ve tüm dünyaları silinsin mi?", default=False):
+                self.instances.delete(instance.name)
+                self.console.print("[green]✅ Silindi[/green]")
+            input("[dim]Enter...[/dim]")
+        elif choice == "4":
+            self._show_wrapper_settings(instance)
+        elif choice == "5":
+            self._export_launch_script(instance.version_id, instance)
+    
+    def _export_launch_script(self, version_id: str, instance=None):
+        """Çözülmüş başlatma komutunu bağımsız bir sh betiğine yaz"""
+        instance_name = instance.name if instance else None
+        script_path, desktop_path = default_export_paths(self.paths, version_id, instance_name)
+        try:
+            self._select_runtime_for_version(version_id)
+            command, env_vars = self._create_launch_command(version_id, instance)
+            config = instance.apply(self.config) if instance else self.config
+            env, _ = launch_environment(os.environ, env_vars, config,
+                                        self.last_launch_spec.wrapper_chain.environment())
+            desktop = Confirm.ask("Uygulama menüsü için .desktop dosyası da oluşturulsun mu?", default=True)
+            result = export_launch_script(self.paths, self.last_launch_spec, env, os.environ, version_id,
+                                          self.java_executable, instance.game_dir if instance else self.minecraft_dir,
+                                          script_path, instance_name=instance_name,
+                                          desktop_file=desktop_path if desktop else None)
+        except Exception as e:
+            self.console.print(f"[red]❌ Betik oluşturulamadı: {e}[/red]")
+            input("[dim]Enter...[/dim]")
+            return
+        
+        self.console.print(f"[green]✅ Betik: {result['script']}[/green]")
+        if result["desktop"]:
+            self.console.print(f"[green]✅ Masaüstü girdisi: {result['desktop']}[/green]")
+        self.console.print(f"[dim]{result['files']} dosya izleniyor; kurulum değişirse betik 'berkemc export' ile kendini yeniler.[/dim]")
+        self.console.print("[dim]Not: Betik cgroup sınırlarını ve çalışan oyun kaydını uygulamaz.[/dim]")
+        input("[dim]Enter...[/dim]")
+    
+    def _show_wrapper_settings(self, instance=None):
+        """Başlatma sarmalayıcı zincirini düzenle (instance verilirse yalnız onun için)"""
+        while True:
+            config = instance.apply(self.config) if instance else self.config
+            automatic = config.get("launch_wrappers", WRAPPER_AUTO) == WRAPPER_AUTO
+            specs = wrapper_specs(config)
+            
+            menu_items = []
+            for i, spec in enumerate(specs, 1):
+                try:
+                    wrapper = parse_wrapper(spec)
+                    problem = validate_wrapper(wrapper)
+                    command = " ".join(wrapper.argv) or "(yalnız ortam değişkenleri)"
+                except ValueError as e:
+                    problem, command = str(e), ""
+                status = f"[red]atlanır: {problem}[/red]" if problem else f"[green]✓[/green] {command}"
+                menu_items.append({"key": str(i), "label": spec, "description": status, "color": "cyan"})
+            
+            source = "otomatik" if automatic else ("launcher ayarı" if instance and instance.wrappers is None else "elle")
+            menu_items += [
+                {"key": "E", "label": "Ekle", "description": "Bilinen ya da özel sarmalayıcı", "color": "green"},
+                {"key": "A", "label": "Otomatik", "description": f"Kurulu olanlardan: {', '.join(AUTO_WRAPPERS)}", "color": "blue"},
+                {"key": "K", "label": "Sarmalayıcısız", "description": "Java doğrudan başlatılır", "color": "yellow"},
+                {"key": "T", "label": "Maliyeti Ölç", "description": "Zincirin başlatmaya eklediği süre", "color": "magenta"},
+            ]
+            if instance:
+                menu_items.append({"key": "L", "label": "Launcher Ayarı", "description": "Instance'a özel zinciri kaldır", "color": "blue"})
+            title = f"SARMALAYICILAR ({source})" + (f" - {instance.name}" if instance else "")
+            choice = self.navigator.show_menu(title, menu_items, show_exit=True)
+            if not choice or choice == "0":
+                return
+            
+            new_specs = None
+            if choice.isdigit():
+                index = int(choice) - 1
+                action = self.navigator.show_menu(specs[index], [
+                    {"key": "1", "label": "Yukarı Taşı", "description": "Zincirde daha dışta çalışır", "color": "cyan"},
+                    {"key": "2", "label": "Kaldır", "description": "", "color": "red"},
+                ], show_exit=True)
+                if action == "1" and index > 0:
+                    specs[index - 1], specs[index] = specs[index], specs[index - 1]
+                    new_specs = specs
+                elif action == "2":
+                    new_specs = specs[:index] + specs[index + 1:]
+            elif choice == "E":
+                available = detect_wrappers()
+                add_items = [{"key": str(i), "label": name,
+                              "description": ("[green]kurulu[/green] " if available[name] else "[dim]yok[/dim] ") + info["description"],
+                              "color": "cyan"}
+                             for i, (name, info) in enumerate(KNOWN_WRAPPERS.items(), 1)]
+                add_items.append({"key": "Ö", "label": "Özel Komut", "description": "Örn. DXVK_HUD=1 /yol/betik --bayrak", "color": "magenta"})
+                selected = self.navigator.show_menu("SARMALAYICI EKLE", add_items, show_exit=True)
+                spec = None
+                if selected == "Ö":
+                    spec = Prompt.ask("Komut").strip()
+                elif selected and selected != "0":
+                    name = add_items[int(selected) - 1]["label"]
+                    spec = name
+                    if "{arg}" in " ".join(KNOWN_WRAPPERS[name]["args"]):
+                        default = KNOWN_WRAPPERS[name].get("default_arg", "")
+                        value = Prompt.ask(f"{name} değeri", default=default).strip()
+                        spec = f"{name}:{value}" if value else name
+                if spec:
+                    try:
+                        problem = validate_wrapper(parse_wrapper(spec))
+                    except ValueError as e:
+                        problem = str(e)
+                    if problem:
+                        self.console.print(f"[yellow]⚠️ {problem} - başlatırken atlanacak[/yellow]")
+                        input("[dim]Enter...[/dim]")
+                    new_specs = specs + [spec]
+            elif choice == "A":
+                new_specs = WRAPPER_AUTO
+            elif choice == "K":
+                new_specs = []
+            elif choice == "L":
+                instance.wrappers = None
+                self.instances.update(instance)
+            elif choice == "T":
+                chain = resolve_chain(config)
+                overhead = self.wrapper_probe.overhead_ms(chain, refresh=True)
+                if overhead is None:
+                    self.console.print("[yellow]⚠️ Ölçülemedi[/yellow]")
+                else:
+                    self.console.print(f"[cyan]{chain.key()}: başlatma başına +{overhead:.1f} ms[/cyan]")
+                    for key, value in chain.environment().items():
+                        self.console.print(f"[dim]   {key}={value}[/dim]")
+                self.console.print("[dim]Açılış süresine etkisi: Performans → Başlatma Profili[/dim]")
+                input("[dim]Enter...[/dim]")
+            
+            if new_specs is not None:
+                if instance:
+                    instance.wrappers = new_specs
+                    self.instances.update(instance)
+                else:
+                    self.config["launch_wrappers"] = new_specs
+                    self._save_config()
+    
+    def _stop_game(self, record: Dict):
+        """Çalışan oyunu SIGTERM ile kapat"""
+        import signal
+        if Confirm.ask(f"{record['instance']} (PID {record['pid']}) kapatılsın mı?", default=False):
+            try:
+                os.kill(record["pid"], signal.SIGTERM)
+                self.console.print("[yellow]Kapatma sinyali gönderildi[/yellow]")
+            except ProcessLookupError:
+                pass
+            self.running_games.unregister(record["pid"])
+    
+    def _show_running_games(self):
+        """Çalışan tüm oyunları (menüden ve CLI'dan başlatılan) izle"""
+        import select
+        previous = {}
+        while True:
+            os.system('clear')
+            records = self.running_games.running()
+            now = time.monotonic()
+            
+            table = Table(title="🎮 Çalışan Oyunlar", show_header=True, header_style="bold cyan", box=box.SIMPLE)
+            table.add_column("#", style="dim", justify="right")
+            table.add_column("Instance", style="white")
+            table.add_column("Sürüm", style="cyan")
+            table.add_column("PID", justify="right")
+            table.add_column("Süre", justify="right")
+            table.add_column("RAM", justify="right", style="green")
+            table.add_column("CPU", justify="right", style="yellow")
+            table.add_column("Cgroup", justify="right", style="magenta")
+            
+            current = {}
+            for i, record in enumerate(records, 1):
+                pid = record["pid"]
+                stats = process_stats(pid)
+                cpu = "-"
+                if stats:
+                    current[pid] = (now, stats["cpu_seconds"])
+                    if pid in previous and now > previous[pid][0]:
+                        cpu = f"{(stats['cpu_seconds'] - previous[pid][1]) / (now - previous[pid][0]) * 100:.0f}%"
+                uptime = int(time.time() - record.get("started_at", time.time()))
+                table.add_row(
+                    str(i), record["instance"], record["version"], str(pid),
+                    f"{uptime // 3600}:{uptime // 60 % 60:02d}:{uptime % 60:02d}",
+                    f"{stats['rss_mb']:.0f} MB" if stats else "-", cpu,
+                    self._cgroup_usage(pid)
+                )
+            previous = current
+            
+            if records:
+                self.console.print(table)
+            else:
+                self.console.print("[yellow]Çalışan oyun yok[/yellow]")
+            self.console.print("[dim]Numara + Enter = durdur | Enter = geri (2 sn'de bir yenilenir)[/dim]")
+            
+            ready, _, _ = select.select([sys.stdin], [], [], 2.0)
+            if not ready:
+                continue
+            key = sys.stdin.readline().strip()
+            if key.isdigit() and 1 <= int(key) <= len(records):
+                self._stop_game(records[int(key) - 1])
+                continue
+            return
+    
+    def _follow_game_log(self, timeline, process, log_file, instance=None):
+        """Oyun logunu takip et: başlatma durumu ve açılış kilometre taşları"""
+        mods_dir = (instance.game_dir if instance else self.minecraft_dir) / "mods"
+        timeline.set("pid", process.pid)
+        timeline.set("log_file", str(log_file))
+        timeline.set("java_path", self.java_executable)
+        timeline.set("mod_count", len(list(mods_dir.glob("*.jar"))) if mods_dir.exists() else 0)
+        
+        # GC logu ayrı takipçiyle artımlı ayrıştırılır; oyun kapanınca özet logun yanına yazılır
+        spec = self.last_launch_spec
+        gc_parser = None
+        if spec and spec.gc_log and spec.gc_log.exists():
+            gc_parser = GcLogParser(spec.gc_pause_target)
+            gc_follower = LogFollower(spec.gc_log, is_alive=lambda: process.poll() is None)
+            gc_follower.subscribe(gc_parser.feed)
+            gc_follower.on_eof(lambda: save_gc_summary(spec.gc_log, gc_parser.summary()))
+            gc_follower.start()
+        
+        # Hata sınıflandırması oyun çalışırken yapılır; ilk eşleşmeler olay olarak kuyruğa düşer
+        classifier = LogClassifier(self.log_rules)
+        events = deque(maxlen=50)
+        classifier.add_listener(events.append)
+        
+        # Oturum ölçümleri izleme ekranı açık olmasa da oyun kapanana kadar toplanır
+        session_id = timeline.meta.get("session_id")
+        recorder = SessionRecorder()
+        sampler = MetricsSampler(self.config.get("monitor_interval", METRICS_INTERVAL))
+        sampler.add_listener(recorder.feed)
+        sampler.watch(process.pid)
+        sampler.start()
+        
+        # JVM içi ölçümler jcmd ile (JDK yoksa atlanır); sınıf histogramları istek üzerine
+        jvm = None
+        jcmd = self._jdk_tool("jcmd") if self.config.get("jvm_introspection", True) else None
+        if jcmd:
+            jvm = JvmIntrospector(jcmd, process.pid, self.config.get("jvm_poll_interval", JVM_POLL_INTERVAL), mods_dir)
+            jvm.start()
+        heap_dump_dir = spec.heap_dump_dir if spec else None
+        
+        # Donma bekçisi oyun hazır olunca kurulur; dökümler monitörden elle de alınabilir
+        watchdog = HangWatchdog(process.pid, lambda kind, reason: self._capture_hang(
+                                    process, timeline, log_file, mods_dir, kind, reason),
+                                sampler=sampler, last_output=lambda: follower.last_line_at,
+                                stall_seconds=self.config.get("hang_stall_seconds", HANG_STALL_SECONDS))
+        self.game_hang = None
+        
+        def finish():
+            exit_code = process.poll()
+            if exit_code is not None:
+                timeline.set("exit_code", exit_code)
+            if classifier.counts():
+                timeline.set("log_errors", classifier.counts())
+            try:
+                self.launch_history.update(timeline.to_dict())
+            except OSError:
+                pass
+            if "main_menu" in timeline.milestones or "state_ready" in timeline.milestones:
+                try:
+                    self.sessions.update(session_id, startup_ms=time_to_play_ms(timeline.to_dict()))
+                except Exception:
+                    pass
+        
+        def on_state(state, reason):
+            timeline.mark(f"state_{state}")
+            # Oyun hazır olduysa kurulum sağlam: sonraki başlatma hızlı yoldan gidebilir
+            fingerprint = timeline.meta.get("fingerprint")
+            if state == STATE_READY and fingerprint:
+                self.launch_fingerprints.set(timeline.version_id, fingerprint)
+            if state == STATE_READY and self.config.get("hang_watchdog", True):
+                watchdog.start()
+        
+        watcher = LaunchStateWatcher(process)
+        watcher.add_listener(on_state)
+        tracker = MilestoneTracker(timeline, on_finish=finish)
+        
+        follower = LogFollower(log_file, is_alive=lambda: process.poll() is None)
+        follower.subscribe(watcher.feed)
+        follower.subscribe(tracker.feed)
+        follower.subscribe_block(classifier.feed_block)
+        # Ana menüye ulaşıldıysa kayıt orada yazıldı; log bitince çıkış kodu ve hatalarla yeniden yazılır
+        follower.on_eof(lambda: finish() if tracker.is_complete() else tracker.finish())
+        follower.on_eof(lambda: self._index_finished_log(log_file, process.poll()))
+        follower.on_eof(lambda: self._finish_session(session_id, process, timeline, sampler, recorder, classifier, gc_parser,
+                                                     jvm, heap_dump_dir, watchdog))
+        follower.start()
+        
+        self.game_log_follower = follower
+        self.game_sampler = sampler
+        self.game_gc_parser = gc_parser
+        self.game_jvm = jvm
+        self.game_watchdog = watchdog
+        self.game_log_classifier = classifier
+        self.game_log_events = events
+        self.last_launch_timeline = timeline
+        return watcher
+    
+    def _finish_session(self, session_id, process, timeline, sampler, recorder, classifier, gc_parser=None,
+                        jvm=None, heap_dump_dir=None, watchdog=None):
+        """Oyun kapandı: oturumu sonuç, ölçüm/JVM özeti ve seriyle kapat"""
+        sampler.stop()
+        if watchdog:
+            watchdog.stop()
+        exit_code = process.poll()
+        ready = ("state_ready" in timeline.milestones or "main_menu" in timeline.milestones
+                 or timeline.meta.get("startup_state") in (STATE_READY, STATE_TIMEOUT))
+        jvm_summary = {}
+        if jvm:
+            jvm.stop()
+            jvm_summary = jvm.summary()
+        if heap_dump_dir:
+            jvm_summary["heap_dump"] = new_heap_dump(heap_dump_dir, timeline.started_at)
+            # Yeni döküm sınırı aştırdıysa eskiler gider (yenisi kalır)
+            prune_heap_dumps(heap_dump_dir, self.config.get("heap_dump_cap_mb", HEAP_DUMP_CAP_MB))
+        try:
+            outcome = outcome_for(exit_code, ready, classifier.counts(), hung=bool(watchdog and watchdog.stalled))
+            self.sessions.finish(session_id, exit_code, outcome, recorder,
+                                 gc_parser.summary() if gc_parser else None, jvm_summary=jvm_summary)
+        except Exception:
+            pass
+    
+    def _capture_hang(self, process, timeline, log_file, mods_dir, kind: str, reason: str) -> Optional[Dict]:
+        """
+        İş parçacığı dökümlerini al, takılı iş parçacıklarını bul ve oturuma bağla
+        
+        Bekçinin iş parçacığında çalışır; monitör sonucu self.game_hang'den okur.
+        """
+        java_pid = jvm_pid(process.pid)
+        if java_pid is None or process.poll() is not None:
+            return None
+        out_dir = hang_dir(self.hangs_dir, timeline.version_id)
+        files = capture_thread_dumps(java_pid, out_dir, self._jdk_tool("jcmd"), log_file)
+        if not files:
+            return None
+        analysis = analyze_dumps(files, mods_dir=mods_dir)
+        save_analysis(out_dir, kind=kind, reason=reason, **analysis)
+        try:
+            self.sessions.record_hang(timeline.meta.get("session_id"), out_dir, reason, analysis["stuck"])
+        except Exception:
+            pass
+        self.game_hang = dict(analysis, pid=process.pid, dir=out_dir, kind=kind, reason=reason)
+        return self.game_hang
+    
+    def _wait_for_game_state(self, watcher, timeline, show_progress: bool = True) -> str:
+        """Oyun hazır olana, hata verene ya da kapanana kadar bekle (sabit bekleme yok)"""
+        timeout = self.config.get("launch_ready_timeout", 60)
+        with timeline.phase("startup_wait"):
+            if show_progress:
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    TimeElapsedColumn(),
+                    console=self.console,
+                    transient=True
+                ) as progress:
+                    progress.add_task("[cyan]Minecraft başlatılıyor...", total=None)
+                    state = watcher.wait(timeout)
+            else:
+                state = watcher.wait(timeout)
+        
+        # Logda hata görüldü ama oyun kapanmadıysa (yakalanmış hata) izlemeye devam et
+        if state == STATE_FAILED and watcher.wait_for_exit(5.0) is None:
+            self.console.print(f"[yellow]⚠️ Logda hata görüldü, oyun çalışmaya devam ediyor: {watcher.reason}[/yellow]")
+            state = STATE_READY
+        
+        timeline.set("startup_state", state)
+        if state == STATE_TIMEOUT:
+            self.console.print(f"[yellow]⚠️ {timeout} saniyede hazır sinyali gelmedi, izlemeye geçiliyor[/yellow]")
+            # Yüklemede takılan oyun da donma sayılır
+            if self.game_watchdog and self.config.get("hang_watchdog", True):
+                self.game_watchdog.start()
+        return state
+    
+    def _show_launch_failure(self, watcher, log_file, command, current_env):
+        """Başlatma hatasını log içeriğiyle göster"""
+        # Logun geri kalanının okunmasını bekle
+        if self.game_log_follower:
+            self.game_log_follower.join(2.0)
+        # Sınıflandırma oyun çalışırken yapıldı; ekranda yalnız logun sonu gösterilir
+        try:
+            log_content = read_tail(log_file)
+        except OSError:
+            log_content = "Log dosyası okunamadı"
+        
+        if watcher.state == STATE_EXITED and watcher.exit_code == 0:
+            self.console.print("[yellow]Minecraft kapandı![/yellow]")
+            input("[dim]Enter...[/dim]")
+            return
+        
+        # Başarısız başlatmadan sonra hızlı yol kullanılmasın
+        if self.last_launch_timeline:
+            self.launch_fingerprints.invalidate(self.last_launch_timeline.version_id)
+            # Açılış arşivle başarısızsa bir sonraki açılış arşivi yeniden kaydetsin
+            if self.last_launch_spec and self.last_launch_spec.cds_plan.mode == CDS_USE:
+                self.cds_store.invalidate(self.last_launch_timeline.version_id)
+        
+        self.console.print("[red]❌ Minecraft başlatılamadı![/red]")
+        if watcher.reason:
+            self.console.print(f"[red]   {watcher.reason}[/red]")
+        self._show_detailed_error("", log_content, command, current_env, self.game_log_classifier)
+        input("[dim]Enter...[/dim]")
+    
+    def _show_launch_profiles(self):
+        """Son başlatmaların zaman çizelgelerini sürüm bazında karşılaştır"""
+        versions = self.launch_history.versions()
+        if not versions:
+            self.console.print("[yellow]⚠️ Henüz başlatma kaydı yok[/yellow]")
+            input("[dim]Enter...[/dim]")
+            return
+        
+        menu_items = [{"key": str(i), "label": v, "description": f"{len(self.launch_history.load(v, limit=0))} kayıt", "color": "cyan"}
+                      for i, v in enumerate(versions[:20], 1)]
+        choice = self.navigator.show_menu("BAŞLATMA PROFİLİ", menu_items, show_exit=True)
+        if not choice or choice == "0":
+            return
+        version_id = versions[int(choice) - 1]
+        
+        try:
+            limit = int(Prompt.ask("Kaç başlatma karşılaştırılsın?", default="10"))
+        except ValueError:
+            limit = 10
+        records = self.launch_history.load(version_id, limit=limit)
+        
+        os.system('clear')
+        table = Table(title=f"⏱️ {version_id} - Son {len(records)} Başlatma", show_header=True, header_style="bold cyan", box=box.SIMPLE)
+        table.add_column("Tarih", style="white")
+        table.add_column("Java", style="dim")
+        phase_labels = {"java_check": "Java", "pre_launch_check": "Kontrol", "asset_verify": "Asset",
+                        "build_command": "Komut", "spawn": "Spawn", "startup_wait": "Bekleme"}
+        for phase in PHASE_ORDER:
+            table.add_column(phase_labels.get(phase, phase), justify="right")
+        milestone_labels = {"first_output": "İlk Log", "lwjgl_init": "LWJGL", "resource_reload_start": "Reload▶",
+                            "sound_engine": "Ses", "resource_reload_done": "Reload✔", "main_menu": "Menü"}
+        for milestone in MILESTONE_ORDER:
+            table.add_column(milestone_labels.get(milestone, milestone), justify="right", style="green")
+        table.add_column("Önbellek", justify="right", style="dim")
+        table.add_column("Sarmalayıcı", style="dim")
+        table.add_column("CDS", style="dim")
+        table.add_column("Çıkış", justify="right")
+        
+        def fmt_ms(value):
+            if value is None:
+                return "-"
+            return f"{value:.0f}ms" if value < 1000 else f"{value / 1000:.1f}s"
+        
+        for record in records:
+            phases = record.get("phases_ms", {})
+            milestones = record.get("milestones_ms", {})
+            meta = record.get("meta", {})
+            date = time.strftime("%d.%m %H:%M", time.localtime(record.get("started_at", 0)))
+            row = [date, str(meta.get("java_version") or "-")]
+            row += [fmt_ms(phases.get(phase)) for phase in PHASE_ORDER]
+            row += [fmt_ms(milestones.get(milestone)) for milestone in MILESTONE_ORDER]
+            row.append(meta.get("page_cache", "-"))
+            wrappers = meta.get("wrappers", "-")
+            if meta.get("wrapper_overhead_ms"):
+                wrappers += f" (+{fmt_ms(meta['wrapper_overhead_ms'])})"
+            row.append(wrappers)
+            row.append(meta.get("cds", CDS_OFF))
+            exit_code = meta.get("exit_code")
+            row.append("-" if exit_code is None else str(exit_code))
+            table.add_row(*row)
+        
+        self.console.print(table)
+        
+        # Oynanabilir süre özeti
+        totals = [t for t in (time_to_play_ms(r) for r in records) if t is not None]
+        if totals:
+            self.console.print(
+                f"[cyan]Oynanabilir süre:[/cyan] ortalama {fmt_ms(sum(totals) / len(totals))}, "
+                f"en iyi {fmt_ms(min(totals))}, en kötü {fmt_ms(max(totals))}"
+            )
+        
+        # Sıcak / soğuk önbellek karşılaştırması
+        for state, label in (("warm", "Sıcak önbellek"), ("partial", "Kısmi önbellek"), ("cold", "Soğuk önbellek")):
+            state_totals = [t for t in (time_to_play_ms(r) for r in records if r.get("meta", {}).get("page_cache") == state)
+                            if t is not None]
+            if state_totals:
+                self.console.print(f"[dim]{label}: ortalama {fmt_ms(sum(state_totals) / len(state_totals))} ({len(state_totals)} başlatma)[/dim]")
+        
+        # AppCDS arşiviyle / arşivsiz (kayıt yapan ilk açılış ayrı)
+        for mode, label in ((CDS_USE, "CDS arşiviyle"), (CDS_RECORD, "CDS kaydı (ilk açılış)"), (CDS_OFF, "CDS'siz")):
+            mode_totals = [t for t in (time_to_play_ms(r) for r in records if r.get("meta", {}).get("cds", CDS_OFF) == mode)
+                           if t is not None]
+            if mode_totals:
+                self.console.print(f"[dim]{label}: ortalama {fmt_ms(sum(mode_totals) / len(mode_totals))} ({len(mode_totals)} başlatma)[/dim]")
+        
+        # Sarmalayıcı zincirine göre karşılaştırma
+        by_chain = {}
+        for record in records:
+            total = time_to_play_ms(record)
+            if total is not None:
+                by_chain.setdefault(record.get("meta", {}).get("wrappers", "-"), []).append(total)
+        if len(by_chain) > 1:
+            for chain_key, chain_totals in sorted(by_chain.items()):
+                self.console.print(f"[dim]Sarmalayıcı {chain_key}: ortalama {fmt_ms(sum(chain_totals) / len(chain_totals))} ({len(chain_totals)} başlatma)[/dim]")
+        input("\n[dim]Enter...[/dim]")
+    
     def _pre_launch_check(self):
         """Başlatma öncesi sistem kontrolü"""
         self.console.print("[blue]🔍 Sistem kontrolü yapılıyor...[/blue]")
@@ -2399,12 +2931,13 @@ class MinecraftLauncher:
         if not self.java_executable:
             raise Exception("Java bulunamadı! Lütfen Java'yı yükleyin: sudo pacman -S jdk21-openjdk")
         
-        # Java versiyonu kontrolü
+        # Java versiyonu kontrolü (kayıt defterinden, gerekirse tek seferlik yoklama)
         try:
-            result = subprocess.run([self.java_executable, "-version"], capture_output=True, text=True)
-            if result.returncode != 0:
+            java_info = self.java_registry.info(self.java_executable)
+            if java_info is None:
                 raise Exception("Java çalıştırılamıyor!")
-            self.console.print(f"[green]✅ Java kontrolü: {result.stderr.split('\\n')[0]}[/green]")
+            vendor = f" ({java_info['vendor']})" if java_info.get("vendor") else ""
+            self.console.print(f"[green]✅ Java kontrolü: {java_info['version']}{vendor}[/green]")
         except Exception as e:
             raise Exception(f"Java test hatası: {e}")
         
@@ -2440,11 +2973,11 @@ class MinecraftLauncher:
         monitor_thread = threading.Thread(target=monitor, daemon=True)
         monitor_thread.start()
     
-    def _show_detailed_error(self, stdout, stderr, command, env):
+    def _show_detailed_error(self, stdout, stderr, command, env, classifier=None):
         """Gelişmiş hata yönetimi sistemi"""
-        self._show_fullscreen_error_menu(stdout, stderr, command, env)
+        self._show_fullscreen_error_menu(stdout, stderr, command, env, classifier)
     
-    def _show_fullscreen_error_menu(self, stdout, stderr, command, env):
+    def _show_fullscreen_error_menu(self, stdout, stderr, command, env, classifier=None):
         """Tam ekran hata yönetimi menüsü"""
         while True:
             os.system('clear')
@@ -2455,8 +2988,8 @@ class MinecraftLauncher:
             else:
                 error_lines = str(stderr).split('\n')
             
-            # Hata analizi
-            detected_errors = self._analyze_errors(error_lines)
+            # Hata analizi (oyun logu takip edilirken sınıflandırıldıysa o sonuç)
+            detected_errors = classifier.messages() if classifier else self._analyze_errors(error_lines)
             
             self.console.print(Panel(
                 "[bold red]❌ MINECRAFT BAŞLATMA HATASI[/bold red]\n"
@@ -2470,8 +3003,13 @@ class MinecraftLauncher:
             # Tespit edilen hatalar
             if detected_errors:
                 self.console.print("[bold red]🔍 Tespit Edilen Hatalar:[/bold red]")
-                for error in detected_errors:
-                    self.console.print(f"  • {error}")
+                if classifier:
+                    for detection in classifier.detections():
+                        self.console.print(f"  • {detection['rule'].message} "
+                                           f"[dim](satır {detection['first_line']}, {detection['count']} kez)[/dim]")
+                else:
+                    for error in detected_errors:
+                        self.console.print(f"  • {error}")
                 self.console.print()
             
             # Komut bilgileri
@@ -2533,79 +3071,18 @@ class MinecraftLauncher:
                 self._show_full_error_report(stdout, stderr, command, env)
     
     def _analyze_errors(self, error_lines):
-        """Hata satırlarını analiz et ve kategorize et"""
-        errors = []
-        
-        for line in error_lines:
-            line_lower = line.lower()
-            
-            # Java sürüm hataları
-            if "unsupportedclassversionerror" in line_lower:
-                errors.append("🚫 Java Sürüm Uyumsuzluğu: Minecraft Java 21+ gerektiriyor")
-            elif "could not create the java virtual machine" in line_lower:
-                errors.append("🚫 Java Virtual Machine oluşturulamadı")
-            elif "linkageerror" in line_lower:
-                errors.append("🔗 Java Sınıf Bağlantı Hatası")
-            
-            # LWJGL hataları
-            elif "lwjgl" in line_lower and "failed to load" in line_lower:
-                errors.append("📦 LWJGL Native Library Hatası")
-            elif "liblwjgl.so" in line_lower:
-                errors.append("📦 LWJGL Native Library Bulunamadı")
-            
-            # SSL hataları
-            elif "ssl" in line_lower and "handshake" in line_lower:
-                errors.append("🔒 SSL Sertifika Hatası")
-            elif "certificate" in line_lower:
-                errors.append("🔒 Sertifika Doğrulama Hatası")
-            
-            # Bellek hataları
-            elif "outofmemoryerror" in line_lower:
-                errors.append("💾 Bellek Yetersizliği")
-            elif "heap space" in line_lower:
-                errors.append("💾 Heap Space Hatası")
-            
-            # Grafik hataları
-            elif "opengl" in line_lower and "error" in line_lower:
-                errors.append("🖥️ OpenGL Hatası")
-            elif "graphics" in line_lower and "error" in line_lower:
-                errors.append("🖥️ Grafik Sürücü Hatası")
-            
-            # Asset hataları
-            elif "asset" in line_lower and "not found" in line_lower:
-                errors.append("📁 Asset Dosyası Bulunamadı")
-            
-            # Network hataları
-            elif "connection" in line_lower and "refused" in line_lower:
-                errors.append("🌐 Bağlantı Reddedildi")
-            elif "timeout" in line_lower:
-                errors.append("⏱️ Bağlantı Zaman Aşımı")
-        
-        return list(set(errors))  # Duplicate'leri kaldır
+        """Hata satırlarını error_rules.json kurallarıyla sınıflandır"""
+        classifier = LogClassifier(self.log_rules)
+        classifier.feed_block("\n".join(error_lines))
+        return classifier.messages()
     
     def _get_error_solutions(self, errors):
-        """Hatalar için çözüm önerileri"""
+        """Hatalar için çözüm önerileri (eşleşen kuralların önerileri)"""
         solutions = []
         
-        for error in errors:
-            if "Java Sürüm Uyumsuzluğu" in error:
-                solutions.append("Java 21+ kurun: sudo pacman -S jdk21-openjdk")
-                solutions.append("Java sürümünü değiştirin: Ayarlar > Java Yönetimi")
-            elif "LWJGL" in error:
-                solutions.append("Native library'leri çıkarın: ./fix_native_libraries.sh")
-                solutions.append("LWJGL cache'ini temizleyin")
-            elif "SSL" in error or "Sertifika" in error:
-                solutions.append("SSL sertifika cache'ini temizleyin")
-                solutions.append("Network ayarlarını kontrol edin")
-            elif "Bellek" in error:
-                solutions.append("Bellek ayarını artırın: Ayarlar > Bellek")
-                solutions.append("Diğer uygulamaları kapatın")
-            elif "OpenGL" in error or "Grafik" in error:
-                solutions.append("Grafik sürücülerini güncelleyin")
-                solutions.append("XWayland'i kontrol edin: sudo pacman -S xorg-server-xwayland")
-            elif "Asset" in error:
-                solutions.append("Minecraft cache'ini temizleyin")
-                solutions.append("Sürümü yeniden indirin")
+        for rule in self.log_rules:
+            if rule.message in errors:
+                solutions += [solution for solution in rule.solutions if solution not in solutions]
         
         # Genel çözümler
         if not solutions:
@@ -3400,7 +3877,8 @@ class MinecraftLauncher:
                 {"key": "8", "label": "Java Yönetimi", "description": "Java ayarlarini yönet", "color": "yellow"},
                 {"key": "9", "label": "Debug Modu", "description": f"Mevcut: {'Acik' if self.config.get('debug', False) else 'Kapali'}", "color": "red"},
                 {"key": "10", "label": "Ayarlari Sifirla", "description": "Varsayilana dön", "color": "red"},
-                {"key": "11", "label": "Sistem Testi", "description": "Kontrol et", "color": "blue"}
+                {"key": "11", "label": "Sistem Testi", "description": "Kontrol et", "color": "blue"},
+                {"key": "12", "label": "Her Başlatmada Doğrula", "description": f"Mevcut: {'Acik' if self.config.get('always_verify', False) else 'Kapali'}", "color": "yellow"}
             ]
             choice = self.navigator.show_menu("AYARLAR", menu_items, show_exit=True)
             if choice is None or choice == "0":
@@ -3441,7 +3919,7 @@ class MinecraftLauncher:
                 memory_table.add_column("Açıklama", style="white")
                 
                 for i, mem in enumerate(memory_options, 1):
-                    desc = "Otomatik (Sistem belleğinin %60'ı)" if mem == "auto" else f"{mem} GB"
+                    desc = "Otomatik (sürüm, modlar ve boş belleğe göre)" if mem == "auto" else f"{mem} GB"
                     memory_table.add_row(str(i), desc)
                 
                 self.console.print(memory_table)
@@ -3484,6 +3962,11 @@ class MinecraftLauncher:
                 self._reset_settings()
             elif choice == "11":
                 self._run_system_test()
+            elif choice == "12":
+                self.config["always_verify"] = not self.config.get("always_verify", False)
+                self._save_config()
+                self.console.print(f"[green]✅ Her başlatmada doğrulama: {'Açık' if self.config['always_verify'] else 'Kapalı'}[/green]")
+                input("[dim]Enter...[/dim]")
     
     def _configure_java_path(self):
         """Java yolu yapılandır"""
@@ -3524,6 +4007,7 @@ class MinecraftLauncher:
                 choice = int(Prompt.ask("Seçmek istediğiniz Java yolunun numarasını girin"))
                 if 1 <= choice <= len(available_paths):
                     self.config["java_path"] = available_paths[choice-1]
+                    self.config["java_runtime"] = RUNTIME_SYSTEM
                     self.java_executable = available_paths[choice-1]
                     self._save_config()
                     self.console.print(f"[green]✅ Java yolu güncellendi: {available_paths[choice-1]}[/green]")
@@ -4649,8 +5133,8 @@ class MinecraftLauncher:
         
         input("[dim]Enter...[/dim]")
     
-    def _show_game_monitor(self, process, version_id: str, log_file):
-        """Oyun çalışırken kaynak izleme - Minecraft başlamasına izin ver"""
+    def _show_game_monitor(self, process, version_id: str, log_file, watcher=None):
+        """Oyun çalışırken kaynak izleme"""
         import psutil
         import time
         
@@ -4658,22 +5142,92 @@ class MinecraftLauncher:
         self.console.print("[green]✅ Minecraft başlatıldı![/green]")
         self.console.print(f"[blue]📋 Sürüm: {version_id}[/blue]")
         self.console.print(f"[blue]🔢 Process ID: {process.pid}[/blue]")
-        self.console.print("[yellow]💡 Minecraft penceresi açılmasını bekleyin...[/yellow]")
+        if watcher and watcher.state == STATE_READY:
+            self.console.print(f"[green]🎮 Oyun hazır ({watcher.reason})[/green]")
+        else:
+            self.console.print("[yellow]💡 Minecraft penceresi açılmasını bekleyin...[/yellow]")
         self.console.print("[dim]Oyunu kapatmak için Ctrl+C tuşlarına basın.[/dim]")
-        self.console.print("[cyan]Kaynak izleme için 'm' tuşuna basın.[/cyan]")
-        
-        # Minecraft'ın başlaması için yeterli zaman ver
-        time.sleep(5)
+        self.console.print("[cyan]Kaynak izleme için 'm', JFR profili için 'p', sınıf histogramı için 'h', "
+                           "iş parçacığı dökümü için 'd' tuşuna basın.[/cyan]")
+        
+        gc_parser = self.game_gc_parser
+        events = self.game_log_events
+        if gc_parser and self.last_launch_spec and self.last_launch_spec.gc_log:
+            self.console.print(f"[dim]🗑️  GC logu: {self.last_launch_spec.gc_log}[/dim]")
+        
+        # Ölçümler arka planda toplanır (oturum kaydının örnekleyicisi); ekranlar tampondan okur
+        sampler = self.game_sampler if self.game_sampler and self.game_sampler.pid == process.pid else None
+        own_sampler = sampler is None
+        if own_sampler:
+            sampler = MetricsSampler(self.config.get("monitor_interval", METRICS_INTERVAL))
+            sampler.watch(process.pid)
+            sampler.start()
+        jvm = self.game_jvm if self.game_jvm and self.game_jvm.pid == process.pid else None
+        watchdog = self.game_watchdog if self.game_watchdog and self.game_watchdog.pid == process.pid else None
+        try:
+            self._game_monitor_loop(process, version_id, watcher, sampler, gc_parser, events, jvm, watchdog)
+        finally:
+            if own_sampler:
+                sampler.stop()
+    
+    def _game_monitor_loop(self, process, version_id: str, watcher, sampler, gc_parser=None, events=None, jvm=None,
+                           watchdog=None):
+        """Oyun kapanana kadar tuşları dinle, 30 sn'de bir durum satırı yaz"""
+        import psutil
         
+        status_every = 30
+        last_status = time.monotonic()
+        codecache_warned = False
+        stalls_seen = 0
+        hang_shown = None
         # Basit bir monitoring döngüsü (sürekli clear yok)
         while True:
             try:
                 # Process hala çalışıyor mu?
                 if process.poll() is not None:
-                    self.console.print("\n[yellow]Minecraft kapandı![/yellow]")
+                    self.console.print(f"\n[yellow]Minecraft kapandı! (çıkış kodu: {process.returncode})[/yellow]")
+                    if watcher and watcher.state == STATE_FAILED:
+                        self.console.print(f"[red]   {watcher.reason}[/red]")
+                    if gc_parser and gc_parser.pauses:
+                        self.console.print(f"[dim]GC: {self._format_gc_summary(gc_parser.summary())}[/dim]")
+                    spec = self.last_launch_spec
+                    timeline = self.last_launch_timeline
+                    heap_dump = (new_heap_dump(spec.heap_dump_dir, timeline.started_at)
+                                 if spec and spec.heap_dump_dir and timeline else None)
+                    if heap_dump:
+                        self.console.print(f"[yellow]💾 Heap dökümü: {heap_dump} (Eclipse MAT / VisualVM ile açılabilir)[/yellow]")
+                    if self.game_hang and self.game_hang["pid"] == process.pid:
+                        self.console.print(f"[yellow]⏸️  İş parçacığı dökümleri: {self.game_hang['dir']}[/yellow]")
                     input("[dim]Enter...[/dim]")
                     return
                 
+                # Bekçi donma sezdi: dökümler arka planda alınıyor, bitince özet yazılır
+                if watchdog and watchdog.stalls > stalls_seen:
+                    stalls_seen = watchdog.stalls
+                    self.console.print(f"[red]⏸️  Oyun donmuş görünüyor: {watchdog.reason}[/red]")
+                hang = self.game_hang
+                if hang and hang["pid"] == process.pid and hang is not hang_shown:
+                    hang_shown = hang
+                    self._print_hang_report(hang)
+                
+                # 'p' ile başlatılan kayıt yazıldıysa bir kez haber ver
+                if self.active_jfr and time.monotonic() >= self.active_jfr["ends_at"] and self.active_jfr["recording"].exists():
+                    self.console.print(f"[green]🎯 JFR kaydı hazır: {self.active_jfr['recording'].name} "
+                                       f"(Performans > JFR Profili > Kayıtlar)[/green]")
+                    self.active_jfr = None
+                
+                # JIT code cache dolunca derleme durur, oyun o andan sonra yorumlanır
+                if jvm and not codecache_warned and jvm.latest.get("compilation_disabled"):
+                    codecache_warned = True
+                    self.console.print("[red]⚠️  Code cache doldu, JIT derlemesi durdu (FPS düşer): "
+                                       "JVM argümanlarına -XX:ReservedCodeCacheSize=512m ekleyin[/red]")
+                
+                # Log sınıflandırıcısının yeni olayları (kural başına ilk eşleşme)
+                while events:
+                    event = events.popleft()
+                    color = "red" if event["severity"] == "fatal" else "yellow"
+                    self.console.print(f"[{color}]⚠️  Log: {event['message']}[/{color}] [dim](satır {event['line_no']})[/dim]")
+                
                 # Non-blocking input check (1 saniye timeout)
                 import select
                 import sys
@@ -4683,21 +5237,60 @@ class MinecraftLauncher:
                     key = sys.stdin.readline().strip()
                     if key.lower() == 'm':
                         # Monitoring ekranını göster (sadece istek üzerine)
-                        self._show_detailed_monitor(process, version_id)
+                        self._show_detailed_monitor(process, version_id, sampler, gc_parser, jvm)
+                    elif key.lower() == 'p':
+                        # Oyunu bekletmeden süreli kayıt; özet kayıt bitince JFR menüsünden
+                        timeline = self.last_launch_timeline
+                        instance_name = timeline.meta.get("instance", DEFAULT_INSTANCE) if timeline else DEFAULT_INSTANCE
+                        record = self.running_games.find(instance_name)
+                        recording = self._start_jfr_attach(process.pid, version_id, instance_name,
+                                                           record["game_dir"] if record else str(self.minecraft_dir))
+                        if recording:
+                            self.console.print(f"[green]🎯 JFR kaydı başladı ({self.active_jfr['duration']} sn): "
+                                               f"özet Performans > JFR Profili > Kayıtlar[/green]")
+                    elif key.lower() == 'h':
+                        if jvm:
+                            self._take_class_histogram(jvm)
+                        else:
+                            self.console.print("[yellow]JVM yoklanmıyor: jcmd (JDK) bulunamadı ya da JVM içgözlem kapalı[/yellow]")
+                    elif key.lower() == 'd':
+                        if watchdog:
+                            with self.console.status("[cyan]İş parçacığı dökümleri alınıyor...[/cyan]"):
+                                hang = watchdog.capture("Elle alınan döküm")
+                            if not hang:
+                                self.console.print("[red]❌ Döküm alınamadı: jcmd (JDK) yok ve JVM SIGQUIT'e yanıt vermedi[/red]")
+                        else:
+                            self.console.print("[yellow]Bu oyun launcher'ın log takipçisiyle başlatılmadı[/yellow]")
+                    elif key.lower() == 'k':
+                        # Kapanış kancaları dünyayı kaydetsin; donmuş oyun yanıt vermezse zorla
+                        self.console.print(f"[yellow]Minecraft kapatılıyor (SIGTERM, {GRACEFUL_TIMEOUT} sn sonra SIGKILL)...[/yellow]")
+                        with self.console.status("[yellow]Kapanması bekleniyor...[/yellow]"):
+                            graceful = graceful_kill(process)
+                        if not graceful:
+                            self.console.print("[red]Oyun SIGTERM'e yanıt vermedi, zorla kapatıldı[/red]")
                     elif key.lower() == 'q':
                         self.console.print("[yellow]Minecraft kapatılıyor...[/yellow]")
                         process.terminate()
                         return
                 
-                # Her 30 saniyede bir basit durum güncellemesi
-                if int(time.time()) % 30 == 0:
-                    try:
-                        p = psutil.Process(process.pid)
-                        cpu_percent = p.cpu_percent()
-                        mem_mb = p.memory_info().rss / (1024 * 1024)
-                        self.console.print(f"[dim]Durum: CPU {cpu_percent:.1f}% | RAM {mem_mb:.0f}MB | PID {process.pid}[/dim]")
-                    except:
-                        pass
+                # Her 30 saniyede bir basit durum güncellemesi (son 30 sn'nin ortalaması)
+                if time.monotonic() - last_status >= status_every:
+                    last_status = time.monotonic()
+                    cpu = sampler.stats("cpu", status_every)
+                    mem_mb = sampler.latest("rss_mb")
+                    if cpu and mem_mb is not None:
+                        cgroup_status = self._cgroup_status(process.pid)
+                        cgroup_text = f" | {cgroup_status}" if cgroup_status else ""
+                        gc_text = ""
+                        if gc_parser and gc_parser.pauses:
+                            gc = gc_parser.summary(status_every)
+                            if gc["pauses"]:
+                                gc_text = f" | GC p99 {gc['p99_ms']:.0f}ms, %{gc['overhead_pct']:.1f}"
+                        heap_text = ""
+                        if jvm and jvm.latest.get("heap_used_mb") is not None:
+                            heap_text = f" | Heap {jvm.latest['heap_used_mb']:.0f}/{jvm.latest.get('heap_committed_mb') or 0:.0f}MB"
+                        self.console.print(f"[dim]Durum: CPU {cpu['avg']:.1f}% (en çok {cpu['max']:.0f}%) | "
+                                           f"RAM {mem_mb:.0f}MB{heap_text} | PID {process.pid}{cgroup_text}{gc_text}[/dim]")
                 
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 self.console.print("\n[yellow]Minecraft kapandı![/yellow]")
@@ -4708,73 +5301,276 @@ class MinecraftLauncher:
                 process.terminate()
                 return
     
-    def _show_detailed_monitor(self, process, version_id: str):
-        """Detaylı monitoring ekranı (isteğe bağlı)"""
-        import psutil
-        import time
-        
-        os.system('clear')
+    def _show_detailed_monitor(self, process, version_id: str, sampler=None, gc_parser=None, jvm=None):
+        """Detaylı monitoring ekranı (isteğe bağlı) - ölçümler örnekleyicinin tamponlarından"""
+        own_sampler = sampler is None
+        if own_sampler:
+            sampler = MetricsSampler(self.config.get("monitor_interval", METRICS_INTERVAL))
+            sampler.watch(process.pid)
+            sampler.sample()
+            sampler.start()
         
-        # Banner
+        window_key = "1"
+        try:
+            while True:
+                os.system('clear')
+                self._render_detailed_monitor(process, version_id, sampler, WINDOWS[window_key], gc_parser, jvm)
+                keys = "/".join(WINDOWS)
+                histogram_key = ", h = sınıf histogramı" if jvm else ""
+                choice = input(f"\n[dim]{keys} = pencere (dk), r = yenile{histogram_key}, Enter = Geri dön[/dim] ").strip().lower()
+                if choice in WINDOWS:
+                    window_key = choice
+                elif choice == "h" and jvm:
+                    self._take_class_histogram(jvm)
+                    input("[dim]Enter...[/dim]")
+                elif choice != "r":
+                    return
+        finally:
+            if own_sampler:
+                sampler.stop()
+    
+    def _render_detailed_monitor(self, process, version_id: str, sampler, window: int, gc_parser=None, jvm=None):
+        """İzleme ekranını tamponlardan çiz (bekleme yok)"""
+        label = f"{window // 60} dk"
         self.console.print(Panel(
             f"[bold cyan]MINECRAFT MONITORING[/bold cyan]\n"
             f"[white]Sürüm: {version_id}[/white]\n"
-            f"[dim]PID: {process.pid}[/dim]",
+            f"[dim]PID: {process.pid} | Pencere: {label} | {sampler.samples()} örnek, {sampler.interval:g} sn aralık[/dim]",
             border_style="green",
             padding=(1, 2)
         ))
         
-        # Process bilgisi
-        try:
-            p = psutil.Process(process.pid)
-            
-            # CPU kullanımı
-            cpu_percent = p.cpu_percent(interval=0.5)
-            cpu_bar = self._create_bar(cpu_percent, 100, 50, "CPU")
-            
-            # RAM kullanımı
-            mem_info = p.memory_info()
-            mem_mb = mem_info.rss / (1024 * 1024)
-            mem_percent = p.memory_percent()
-            mem_bar = self._create_bar(mem_percent, 100, 50, "RAM")
-            
-            # Sistem genel
-            sys_cpu = psutil.cpu_percent(interval=0.1)
-            sys_mem = psutil.virtual_memory().percent
-            
-            # Göster
+        def row(name, title, unit, low=None, high=None, fmt="{:.0f}"):
+            values = sampler.window(name, window)
+            stats = sampler.stats(name, window)
+            latest = sampler.latest(name)
+            if stats is None or latest is None:
+                return f"[white]{title:14}[/white] [dim]ölçüm bekleniyor[/dim]"
+            spark = sparkline(values, 40, low, high)
+            numbers = "/".join(fmt.format(stats[k]) for k in ("min", "avg", "max"))
+            return (f"[white]{title:14}[/white] [cyan]{fmt.format(latest) + unit:>10}[/cyan] "
+                    f"[green]{spark}[/green] [dim]min/ort/max {numbers}[/dim]")
+        
+        if not sampler.process_alive and sampler.samples():
+            self.console.print("[red]Process bilgisi alınamadı![/red]")
+        cpu_high = 100 * max(1, sampler.cores)
+        self.console.print()
+        self.console.print(Panel(
+            "\n".join([
+                row("cpu", "CPU", "%", 0, cpu_high),
+                row("rss_mb", "RAM", " MB", 0, sampler.mem_total_mb or None),
+                row("threads", "İş parçacığı", ""),
+                row("fds", "Açık dosya", ""),
+                row("io_read_kbs", "Disk okuma", " KB/s", 0),
+                row("io_write_kbs", "Disk yazma", " KB/s", 0),
+                row("ctx_switches", "Bağlam geçişi", "/s", 0),
+            ]),
+            title="[bold white]KAYNAK KULLANIMI[/bold white]",
+            border_style="cyan",
+            padding=(1, 2)
+        ))
+        
+        sys_cpu = sampler.latest("sys_cpu") or 0
+        available = sampler.latest("mem_available_mb")
+        sys_mem = (1 - available / sampler.mem_total_mb) * 100 if available is not None and sampler.mem_total_mb else 0
+        core_lines = []
+        for i in range(sampler.cores):
+            load = sampler.latest(f"core{i}")
+            core_lines.append(f"[dim]{i:>3}[/dim] {sparkline(sampler.window(f'core{i}', window), 20, 0, 100)} "
+                              f"[cyan]{load or 0:>3.0f}%[/cyan]")
+        # Çekirdekler ikişer sütunda
+        half = (len(core_lines) + 1) // 2
+        cores_text = "\n".join(
+            core_lines[i] + ("    " + core_lines[i + half] if i + half < len(core_lines) else "") for i in range(half)
+        )
+        self.console.print()
+        self.console.print(Panel(
+            f"{self._create_bar(sys_cpu, 100, 50, 'SYS CPU')}\n"
+            f"{self._create_bar(sys_mem, 100, 50, 'SYS RAM')}\n\n"
+            + row("sys_cpu", "Sistem CPU", "%", 0, 100) + "\n"
+            + row("swap_used_mb", "Swap", " MB", 0) + "\n\n"
+            + cores_text,
+            title="[bold white]SISTEM[/bold white]",
+            border_style="yellow",
+            padding=(1, 2)
+        ))
+        
+        cgroup_dir = governed_cgroup(process.pid)
+        cgroup_stats = read_cgroup_stats(cgroup_dir) if cgroup_dir else None
+        if cgroup_stats:
+            events = cgroup_stats["events"]
+            high = cgroup_stats["memory_high_mb"]
+            limit = cgroup_stats["memory_max_mb"]
+            cpu_s = (cgroup_stats["cpu_usec"] or 0) / 1e6
+            throttled_s = (cgroup_stats["throttled_usec"] or 0) / 1e6
             self.console.print()
             self.console.print(Panel(
-                f"[cyan]Minecraft Process:[/cyan]\n\n"
-                f"{cpu_bar}\n"
-                f"[dim]Kullanım: {cpu_percent:.1f}%[/dim]\n\n"
-                f"{mem_bar}\n"
-                f"[dim]Kullanım: {mem_mb:.0f} MB ({mem_percent:.1f}%)[/dim]",
-                title="[bold white]KAYNAK KULLANIMI[/bold white]",
-                border_style="cyan",
+                f"[white]Bellek:[/white] [cyan]{cgroup_stats['memory_mb'] or 0:.0f} MB[/cyan] "
+                f"[dim](high {f'{high:.0f} MB' if high else 'yok'}, max {f'{limit:.0f} MB' if limit else 'yok'})[/dim]\n"
+                f"[white]Olaylar:[/white] high {events.get('high', 0)} | max {events.get('max', 0)} | "
+                f"oom {events.get('oom', 0)} | oom_kill {events.get('oom_kill', 0)}\n"
+                f"[white]CPU:[/white] {cpu_s:.1f} sn [dim](kısıtlanan {throttled_s:.1f} sn)[/dim]\n"
+                f"[white]Disk:[/white] okuma {cgroup_stats['io_read_bytes'] / (1024 * 1024):.0f} MB | "
+                f"yazma {cgroup_stats['io_write_bytes'] / (1024 * 1024):.0f} MB\n"
+                f"[dim]{cgroup_dir}[/dim]",
+                title="[bold white]CGROUP[/bold white]",
+                border_style="magenta",
                 padding=(1, 2)
             ))
-            
+        
+        if jvm:
             self.console.print()
-            sys_cpu_bar = self._create_bar(sys_cpu, 100, 50, "SYS CPU")
-            sys_mem_bar = self._create_bar(sys_mem, 100, 50, "SYS RAM")
-            
-            self.console.print(Panel(
-                f"[yellow]Sistem Geneli:[/yellow]\n\n"
-                f"{sys_cpu_bar}\n"
-                f"[dim]{sys_cpu:.1f}%[/dim]\n\n"
-                f"{sys_mem_bar}\n"
-                f"[dim]{sys_mem:.1f}%[/dim]",
-                title="[bold white]SISTEM[/bold white]",
-                border_style="yellow",
-                padding=(1, 2)
-            ))
-            
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
-            self.console.print("[red]Process bilgisi alınamadı![/red]")
+            self.console.print(self._jvm_panel(jvm, window))
         
-        self.console.print("\n[dim]Enter = Geri dön[/dim]")
-        input()
+        if gc_parser:
+            self.console.print()
+            self.console.print(self._gc_panel(gc_parser, window))
+    
+    def _jvm_panel(self, jvm, window: int) -> Panel:
+        """jcmd yoklamaları: heap, metaspace, code cache, sınıf yükleyiciler ve sızıntı şüphelileri"""
+        latest = jvm.latest
+        if not latest:
+            text = jvm.error or f"İlk yoklama bekleniyor ({jvm.interval:g} sn aralık)"
+            return Panel(f"[dim]{text}[/dim]", title="[bold white]JVM[/bold white]", border_style="blue", padding=(1, 2))
+        
+        def row(title, used, committed, high=None):
+            values = jvm.window(used, max(window, jvm.interval * 2))
+            value = latest.get(used)
+            if value is None:
+                return f"[white]{title:14}[/white] [dim]yok[/dim]"
+            limit = f" / {latest[committed]:.0f}" if committed and latest.get(committed) is not None else ""
+            return (f"[white]{title:14}[/white] [cyan]{value:>6.0f}{limit} MB[/cyan] "
+                    f"[green]{sparkline(values, 30, 0, high)}[/green] [dim]tepe {jvm.peaks.get(used, value):.0f} MB[/dim]")
+        
+        lines = [
+            row("Heap", "heap_used_mb", "heap_committed_mb", latest.get("heap_committed_mb")),
+            row("Metaspace", "metaspace_used_mb", "metaspace_committed_mb"),
+            row("Code cache", "codecache_used_mb", "codecache_size_mb", latest.get("codecache_size_mb")),
+        ]
+        if latest.get("class_loaders") is not None:
+            lines.append(f"[white]{'Sınıflar':14}[/white] [cyan]{latest['classes']}[/cyan] "
+                         f"[dim]({latest['class_loaders']} sınıf yükleyici)[/dim]")
+        if latest.get("compilation_disabled"):
+            lines.append("[red]Code cache dolu: JIT derlemesi durdu (-XX:ReservedCodeCacheSize)[/red]")
+        taken = len(jvm.histograms.snapshots)
+        suspects = jvm.histograms.suspects()
+        lines.append("")
+        if suspects:
+            lines.append("[yellow]Sızıntı şüphelileri:[/yellow]")
+            for suspect in suspects[:3]:
+                lines.append(f"  [yellow]{suspect['class']}[/yellow] [dim]({suspect['owner']})[/dim] "
+                             f"+{suspect['growth']} örnek, +{suspect['growth_mb']:.1f} MB")
+        else:
+            lines.append(f"[dim]{taken} sınıf histogramı alındı; sızıntı taraması için en az {LEAK_MIN_HISTOGRAMS}[/dim]")
+        age = time.time() - latest["time"]
+        return Panel("\n".join(lines), title=f"[bold white]JVM (jcmd, {age:.0f} sn önce)[/bold white]",
+                     border_style="blue", padding=(1, 2))
+    
+    def _print_hang_report(self, hang: Dict):
+        """Dökümlerin hepsinde aynı yerde kalan iş parçacıkları ve kilitlenmeler"""
+        self.console.print(f"[yellow]⏸️  {len(hang['dumps'])} iş parçacığı dökümü: {hang['dir']}[/yellow]")
+        if hang["deadlock"]:
+            self.console.print("[red]🔒 Java kilitlenmesi (deadlock) bulundu:[/red]")
+            for line in hang["deadlock"][2:8]:
+                self.console.print(f"   [dim]{line.strip()}[/dim]")
+        for stuck in hang["stuck"][:5]:
+            where = short_frame(stuck["frame"])
+            culprit = "" if stuck["owner_frame"] == stuck["frame"] else f" ← {short_frame(stuck['owner_frame'])}"
+            spinning = " [red]dönüyor[/red]" if stuck["spinning"] else ""
+            color = "red" if stuck["main"] else "yellow"
+            self.console.print(f"   [{color}]{stuck['thread']}[/{color}] [dim]{stuck['state']}[/dim] {where}{culprit} "
+                               f"[cyan]({stuck['owner']})[/cyan]{spinning}")
+            if stuck["waiting"]:
+                self.console.print(f"      [dim]{stuck['waiting']}[/dim]")
+        if not hang["stuck"] and not hang["deadlock"]:
+            self.console.print("[dim]   Dökümler arasında aynı yerde kalan iş parçacığı yok (oyun ilerliyor olabilir)[/dim]")
+        elif hang["kind"] != REASON_MANUAL:
+            self.console.print(f"[yellow]'k' = oyunu kapat (önce SIGTERM, {GRACEFUL_TIMEOUT} sn sonra SIGKILL)[/yellow]")
+    
+    def _take_class_histogram(self, jvm):
+        """Sınıf histogramı al, öncekine göre büyüyenleri ve sızıntı şüphelilerini yaz"""
+        self.console.print("[dim]Sınıf histogramı alınıyor (tam GC: oyun kısa süre donabilir)...[/dim]")
+        with self.console.status("[cyan]jcmd GC.class_histogram...[/cyan]"):
+            ok, error = jvm.take_histogram()
+        if not ok:
+            self.console.print(f"[red]❌ Histogram alınamadı: {error}[/red]")
+            return
+        taken = len(jvm.histograms.snapshots)
+        changes = jvm.histograms.changes(5)
+        if changes:
+            table = Table(title="Önceki histogramdan beri en çok büyüyen", box=box.SIMPLE, header_style="bold cyan")
+            table.add_column("Sınıf", overflow="fold")
+            table.add_column("Sahip", style="cyan")
+            table.add_column("Örnek", justify="right")
+            table.add_column("Bayt", justify="right")
+            for change in changes:
+                table.add_row(change["class"], change["owner"], f"{change['instance_change']:+d}",
+                              f"{change['bytes_change'] / (1024 * 1024):+.1f} MB")
+            self.console.print(table)
+        suspects = jvm.histograms.suspects()
+        if suspects:
+            self.console.print(f"[yellow]⚠️  Son {taken} histogramın hepsinde büyüyen sınıflar (sızıntı şüphelisi):[/yellow]")
+            for suspect in suspects[:5]:
+                self.console.print(f"   [yellow]{suspect['class']}[/yellow] [dim]({suspect['owner']})[/dim] "
+                                   f"+{suspect['growth']} örnek ({suspect['per_min']:.0f}/dk), +{suspect['growth_mb']:.1f} MB")
+        elif taken < LEAK_MIN_HISTOGRAMS:
+            self.console.print(f"[dim]Histogram {taken}/{LEAK_MIN_HISTOGRAMS}: oynarken birkaç dakika arayla tekrar alın[/dim]")
+        else:
+            self.console.print(f"[green]✅ Son {taken} histogramda sürekli büyüyen sınıf yok[/green]")
+    
+    def _gc_panel(self, gc_parser, window: int) -> Panel:
+        """GC duraklama histogramı, p99 (hedefe göre), ek yük ve ayırma hızı"""
+        recent = gc_parser.summary(window)
+        session = gc_parser.summary()
+        if not session["pauses"]:
+            lines = ["[dim]Henüz GC duraklaması yok[/dim]"]
+        else:
+            target = session["target_ms"]
+            
+            def pause_text(value):
+                if value is None:
+                    return "-"
+                color = "red" if target and value > target else "green"
+                return f"[{color}]{value:.1f} ms[/{color}]"
+            
+            target_text = f" | hedef {target:.0f} ms ({recent['over_target']} aşım)" if target else ""
+            lines = [
+                f"[white]Duraklama:[/white] {recent['pauses']} | p50 {pause_text(recent['p50_ms'])} | "
+                f"p99 {pause_text(recent['p99_ms'])} | max {pause_text(recent['max_ms'])}{target_text}",
+                f"[white]GC ek yükü:[/white] [cyan]%{recent['overhead_pct'] or 0:.2f}[/cyan] "
+                f"[dim](oturum %{session['overhead_pct'] or 0:.2f}, p99 {session['p99_ms']:.1f} ms, {session['pauses']} duraklama)[/dim]",
+            ]
+            rate = recent["alloc_rate_mbs"] if recent["alloc_rate_mbs"] is not None else session["alloc_rate_mbs"]
+            heap_text = ""
+            if session["heap_after_mb"] is not None:
+                heap_text = f" | GC sonrası heap {session['heap_after_mb']:.0f}/{session['heap_total_mb']:.0f} MB"
+            lines.append(f"[white]Ayırma hızı:[/white] [cyan]{f'{rate:.0f} MB/s' if rate is not None else '-'}[/cyan]{heap_text}")
+            
+            lines.append("")
+            histogram = recent["histogram"]
+            peak = max(histogram) or 1
+            for label, count in zip(histogram_labels(), histogram):
+                bar = "█" * int(count / peak * 30 + (0.999 if count else 0))
+                lines.append(f"[dim]{label + ' ms':>9}[/dim] [green]{bar:<30}[/green] {count}")
+            
+            causes = list(session["causes"].items())[:3]
+            if causes:
+                lines.append("")
+                lines.append("[white]Sebepler:[/white] " + ", ".join(f"{cause} ({count})" for cause, count in causes))
+        return Panel("\n".join(lines),
+                     title=f"[bold white]GC ({window // 60} dk)[/bold white]", border_style="blue", padding=(1, 2))
+    
+    def _format_gc_summary(self, summary: Dict) -> str:
+        """Tek satırlık GC özeti"""
+        if not summary or not summary.get("pauses"):
+            return "duraklama yok"
+        parts = [f"{summary['pauses']} duraklama", f"p99 {summary['p99_ms']:.1f} ms", f"max {summary['max_ms']:.1f} ms",
+                 f"ek yük %{summary['overhead_pct'] or 0:.2f}"]
+        if summary.get("target_ms"):
+            parts.append(f"hedef {summary['target_ms']:.0f} ms üstü {summary['over_target']}")
+        if summary.get("alloc_rate_mbs") is not None:
+            parts.append(f"ayırma {summary['alloc_rate_mbs']:.0f} MB/s")
+        return ", ".join(parts)
     
     def _create_bar(self, value: float, max_value: float, width: int, label: str) -> str:
         """Büyük progress bar oluştur"""
@@ -4822,6 +5618,10 @@ class MinecraftLauncher:
                 border_style="blue"
             ))
             
+            # Otomatik bellek modelinin son başlatılan sürüm için kararı
+            if memory == "auto":
+                self._show_heap_plan_panel()
+            
             # Seçmeli menü (ok tuşları)
             menu_items = [
                 {"key": "1", "label": f"Bellek Ayari", "description": f"Mevcut: {memory}", "color": "cyan"},
@@ -4832,7 +5632,18 @@ class MinecraftLauncher:
                 {"key": "6", "label": "Orta Performans", "description": "4GB RAM, uyumlu", "color": "yellow"},
                 {"key": "7", "label": "Dusuk Performans", "description": "2GB RAM, minimum", "color": "yellow"},
                 {"key": "8", "label": "Sistem Optimizasyonu", "description": "Auto-optimize", "color": "blue"},
-                {"key": "9", "label": "Performans Testi", "description": "FPS ve sistem testi", "color": "blue"}
+                {"key": "9", "label": "Performans Testi", "description": "FPS ve sistem testi", "color": "blue"},
+                {"key": "10", "label": "Başlatma Profili", "description": "Açılış sürelerini karşılaştır", "color": "magenta"},
+                {"key": "11", "label": "Kaynak Sınırları", "description": f"Cgroup: {self.config.get('cgroup_governor', METHOD_OFF)}", "color": "magenta"},
+                {"key": "12", "label": "Sarmalayıcılar", "description": ", ".join(wrapper_specs(self.config)) or "yok", "color": "magenta"},
+                {"key": "13", "label": "GPU Profili", "description": f"Mevcut: {self.config.get('gpu_profile', PROFILE_AUTO)}", "color": "magenta"},
+                {"key": "14", "label": "CDS Hızlı Açılış", "description": f"{'Açık' if self.config.get('cds_fast_start', False) else 'Kapalı'} - sınıf arşivi", "color": "magenta"},
+                {"key": "15", "label": "GC Logu", "description": f"{'Açık' if self.config.get('gc_logging', False) else 'Kapalı'} - duraklama analizi", "color": "magenta"},
+                {"key": "16", "label": "Log Arama", "description": "Tüm oturum logları ve çökme raporları", "color": "magenta"},
+                {"key": "17", "label": "Oturum Geçmişi", "description": "Açılış süresi ve bellek eğilimleri, ayar değişiklikleri", "color": "magenta"},
+                {"key": "18", "label": "Ölçüm Uç Noktası", "description": self.metrics_exporter.url if self.metrics_exporter else "Kapalı - Prometheus/OpenMetrics", "color": "magenta"},
+                {"key": "19", "label": "JFR Profili", "description": "Flight Recorder: sıcak metotlar, modlar, GC, kilitler", "color": "magenta"},
+                {"key": "20", "label": "JVM İçgözlem", "description": "jcmd: heap, metaspace, code cache, sızıntılar, OOM dökümü", "color": "magenta"}
             ]
             choice = self.navigator.show_menu("PERFORMANS AYARLARI", menu_items, show_exit=True)
             if choice is None or choice == "0":
@@ -4845,9 +5656,8 @@ class MinecraftLauncher:
                              [("A", "auto"), ("2", "2"), ("4", "4"), ("6", "6"), ("8", "8"), ("12", "12"), ("16", "16")]]
                 sel = self.navigator.show_menu("BELLEK SEÇİMİ (GB)", mem_items, show_exit=True)
                 if sel and sel != "0":
-                    new_memory = "auto" if sel == "A" else sel
-                self.config["memory"] = new_memory
-                self._save_config()
+                    self.config["memory"] = "auto" if sel == "A" else sel
+                    self._save_config()
                 
                 
             elif choice == "2":
@@ -4907,6 +5717,813 @@ class MinecraftLauncher:
             elif choice == "9":
                 # Performans testi
                 self._run_performance_test()
+                
+            elif choice == "10":
+                # Başlatma zaman çizelgeleri
+                self._show_launch_profiles()
+                
+            elif choice == "11":
+                # Oyun sürecinin cgroup yerleşimi
+                gov_items = [
+                    {"key": "1", "label": METHOD_OFF, "description": "Sınır yok", "color": "cyan"},
+                    {"key": "2", "label": METHOD_AUTO, "description": "cgroup_parent varsa o, yoksa systemd", "color": "cyan"},
+                    {"key": "3", "label": METHOD_SYSTEMD, "description": "systemd-run --user --scope", "color": "cyan"},
+                    {"key": "4", "label": METHOD_DELEGATED, "description": "cgroup_parent altında", "color": "cyan"},
+                ]
+                sel = self.navigator.show_menu("CGROUP YÖNTEMİ", gov_items, show_exit=True)
+                if sel and sel != "0":
+                    self.config["cgroup_governor"] = gov_items[int(sel) - 1]["label"]
+                    self._save_config()
+                    heap_mb = self.last_launch_spec.max_heap_mb if self.last_launch_spec else 4096
+                    limits = limits_for(heap_mb, self.config)
+                    governed = CgroupGovernor(self.config)
+                    self.console.print(f"[green]✅ Cgroup: {governed.mode}[/green] [dim]({limits.summary()})[/dim]")
+                    if governed.mode != METHOD_OFF and not cgroup_v2_available():
+                        self.console.print("[yellow]⚠️ cgroup v2 bağlı değil, oyun sınırsız başlatılacak[/yellow]")
+                    input("[dim]Enter...[/dim]")
+                
+            elif choice == "12":
+                self._show_wrapper_settings()
+                
+            elif choice == "13":
+                self._show_gpu_profile_settings()
+                
+            elif choice == "14":
+                self._show_cds_settings()
+                
+            elif choice == "15":
+                self._show_gc_log_settings()
+                
+            elif choice == "16":
+                self._show_log_search()
+                
+            elif choice == "17":
+                self._show_session_trends()
+                
+            elif choice == "18":
+                self._show_metrics_exporter_settings()
+                
+            elif choice == "19":
+                self._show_jfr_menu()
+            
+            elif choice == "20":
+                self._show_jvm_settings()
+    
+    def _show_gpu_profile_settings(self):
+        """Algılanan GPU'ya göre seçilen ortam profilini açıkla ve geçersiz kıl"""
+        info = detect_gpu()
+        while True:
+            automatic = select_profile(info)
+            current = self.config.get("gpu_profile", PROFILE_AUTO)
+            descriptions = {
+                PROFILE_NATIVE: "Mesa'nın yerel GL sürücüsü (Intel/AMD)",
+                PROFILE_NVIDIA: "NVIDIA kapalı kaynak sürücü",
+                PROFILE_HYBRID: "Dizüstü: ayrık karta PRIME offload",
+                PROFILE_ZINK: "GL'i Vulkan üzerinden (son çare)",
+            }
+            menu_items = [{"key": "D", "label": "Neden?", "description": f"Otomatik seçim: {automatic.name}", "color": "blue"},
+                          {"key": "A", "label": "Otomatik" + (" ✓" if current == PROFILE_AUTO else ""), "description": automatic.name, "color": "green"}]
+            for i, name in enumerate(PROFILES, 1):
+                menu_items.append({"key": str(i), "label": name + (" ✓" if current == name else ""),
+                                   "description": descriptions[name], "color": "cyan"})
+            menu_items.append({"key": "E", "label": "Ek Değişkenler", "description": ", ".join(self.config.get("gpu_env") or {}) or "yok", "color": "magenta"})
+            choice = self.navigator.show_menu("GPU PROFİLİ", menu_items, show_exit=True)
+            if not choice or choice == "0":
+                return
+            
+            if choice == "D":
+                os.system('clear')
+                profile = profile_for_config(self.config, info)
+                self.console.print(Panel("\n".join(profile.explain()), title="[bold white]GPU PROFİLİ[/bold white]",
+                                         border_style="cyan", padding=(1, 2)))
+                if info.icds:
+                    self.console.print(f"[dim]Vulkan ICD: {', '.join(info.icds)}[/dim]")
+                if info.mesa_drivers is not None:
+                    self.console.print(f"[dim]Mesa GL sürücüleri: {', '.join(info.mesa_drivers) or 'yok'}[/dim]")
+                input("\n[dim]Enter...[/dim]")
+            elif choice == "A":
+                self.config["gpu_profile"] = PROFILE_AUTO
+                self._save_config()
+            elif choice == "E":
+                current_env = self.config.get("gpu_env") or {}
+                text = Prompt.ask("AD=değer (boşlukla ayrılmış, boş = temizle)",
+                                  default=" ".join(f"{k}={v}" for k, v in current_env.items()))
+                extra_env = {}
+                for item in text.split():
+                    key, sep, value = item.partition("=")
+                    if sep and key:
+                        extra_env[key] = value
+                self.config["gpu_env"] = extra_env
+                self._save_config()
+            elif choice.isdigit():
+                self.config["gpu_profile"] = PROFILES[int(choice) - 1]
+                self._save_config()
+    
+    def _show_cds_settings(self):
+        """AppCDS hızlı açılışını aç/kapat, arşivleri göster/temizle"""
+        while True:
+            enabled = self.config.get("cds_fast_start", False)
+            archives = self.cds_store.archives()
+            total_mb = sum(a["size_mb"] for a in archives)
+            menu_items = [
+                {"key": "1", "label": "Kapat" if enabled else "Aç", "description": "İlk açılış arşivi kaydeder, sonrakiler kullanır", "color": "green"},
+                {"key": "2", "label": "Arşivler", "description": f"{len(archives)} arşiv, {total_mb:.0f} MB", "color": "cyan"},
+                {"key": "3", "label": "Arşivleri Temizle", "description": "Sonraki açılışlar yeniden kaydeder", "color": "red"},
+            ]
+            choice = self.navigator.show_menu(f"CDS HIZLI AÇILIŞ ({'Açık' if enabled else 'Kapalı'})", menu_items, show_exit=True)
+            if not choice or choice == "0":
+                return
+            if choice == "1":
+                self.config["cds_fast_start"] = not enabled
+                self._save_config()
+            elif choice == "2":
+                os.system('clear')
+                table = Table(title="⚡ AppCDS Arşivleri", show_header=True, header_style="bold cyan", box=box.SIMPLE)
+                table.add_column("Sürüm", style="cyan")
+                table.add_column("Boyut", justify="right")
+                table.add_column("Durum")
+                for archive in archives:
+                    table.add_row(archive["version"], f"{archive['size_mb']:.0f} MB",
+                                  "[green]hazır[/green]" if archive["valid"] else "[yellow]yarım[/yellow]")
+                self.console.print(table if archives else "[yellow]Henüz arşiv yok[/yellow]")
+                self.console.print("[dim]Arşivli ve arşivsiz açılış süreleri: Başlatma Profili[/dim]")
+                input("\n[dim]Enter...[/dim]")
+            elif choice == "3":
+                removed = self.cds_store.clear()
+                self.console.print(f"[green]✅ {removed} arşiv silindi[/green]")
+                input("[dim]Enter...[/dim]")
+    
+    def _show_gc_log_settings(self):
+        """GC logunu aç/kapat, oturumların GC özetlerini karşılaştır"""
+        while True:
+            enabled = self.config.get("gc_logging", False)
+            sessions = [r for r in self.launch_history.load(limit=0) if r.get("meta", {}).get("gc_log")]
+            menu_items = [
+                {"key": "1", "label": "Kapat" if enabled else "Aç", "description": "-Xlog:gc* ile duraklamaları kaydet (Java 9+)", "color": "green"},
+                {"key": "2", "label": "Oturumlar", "description": f"{len(sessions)} GC loglu oturum", "color": "cyan"},
+            ]
+            choice = self.navigator.show_menu(f"GC LOGU ({'Açık' if enabled else 'Kapalı'})", menu_items, show_exit=True)
+            if not choice or choice == "0":
+                return
+            if choice == "1":
+                self.config["gc_logging"] = not enabled
+                self._save_config()
+            elif choice == "2":
+                os.system('clear')
+                table = Table(title="🗑️  GC Oturumları", show_header=True, header_style="bold cyan", box=box.SIMPLE)
+                table.add_column("Tarih", style="white")
+                table.add_column("Sürüm", style="cyan")
+                table.add_column("Heap", justify="right", style="dim")
+                table.add_column("Duraklama", justify="right")
+                table.add_column("p99", justify="right")
+                table.add_column("Max", justify="right")
+                table.add_column("Hedef üstü", justify="right")
+                table.add_column("Ek yük", justify="right")
+                table.add_column("Ayırma", justify="right", style="dim")
+                for record in sessions[-15:]:
+                    meta = record["meta"]
+                    summary = load_gc_summary(meta["gc_log"], meta.get("gc_pause_target"))
+                    date = time.strftime("%d.%m %H:%M", time.localtime(record.get("started_at", 0)))
+                    if not summary or not summary.get("pauses"):
+                        table.add_row(date, record.get("version", "-"), "-", "0", "-", "-", "-", "-", "-")
+                        continue
+                    target = summary.get("target_ms")
+                    p99 = summary["p99_ms"]
+                    p99_text = f"[red]{p99:.1f} ms[/red]" if target and p99 > target else f"{p99:.1f} ms"
+                    heap = f"{summary['heap_total_mb']:.0f} MB" if summary.get("heap_total_mb") else "-"
+                    rate = summary.get("alloc_rate_mbs")
+                    table.add_row(date, record.get("version", "-"), heap, str(summary["pauses"]), p99_text,
+                                  f"{summary['max_ms']:.1f} ms", str(summary["over_target"]) if target else "-",
+                                  f"%{summary['overhead_pct'] or 0:.2f}", f"{rate:.0f} MB/s" if rate is not None else "-")
+                self.console.print(table if sessions else "[yellow]Henüz GC loglu oturum yok[/yellow]")
+                self.console.print("[dim]p99 hedefi (MaxGCPauseMillis) aşıyorsa heap'i küçültmek ya da GC'yi değiştirmek gerekebilir; "
+                                   "ek yük yüksek ve ayırma hızı büyükse heap'i büyütün[/dim]")
+                input("\n[dim]Enter...[/dim]")
+    
+    def _show_log_search(self):
+        """Loglarda ve çökme raporlarında sürüm/yükleyici/tarih süzgeçli tam metin arama"""
+        if not fts_available():
+            self.console.print("[red]❌ Python'un SQLite'ı FTS5 desteklemiyor, log araması kullanılamaz[/red]")
+            input("[dim]Enter...[/dim]")
+            return
+        if self.log_indexer is None:
+            # Kapalı dizinleyici: ekran açıkken yine de güncel sonuç ver
+            self.log_index.update(self._log_index_sources())
+        
+        filters = {"version": None, "loader": None, "since": None, "kind": None}
+        since_text = None
+        query = ""
+        while True:
+            stats = self.log_index.stats()
+            kind_text = {None: "log + çökme raporu", KIND_LOG: "yalnız loglar", KIND_CRASH: "yalnız çökme raporları"}[filters["kind"]]
+            menu_items = [
+                {"key": "1", "label": "Ara", "description": f"Son: {query}" if query else "Kelime, \"ifade\" ya da FTS5 sorgusu (OR, NOT, önek*)", "color": "green"},
+                {"key": "2", "label": "Sürüm", "description": filters["version"] or "tümü", "color": "cyan"},
+                {"key": "3", "label": "Yükleyici", "description": filters["loader"] or "tümü", "color": "cyan"},
+                {"key": "4", "label": "Tarih", "description": f"{since_text} içinde" if since_text else "tümü", "color": "cyan"},
+                {"key": "5", "label": "Tür", "description": kind_text, "color": "cyan"},
+                {"key": "6", "label": "Dizini Güncelle", "description": f"{stats['documents']} belge, {stats['lines']:,} satır, {stats['size_mb']:.0f} MB", "color": "blue"},
+            ]
+            choice = self.navigator.show_menu("LOG ARAMA", menu_items, show_exit=True)
+            if not choice or choice == "0":
+                return
+            if choice == "1":
+                query = Prompt.ask("[cyan]Sorgu[/cyan]", default=query or None) or ""
+                if query.strip():
+                    self._show_log_search_results(query, filters)
+            elif choice == "2":
+                versions = self.log_index.facets()["versions"]
+                if versions:
+                    self.console.print(f"[dim]Dizindeki sürümler: {', '.join(versions[:15])}[/dim]")
+                filters["version"] = Prompt.ask("Sürüm ya da sürüm kimliği (boş = tümü)", default="").strip() or None
+            elif choice == "3":
+                loaders = ["tümü"] + self.log_index.facets()["loaders"]
+                selected = Prompt.ask("Yükleyici", choices=loaders, default="tümü")
+                filters["loader"] = None if selected == "tümü" else selected
+            elif choice == "4":
+                text = Prompt.ask("Son ne kadar (30d, 2w, 12h) ya da YYYY-AA-GG'den beri (boş = tümü)", default="").strip()
+                try:
+                    filters["since"] = parse_time(text) if text else None
+                    since_text = text or None
+                except ValueError as e:
+                    self.console.print(f"[red]❌ {e}[/red]")
+                    input("[dim]Enter...[/dim]")
+            elif choice == "5":
+                order = [None, KIND_LOG, KIND_CRASH]
+                filters["kind"] = order[(order.index(filters["kind"]) + 1) % len(order)]
+            elif choice == "6":
+                report = self.log_index.update(self._log_index_sources())
+                self.console.print(f"[green]✅ {report['files']} dosya ({report['bytes'] / (1024 * 1024):.1f} MB) "
+                                   f"{report['seconds']:.1f} sn'de dizinlendi, {report['removed']} silinen kaldırıldı[/green]")
+                input("[dim]Enter...[/dim]")
+    
+    def _show_log_search_results(self, query: str, filters: Dict):
+        """Arama sonuçları; numara seçilince eşleşmenin çevresi gösterilir"""
+        started = time.perf_counter()
+        try:
+            results = self.log_index.search(query, **filters)
+        except ValueError as e:
+            self.console.print(f"[red]❌ {e}[/red]")
+            input("[dim]Enter...[/dim]")
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        while True:
+            os.system('clear')
+            table = Table(title=f"🔎 {query}  [dim]({len(results)} belge, {elapsed_ms:.0f} ms)[/dim]", show_header=True,
+                          header_style="bold cyan", box=box.SIMPLE)
+            table.add_column("#", style="cyan", justify="right")
+            table.add_column("Tarih", style="white")
+            table.add_column("Sürüm", style="cyan")
+            table.add_column("Yükleyici", style="dim")
+            table.add_column("Çıkış", justify="right")
+            table.add_column("Java", style="dim")
+            table.add_column("Mod", justify="right", style="dim")
+            table.add_column("Eşleşme", justify="right")
+            matches = []
+            for i, result in enumerate(results, 1):
+                date = time.strftime("%d.%m.%Y %H:%M", time.localtime(result["started_at"])) if result["started_at"] else "-"
+                exit_code = result["exit_code"]
+                exit_text = "-" if exit_code is None else (f"[red]{exit_code}[/red]" if exit_code else "0")
+                if result["kind"] == KIND_CRASH:
+                    exit_text = "[red]çökme[/red]"
+                table.add_row(str(i), date, result["version"] or "-", result["loader"] or "-", exit_text,
+                              result["java_version"] or "-", "-" if result["mod_count"] is None else str(result["mod_count"]),
+                              str(result["hits"]))
+                # İlk eşleşen satır, eşleşen kelimeler vurgulu
+                line = Text(f"{i:>3}  ", style="cyan")
+                line.append(f"{result.get('line_no', 1)}: ", style="dim")
+                offset = len(line)
+                line.append(result.get("line", ""))
+                for start, end in result.get("spans", []):
+                    line.stylize("bold red", offset + start, offset + end)
+                line.truncate(self.console.width, overflow="ellipsis")
+                matches.append(line)
+            if not results:
+                self.console.print(f"[yellow]'{query}' için sonuç yok[/yellow]")
+                input("\n[dim]Enter...[/dim]")
+                return
+            self.console.print(table)
+            self.console.print("[bold]İlk eşleşen satırlar[/bold]")
+            for line in matches:
+                self.console.print(line, no_wrap=True)
+            
+            selected = Prompt.ask("\n[cyan]Numara = çevresini göster, Enter = geri[/cyan]", default="")
+            if not selected.isdigit() or not 1 <= int(selected) <= len(results):
+                return
+            self._show_log_match_context(results[int(selected) - 1])
+    
+    def _show_log_match_context(self, result: Dict, before: int = 10, after: int = 30):
+        """Eşleşen satırın çevresini dosyadan oku (yalnız gereken satırlar)"""
+        import itertools
+        
+        os.system('clear')
+        path = Path(result["path"])
+        line_no = result.get("line_no", 1)
+        self.console.print(f"[bold]{path}[/bold]  [dim]satır {line_no}[/dim]\n")
+        first = max(1, line_no - before)
+        try:
+            with open(path, 'r', errors='replace') as f:
+                for number, line in enumerate(itertools.islice(f, first - 1, line_no + after), first):
+                    text = Text(f"{number:6}  ", style="dim")
+                    text.append(line.rstrip("\n"), style="bold red" if number == line_no else None)
+                    self.console.print(text)
+        except OSError as e:
+            self.console.print(f"[red]❌ Dosya okunamadı: {e}[/red]")
+        input("\n[dim]Enter...[/dim]")
+    
+    def _jdk_tool(self, name: str) -> Optional[str]:
+        """jcmd/jfr: oyunun Java'sının yanında, yoksa JAVA_HOME, PATH ve diğer kurulu JDK'larda"""
+        java_paths = [self.java_executable] + [runtime["path"] for runtime in self.java_registry.discover()]
+        return find_jdk_tool(name, java_paths)
+    
+    def _start_jfr_attach(self, pid: int, version_id: str, instance_name: str, game_dir: str,
+                          duration: int = None) -> Optional[Path]:
+        """Çalışan oyuna jcmd ile süreli JFR kaydı başlat (hata mesajını kendisi yazar)"""
+        jcmd = self._jdk_tool("jcmd")
+        if not jcmd:
+            self.console.print("[red]❌ jcmd bulunamadı: bir JDK kurun (yönetilen runtime'lar yalnız JRE içerir)[/red]")
+            return None
+        java_pid = jvm_pid(pid)
+        if not java_pid:
+            self.console.print(f"[red]❌ PID {pid} altında çalışan bir JVM yok[/red]")
+            return None
+        duration = duration or self.config.get("jfr_duration", JFR_DEFAULT_DURATION)
+        template = self.config.get("jfr_default_template", JFR_DEFAULT_TEMPLATE)
+        recording = recording_path(self.profiles_dir, version_id)
+        ok, output = start_recording(jcmd, java_pid, recording, template, duration)
+        if not ok:
+            self.console.print(f"[red]❌ JFR.start başarısız: {output.splitlines()[-1] if output else 'bilinmeyen hata'}[/red]")
+            return None
+        save_jfr_meta(recording, version=version_id, instance=instance_name, game_dir=game_dir, template=template,
+                      mode="attach", pid=java_pid, duration=duration, started_at=time.time())
+        self.active_jfr = {"recording": recording, "pid": java_pid, "jcmd": jcmd, "duration": duration,
+                           "ends_at": time.monotonic() + duration}
+        return recording
+    
+    def _show_jfr_menu(self):
+        """Flight Recorder ile profil: çalışan oyun, profille başlatma, kayıt özetleri"""
+        while True:
+            template = self.config.get("jfr_default_template", JFR_DEFAULT_TEMPLATE)
+            duration = self.config.get("jfr_duration", JFR_DEFAULT_DURATION)
+            recordings = list_jfr_recordings(self.profiles_dir)
+            running = self.running_games.running()
+            menu_items = [
+                {"key": "1", "label": "Çalışan Oyunu Profille", "description": f"jcmd JFR.start, {duration} sn" if running else "Çalışan oyun yok", "color": "green"},
+                {"key": "2", "label": "Profil ile Başlat", "description": "Açılıştan kapanışa kadar kaydet", "color": "green"},
+                {"key": "3", "label": "Kayıtlar", "description": f"{len(recordings)} kayıt - özet ve ham .jfr", "color": "cyan"},
+                {"key": "4", "label": "Şablon", "description": f"{template}: {JFR_TEMPLATES.get(template, 'özel .jfc')}", "color": "magenta"},
+                {"key": "5", "label": "Süre", "description": f"Çalışan oyunda {duration} sn", "color": "magenta"},
+                {"key": "6", "label": "Kayıtları Sil", "description": f"{sum(r['size_mb'] or 0 for r in recordings):.0f} MB", "color": "red"},
+            ]
+            choice = self.navigator.show_menu("JFR PROFİLİ", menu_items, show_exit=True)
+            if not choice or choice == "0":
+                return
+            if choice == "1":
+                self._profile_running_game(running)
+            elif choice == "2":
+                versions = self._get_installed_versions()
+                items = [{"key": str(i), "label": v, "description": "", "color": "cyan"} for i, v in enumerate(versions[:30], 1)]
+                selection = self.navigator.show_menu("PROFİL İLE BAŞLAT", items, show_exit=True) if items else None
+                if selection and selection != "0" and selection.isdigit() and 1 <= int(selection) <= len(items):
+                    self.pending_jfr_template = template
+                    self._launch_minecraft(versions[int(selection) - 1])
+                    # Başlatma komut oluşturmadan önce durduysa sonraki başlatmaya taşınmasın
+                    self.pending_jfr_template = None
+            elif choice == "3":
+                self._show_jfr_recordings()
+            elif choice == "4":
+                value = Prompt.ask(f"Şablon ({', '.join(JFR_TEMPLATES)} ya da .jfc yolu)", default=template).strip()
+                if value in JFR_TEMPLATES or Path(value).expanduser().is_file():
+                    self.config["jfr_default_template"] = value if value in JFR_TEMPLATES else str(Path(value).expanduser())
+                    self._save_config()
+            elif choice == "5":
+                value = Prompt.ask("Süre (sn)", default=str(duration))
+                if value.isdigit() and int(value) > 0:
+                    self.config["jfr_duration"] = int(value)
+                    self._save_config()
+            elif choice == "6":
+                if recordings and Confirm.ask(f"{len(recordings)} kayıt silinsin mi?", default=False):
+                    for recording in recordings:
+                        for path in (recording["path"], recording["path"].with_suffix(".json")):
+                            if path.exists():
+                                path.unlink()
+    
+    def _profile_running_game(self, running: List[Dict]):
+        """Çalışan oyuna bağlan, süre dolana kadar bekle, özeti göster (Ctrl+C = erken bitir)"""
+        if not running:
+            self.console.print("[yellow]Çalışan oyun yok - 'Profil ile Başlat' açılıştan itibaren kaydeder[/yellow]")
+            input("[dim]Enter...[/dim]")
+            return
+        record = running[0]
+        if len(running) > 1:
+            items = [{"key": str(i), "label": r["instance"], "description": f"{r['version']} - PID {r['pid']}", "color": "cyan"}
+                     for i, r in enumerate(running, 1)]
+            selection = self.navigator.show_menu("HANGİ OYUN?", items, show_exit=True)
+            if not selection or not selection.isdigit() or not 1 <= int(selection) <= len(running):
+                return
+            record = running[int(selection) - 1]
+        
+        recording = self._start_jfr_attach(record["pid"], record["version"], record["instance"], record["game_dir"])
+        if not recording:
+            input("[dim]Enter...[/dim]")
+            return
+        active = self.active_jfr
+        self.console.print("[dim]Takılmayı yaşadığınız yerde oynamaya devam edin; Ctrl+C kaydı erken bitirir[/dim]")
+        try:
+            with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), BarColumn(),
+                          TimeElapsedColumn(), console=self.console, transient=True) as progress:
+                task = progress.add_task("[cyan]JFR kaydediliyor...", total=active["duration"])
+                while time.monotonic() < active["ends_at"] and jvm_pid(active["pid"]):
+                    time.sleep(0.5)
+                    progress.update(task, completed=active["duration"] - max(0.0, active["ends_at"] - time.monotonic()))
+        except KeyboardInterrupt:
+            ok, output = stop_recording(active["jcmd"], active["pid"], recording)
+            if not ok:
+                self.console.print(f"[yellow]⚠️ JFR.stop: {output}[/yellow]")
+        
+        # JVM kaydı süre dolduktan hemen sonra yazar
+        deadline = time.monotonic() + 30
+        while not recording.exists() and time.monotonic() < deadline:
+            time.sleep(0.5)
+        self.active_jfr = None
+        if not recording.exists():
+            self.console.print(f"[red]❌ Kayıt yazılmadı: {recording}[/red]")
+            input("[dim]Enter...[/dim]")
+            return
+        self._show_jfr_summary(recording)
+    
+    def _show_jfr_recordings(self):
+        """Kayıt listesi; seçilen kaydın özeti"""
+        while True:
+            recordings = list_jfr_recordings(self.profiles_dir)[:20]
+            if not recordings:
+                self.console.print("[yellow]Henüz JFR kaydı yok[/yellow]")
+                input("[dim]Enter...[/dim]")
+                return
+            items = []
+            for i, recording in enumerate(recordings, 1):
+                meta = recording["meta"]
+                date = time.strftime("%d.%m %H:%M", time.localtime(meta.get("started_at", recording["mtime"])))
+                if recording["size_mb"] is None:
+                    state = "oyun kapanınca yazılacak" if meta.get("mode") == "launch" else "kaydediliyor"
+                else:
+                    state = f"{recording['size_mb']:.1f} MB" + (" - özet hazır" if meta.get("summary") else "")
+                items.append({"key": str(i), "label": f"{meta.get('version', recording['path'].stem)} {date}",
+                              "description": f"{meta.get('instance', '-')}, {meta.get('template', '-')}, {state}", "color": "cyan"})
+            selection = self.navigator.show_menu("JFR KAYITLARI", items, show_exit=True)
+            if not selection or not selection.isdigit() or not 1 <= int(selection) <= len(recordings):
+                return
+            recording = recordings[int(selection) - 1]
+            if recording["size_mb"] is None:
+                self.console.print("[yellow]Kayıt henüz yazılmadı[/yellow]")
+                input("[dim]Enter...[/dim]")
+                continue
+            self._show_jfr_summary(recording["path"])
+    
+    def _jfr_summary(self, recording: Path) -> Optional[Dict]:
+        """Kaydın özeti (kaydın yanındaki .json'da önbelleklenir; jfr aracı gerekir)"""
+        meta = load_jfr_meta(recording)
+        mtime = recording.stat().st_mtime
+        if meta.get("summary") and meta.get("summary_mtime") == mtime:
+            return meta["summary"]
+        jfr_tool = self._jdk_tool("jfr")
+        if not jfr_tool:
+            self.console.print("[red]❌ jfr aracı bulunamadı: bir JDK kurun (11+)[/red]")
+            return None
+        game_dir = Path(meta.get("game_dir") or self.minecraft_dir)
+        try:
+            with self.console.status("[cyan]jfr print ile özetleniyor...[/cyan]"):
+                summary = summarize_jfr(recording, jfr_tool, ModMap.from_dir(game_dir / "mods"),
+                                        self.config.get("jfr_top", 10))
+        except OSError as e:
+            self.console.print(f"[red]❌ Kayıt okunamadı: {e}[/red]")
+            return None
+        save_jfr_meta(recording, summary=summary, summary_mtime=mtime)
+        return summary
+    
+    def _show_jfr_summary(self, recording: Path):
+        """Sıcak metotlar, mod payları, ayırma, GC/safepoint ve kilit çekişmesi"""
+        summary = self._jfr_summary(recording)
+        if summary is None:
+            input("[dim]Enter...[/dim]")
+            return
+        os.system('clear')
+        gc, safepoints = summary["gc"], summary["safepoints"]
+        lines = [
+            f"[white]{summary['samples']}[/white] [dim]CPU örneği, ayrılan[/dim] [white]{summary['allocated_bytes'] / (1024 ** 3):.2f} GB[/white] "
+            f"[dim](örneklenen), özet {summary.get('seconds', 0):.1f} sn[/dim]",
+            f"[white]GC:[/white] {gc['count']} duraklama, toplam {gc['total_ms']:.0f} ms, en uzun {gc['max_ms']:.1f} ms"
+            + (f" [dim]({', '.join(f'{k} {v}' for k, v in gc['names'].items())})[/dim]" if gc["names"] else ""),
+            f"[white]Safepoint:[/white] {safepoints['count']}, toplam {safepoints['total_ms']:.0f} ms, en uzun {safepoints['max_ms']:.1f} ms",
+            f"[dim]Ham kayıt: {recording} (JDK Mission Control ile açılabilir)[/dim]",
+        ]
+        self.console.print(Panel("\n".join(lines), title="[bold white]🎯 JFR Özeti[/bold white]", border_style="cyan"))
+        
+        if summary["owners"]:
+            table = Table(title="CPU - sahibine göre (JDK dışındaki ilk çerçeve)", box=box.SIMPLE, header_style="bold cyan")
+            table.add_column("Sahip", style="cyan")
+            table.add_column("Pay", justify="right")
+            table.add_column("", style="green")
+            for row in summary["owners"]:
+                table.add_row(row["owner"], f"%{row['pct']:.1f}", "█" * max(1, int(row["pct"] / 4)))
+            self.console.print(table)
+        
+        def frame_table(title, rows, value_title, value):
+            table = Table(title=title, box=box.SIMPLE, header_style="bold cyan")
+            table.add_column("Çerçeve", overflow="fold")
+            table.add_column("Sahip", style="cyan")
+            table.add_column(value_title, justify="right")
+            for row in rows:
+                table.add_row(short_frame(row["frame"]), row["owner"], value(row))
+            self.console.print(table)
+        
+        if summary["hot_methods"]:
+            frame_table("Sıcak metotlar (yığının tepesi)", summary["hot_methods"], "Pay", lambda r: f"%{r['pct']:.1f}")
+        if summary["alloc_sites"]:
+            frame_table("Ayırma noktaları", summary["alloc_sites"], "Ayrılan", lambda r: f"{r['bytes'] / (1024 * 1024):.0f} MB")
+            self.console.print("[dim]En çok ayrılan: " + ", ".join(
+                f"{row['class']} {row['bytes'] / (1024 * 1024):.0f} MB" for row in summary["alloc_classes"][:5]) + "[/dim]")
+        if summary["locks"]:
+            frame_table("Kilit çekişmesi", summary["locks"], "Bekleme",
+                        lambda r: f"{r['total_ms']:.0f} ms / {r['count']}x")
+        if not summary["samples"]:
+            self.console.print("[yellow]Kayıtta CPU örneği yok - şablon örneklemeyi kapatıyor ya da kayıt çok kısa[/yellow]")
+        input("\n[dim]Enter...[/dim]")
+    
+    def _show_jvm_settings(self):
+        """jcmd yoklaması, çalışan oyunun sınıf histogramı, OOM heap dökümleri ve donma bekçisi"""
+        while True:
+            enabled = self.config.get("jvm_introspection", True)
+            interval = self.config.get("jvm_poll_interval", JVM_POLL_INTERVAL)
+            heap_dump = self.config.get("heap_dump_on_oom", False)
+            cap_mb = self.config.get("heap_dump_cap_mb", HEAP_DUMP_CAP_MB)
+            dumps = list_heap_dumps(self.heap_dumps_dir)
+            jvm = self.game_jvm if self.game_jvm and self.game_jvm.active else None
+            jcmd = self._jdk_tool("jcmd")
+            watchdog = self.config.get("hang_watchdog", True)
+            stall_seconds = self.config.get("hang_stall_seconds", HANG_STALL_SECONDS)
+            menu_items = [
+                {"key": "1", "label": "Yoklama", "description": f"{'Açık' if enabled else 'Kapalı'} - {interval} sn'de bir jcmd" + ("" if jcmd else " (jcmd yok: JDK kurun)"), "color": "green"},
+                {"key": "2", "label": "Aralık", "description": f"{interval} sn", "color": "cyan"},
+                {"key": "3", "label": "Sınıf Histogramı", "description": f"Çalışan oyun, {len(jvm.histograms.snapshots)} alındı" if jvm else "Yoklanan oyun yok", "color": "cyan"},
+                {"key": "4", "label": "OOM Heap Dökümü", "description": f"{'Açık' if heap_dump else 'Kapalı'} - {self.heap_dumps_dir}", "color": "magenta"},
+                {"key": "5", "label": "Döküm Sınırı", "description": f"{cap_mb} MB (en eskiler silinir)", "color": "magenta"},
+                {"key": "6", "label": "Dökümler", "description": f"{len(dumps)} döküm, {sum(d['size_mb'] for d in dumps):.0f} MB", "color": "red"},
+                {"key": "7", "label": "Donma Bekçisi", "description": f"{'Açık' if watchdog else 'Kapalı'} - {self.hangs_dir}", "color": "yellow"},
+                {"key": "8", "label": "Donma Süresi", "description": f"Render iş parçacığı {stall_seconds} sn ilerlemezse", "color": "yellow"},
+            ]
+            choice = self.navigator.show_menu("JVM İÇGÖZLEM", menu_items, show_exit=True)
+            if not choice or choice == "0":
+                return
+            if choice == "1":
+                self.config["jvm_introspection"] = not enabled
+                self._save_config()
+            elif choice == "2":
+                value = Prompt.ask("Aralık (sn, en az 5)", default=str(interval))
+                if value.isdigit() and int(value) >= 5:
+                    self.config["jvm_poll_interval"] = int(value)
+                    self._save_config()
+            elif choice == "3":
+                if jvm:
+                    self._take_class_histogram(jvm)
+                else:
+                    self.console.print("[yellow]Launcher'dan başlatılıp jcmd ile yoklanan çalışan bir oyun yok[/yellow]")
+                input("[dim]Enter...[/dim]")
+            elif choice == "4":
+                self.config["heap_dump_on_oom"] = not heap_dump
+                self._save_config()
+            elif choice == "5":
+                value = Prompt.ask("Sınır (MB)", default=str(cap_mb))
+                if value.isdigit() and int(value) > 0:
+                    self.config["heap_dump_cap_mb"] = int(value)
+                    self._save_config()
+                    prune_heap_dumps(self.heap_dumps_dir, int(value))
+            elif choice == "6":
+                if not dumps:
+                    self.console.print("[yellow]Döküm yok[/yellow]")
+                    input("[dim]Enter...[/dim]")
+                    continue
+                for dump in dumps:
+                    written = time.strftime("%d.%m.%Y %H:%M", time.localtime(dump["mtime"]))
+                    self.console.print(f"[white]{dump['path'].name}[/white] [dim]{written}, {dump['size_mb']:.0f} MB[/dim]")
+                self.console.print(f"[dim]{self.heap_dumps_dir} - Eclipse MAT ya da VisualVM ile açılabilir[/dim]")
+                if Confirm.ask(f"{len(dumps)} döküm silinsin mi?", default=False):
+                    for dump in dumps:
+                        dump["path"].unlink()
+            elif choice == "7":
+                self.config["hang_watchdog"] = not watchdog
+                self._save_config()
+            elif choice == "8":
+                value = Prompt.ask("Süre (sn, en az 10)", default=str(stall_seconds))
+                if value.isdigit() and int(value) >= 10:
+                    self.config["hang_stall_seconds"] = int(value)
+                    self._save_config()
+    
+    def _show_metrics_exporter_settings(self):
+        """OpenMetrics uç noktasını aç/kapat, adresini değiştir, çıktısını önizle"""
+        while True:
+            exporter = self.metrics_exporter
+            host = self.config.get("metrics_host", METRICS_HOST)
+            port = self.config.get("metrics_port", METRICS_PORT)
+            menu_items = [
+                {"key": "1", "label": "Kapat" if exporter else "Aç", "description": f"http://{host}:{port}/metrics", "color": "green"},
+                {"key": "2", "label": "Port", "description": str(port), "color": "cyan"},
+                {"key": "3", "label": "Adres", "description": f"{host} (0.0.0.0 = tüm ağ arayüzleri)", "color": "cyan"},
+                {"key": "4", "label": "Önizle", "description": "Şu anki ölçüm metni", "color": "blue"},
+            ]
+            choice = self.navigator.show_menu(f"ÖLÇÜM UÇ NOKTASI ({'Açık' if exporter else 'Kapalı'})", menu_items, show_exit=True)
+            if not choice or choice == "0":
+                return
+            if choice == "1":
+                self.config["metrics_exporter"] = not exporter
+                self._save_config()
+                if exporter:
+                    self._stop_metrics_exporter()
+                    continue
+                error = self._start_metrics_exporter()
+                if error:
+                    self.config["metrics_exporter"] = False
+                    self._save_config()
+                    self.console.print(f"[red]❌ {error}[/red]")
+                else:
+                    self.console.print(f"[green]✅ Ölçümler: {self.metrics_exporter.url}[/green]")
+                input("[dim]Enter...[/dim]")
+            elif choice in ("2", "3"):
+                if choice == "2":
+                    value = Prompt.ask("Port", default=str(port))
+                    if not value.isdigit() or not 0 < int(value) < 65536:
+                        continue
+                    self.config["metrics_port"] = int(value)
+                else:
+                    self.config["metrics_host"] = Prompt.ask("Adres", default=host).strip() or METRICS_HOST
+                self._save_config()
+                # Açıksa yeni adresle yeniden başlat
+                if exporter:
+                    self._stop_metrics_exporter()
+                    error = self._start_metrics_exporter()
+                    if error:
+                        self.console.print(f"[red]❌ {error}[/red]")
+                        input("[dim]Enter...[/dim]")
+            elif choice == "4":
+                os.system('clear')
+                if exporter:
+                    exporter.refresh()
+                    text = exporter.body().decode("utf-8")
+                else:
+                    text = render_metrics(self._collect_metrics())
+                self.console.print(Text(text))
+                input("\n[dim]Enter...[/dim]")
+    
+    def _show_session_trends(self):
+        """Sürüm/instance başına oturum geçmişi"""
+        while True:
+            groups = self.sessions.groups()[:20]
+            if not groups:
+                self.console.print("[yellow]Henüz kayıtlı oturum yok; oyunu launcher'dan başlatınca kaydedilir[/yellow]")
+                input("[dim]Enter...[/dim]")
+                return
+            menu_items = []
+            for i, group in enumerate(groups, 1):
+                label = group["version"] if group["instance"] == DEFAULT_INSTANCE else f"{group['version']} ({group['instance']})"
+                last = time.strftime("%d.%m.%Y %H:%M", time.localtime(group["last_started"]))
+                menu_items.append({"key": str(i), "label": label, "description": f"{group['sessions']} oturum, son: {last}", "color": "cyan"})
+            choice = self.navigator.show_menu("OTURUM GEÇMİŞİ", menu_items, show_exit=True)
+            if not choice or choice == "0":
+                return
+            if choice.isdigit() and 1 <= int(choice) <= len(groups):
+                self._show_session_group(groups[int(choice) - 1]["version"], groups[int(choice) - 1]["instance"])
+    
+    def _show_session_group(self, version_id: str, instance_name: str):
+        """Açılış süresi, tepe RAM ve CPU eğilimi; gerilemeler ve önceki oturuma göre ayar değişiklikleri"""
+        outcome_text = {OUTCOME_CLEAN: "[green]temiz[/green]", OUTCOME_CRASH: "[red]çöktü[/red]",
+                        OUTCOME_KILLED: "[yellow]kapatıldı[/yellow]", OUTCOME_FAILED: "[red]açılmadı[/red]",
+                        OUTCOME_HUNG: "[red]dondu[/red]"}
+        while True:
+            records = self.sessions.trends(version_id, instance_name, limit=20)
+            os.system('clear')
+            
+            def series(key, scale=1.0):
+                return [r[key] / scale if r.get(key) is not None else float("nan") for r in records]
+            
+            def trend_row(title, values, unit):
+                measured = [v for v in values if v == v]
+                if not measured:
+                    return f"[white]{title:10}[/white] [dim]ölçüm yok[/dim]"
+                return (f"[white]{title:10}[/white] [green]{sparkline(values, 40, 0)}[/green] "
+                        f"[cyan]son {measured[-1]:.1f}{unit}[/cyan] [dim]min/max {min(measured):.1f}/{max(measured):.1f}{unit}[/dim]")
+            
+            title = version_id if instance_name == DEFAULT_INSTANCE else f"{version_id} ({instance_name})"
+            self.console.print(Panel(
+                "\n".join([
+                    trend_row("Açılış", series("startup_ms", 1000), " s"),
+                    trend_row("Tepe RAM", series("peak_rss_mb", 1024), " GB"),
+                    trend_row("Ort. CPU", series("avg_cpu"), "%"),
+                    trend_row("Süre", series("duration_s", 60), " dk"),
+                ]),
+                title=f"[bold white]{title} - son {len(records)} oturum[/bold white]",
+                border_style="cyan"
+            ))
+            
+            table = Table(show_header=True, header_style="bold cyan", box=box.SIMPLE)
+            table.add_column("#", style="cyan", justify="right")
+            table.add_column("Tarih", style="white", no_wrap=True)
+            table.add_column("Açılış", justify="right")
+            table.add_column("Tepe RAM", justify="right")
+            table.add_column("Ort. CPU", justify="right", style="dim")
+            table.add_column("Süre", justify="right", style="dim")
+            table.add_column("Sonuç")
+            table.add_column("Değişiklik", style="yellow")
+            for i, record in enumerate(records, 1):
+                startup = f"{record['startup_ms'] / 1000:.1f} s" if record.get("startup_ms") else "-"
+                if "startup_ms" in record["regression"]:
+                    startup = f"[red]{startup} ↑%{(record['startup_change'] - 1) * 100:.0f}[/red]"
+                peak = f"{record['peak_rss_mb']:.0f} MB" if record.get("peak_rss_mb") else "-"
+                if "peak_rss_mb" in record["regression"]:
+                    peak = f"[red]{peak} ↑%{(record['rss_change'] - 1) * 100:.0f}[/red]"
+                cpu = f"%{record['avg_cpu']:.0f}" if record.get("avg_cpu") is not None else "-"
+                duration = f"{record['duration_s'] / 60:.0f} dk" if record.get("duration_s") else "-"
+                outcome = outcome_text.get(record.get("outcome"), "[dim]açık[/dim]")
+                # Tam liste oturum ayrıntısında
+                changes = ", ".join(record["changes"][:2]) + (f" +{len(record['changes']) - 2}" if len(record["changes"]) > 2 else "")
+                table.add_row(str(i), time.strftime("%d.%m %H:%M", time.localtime(record["started_at"])), startup, peak,
+                              cpu, duration, outcome, changes)
+            self.console.print(table)
+            
+            regressions = [r for r in records if r["regression"]]
+            for record in regressions[-3:]:
+                what = " ve ".join({"startup_ms": "açılış", "peak_rss_mb": "tepe RAM"}[k] for k in record["regression"])
+                cause = f" - önceki oturumdan beri: {', '.join(record['changes'])}" if record["changes"] else ""
+                self.console.print(f"[red]⚠️  {time.strftime('%d.%m %H:%M', time.localtime(record['started_at']))}: "
+                                   f"{what} önceki oturumların medyanından %{(REGRESSION_RATIO - 1) * 100:.0f}+ kötü{cause}[/red]")
+            
+            selected = Prompt.ask("\n[cyan]Numara = oturumun CPU/RAM serisi, Enter = geri[/cyan]", default="")
+            if not selected.isdigit() or not 1 <= int(selected) <= len(records):
+                return
+            self._show_session_detail(records[int(selected) - 1])
+    
+    def _show_session_detail(self, record: Dict):
+        """Tek oturumun seyreltilmiş CPU/RAM serisi ve ayarları"""
+        os.system('clear')
+        points = self.sessions.series(record["id"])
+        started = time.strftime("%d.%m.%Y %H:%M", time.localtime(record["started_at"]))
+        lines = [f"[white]{record['version']}[/white] [dim]{record['instance']} | {started} | PID {record.get('pid') or '-'}[/dim]"]
+        if points:
+            span = points[-1][0] / 60
+            cpu = [p[1] if p[1] is not None else float("nan") for p in points]
+            rss = [p[2] if p[2] is not None else float("nan") for p in points]
+            lines.append(f"[white]{'CPU':10}[/white] [green]{sparkline(cpu, 60, 0)}[/green] [dim]en çok %{record.get('max_cpu') or 0:.0f}[/dim]")
+            lines.append(f"[white]{'RAM':10}[/white] [green]{sparkline(rss, 60, 0)}[/green] [dim]tepe {record.get('peak_rss_mb') or 0:.0f} MB[/dim]")
+            lines.append(f"[dim]{len(points)} nokta, {span:.0f} dk[/dim]")
+        else:
+            lines.append("[dim]Bu oturumun ölçüm serisi yok[/dim]")
+        if record.get("gc_p99_ms") is not None:
+            lines.append(f"[white]GC[/white] [dim]p99 {record['gc_p99_ms']:.1f} ms, ek yük %{record.get('gc_overhead_pct') or 0:.2f}[/dim]")
+        if record.get("heap_peak_mb") is not None:
+            loaders = f", {record['class_loaders']} sınıf yükleyici" if record.get("class_loaders") else ""
+            lines.append(f"[white]JVM[/white] [dim]heap tepe {record['heap_peak_mb']:.0f} MB, metaspace {record.get('metaspace_peak_mb') or 0:.0f} MB, "
+                         f"code cache {record.get('codecache_peak_mb') or 0:.0f} MB{loaders}[/dim]")
+        if record.get("codecache_full"):
+            lines.append("[red]Code cache doldu, JIT derlemesi durdu (-XX:ReservedCodeCacheSize)[/red]")
+        for suspect in record.get("leak_suspects", [])[:5]:
+            lines.append(f"[yellow]Sızıntı şüphelisi: {suspect['class']} ({suspect['owner']}) "
+                         f"+{suspect['growth']} örnek, +{suspect['growth_mb']:.1f} MB[/yellow]")
+        if record.get("heap_dump"):
+            lines.append(f"[yellow]💾 Heap dökümü: {record['heap_dump']}[/yellow]")
+        if record.get("hang_dir"):
+            lines.append(f"[red]⏸️  Donma: {record.get('hang_reason') or '-'}[/red]")
+            for stuck in record.get("stuck_threads", [])[:5]:
+                lines.append(f"   [white]{stuck['thread']}[/white] [dim]{stuck['state']}[/dim] "
+                             f"{short_frame(stuck['owner_frame'])} [cyan]({stuck['owner']})[/cyan]")
+            lines.append(f"[dim]   İş parçacığı dökümleri: {record['hang_dir']}[/dim]")
+        settings = dict(record["settings"])
+        mods = settings.pop("mods", None)
+        lines.append("[dim]" + ", ".join(f"{k}={v}" for k, v in settings.items()) + (f", {len(mods)} mod" if mods is not None else "") + "[/dim]")
+        if record.get("changes"):
+            lines.append("[yellow]Önceki oturumdan beri: " + ", ".join(record["changes"]) + "[/yellow]")
+        self.console.print(Panel("\n".join(lines), title="[bold white]Oturum[/bold white]", border_style="cyan"))
+        input("\n[dim]Enter...[/dim]")
+    
+    def _show_heap_plan_panel(self):
+        """Otomatik bellek seçimini ve gerekçesini göster"""
+        recent = self.launch_history.versions()
+        version_id = next((v for v in recent if (self.versions_dir / v / f"{v}.json").exists()), None)
+        if not version_id:
+            return
+        
+        try:
+            heap_plan = self._plan_heap(version_id)
+        except (OSError, ValueError) as e:
+            self.console.print(f"[dim]Bellek modeli hesaplanamadı: {e}[/dim]")
+            return
+        
+        lines = [f"[white]{version_id}:[/white] [cyan]{heap_plan.summary()}[/cyan]"]
+        lines += [f"[dim]• {reason}[/dim]" for reason in heap_plan.reasons]
+        self.console.print(Panel(
+            "\n".join(lines),
+            title="[bold white]Otomatik Bellek[/bold white]",
+            border_style="cyan"
+        ))
     
     def _run_performance_test(self):
         """Performans testi yap"""
@@ -5016,6 +6633,7 @@ class MinecraftLauncher:
             border_style=overall_color,
             padding=(1, 2)
         ))
+        self.console.print("[dim]Bu bir tahmin; takılmaların gerçek sebebi için: Performans > JFR Profili[/dim]")
         
         input("\n[dim]Enter...[/dim]")
     
@@ -6722,12 +8340,15 @@ class MinecraftLauncher:
                         {"key": "1", "label": "Sürüm Başlat", "description": "Oyunu başlat", "color": "green"},
                         {"key": "2", "label": "Sürüm Yönet", "description": "Detaylı yönetim", "color": "yellow"},
                         {"key": "3", "label": "Sürüm Sil", "description": "Kaldır", "color": "red"},
-                        {"key": "4", "label": "Sürüm Onar", "description": "Dosyaları onar", "color": "blue"}
+                        {"key": "4", "label": "Sürüm Onar", "description": "Dosyaları onar", "color": "blue"},
+                        {"key": "5", "label": "Tam Doğrulamayla Başlat", "description": "Tüm kontrolleri çalıştır", "color": "green"}
                     ],
                     show_exit=True
                 )
                 if action == "1":
                     self._launch_minecraft(versions[idx])
+                elif action == "5":
+                    self._launch_minecraft(versions[idx], deep_verify=True)
                 elif action == "2":
                     self._manage_version(versions)
                 elif action == "3":
@@ -6857,6 +8478,9 @@ class MinecraftLauncher:
             if version_dir.exists():
                 import shutil
                 shutil.rmtree(version_dir)
+                self.generations.bump()
+                self.launch_fingerprints.invalidate(version_id)
+                self.cds_store.invalidate(version_id)
                 self.console.print(f"[green]✅ {version_id} sürümü başarıyla silindi![/green]")
             else:
                 self.console.print(f"[yellow]⚠️ {version_id} sürüm dizini bulunamadı![/yellow]")
@@ -6896,6 +8520,10 @@ class MinecraftLauncher:
             return
         
         try:
+            # Onarım sonrası ilk başlatma tam kontrol yapsın
+            self.generations.bump()
+            self.launch_fingerprints.invalidate(version_id)
+            
             # Sürümü yeniden indir
             self.console.print("[yellow]📥 Sürüm dosyaları kontrol ediliyor...[/yellow]")
             self._download_version(version_id)
@@ -6962,6 +8590,18 @@ class MinecraftLauncher:
                 if 'libraries' in version_data:
                     self.console.print(f"[green]Kütüphaneler:[/green] {len(version_data['libraries'])} adet")
                 
+                # Tekilleştirilmiş classpath raporu
+                try:
+                    classpath_result = self._resolve_classpath(version_id)
+                    self.console.print(f"[green]Classpath:[/green] {classpath_result.summary()}")
+                    for dropped in classpath_result.dropped:
+                        self.console.print(
+                            f"[dim]  - {dropped['key']} {dropped['version']} atlandı → "
+                            f"{dropped['kept_version']} ({dropped['reason']})[/dim]"
+                        )
+                except Exception as e:
+                    self.console.print(f"[yellow]⚠️ Classpath çözülemedi: {e}[/yellow]")
+                
                 jar_file = version_dir / f"{version_id}.jar"
                 size_mb = round(jar_file.stat().st_size / (1024*1024), 1) if jar_file.exists() else 0
                 self.console.print(f"[green]Boyut:[/green] {size_mb} MB")
@@ -7694,6 +9334,13 @@ class MinecraftLauncher:
         # İlk çalıştırma kontrolü
         self._first_run_setup()
         
+        # Kullanıcı menüdeyken son oynanan sürümü önbelleğe al
+        self._start_prewarm()
+        self._start_log_indexer()
+        metrics_error = self._start_metrics_exporter()
+        if metrics_error:
+            print(f"⚠️  Ölçüm uç noktası: {metrics_error}")
+        
         print("DEBUG: run() başladı")
         while True:
             # TTY kontrolü yap
@@ -7736,7 +9383,8 @@ class MinecraftLauncher:
                     {"key": "5", "label": "Mod Yonetimi", "description": "Modlari ara ve yukle", "color": "blue"},
                     {"key": "6", "label": "Ayarlar", "description": "Launcher ayarlarini duzenle", "color": "yellow"},
                     {"key": "7", "label": "Performans", "description": "Sistem kaynaklarini izle", "color": "yellow"},
-                    {"key": "8", "label": "Hakkinda", "description": "Launcher hakkinda bilgi", "color": "yellow"}
+                    {"key": "8", "label": "Hakkinda", "description": "Launcher hakkinda bilgi", "color": "yellow"},
+                    {"key": "9", "label": "Instance'lar", "description": "Ayri oyun dizinleri, eszamanli oyunlar", "color": "magenta"}
                 ],
                 show_exit=True
             )
@@ -7834,6 +9482,9 @@ class MinecraftLauncher:
             elif choice == "8":
                 # Hakkında (Sistem + Geliştirici)
                 self._show_about()
+            elif choice == "9":
+                # Instance'lar (ayrı oyun dizinleri)
+                self._show_instances_menu()
 
 def main():
     """Ana fonksiyon"""
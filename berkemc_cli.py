@@ -0,0 +1,722 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Komut satırı
+Menü, soru ve ilerleme çubuğu olmadan betiklerden, masaüstü kısayollarından
+ve kiosk kurulumlarından kullanılabilen komutlar:
+
+    berkemc launch <sürüm> [--username AD] [--memory GB|auto]
+    berkemc launch --instance <ad>
+    berkemc launch <sürüm> --wrapper gamemode --wrapper nice:-5
+    berkemc install <sürüm>
+    berkemc list [--remote | --instances | --running]
+    berkemc verify <sürüm> [--deep] [--repair]
+    berkemc gpu [--json]
+    berkemc export <sürüm> [--instance AD] [--output DOSYA] [--desktop]
+    berkemc java [--install BİLEŞEN|SÜRÜM] [--remove BİLEŞEN]
+    berkemc search <sorgu> [--version 1.20.1] [--loader forge] [--since 30d] [--json]
+
+Argümansız çalıştırıldığında menülü launcher açılır. Hızlı açılış için
+rich/requests gibi ağır modüller bu dosyada yüklenmez.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import List
+
+from launch_builder import LauncherPaths, load_config, save_config, find_java
+from gpu_profile import PROFILE_AUTO, PROFILES
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_TIMEOUT = 3
+
+COMMANDS = ("launch", "install", "list", "verify", "gpu", "export", "java", "search")
+
+
+def _error(message: str):
+    print(f"❌ {message}", file=sys.stderr)
+
+
+def _info(args, message: str):
+    if not args.quiet:
+        print(message)
+
+
+def _repair(args, paths: LauncherPaths, tasks) -> bool:
+    """Eksik/bozuk dosyaları indir, native'leri yeniden çıkar"""
+    from classpath_builder import merge_version_chain
+    from launch_builder import load_chain
+    from launch_fingerprint import GenerationCounter
+    from parallel_download import download_all
+    from version_installer import extract_natives
+
+    report = download_all(tasks, workers=args.workers)
+    extract_natives(paths, merge_version_chain(load_chain(paths, args.version))["libraries"])
+    GenerationCounter(paths.launcher_dir / "generations.json").bump()
+    _info(args, f"📥 {report.summary()}")
+    for failed in report.failed[:10]:
+        _error(f"{failed['name']}: {failed['error']}")
+    return report.ok
+
+
+def cmd_list(args, paths: LauncherPaths) -> int:
+    """Kurulu (veya --remote ile indirilebilir) sürümleri, instance'ları ya da çalışan oyunları listele"""
+    from version_installer import installed_versions, manifest_versions
+
+    if args.instances or args.running:
+        from instance_manager import InstanceManager, ProcessRegistry
+        running = ProcessRegistry(paths.launcher_dir / "running.json").running()
+        if args.running:
+            for record in running:
+                print(f"{record['pid']}\t{record['instance']}\t{record['version']}")
+            return EXIT_OK
+        running_names = {r["instance"] for r in running}
+        for instance in InstanceManager(paths.launcher_dir / "instances").list():
+            state = "running" if instance.name in running_names else "stopped"
+            print(f"{instance.name}\t{instance.version_id}\t{state}")
+        return EXIT_OK
+
+    if args.remote:
+        versions = manifest_versions(paths, offline=args.offline)
+        if not versions:
+            _error("Sürüm listesi alınamadı")
+            return EXIT_FAILED
+        for version in versions:
+            if args.type == "all" or version.get("type") == args.type:
+                print(version["id"])
+        return EXIT_OK
+
+    for version_id in installed_versions(paths):
+        print(version_id)
+    return EXIT_OK
+
+
+def cmd_install(args, paths: LauncherPaths) -> int:
+    """Sürümü kur"""
+    from version_installer import install_version
+    from launch_fingerprint import GenerationCounter
+
+    paths.ensure()
+    _info(args, f"📥 {args.version} kuruluyor...")
+    try:
+        report = install_version(paths, args.version, workers=args.workers)
+    except ValueError as e:
+        _error(str(e))
+        return EXIT_FAILED
+    except OSError as e:
+        _error(f"İndirme hatası: {e}")
+        return EXIT_FAILED
+    GenerationCounter(paths.launcher_dir / "generations.json").bump()
+
+    _info(args, f"✅ {args.version}: {report.summary()}")
+    for failed in report.failed[:10]:
+        _error(f"{failed['name']}: {failed['error']}")
+    if not report.ok:
+        return EXIT_FAILED
+    if not args.no_java:
+        # İlk başlatma runtime indirmekle vakit kaybetmesin
+        return _install_runtime(args, paths, args.version)
+    return EXIT_OK
+
+
+def _install_runtime(args, paths: LauncherPaths, target: str) -> int:
+    """Bileşeni ya da kurulu bir sürümün istediği runtime'ı kur"""
+    from classpath_builder import merge_version_chain
+    from launch_builder import load_chain
+    from java_runtimes import RuntimeStore, runtime_requirement, RUNTIME_AUTO, RUNTIME_SYSTEM
+
+    component = target
+    if (paths.versions_dir / target / f"{target}.json").exists():
+        if load_config(paths.config_file, create=False).get("java_runtime", RUNTIME_AUTO) == RUNTIME_SYSTEM:
+            return EXIT_OK
+        component, _ = runtime_requirement(merge_version_chain(load_chain(paths, target)))
+
+    store = RuntimeStore(paths.runtimes_dir, cache_dir=paths.cache_dir)
+    _info(args, f"☕ {component} kuruluyor...")
+    try:
+        report = store.install(component, workers=getattr(args, "workers", 16))
+    except ValueError as e:
+        _error(str(e))
+        return EXIT_FAILED
+    except OSError as e:
+        _error(f"İndirme hatası: {e}")
+        return EXIT_FAILED
+    for failed in report.failed[:10]:
+        _error(f"{failed['name']}: {failed['error']}")
+    if not report.ok:
+        return EXIT_FAILED
+    info = store.installed().get(component, {})
+    _info(args, f"✅ {component} {info.get('version', '')}: {report.summary()}")
+    return EXIT_OK
+
+
+def cmd_java(args, paths: LauncherPaths) -> int:
+    """Yönetilen Java runtime'ları: listele, kur, kaldır"""
+    import json
+    from classpath_builder import merge_version_chain
+    from launch_builder import load_chain
+    from version_installer import installed_versions
+    from java_runtimes import RuntimeStore, runtime_requirement
+
+    store = RuntimeStore(paths.runtimes_dir, cache_dir=paths.cache_dir)
+    if args.install:
+        return _install_runtime(args, paths, args.install)
+    if args.remove:
+        if args.remove not in store.installed():
+            _error(f"Kurulu değil: {args.remove}")
+            return EXIT_FAILED
+        removed = store.remove(args.remove)
+        _info(args, f"🗑️ {args.remove} kaldırıldı ({removed} dosya silindi)")
+        return EXIT_OK
+
+    installed = store.installed()
+    needs = {}
+    for version_id in installed_versions(paths):
+        try:
+            component, major = runtime_requirement(merge_version_chain(load_chain(paths, version_id)))
+        except (OSError, ValueError):
+            continue
+        needs.setdefault(component, {"major": major, "versions": []})["versions"].append(version_id)
+
+    if args.json:
+        print(json.dumps({"installed": installed, "required": needs,
+                          "disk_mb": round(store.disk_usage_mb(), 1)}, indent=2))
+        return EXIT_OK
+    for component, info in sorted(installed.items()):
+        print(f"{component:24} {info.get('version', '?'):16} {store.root / component}")
+    if not installed:
+        print("Yönetilen runtime yok")
+    for component, need in sorted(needs.items()):
+        if component not in installed:
+            print(f"eksik: {component} (Java {need['major']}) - {', '.join(need['versions'][:5])}")
+    _info(args, f"Disk: {store.disk_usage_mb():.0f} MB")
+    return EXIT_OK
+
+
+def cmd_verify(args, paths: LauncherPaths) -> int:
+    """Sürüm dosyalarını doğrula, istenirse onar"""
+    from version_installer import verify_version
+
+    try:
+        bad = verify_version(paths, args.version, deep=args.deep)
+    except FileNotFoundError as e:
+        _error(str(e))
+        return EXIT_FAILED
+    except OSError as e:
+        _error(f"Asset index indirilemedi: {e}")
+        return EXIT_FAILED
+
+    if not bad:
+        _info(args, f"✅ {args.version}: tüm dosyalar sağlam")
+        return EXIT_OK
+
+    _info(args, f"⚠️ {args.version}: {len(bad)} dosya eksik ya da bozuk")
+    if not args.repair:
+        for task in bad[:20]:
+            print(f"  {task.path}")
+        return EXIT_FAILED
+
+    from launch_fingerprint import FingerprintStore
+    FingerprintStore(paths.launcher_dir / "launch_fingerprints.json").invalidate(args.version)
+    return EXIT_OK if _repair(args, paths, bad) else EXIT_FAILED
+
+
+def cmd_gpu(args, paths: LauncherPaths) -> int:
+    """Algılanan grafik donanımı ve seçilen ortam profili"""
+    import json
+    from gpu_profile import detect_gpu, profile_for_config
+
+    info = detect_gpu()
+    profile = profile_for_config(load_config(paths.config_file, create=False), info)
+    if args.json:
+        print(json.dumps({"detected": info.to_dict(), "profile": profile.to_dict()}, indent=2))
+        return EXIT_OK
+    print("\n".join(profile.explain()))
+    if info.icds:
+        print("Vulkan ICD: " + ", ".join(f"{name} ({path})" for name, path in info.icds.items()))
+    return EXIT_OK
+
+
+def _select_java(args, paths: LauncherPaths, config, version_id: str):
+    """--java, yoksa sürümün javaVersion'ına göre yönetilen runtime (gerekirse kurulur)"""
+    if args.java:
+        return args.java
+    from classpath_builder import merge_version_chain
+    from launch_builder import load_chain
+    from java_runtimes import RuntimeStore, select_runtime, runtime_requirement, RUNTIME_AUTO, RUNTIME_SYSTEM
+
+    store = RuntimeStore(paths.runtimes_dir, cache_dir=paths.cache_dir)
+    fallback = config.get("java_path") or find_java()
+    try:
+        version_data = merge_version_chain(load_chain(paths, version_id))
+    except (OSError, ValueError):
+        return fallback
+    if config.get("java_runtime", RUNTIME_AUTO) == RUNTIME_SYSTEM:
+        return fallback
+    component, _ = runtime_requirement(version_data)
+    if not store.java_path(component):
+        _info(args, f"☕ {component} kuruluyor...")
+    choice = select_runtime(store, version_data, config, fallback, workers=getattr(args, "workers", 16))
+    if not choice.managed:
+        _info(args, f"⚠️ Java: {choice.summary()}")
+    return choice.java_path
+
+
+def cmd_launch(args, paths: LauncherPaths) -> int:
+    """Sürümü başlat; hazır olunca (ya da hata verince) çık"""
+    from java_registry import JavaRegistry
+    from jvm_flags import JvmFlagProbe
+    from launch_builder import build_launch_command, fingerprint_version, launch_environment
+    from instance_manager import InstanceManager, ProcessRegistry, DEFAULT_INSTANCE
+    from cgroup_governor import CgroupGovernor, limits_for, METHOD_OFF
+    from launch_wrappers import WrapperProbe
+    from appcds import CdsStore, MODE_USE as CDS_USE
+    from gc_log import prepare_gc_log, parse_file as parse_gc_log, save_summary as save_gc_summary
+    from launch_fingerprint import GenerationCounter, FingerprintStore
+    from launch_profiler import LaunchTimeline, LaunchHistory, time_to_play_ms
+    from log_follower import LogFollower, LaunchStateWatcher, STATE_READY, STATE_FAILED, STATE_TIMEOUT, STATE_EXITED
+    from log_classifier import LogClassifier, load_rules, rule_files, read_tail
+    from session_history import SessionStore, SESSIONS_FILE, outcome_for, settings_snapshot
+    from jfr_profiler import save_meta as save_jfr_meta
+    from jvm_introspect import HEAP_DUMP_CAP_MB, prepare_heap_dumps, new_heap_dump
+
+    instance = None
+    if args.instance:
+        instance = InstanceManager(paths.launcher_dir / "instances").get(args.instance)
+        if instance is None:
+            _error(f"Instance bulunamadı: {args.instance}")
+            return EXIT_FAILED
+    version_id = args.version or (instance.version_id if instance else None)
+    if not version_id:
+        _error("Sürüm ya da --instance verilmeli")
+        return EXIT_USAGE
+    if not (paths.versions_dir / version_id / f"{version_id}.json").exists():
+        _error(f"Sürüm kurulu değil: {version_id} (berkemc install {version_id})")
+        return EXIT_FAILED
+
+    # Aynı oyun dizinini iki süreç paylaşamaz
+    game_dir = instance.game_dir if instance else paths.minecraft_dir
+    registry = ProcessRegistry(paths.launcher_dir / "running.json")
+    running = registry.find_game_dir(game_dir)
+    if running:
+        _error(f"Bu oyun dizini zaten kullanımda: {running['instance']} (PID {running['pid']})")
+        return EXIT_FAILED
+
+    # Parmak izi kayıtlı ayarlarla hesaplanır; bu başlatmaya özel değerler ayrı kopyada
+    stored_config = load_config(paths.config_file)
+    saved_username = stored_config["username"]
+    config = instance.apply(stored_config) if instance else dict(stored_config)
+    if args.username:
+        config["username"] = args.username
+        if args.username != saved_username:
+            config.pop("uuid", None)
+    if args.memory:
+        config["memory"] = args.memory
+    if args.no_wrappers:
+        config["launch_wrappers"] = []
+    elif args.wrapper:
+        config["launch_wrappers"] = args.wrapper
+    if args.gpu_profile:
+        config["gpu_profile"] = args.gpu_profile
+    if args.cds is not None:
+        config["cds_fast_start"] = args.cds
+    if args.gc_log is not None:
+        config["gc_logging"] = args.gc_log
+    if args.jfr:
+        config["jfr_template"] = args.jfr
+    if args.heap_dump is not None:
+        config["heap_dump_on_oom"] = args.heap_dump
+
+    timeline = LaunchTimeline(version_id)
+    timeline.set("source", "cli")
+    with timeline.phase("java_check"):
+        java_path = _select_java(args, paths, config, version_id)
+    if not java_path:
+        _error("Java bulunamadı! Lütfen Java'yı yükleyin.")
+        return EXIT_FAILED
+
+    generations = GenerationCounter(paths.launcher_dir / "generations.json")
+    fingerprints = FingerprintStore(paths.launcher_dir / "launch_fingerprints.json")
+
+    # Son başarılı başlatmadan beri hiçbir şey değişmediyse kontrolleri atla
+    fingerprint = fingerprint_version(paths, version_id, java_path, stored_config, generations.get())
+    fast_path = not args.verify and fingerprint is not None and fingerprint == fingerprints.get(version_id)
+    timeline.set("fast_path", fast_path)
+    if not fast_path:
+        from version_installer import verify_version
+        with timeline.phase("asset_verify"):
+            try:
+                bad = verify_version(paths, version_id)
+            except OSError as e:
+                _error(f"Doğrulama başarısız: {e}")
+                return EXIT_FAILED
+            if bad:
+                _info(args, f"⚠️ {len(bad)} dosya eksik, indiriliyor...")
+                if not _repair(args, paths, bad):
+                    return EXIT_FAILED
+
+    with timeline.phase("build_command"):
+        try:
+            spec = build_launch_command(paths, config, version_id, java_path,
+                                        JavaRegistry(paths.cache_dir / "java_registry.json"),
+                                        JvmFlagProbe(paths.cache_dir / "jvm_flags.json"),
+                                        game_dir=game_dir)
+        except Exception as e:
+            _error(str(e))
+            return EXIT_FAILED
+    if spec.uuid_generated and config["username"] == saved_username:
+        stored_config["uuid"] = spec.player_uuid
+        save_config(paths.config_file, stored_config)
+    if spec.missing_asset_index:
+        _info(args, "⚠️ Asset index eksik, oyun seslerini/dokularını bulamayabilir (berkemc verify --repair)")
+    for dropped in spec.flag_plan.dropped:
+        _info(args, f"⚠️ Bu Java desteklemiyor, atlandı: {dropped}")
+    for wrapper_spec, reason in spec.wrapper_chain.skipped:
+        _info(args, f"⚠️ Sarmalayıcı atlandı: {wrapper_spec} ({reason})")
+
+    env, _ = launch_environment(os.environ, spec.display_env, config, spec.wrapper_chain.environment())
+    if not fast_path:
+        fingerprint = fingerprint_version(paths, version_id, java_path, stored_config, generations.get())
+    timeline.set("fingerprint", fingerprint)
+    timeline.set("java_path", java_path)
+    timeline.set("gpu_profile", spec.gpu_profile.name)
+    timeline.set("cds", spec.cds_plan.mode)
+
+    paths.logs_dir.mkdir(parents=True, exist_ok=True)
+    log_name = f"{instance.name}_{version_id}" if instance else version_id
+    log_file = paths.logs_dir / f"minecraft_{log_name}_{time.strftime('%Y%m%d_%H%M%S')}.log"
+    instance_name = instance.name if instance else DEFAULT_INSTANCE
+    governed = CgroupGovernor(config).prepare(instance_name, limits_for(spec.max_heap_mb, config))
+    if governed.reason and config.get("cgroup_governor", METHOD_OFF) != METHOD_OFF:
+        _info(args, f"⚠️ Cgroup: {governed.reason}")
+    timeline.set("cgroup", dict(governed.limits.to_dict(), method=governed.method, unit=governed.unit))
+    if spec.wrapper_chain:
+        with timeline.phase("wrapper_probe"):
+            probe = WrapperProbe(paths.cache_dir / "wrapper_probe.json")
+            timeline.set("wrapper_overhead_ms", probe.overhead_ms(spec.wrapper_chain))
+    timeline.set("wrappers", spec.wrapper_chain.key())
+    if spec.wrapper_chain.skipped:
+        timeline.set("wrappers_skipped", [f"{s}: {reason}" for s, reason in spec.wrapper_chain.skipped])
+    if spec.gc_log:
+        prepare_gc_log(spec.gc_log)
+        timeline.set("gc_log", str(spec.gc_log))
+        timeline.set("gc_pause_target", spec.gc_pause_target)
+    if spec.heap_dump_dir:
+        prepare_heap_dumps(spec.heap_dump_dir, config.get("heap_dump_cap_mb", HEAP_DUMP_CAP_MB), spec.max_heap_mb)
+    if spec.jfr_recording:
+        # JVM kayıt dosyasını açılışta oluşturur; dizin o sırada var olmalı
+        save_jfr_meta(spec.jfr_recording, version=version_id, instance=instance_name, game_dir=str(game_dir),
+                      template=args.jfr, mode="launch", started_at=time.time())
+    with timeline.phase("spawn"):
+        with open(log_file, 'w') as log:
+            process = subprocess.Popen(governed.wrap(spec.command), stdout=log, stderr=subprocess.STDOUT,
+                                       env=env, start_new_session=True)
+    timeline.mark("spawned")
+    registry.register(process.pid, instance_name, version_id, game_dir, log_file)
+    timeline.set("instance", instance_name)
+    timeline.set("pid", process.pid)
+    timeline.set("log_file", str(log_file))
+    # Komut oyun hazır olunca çıkar; oturum yalnız oyun bu sırada kapanırsa bitirilir
+    sessions = SessionStore(paths.launcher_dir / SESSIONS_FILE)
+    session_id = sessions.begin(version_id, instance_name, settings_snapshot(config, spec, game_dir), timeline.started_at,
+                                log_file, process.pid, source="cli")
+    timeline.set("session_id", session_id)
+    _info(args, f"🚀 {version_id} başlatıldı (PID {process.pid})")
+    _info(args, f"📋 Log: {log_file}")
+    if spec.gc_log:
+        _info(args, f"🗑️  GC logu: {spec.gc_log}")
+    if spec.jfr_recording:
+        _info(args, f"🎯 JFR kaydı (oyun kapanınca yazılır): {spec.jfr_recording}")
+    elif args.jfr:
+        _error(f"JFR kaydı eklenmedi: {spec.jfr_skipped or 'Java desteklemiyor'}")
+
+    history = LaunchHistory(paths.launcher_dir / "launch_history.jsonl")
+    if args.no_wait:
+        history.append(timeline.to_dict())
+        return EXIT_OK
+
+    watcher = LaunchStateWatcher(process)
+    classifier = LogClassifier(load_rules(rule_files(paths.launcher_dir)))
+    follower = LogFollower(log_file, is_alive=lambda: process.poll() is None)
+    follower.subscribe(watcher.feed)
+    follower.subscribe_block(classifier.feed_block)
+    follower.start()
+
+    with timeline.phase("startup_wait"):
+        state = watcher.wait(args.timeout)
+    if state == STATE_FAILED and watcher.wait_for_exit(5.0) is None:
+        # Yakalanmış hata: oyun çalışmaya devam ediyor
+        state = STATE_READY
+    timeline.mark(f"state_{state}")
+    timeline.set("startup_state", state)
+
+    if state == STATE_READY:
+        if fingerprint:
+            fingerprints.set(version_id, fingerprint)
+        history.append(timeline.to_dict())
+        sessions.update(session_id, startup_ms=time_to_play_ms(timeline.to_dict()))
+        _info(args, f"✅ Oyun hazır ({timeline.elapsed_ms() / 1000:.1f}s)")
+        return EXIT_OK
+
+    if state == STATE_TIMEOUT:
+        history.append(timeline.to_dict())
+        _error(f"{args.timeout} saniyede hazır sinyali gelmedi, oyun çalışıyor (PID {process.pid})")
+        return EXIT_TIMEOUT
+
+    follower.join(2.0)
+    if watcher.exit_code is not None:
+        timeline.set("exit_code", watcher.exit_code)
+    if classifier.counts():
+        timeline.set("log_errors", classifier.counts())
+    if spec.gc_log:
+        # Oyun kapandı: log tamam, özet logun yanına yazılır
+        try:
+            save_gc_summary(spec.gc_log, parse_gc_log(spec.gc_log, spec.gc_pause_target).summary())
+        except OSError:
+            pass
+    history.append(timeline.to_dict())
+    heap_dump = new_heap_dump(spec.heap_dump_dir, timeline.started_at) if spec.heap_dump_dir else None
+    sessions.finish(session_id, watcher.exit_code, outcome_for(watcher.exit_code, False, classifier.counts()),
+                    jvm_summary={"heap_dump": heap_dump} if heap_dump else None)
+    if state == STATE_EXITED and watcher.exit_code == 0:
+        _info(args, "Minecraft kapandı")
+        return EXIT_OK
+
+    fingerprints.invalidate(version_id)
+    if spec.cds_plan.mode == CDS_USE:
+        CdsStore(paths.cache_dir / "cds").invalidate(version_id)
+    _error(f"Minecraft başlatılamadı: {watcher.reason}")
+    for message in classifier.messages():
+        print(f"   {message}", file=sys.stderr)
+    for solution in classifier.solutions(4):
+        print(f"   💡 {solution}", file=sys.stderr)
+    if heap_dump:
+        print(f"   💾 Heap dökümü: {heap_dump}", file=sys.stderr)
+    try:
+        tail = read_tail(log_file, 16 * 1024).splitlines()[-20:]
+        sys.stderr.write("\n".join(tail) + "\n")
+    except OSError:
+        pass
+    return EXIT_FAILED
+
+
+def cmd_export(args, paths: LauncherPaths) -> int:
+    """Çözülmüş başlatma komutunu bağımsız bir sh betiğine yaz"""
+    from pathlib import Path
+    from java_registry import JavaRegistry
+    from jvm_flags import JvmFlagProbe
+    from launch_builder import build_launch_command, launch_environment
+    from instance_manager import InstanceManager
+    from launch_script import export_launch_script, default_export_paths
+
+    instance = None
+    if args.instance:
+        instance = InstanceManager(paths.launcher_dir / "instances").get(args.instance)
+        if instance is None:
+            _error(f"Instance bulunamadı: {args.instance}")
+            return EXIT_FAILED
+    version_id = args.version or (instance.version_id if instance else None)
+    if not version_id:
+        _error("Sürüm ya da --instance verilmeli")
+        return EXIT_USAGE
+    if not (paths.versions_dir / version_id / f"{version_id}.json").exists():
+        _error(f"Sürüm kurulu değil: {version_id} (berkemc install {version_id})")
+        return EXIT_FAILED
+
+    stored_config = load_config(paths.config_file)
+    config = instance.apply(stored_config) if instance else dict(stored_config)
+    java_path = _select_java(args, paths, config, version_id)
+    if not java_path:
+        _error("Java bulunamadı! Lütfen Java'yı yükleyin.")
+        return EXIT_FAILED
+
+    game_dir = instance.game_dir if instance else paths.minecraft_dir
+    try:
+        spec = build_launch_command(paths, config, version_id, java_path,
+                                    JavaRegistry(paths.cache_dir / "java_registry.json"),
+                                    JvmFlagProbe(paths.cache_dir / "jvm_flags.json"),
+                                    game_dir=game_dir)
+    except Exception as e:
+        _error(str(e))
+        return EXIT_FAILED
+    # Betik her açılışta aynı UUID'yi kullanmalı
+    if spec.uuid_generated:
+        stored_config["uuid"] = spec.player_uuid
+        save_config(paths.config_file, stored_config)
+    if spec.missing_asset_index:
+        _info(args, "⚠️ Asset index eksik, oyun seslerini/dokularını bulamayabilir (berkemc verify --repair)")
+    for wrapper_spec, reason in spec.wrapper_chain.skipped:
+        _info(args, f"⚠️ Sarmalayıcı atlandı: {wrapper_spec} ({reason})")
+
+    env, _ = launch_environment(os.environ, spec.display_env, config, spec.wrapper_chain.environment())
+    instance_name = instance.name if instance else None
+    script_path, desktop_path = default_export_paths(paths, version_id, instance_name)
+    try:
+        result = export_launch_script(paths, spec, env, os.environ, version_id, java_path, game_dir,
+                                      Path(args.output) if args.output else script_path,
+                                      instance_name=instance_name,
+                                      desktop_file=desktop_path if args.desktop else None,
+                                      explicit_java=bool(args.java))
+    except OSError as e:
+        _error(f"Betik yazılamadı: {e}")
+        return EXIT_FAILED
+    _info(args, f"📜 Betik: {result['script']} ({result['files']} dosya izleniyor)")
+    if result["desktop"]:
+        _info(args, f"🖥️ Masaüstü girdisi: {result['desktop']}")
+    return EXIT_OK
+
+
+def cmd_search(args, paths: LauncherPaths) -> int:
+    """Loglarda ve çökme raporlarında ara (dizin önce artımlı güncellenir)"""
+    import json
+    from instance_manager import InstanceManager, DEFAULT_INSTANCE
+    from launch_profiler import LaunchHistory
+    from log_index import LogIndex, INDEX_FILE, KIND_CRASH, fts_available, version_resolver, log_sources, parse_time
+
+    if not fts_available():
+        _error("Python'un SQLite'ı FTS5 desteklemiyor")
+        return EXIT_FAILED
+    try:
+        since = parse_time(args.since) if args.since else None
+        until = parse_time(args.until) if args.until else None
+    except ValueError as e:
+        _error(str(e))
+        return EXIT_USAGE
+
+    index = LogIndex(paths.cache_dir / INDEX_FILE, LaunchHistory(paths.launcher_dir / "launch_history.jsonl"),
+                     version_resolver(paths.version_search_dirs()))
+    if not args.no_update:
+        game_dirs = {DEFAULT_INSTANCE: paths.minecraft_dir}
+        game_dirs.update({i.name: i.game_dir for i in InstanceManager(paths.launcher_dir / "instances").list()})
+        report = index.update(log_sources(paths.logs_dir, game_dirs))
+        if report["files"]:
+            print(f"📚 {report['files']} dosya dizinlendi ({report['seconds']:.1f}s)", file=sys.stderr)
+
+    try:
+        results = index.search(args.query, version=args.version, loader=args.loader,
+                               kind=KIND_CRASH if args.crashes else None, since=since, until=until,
+                               exit_code=args.exit_code, limit=args.limit)
+    except ValueError as e:
+        _error(str(e))
+        return EXIT_USAGE
+
+    if args.json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+        return EXIT_OK if results else EXIT_FAILED
+    for result in results:
+        # grep biçimi: yol:satır: metin, ardından metadata
+        date = time.strftime("%Y-%m-%d %H:%M", time.localtime(result["started_at"])) if result["started_at"] else "-"
+        exit_code = "çökme" if result["kind"] == KIND_CRASH else result["exit_code"]
+        print(f"{result['path']}:{result.get('line_no', 1)}: {result.get('line', '').strip()}")
+        _info(args, f"    {date}  {result['version'] or '-'}  {result['loader'] or '-'}  çıkış {'-' if exit_code is None else exit_code}"
+                    f"  java {result['java_version'] or '-'}  {result['hits']} eşleşme")
+    return EXIT_OK if results else EXIT_FAILED
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="berkemc", description="Berke Minecraft Launcher - komut satırı")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Sadece hataları yaz")
+    subparsers = parser.add_subparsers(dest="command")
+
+    launch = subparsers.add_parser("launch", help="Sürümü başlat, oyun hazır olunca çık")
+    launch.add_argument("version", nargs="?")
+    launch.add_argument("--instance", help="Instance adı (kendi oyun dizini ve ayarlarıyla)")
+    launch.add_argument("--username", help="Bu başlatma için oyuncu adı")
+    launch.add_argument("--memory", help="Heap boyutu (GB) ya da 'auto'")
+    launch.add_argument("--java", help="Java ikilisi")
+    launch.add_argument("--wrapper", action="append", metavar="SPEC",
+                        help="Sarmalayıcı (gamemode, prime-run, mangohud, nice:-5, taskset:0-3 ya da komut); tekrarlanabilir")
+    launch.add_argument("--no-wrappers", action="store_true", help="Java'yı sarmalayıcısız başlat")
+    launch.add_argument("--gpu-profile", choices=[PROFILE_AUTO] + PROFILES,
+                        help="Grafik ortam profili (varsayılan: ayar ya da otomatik)")
+    launch.add_argument("--cds", action="store_const", const=True, default=None,
+                        help="AppCDS sınıf arşiviyle hızlı açılış (varsayılan: ayar)")
+    launch.add_argument("--no-cds", dest="cds", action="store_const", const=False, help="Bu açılışta CDS kullanma")
+    launch.add_argument("--gc-log", action="store_const", const=True, default=None,
+                        help="GC logunu kaydet, duraklamalar launcher'da incelenir (varsayılan: ayar)")
+    launch.add_argument("--no-gc-log", dest="gc_log", action="store_const", const=False, help="Bu açılışta GC logu yazma")
+    launch.add_argument("--jfr", nargs="?", const="profile", metavar="ŞABLON",
+                        help="Flight Recorder ile kaydet (default, profile ya da .jfc; özet: menü > Performans > JFR Profili)")
+    launch.add_argument("--heap-dump", action="store_const", const=True, default=None,
+                        help="OutOfMemoryError'da heap dökümü yaz (boyutu sınırlı dizine; varsayılan: ayar)")
+    launch.add_argument("--no-heap-dump", dest="heap_dump", action="store_const", const=False,
+                        help="Bu açılışta heap dökümü yazma")
+    launch.add_argument("--verify", action="store_true", help="Parmak izi eşleşse de dosyaları kontrol et")
+    launch.add_argument("--no-wait", action="store_true", help="Hazır olmasını bekleme")
+    launch.add_argument("--timeout", type=float, default=60, help="Hazır sinyali için süre (sn)")
+    launch.add_argument("--workers", type=int, default=16, help="Eksik dosyalar için paralel indirme")
+
+    install = subparsers.add_parser("install", help="Sürümü indir ve kur")
+    install.add_argument("version")
+    install.add_argument("--workers", type=int, default=16, help="Paralel indirme sayısı")
+    install.add_argument("--no-java", action="store_true", help="Sürümün Java runtime'ını kurma")
+
+    listing = subparsers.add_parser("list", help="Kurulu sürümleri listele")
+    listing.add_argument("--remote", action="store_true", help="İndirilebilir sürümleri listele")
+    listing.add_argument("--instances", action="store_true", help="Instance'ları listele")
+    listing.add_argument("--running", action="store_true", help="Çalışan oyunları listele")
+    listing.add_argument("--type", default="release", choices=["release", "snapshot", "old_beta", "old_alpha", "all"])
+    listing.add_argument("--offline", action="store_true", help="Sadece önbellekteki listeyi kullan")
+
+    verify = subparsers.add_parser("verify", help="Sürüm dosyalarını doğrula")
+    verify.add_argument("version")
+    verify.add_argument("--deep", action="store_true", help="SHA-1 özetlerini de kontrol et")
+    verify.add_argument("--repair", action="store_true", help="Eksik/bozuk dosyaları yeniden indir")
+    verify.add_argument("--workers", type=int, default=16, help="Paralel indirme sayısı")
+
+    gpu = subparsers.add_parser("gpu", help="Grafik donanımını ve seçilen ortam profilini göster")
+    gpu.add_argument("--json", action="store_true", help="JSON çıktı")
+
+    java = subparsers.add_parser("java", help="Yönetilen Java runtime'larını listele, kur, kaldır")
+    java.add_argument("--install", metavar="BİLEŞEN|SÜRÜM", help="Runtime kur (java-runtime-delta ya da 1.21.1 gibi)")
+    java.add_argument("--remove", metavar="BİLEŞEN", help="Runtime'ı kaldır")
+    java.add_argument("--workers", type=int, default=16, help="Paralel indirme sayısı")
+    java.add_argument("--json", action="store_true", help="JSON çıktı")
+
+    search = subparsers.add_parser("search", help="Loglarda ve çökme raporlarında tam metin arama")
+    search.add_argument("query", help="Kelimeler (hepsi aranır), \"ifade\" ya da FTS5 sorgusu (OR, NOT, önek*)")
+    search.add_argument("--version", help="Oyun sürümü (1.20.1) ya da sürüm kimliği")
+    search.add_argument("--loader", choices=["vanilla", "fabric", "quilt", "forge", "neoforge"])
+    search.add_argument("--since", help="30d, 2w, 12h ya da YYYY-AA-GG")
+    search.add_argument("--until", help="YYYY-AA-GG (hariç) ya da 30d")
+    search.add_argument("--exit-code", type=int, help="Yalnız bu çıkış koduyla kapanan oturumlar")
+    search.add_argument("--crashes", action="store_true", help="Yalnız çökme raporları")
+    search.add_argument("--limit", type=int, default=50, help="En çok belge")
+    search.add_argument("--no-update", action="store_true", help="Dizini güncellemeden ara")
+    search.add_argument("--json", action="store_true", help="JSON çıktı")
+
+    export = subparsers.add_parser("export", help="Launcher'sız çalışan başlatma betiği oluştur")
+    export.add_argument("version", nargs="?")
+    export.add_argument("--instance", help="Instance adı (kendi oyun dizini ve ayarlarıyla)")
+    export.add_argument("--output", help="Betik yolu (varsayılan: ~/.berke_minecraft_launcher/exports/)")
+    export.add_argument("--desktop", action="store_true", help="Uygulama menüsü için .desktop dosyası da yaz")
+    export.add_argument("--java", help="Java ikilisi")
+    return parser
+
+
+def main(argv: List[str] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not any(arg in COMMANDS for arg in argv[:2]) and not set(argv) & {"-h", "--help"}:
+        # Alt komut yoksa menülü launcher
+        from berke_minecraft_launcher import main as tui_main
+        return tui_main()
+
+    args = build_parser().parse_args(argv)
+    if args.command == "launch" and args.memory and args.memory != "auto" and not args.memory.isdigit():
+        _error("--memory bir sayı (GB) ya da 'auto' olmalı")
+        return EXIT_USAGE
+
+    handlers = {"launch": cmd_launch, "install": cmd_install, "list": cmd_list, "verify": cmd_verify, "gpu": cmd_gpu,
+                "export": cmd_export, "java": cmd_java, "search": cmd_search}
+    try:
+        return handlers[args.command](args, LauncherPaths())
+    except KeyboardInterrupt:
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Cgroup Governor
+Her oyun sürecini kendi cgroup v2 kapsamına al (systemd-run --user --scope
+ya da kullanıcıya devredilmiş alt ağaç); bellek, CPU ve I/O paylarını uygula,
+istatistikleri oku
+"""
+
+import os
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+SCOPE_PREFIX = "berkemc-"
+
+METHOD_OFF = "off"
+METHOD_AUTO = "auto"
+METHOD_SYSTEMD = "systemd"
+METHOD_DELEGATED = "delegated"
+
+# Oyun, arka plan indirmelerine (varsayılan 100) göre öncelikli
+DEFAULT_CPU_WEIGHT = 200
+DEFAULT_IO_WEIGHT = 500
+
+REQUIRED_CONTROLLERS = ("memory", "cpu", "io")
+
+_UNIT_SAFE_RE = re.compile(r'[^A-Za-z0-9:_.-]')
+
+
+def parse_cpu_list(text: str) -> List[int]:
+    """'0-3,6' → [0, 1, 2, 3, 6]"""
+    cpus = []
+    for part in (text or "").split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            cpus.extend(range(int(start), int(end) + 1))
+        else:
+            cpus.append(int(part))
+    return sorted(set(cpus))
+
+
+def cgroup_of(pid) -> Optional[Path]:
+    """Sürecin cgroup v2 dizini"""
+    try:
+        with open(f"/proc/{pid}/cgroup", 'r') as f:
+            for line in f:
+                if line.startswith("0::"):
+                    return CGROUP_ROOT / line.strip()[3:].lstrip("/")
+    except OSError:
+        pass
+    return None
+
+
+def _controllers(cgroup_dir: Path, file_name: str = "cgroup.controllers") -> List[str]:
+    try:
+        return (cgroup_dir / file_name).read_text().split()
+    except OSError:
+        return []
+
+
+def cgroup_v2_available() -> bool:
+    """Birleşik (v2) hiyerarşi bağlı mı"""
+    return (CGROUP_ROOT / "cgroup.controllers").exists()
+
+
+class CgroupLimits:
+    """Bir oyun süreci için kaynak sınırları"""
+
+    def __init__(self, memory_high_mb: int = None, memory_max_mb: int = None, cpu_weight: int = DEFAULT_CPU_WEIGHT,
+                 io_weight: int = DEFAULT_IO_WEIGHT, cpus: List[int] = None):
+        self.memory_high_mb = memory_high_mb
+        self.memory_max_mb = memory_max_mb
+        self.cpu_weight = cpu_weight
+        self.io_weight = io_weight
+        self.cpus = cpus or []
+
+    def summary(self) -> str:
+        """Kısa rapor"""
+        parts = []
+        if self.memory_max_mb:
+            parts.append(f"bellek {self.memory_high_mb}/{self.memory_max_mb} MB")
+        parts.append(f"cpu.weight {self.cpu_weight}")
+        parts.append(f"io.weight {self.io_weight}")
+        if self.cpus:
+            parts.append(f"CPU {','.join(map(str, self.cpus))}")
+        return ", ".join(parts)
+
+    def to_dict(self) -> Dict:
+        return {
+            "memory_high_mb": self.memory_high_mb,
+            "memory_max_mb": self.memory_max_mb,
+            "cpu_weight": self.cpu_weight,
+            "io_weight": self.io_weight,
+            "cpus": self.cpus,
+        }
+
+
+def limits_for(heap_mb: int, config: Dict) -> CgroupLimits:
+    """
+    Heap boyutuna göre varsayılan sınırlar, config ile geçersiz kılınabilir
+
+    memory.max heap + JVM'in heap dışı kullanımı (metaspace, code cache,
+    native/sürücü tamponları) kadardır; memory.high biraz altında kalır ki
+    sızıntı önce geri kazanımla yavaşlasın, OOM en son gelsin.
+    """
+    non_heap = max(2048, heap_mb // 2)
+    memory_max = config.get("cgroup_memory_max_mb") or heap_mb + non_heap
+    memory_high = config.get("cgroup_memory_high_mb") or memory_max - max(512, (memory_max - heap_mb) // 4)
+    return CgroupLimits(
+        memory_high_mb=int(min(memory_high, memory_max)),
+        memory_max_mb=int(memory_max),
+        cpu_weight=int(config.get("cgroup_cpu_weight", DEFAULT_CPU_WEIGHT)),
+        io_weight=int(config.get("cgroup_io_weight", DEFAULT_IO_WEIGHT)),
+        cpus=parse_cpu_list(config.get("cgroup_cpus", "")),
+    )
+
+
+class GovernedLaunch:
+    """
+    Tek başlatma için cgroup yerleşimi
+
+    wrap() komutu sarar: systemd-run kapsamı ya da devredilmiş modda kendini
+    cgroup'a yazıp exec eden sh katmanı, CPU kümesi için taskset. Yerleşim
+    exec edilen komutta yapılır; launcher'ın iş parçacıkları varken fork
+    sonrası Python çalıştıran preexec_fn güvenli değildir.
+    """
+
+    def __init__(self, method: str, limits: CgroupLimits, reason: str = "", unit: str = None,
+                 cgroup_dir: Path = None):
+        self.method = method
+        self.limits = limits
+        self.reason = reason
+        self.unit = unit
+        self.cgroup_dir = cgroup_dir
+        if limits.cpus and not shutil.which("taskset"):
+            self.reason = ", ".join(filter(None, [reason, "taskset bulunamadı, CPU kümesi uygulanmadı"]))
+
+    def wrap(self, command: List[str]) -> List[str]:
+        command = list(command)
+        if self.limits.cpus and shutil.which("taskset"):
+            command = ["taskset", "-c", ",".join(map(str, self.limits.cpus))] + command
+        if self.method == METHOD_DELEGATED:
+            # sh kendini ($$) cgroup'a taşır, sonra exec ile PID'i oyuna bırakır; yazamazsa oyun yine açılır
+            return ["sh", "-c", 'echo $$ > "$0"; exec "$@"', str(self.cgroup_dir / "cgroup.procs")] + command
+        if self.method != METHOD_SYSTEMD:
+            return command
+        properties = [
+            f"MemoryHigh={self.limits.memory_high_mb}M",
+            f"MemoryMax={self.limits.memory_max_mb}M",
+            f"CPUWeight={self.limits.cpu_weight}",
+            f"IOWeight={self.limits.io_weight}",
+        ]
+        prefix = ["systemd-run", "--user", "--scope", "--quiet", f"--unit={self.unit}"]
+        for prop in properties:
+            prefix += ["-p", prop]
+        return prefix + ["--"] + command
+
+    def describe(self) -> str:
+        if self.method == METHOD_OFF:
+            return f"cgroup yok ({self.reason})" if self.reason else "cgroup yok"
+        return f"{self.method}: {self.limits.summary()}"
+
+
+class CgroupGovernor:
+    """Config'e göre yerleşim yöntemini seçer"""
+
+    def __init__(self, config: Dict):
+        self.mode = config.get("cgroup_governor", METHOD_OFF)
+        self.parent = config.get("cgroup_parent")
+        self.config = config
+
+    def _systemd_usable(self) -> Optional[str]:
+        """systemd-run --user kullanılabilir mi; değilse sebep"""
+        if not shutil.which("systemd-run"):
+            return "systemd-run bulunamadı"
+        runtime_dir = os.environ.get("XDG_RUNTIME_DIR", f"/run/user/{os.getuid()}")
+        if not os.environ.get("DBUS_SESSION_BUS_ADDRESS") and not os.path.exists(os.path.join(runtime_dir, "bus")):
+            return "kullanıcı oturum veri yolu yok"
+        return None
+
+    @staticmethod
+    def _user_manager_controllers() -> List[str]:
+        """Kullanıcı systemd'sine devredilen denetleyiciler"""
+        uid = os.getuid()
+        manager = CGROUP_ROOT / "user.slice" / f"user-{uid}.slice" / f"user@{uid}.service"
+        return _controllers(manager)
+
+    def _prepare_delegated(self, unit: str, limits: CgroupLimits) -> GovernedLaunch:
+        parent = Path(self.parent) if self.parent else None
+        if not parent or not parent.is_dir() or not os.access(parent, os.W_OK):
+            return GovernedLaunch(METHOD_OFF, limits, "devredilmiş cgroup (cgroup_parent) yazılabilir değil")
+
+        enabled = _controllers(parent, "cgroup.subtree_control")
+        missing = [c for c in REQUIRED_CONTROLLERS if c not in enabled and c in _controllers(parent)]
+        if missing:
+            try:
+                (parent / "cgroup.subtree_control").write_text(" ".join(f"+{c}" for c in missing))
+            except OSError:
+                pass
+        enabled = _controllers(parent, "cgroup.subtree_control")
+
+        # Önceki oyunlardan kalan boş cgroup'ları temizle (doluysa rmdir başarısız olur)
+        for stale in parent.glob(f"{SCOPE_PREFIX}*"):
+            try:
+                stale.rmdir()
+            except OSError:
+                pass
+
+        cgroup_dir = parent / unit
+        try:
+            cgroup_dir.mkdir(exist_ok=True)
+            if "memory" in enabled:
+                (cgroup_dir / "memory.high").write_text(f"{limits.memory_high_mb}M")
+                (cgroup_dir / "memory.max").write_text(f"{limits.memory_max_mb}M")
+            if "cpu" in enabled:
+                (cgroup_dir / "cpu.weight").write_text(str(limits.cpu_weight))
+            if "io" in enabled and (cgroup_dir / "io.weight").exists():
+                (cgroup_dir / "io.weight").write_text(f"default {limits.io_weight}")
+        except OSError as e:
+            return GovernedLaunch(METHOD_OFF, limits, f"cgroup oluşturulamadı: {e}")
+
+        reason = "" if all(c in enabled for c in REQUIRED_CONTROLLERS) else \
+            "eksik denetleyici: " + ", ".join(c for c in REQUIRED_CONTROLLERS if c not in enabled)
+        return GovernedLaunch(METHOD_DELEGATED, limits, reason, unit, cgroup_dir)
+
+    def prepare(self, name: str, limits: CgroupLimits) -> GovernedLaunch:
+        """
+        Başlatma için yerleşimi hazırla
+
+        Args:
+            name: Instance adı (scope adına girer)
+            limits: Uygulanacak sınırlar
+
+        Returns:
+            GovernedLaunch; yöntem kullanılamıyorsa METHOD_OFF ve sebep
+        """
+        if self.mode == METHOD_OFF:
+            return GovernedLaunch(METHOD_OFF, limits)
+        if not cgroup_v2_available():
+            return GovernedLaunch(METHOD_OFF, limits, "cgroup v2 bağlı değil")
+
+        unit = f"{SCOPE_PREFIX}{_UNIT_SAFE_RE.sub('_', name)}-{int(time.time() * 1000)}"
+        if self.mode == METHOD_DELEGATED or (self.mode == METHOD_AUTO and self.parent):
+            return self._prepare_delegated(unit, limits)
+
+        problem = self._systemd_usable()
+        if problem:
+            return GovernedLaunch(METHOD_OFF, limits, problem)
+        controllers = self._user_manager_controllers()
+        missing = [c for c in REQUIRED_CONTROLLERS if controllers and c not in controllers]
+        reason = ("kullanıcı systemd'sine devredilmemiş: " + ", ".join(missing)) if missing else ""
+        return GovernedLaunch(METHOD_SYSTEMD, limits, reason, unit=unit + ".scope")
+
+
+def _read_flat_keyed(path: Path) -> Dict[str, int]:
+    values = {}
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[1].lstrip("-").isdigit():
+                    values[parts[0]] = int(parts[1])
+    except OSError:
+        pass
+    return values
+
+
+def _read_value(path: Path) -> Optional[str]:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def read_cgroup_stats(cgroup_dir: Path) -> Optional[Dict]:
+    """
+    memory.current/high/max, memory.events, cpu.stat ve io.stat özeti
+
+    Returns:
+        {"memory_mb", "memory_high_mb", "memory_max_mb", "events": {...},
+         "cpu_usec", "throttled_usec", "io_read_bytes", "io_write_bytes"} ya da None
+    """
+    cgroup_dir = Path(cgroup_dir)
+    if not cgroup_dir.is_dir():
+        return None
+
+    def to_mb(raw):
+        if raw is None or raw == "max":
+            return None
+        try:
+            return int(raw) / (1024 * 1024)
+        except ValueError:
+            return None
+
+    cpu = _read_flat_keyed(cgroup_dir / "cpu.stat")
+    stats = {
+        "path": str(cgroup_dir),
+        "memory_mb": to_mb(_read_value(cgroup_dir / "memory.current")),
+        "memory_high_mb": to_mb(_read_value(cgroup_dir / "memory.high")),
+        "memory_max_mb": to_mb(_read_value(cgroup_dir / "memory.max")),
+        "events": _read_flat_keyed(cgroup_dir / "memory.events"),
+        "cpu_usec": cpu.get("usage_usec"),
+        "throttled_usec": cpu.get("throttled_usec"),
+        "io_read_bytes": 0,
+        "io_write_bytes": 0,
+    }
+
+    # io.stat: "8:0 rbytes=... wbytes=... rios=..." her cihaz için bir satır
+    try:
+        with open(cgroup_dir / "io.stat", 'r') as f:
+            for line in f:
+                for field in line.split()[1:]:
+                    key, _, value = field.partition("=")
+                    if key == "rbytes":
+                        stats["io_read_bytes"] += int(value)
+                    elif key == "wbytes":
+                        stats["io_write_bytes"] += int(value)
+    except (OSError, ValueError):
+        pass
+    return stats
+
+
+def governed_cgroup(pid: int) -> Optional[Path]:
+    """Süreç launcher'ın açtığı bir cgroup'taysa onun yolu"""
+    path = cgroup_of(pid)
+    if path and path.name.startswith(SCOPE_PREFIX):
+        return path
+    return None
+
+
+__all__ = [
+    'METHOD_OFF', 'METHOD_AUTO', 'METHOD_SYSTEMD', 'METHOD_DELEGATED',
+    'parse_cpu_list', 'cgroup_of', 'cgroup_v2_available', 'CgroupLimits', 'limits_for',
+    'GovernedLaunch', 'CgroupGovernor', 'read_cgroup_stats', 'governed_cgroup'
+]
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Classpath Builder
+Maven koordinatlarına göre classpath tekilleştirme ve çakışma çözümü
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Kütüphane kaynakları (yüksek öncelik kazanır)
+SOURCE_VANILLA = "vanilla"
+SOURCE_LOADER = "loader"
+SOURCE_PRIORITY = {SOURCE_VANILLA: 0, SOURCE_LOADER: 1}
+
+_VERSION_TOKEN_RE = re.compile(r'\d+|[A-Za-z]+')
+
+# Maven qualifier sıralaması (bilinmeyenler release'den sonra gelir)
+_QUALIFIER_ORDER = {
+    "alpha": 0, "a": 0,
+    "beta": 1, "b": 1,
+    "milestone": 2, "m": 2,
+    "rc": 3, "cr": 3,
+    "snapshot": 4,
+    "": 5, "ga": 5, "final": 5, "release": 5,
+    "sp": 6,
+}
+
+
+def parse_maven_coordinate(name: str) -> Optional[Dict[str, str]]:
+    """
+    Maven koordinatını ayrıştır
+
+    Args:
+        name: "group:artifact:version[:classifier][@extension]"
+
+    Returns:
+        group, artifact, version, classifier, extension anahtarlı dict
+        veya geçersizse None
+    """
+    if not name:
+        return None
+
+    extension = "jar"
+    if "@" in name:
+        name, extension = name.split("@", 1)
+
+    parts = name.split(":")
+    if len(parts) < 3:
+        return None
+
+    return {
+        "group": parts[0],
+        "artifact": parts[1],
+        "version": parts[2],
+        "classifier": parts[3] if len(parts) > 3 else "",
+        "extension": extension,
+    }
+
+
+def coordinate_key(coord: Dict[str, str]) -> str:
+    """Çakışma anahtarı: group:artifact[:classifier]"""
+    key = f"{coord['group']}:{coord['artifact']}"
+    if coord.get("classifier"):
+        key += f":{coord['classifier']}"
+    return key
+
+
+def maven_path(coord: Dict[str, str]) -> str:
+    """Koordinattan depo içi göreli yolu oluştur"""
+    file_name = f"{coord['artifact']}-{coord['version']}"
+    if coord.get("classifier"):
+        file_name += f"-{coord['classifier']}"
+    file_name += f".{coord.get('extension', 'jar')}"
+    return "/".join([coord["group"].replace(".", "/"), coord["artifact"], coord["version"], file_name])
+
+
+def _version_tokens(version: str) -> List:
+    """Sürüm string'ini karşılaştırılabilir parçalara böl"""
+    tokens = []
+    for token in _VERSION_TOKEN_RE.findall(version):
+        if token.isdigit():
+            tokens.append((1, int(token), ""))
+        else:
+            tokens.append((0, _QUALIFIER_ORDER.get(token.lower(), 5), token.lower()))
+    return tokens
+
+
+def compare_versions(a: str, b: str) -> int:
+    """
+    İki Maven sürümünü karşılaştır
+
+    Returns:
+        a < b ise -1, eşitse 0, a > b ise 1
+    """
+    ta, tb = _version_tokens(a), _version_tokens(b)
+
+    def pad(other):
+        # Eksik parça: karşısı sayı ise 0, qualifier ise release kabul edilir
+        return (1, 0, "") if other[0] == 1 else (0, 5, "")
+
+    for i in range(max(len(ta), len(tb))):
+        xa = ta[i] if i < len(ta) else pad(tb[i])
+        xb = tb[i] if i < len(tb) else pad(ta[i])
+        if xa != xb:
+            return -1 if xa < xb else 1
+    return 0
+
+
+def library_allowed(lib: Dict, os_name: str = "linux") -> bool:
+    """Kütüphanenin 'rules' alanını bu işletim sistemi için değerlendir"""
+    rules = lib.get("rules")
+    if not rules:
+        return True
+
+    allowed = False
+    for rule in rules:
+        # Özellik bazlı kurallar (demo, custom resolution vb.) launcher'da kullanılmıyor
+        if rule.get("features"):
+            continue
+        rule_os = rule.get("os")
+        if rule_os and rule_os.get("name") and rule_os["name"] != os_name:
+            continue
+        allowed = rule.get("action") == "allow"
+    return allowed
+
+
+def library_jar_path(lib: Dict, libraries_dir: Path) -> Optional[Path]:
+    """Kütüphanenin classpath'e girecek JAR yolunu bul (eski ve yeni format)"""
+    downloads = lib.get("downloads", {})
+    if "artifact" in downloads and downloads["artifact"].get("path"):
+        return libraries_dir / downloads["artifact"]["path"]
+
+    coord = parse_maven_coordinate(lib.get("name", ""))
+    if coord:
+        return libraries_dir / maven_path(coord)
+    return None
+
+
+def load_version_chain(version_id: str, search_dirs: List[Path]) -> List[Dict]:
+    """
+    Sürüm JSON'unu ve 'inheritsFrom' zincirini yükle
+
+    Returns:
+        [çocuk (loader), ..., kök (vanilla)] sırasında JSON listesi
+    """
+    chain = []
+    seen = set()
+    current = version_id
+
+    while current and current not in seen:
+        seen.add(current)
+        data = None
+        for base in search_dirs:
+            json_path = Path(base) / current / f"{current}.json"
+            if json_path.exists():
+                with open(json_path, 'r') as f:
+                    data = json.load(f)
+                break
+
+        if data is None:
+            if not chain:
+                raise FileNotFoundError(f"Sürüm JSON'u bulunamadı: {current}")
+            break
+
+        chain.append(data)
+        current = data.get("inheritsFrom")
+
+    return chain
+
+
+def merge_version_chain(chain: List[Dict]) -> Dict:
+    """Zinciri tek sürüm verisine indir - çocuk alanları ebeveyninkileri ezer"""
+    merged: Dict = {}
+    for data in reversed(chain):
+        for key, value in data.items():
+            if key == "libraries":
+                continue
+            if key == "arguments" and isinstance(value, dict) and isinstance(merged.get("arguments"), dict):
+                combined = dict(merged["arguments"])
+                for arg_type, args in value.items():
+                    combined[arg_type] = combined.get(arg_type, []) + args
+                merged["arguments"] = combined
+            else:
+                merged[key] = value
+
+    # Kütüphaneler çocuktan köke doğru sıralanır (loader önce)
+    merged["libraries"] = [lib for data in chain for lib in data.get("libraries", [])]
+    if chain:
+        merged["id"] = chain[0].get("id", merged.get("id"))
+        merged.pop("inheritsFrom", None)
+    return merged
+
+
+class ClasspathResult:
+    """Classpath oluşturma sonucu ve atılan girdilerin raporu"""
+
+    def __init__(self):
+        self.entries: List[str] = []
+        self.dropped: List[Dict] = []
+        self.missing: List[str] = []
+        self.skipped_by_rules = 0
+
+    def as_string(self, separator: str = os.pathsep) -> str:
+        """Classpath'i JVM'e verilecek string olarak döndür"""
+        return separator.join(self.entries)
+
+    def summary(self) -> str:
+        """Kısa rapor"""
+        text = f"{len(self.entries)} JAR"
+        if self.dropped:
+            text += f", {len(self.dropped)} tekrar atlandı"
+        if self.missing:
+            text += f", {len(self.missing)} eksik"
+        return text
+
+
+class ClasspathBuilder:
+    """
+    Kütüphaneleri group:artifact[:classifier] ile gruplayıp tek sürüme indirger
+
+    Öncelik kuralı:
+        1. Loader kütüphanesi vanilla kütüphanesini ezer
+        2. Aynı kaynak içinde en yüksek sürüm kazanır
+    """
+
+    def __init__(self, libraries_dir: Path, os_name: str = "linux"):
+        self.libraries_dir = Path(libraries_dir)
+        self.os_name = os_name
+        self._candidates: Dict[str, Dict] = {}
+        self._order: List[str] = []
+        self._extra_jars: List[str] = []
+        self._result = ClasspathResult()
+
+    def add_version(self, version_data: Dict, source: str = SOURCE_VANILLA):
+        """Bir sürüm JSON'undaki tüm kütüphaneleri aday olarak ekle"""
+        for lib in version_data.get("libraries", []):
+            self.add_library(lib, source)
+
+    def add_chain(self, chain: List[Dict]):
+        """load_version_chain çıktısını ekle - kök vanilla, diğerleri loader"""
+        for index, data in enumerate(chain):
+            source = SOURCE_VANILLA if index == len(chain) - 1 else SOURCE_LOADER
+            self.add_version(data, source)
+
+    def add_library(self, lib: Dict, source: str = SOURCE_VANILLA):
+        """Tek kütüphane ekle ve varsa çakışmayı çöz"""
+        if not library_allowed(lib, self.os_name):
+            self._result.skipped_by_rules += 1
+            return
+
+        path = library_jar_path(lib, self.libraries_dir)
+        if path is None:
+            return
+
+        coord = parse_maven_coordinate(lib.get("name", ""))
+        if coord is None:
+            # Koordinatsız kütüphane: yoluna göre tekilleştir
+            key = f"path:{path}"
+            version = ""
+        else:
+            key = coordinate_key(coord)
+            version = coord["version"]
+
+        candidate = {"key": key, "version": version, "path": str(path), "source": source}
+        current = self._candidates.get(key)
+
+        if current is None:
+            self._candidates[key] = candidate
+            self._order.append(key)
+            return
+
+        if current["path"] == candidate["path"]:
+            return
+
+        winner, loser = self._resolve(current, candidate)
+        self._candidates[key] = winner
+        self._result.dropped.append({
+            "key": key,
+            "version": loser["version"],
+            "path": loser["path"],
+            "source": loser["source"],
+            "kept_version": winner["version"],
+            "kept_source": winner["source"],
+            "reason": "loader önceliği" if winner["source"] != loser["source"] else "daha yüksek sürüm",
+        })
+
+    def add_jar(self, path: Path):
+        """Koordinatı olmayan JAR ekle (ör. client JAR) - her zaman en sona eklenir"""
+        if str(path) not in self._extra_jars:
+            self._extra_jars.append(str(path))
+
+    def _resolve(self, current: Dict, candidate: Dict):
+        """İki aday arasından kazananı seç: (kazanan, kaybeden)"""
+        current_rank = SOURCE_PRIORITY.get(current["source"], 0)
+        candidate_rank = SOURCE_PRIORITY.get(candidate["source"], 0)
+        if candidate_rank != current_rank:
+            return (candidate, current) if candidate_rank > current_rank else (current, candidate)
+        if compare_versions(candidate["version"], current["version"]) > 0:
+            return candidate, current
+        return current, candidate
+
+    def build(self, require_exists: bool = True) -> ClasspathResult:
+        """Sıralı ve minimal classpath'i üret"""
+        result = self._result
+        result.entries = []
+        result.missing = []
+
+        for key in self._order:
+            path = self._candidates[key]["path"]
+            if require_exists and not os.path.exists(path):
+                result.missing.append(path)
+                continue
+            result.entries.append(path)
+
+        for path in self._extra_jars:
+            if require_exists and not os.path.exists(path):
+                result.missing.append(path)
+                continue
+            result.entries.append(path)
+
+        return result
+
+
+__all__ = [
+    'SOURCE_VANILLA', 'SOURCE_LOADER',
+    'parse_maven_coordinate', 'coordinate_key', 'maven_path', 'compare_versions',
+    'library_allowed', 'library_jar_path', 'load_version_chain', 'merge_version_chain',
+    'ClasspathResult', 'ClasspathBuilder'
+]
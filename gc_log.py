@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - GC Log
+JVM'nin birleşik GC logunu (-Xlog:gc*) oyun çalışırken artımlı ayrıştır:
+duraklama süreleri, sebepleri, heap öncesi/sonrası ve ayırma hızı
+"""
+
+import json
+import re
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Birleşik loglama Java 9'da geldi; Java 8'in -Xloggc biçimi ayrıştırılmaz
+MIN_JAVA_UNIFIED_LOGGING = 9
+
+# Duraklama histogramı kova üst sınırları (ms); son kova sınırsız
+HISTOGRAM_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500]
+
+# "[12.345s]" ya da "[12345ms]" uptime süslemesi
+_UPTIME_RE = re.compile(r"^\[(\d+(?:\.\d+)?)(s|ms)\]")
+# "GC(12) Pause Young (Normal) (G1 Evacuation Pause) 24M->5M(256M) 6.123ms"
+# ZGC/Shenandoah: "GC(3) Pause Mark Start 0.012ms", kuşaklı ZGC: "GC(3) Y: Pause Mark Start 0.012ms"
+# (küçük toplamalar "y:", Java 21+ ZGenerational)
+_PAUSE_RE = re.compile(r"\bGC\((\d+)\)\s+(?:[yYO]: )?Pause (.+?)\s+(\d+(?:\.\d+)?)ms\s*$")
+_HEAP_RE = re.compile(r"\s(\d+)([KMG])->(\d+)([KMG])\((\d+)([KMG])\)\s*$")
+_UNIT_MB = {"K": 1 / 1024, "M": 1.0, "G": 1024.0}
+
+
+def gc_log_args(log_path: Path, java_major: int) -> List[str]:
+    """
+    GC logunu dosyaya yazdıran JVM bayrakları
+
+    Dosya döndürülmez (filecount=0): takipçi tek dosyayı baştan sona okur.
+
+    Returns:
+        Bayraklar; Java birleşik loglamayı desteklemiyorsa boş liste
+    """
+    if java_major < MIN_JAVA_UNIFIED_LOGGING:
+        return []
+    return [f"-Xlog:gc*:file={log_path}:uptime,level,tags:filecount=0"]
+
+
+def gc_log_path(logs_dir: Path, version_id: str) -> Path:
+    """Oturuma özgü GC log yolu (oyun loguyla aynı zaman damgası biçimi)"""
+    return Path(logs_dir) / f"gc_{version_id}_{time.strftime('%Y%m%d_%H%M%S')}.log"
+
+
+def prepare_gc_log(log_path: Path):
+    """
+    Logu oyundan önce oluştur
+
+    JVM dizin yoksa açılmaz; takipçi de dosya yoksa hemen biter.
+    JVM dosyayı ekleme kipinde açar, boş dosya sorun olmaz.
+    """
+    log_path = Path(log_path)
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    log_path.touch()
+
+
+def pause_target_ms(jvm_args: List[str]) -> Optional[float]:
+    """Komuttaki -XX:MaxGCPauseMillis hedefi"""
+    for arg in jvm_args:
+        if arg.startswith("-XX:MaxGCPauseMillis="):
+            try:
+                return float(arg.split("=", 1)[1])
+            except ValueError:
+                return None
+    return None
+
+
+def _split_pause(text: str):
+    """'Young (Normal) (G1 Evacuation Pause)' -> ('Young (Normal)', 'G1 Evacuation Pause')"""
+    start = text.find("(")
+    if start < 0:
+        return text.strip(), ""
+    head = text[:start].strip()
+    groups = []
+    depth = 0
+    current = ""
+    for char in text[start:]:
+        if char == "(":
+            if depth:
+                current += char
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth:
+                current += char
+            else:
+                groups.append(current.strip())
+                current = ""
+        elif depth:
+            current += char
+    if len(groups) == 1:
+        return head, groups[0]
+    return f"{head} ({groups[0]})", groups[-1]
+
+
+def parse_pause(line: str) -> Optional[Dict]:
+    """
+    Tek log satırından duraklama olayı
+
+    Returns:
+        {"uptime", "gc_id", "kind", "cause", "pause_ms", "heap_before_mb", "heap_after_mb", "heap_total_mb"}
+        ya da duraklama satırı değilse None
+
+    >>> parse_pause("[2.0s][info][gc,phases   ] GC(1) y: Pause Mark Start 0.006ms")["pause_ms"]
+    0.006
+    """
+    match = _PAUSE_RE.search(line)
+    if not match:
+        return None
+    uptime = _parse_uptime(line)
+    body = match.group(2)
+    event = {"uptime": uptime, "gc_id": int(match.group(1)), "pause_ms": float(match.group(3)),
+             "heap_before_mb": None, "heap_after_mb": None, "heap_total_mb": None}
+    heap = _HEAP_RE.search(" " + body)
+    if heap:
+        before, before_unit, after, after_unit, total, total_unit = heap.groups()
+        event["heap_before_mb"] = int(before) * _UNIT_MB[before_unit]
+        event["heap_after_mb"] = int(after) * _UNIT_MB[after_unit]
+        event["heap_total_mb"] = int(total) * _UNIT_MB[total_unit]
+        body = (" " + body)[:heap.start()].strip()
+    event["kind"], event["cause"] = _split_pause(body)
+    return event
+
+
+def _parse_uptime(line: str) -> Optional[float]:
+    match = _UPTIME_RE.match(line)
+    if not match:
+        return None
+    value = float(match.group(1))
+    return value / 1000 if match.group(2) == "ms" else value
+
+
+def percentile(sorted_values: List[float], fraction: float) -> Optional[float]:
+    """Sıralı değerlerde en yakın sıra yöntemiyle yüzdelik"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(fraction * len(sorted_values) + 0.999999) - 1))
+    return sorted_values[index]
+
+
+class GcLogParser:
+    """
+    Satır satır beslenen GC log ayrıştırıcısı
+
+    LogFollower'ın iş parçacığından feed() çağrılır; izleme ekranı aynı
+    anda özet okuyabilir. Duraklamalar array('d') içinde tutulur.
+    """
+
+    def __init__(self, pause_target: float = None):
+        self.pause_target = pause_target
+        self.uptime = 0.0
+        self.pauses = array('d')
+        self.pause_times = array('d')
+        self.histogram = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.causes: Dict[str, int] = {}
+        self.kinds: Dict[str, int] = {}
+        self.total_pause_ms = 0.0
+        self.max_pause_ms = 0.0
+        self.allocated_mb = 0.0
+        self.last_event: Optional[Dict] = None
+        self.lines = 0
+        # (uptime, o ana kadar ayrılan MB) - ayırma hızı için
+        self._alloc_points: List[tuple] = []
+        self._last_heap_after: Optional[float] = None
+        self._last_heap_total: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def feed(self, line: str):
+        """Bir log satırını işle"""
+        uptime = _parse_uptime(line)
+        event = parse_pause(line)
+        with self._lock:
+            self.lines += 1
+            if uptime is not None:
+                self.uptime = max(self.uptime, uptime)
+            if event:
+                self._add(event)
+
+    def _add(self, event: Dict):
+        pause_ms = event["pause_ms"]
+        self.pauses.append(pause_ms)
+        self.pause_times.append(event["uptime"] if event["uptime"] is not None else self.uptime)
+        bucket = next((i for i, bound in enumerate(HISTOGRAM_BOUNDS_MS) if pause_ms <= bound), len(HISTOGRAM_BOUNDS_MS))
+        self.histogram[bucket] += 1
+        if event["cause"]:
+            self.causes[event["cause"]] = self.causes.get(event["cause"], 0) + 1
+        self.kinds[event["kind"]] = self.kinds.get(event["kind"], 0) + 1
+        self.total_pause_ms += pause_ms
+        self.max_pause_ms = max(self.max_pause_ms, pause_ms)
+
+        # Ayırma: bu GC'den önceki heap - önceki GC'den sonraki heap
+        before = event["heap_before_mb"]
+        if before is not None and event["uptime"] is not None:
+            if self._last_heap_after is not None:
+                self.allocated_mb += max(0.0, before - self._last_heap_after)
+            self._alloc_points.append((event["uptime"], self.allocated_mb))
+            self._last_heap_after = event["heap_after_mb"]
+            self._last_heap_total = event["heap_total_mb"]
+        self.last_event = event
+
+    def _allocation_rate(self, since: float = None) -> Optional[float]:
+        """MB/s (since verilirse o uptime'dan sonraki GC'ler)"""
+        points = self._alloc_points
+        if since is not None:
+            baseline = [p for p in points if p[0] <= since]
+            points = baseline[-1:] + [p for p in points if p[0] > since]
+        if len(points) < 2 or points[-1][0] <= points[0][0]:
+            return None
+        return (points[-1][1] - points[0][1]) / (points[-1][0] - points[0][0])
+
+    def _pauses_since(self, since: float) -> List[float]:
+        return [pause for pause, at in zip(self.pauses, self.pause_times) if at > since]
+
+    def summary(self, window: float = None) -> Dict:
+        """
+        Özet (izleme ekranı ve oturum kaydı için)
+
+        Args:
+            window: Verilirse ek yük, p99 ve ayırma hızı son 'window' saniyeden
+        """
+        with self._lock:
+            uptime = self.uptime
+            since = max(0.0, uptime - window) if window else None
+            pauses = self._pauses_since(since) if since is not None else list(self.pauses)
+            span = (uptime - since) if since is not None else uptime
+            ordered = sorted(pauses)
+            total = sum(pauses)
+            summary = {
+                "uptime_s": round(uptime, 1),
+                "pauses": len(pauses),
+                "total_pause_ms": round(total, 1),
+                "p50_ms": percentile(ordered, 0.50),
+                "p99_ms": percentile(ordered, 0.99),
+                "max_ms": ordered[-1] if ordered else None,
+                "overhead_pct": round(total / (span * 1000) * 100, 2) if span > 0 else None,
+                "target_ms": self.pause_target,
+                "over_target": sum(1 for p in pauses if self.pause_target and p > self.pause_target),
+                "alloc_rate_mbs": self._allocation_rate(since),
+                "heap_after_mb": self._last_heap_after,
+                "heap_total_mb": self._last_heap_total,
+                "histogram": list(self.histogram) if since is None else self._histogram(pauses),
+                "causes": dict(sorted(self.causes.items(), key=lambda item: -item[1])),
+                "kinds": dict(self.kinds),
+            }
+        if summary["alloc_rate_mbs"] is not None:
+            summary["alloc_rate_mbs"] = round(summary["alloc_rate_mbs"], 1)
+        return summary
+
+    @staticmethod
+    def _histogram(pauses: List[float]) -> List[int]:
+        counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        for pause in pauses:
+            counts[next((i for i, bound in enumerate(HISTOGRAM_BOUNDS_MS) if pause <= bound), len(HISTOGRAM_BOUNDS_MS))] += 1
+        return counts
+
+
+def histogram_labels() -> List[str]:
+    """Kova etiketleri: '≤1', '≤2', ..., '>500' (ms)"""
+    return [f"≤{bound}" for bound in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}"]
+
+
+def parse_file(log_path: Path, pause_target: float = None) -> GcLogParser:
+    """Tamamlanmış bir GC logunu baştan ayrıştır"""
+    parser = GcLogParser(pause_target)
+    with open(log_path, 'r', errors='replace') as f:
+        for line in f:
+            parser.feed(line.rstrip("\n"))
+    return parser
+
+
+def save_summary(log_path: Path, summary: Dict):
+    """Özeti logun yanına <log>.json olarak yaz"""
+    summary_file = Path(log_path).with_suffix(".json")
+    tmp_file = summary_file.with_name(summary_file.name + ".tmp")
+    try:
+        with open(tmp_file, 'w') as f:
+            json.dump(summary, f, indent=2)
+        tmp_file.replace(summary_file)
+    except OSError:
+        pass
+
+
+def load_summary(log_path: Path, pause_target: float = None) -> Optional[Dict]:
+    """
+    Oturumun GC özeti
+
+    Oyun kapanırken yazılan <log>.json varsa o, yoksa (CLI ile başlatılan ya da
+    hâlâ çalışan oyun) log baştan ayrıştırılır. Log yoksa None.
+    """
+    summary_file = Path(log_path).with_suffix(".json")
+    try:
+        with open(summary_file, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+    try:
+        return parse_file(log_path, pause_target).summary()
+    except OSError:
+        return None
+
+
+__all__ = [
+    'MIN_JAVA_UNIFIED_LOGGING', 'HISTOGRAM_BOUNDS_MS', 'gc_log_args', 'gc_log_path',
+    'prepare_gc_log', 'pause_target_ms', 'parse_pause', 'percentile', 'GcLogParser', 'histogram_labels',
+    'parse_file', 'save_summary', 'load_summary'
+]
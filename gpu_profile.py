@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - GPU Profile
+/sys/class/drm, Vulkan ICD'leri ve oturum türüne göre en az ortam değişkeniyle
+çalışan grafik profilini seç (Mesa, NVIDIA, hibrit PRIME, son çare zink)
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROFILE_AUTO = "auto"
+PROFILE_NATIVE = "native-mesa"
+PROFILE_NVIDIA = "nvidia"
+PROFILE_HYBRID = "hybrid-prime"
+PROFILE_ZINK = "zink"
+PROFILES = [PROFILE_NATIVE, PROFILE_NVIDIA, PROFILE_HYBRID, PROFILE_ZINK]
+
+VENDOR_NAMES = {
+    "0x8086": "Intel",
+    "0x1002": "AMD",
+    "0x10de": "NVIDIA",
+    "0x1af4": "VirtIO",
+    "0x15ad": "VMware",
+}
+
+# Çekirdek sürücüsü → Mesa OpenGL (DRI/Gallium) sürücüsü
+MESA_GL_DRIVERS = {
+    "i915": ["iris", "crocus", "i965"],
+    "xe": ["iris"],
+    "amdgpu": ["radeonsi"],
+    "radeon": ["r600", "r300", "radeonsi"],
+    "nouveau": ["nouveau"],
+    "virtio_gpu": ["virtio_gpu", "virgl"],
+    "vmwgfx": ["vmwgfx"],
+    "msm": ["msm"],
+    "panfrost": ["panfrost"],
+    "lima": ["lima"],
+    "v3d": ["v3d"],
+    "vc4": ["vc4"],
+    "etnaviv": ["etnaviv"],
+}
+
+DEFAULT_ICD_DIRS = [Path("/usr/share/vulkan/icd.d"), Path("/etc/vulkan/icd.d")]
+DEFAULT_DRI_DIRS = [Path("/usr/lib/dri"), Path("/usr/lib64/dri"), Path("/usr/lib/x86_64-linux-gnu/dri")]
+
+# ICD dosya adındaki anahtar → çekirdek sürücüleri
+_ICD_DRIVERS = {
+    "nvidia": ["nvidia"],
+    "intel": ["i915", "xe"],
+    "radeon": ["amdgpu", "radeon"],
+    "amd": ["amdgpu"],
+    "nouveau": ["nouveau"],
+    "virtio": ["virtio_gpu"],
+}
+
+
+class GpuDevice:
+    """/sys/class/drm/cardN"""
+
+    def __init__(self, card: str, vendor_id: str, driver: str, boot_vga: bool = False, pci_slot: str = ""):
+        self.card = card
+        self.vendor_id = vendor_id
+        self.driver = driver
+        self.boot_vga = boot_vga
+        self.pci_slot = pci_slot
+
+    @property
+    def vendor(self) -> str:
+        return VENDOR_NAMES.get(self.vendor_id, self.vendor_id or "?")
+
+    @property
+    def is_nvidia_proprietary(self) -> bool:
+        return self.driver == "nvidia"
+
+    def describe(self) -> str:
+        primary = ", birincil" if self.boot_vga else ""
+        return f"{self.card}: {self.vendor} ({self.driver or 'sürücüsüz'}{primary})"
+
+    def to_dict(self) -> Dict:
+        return {"card": self.card, "vendor_id": self.vendor_id, "driver": self.driver,
+                "boot_vga": self.boot_vga, "pci_slot": self.pci_slot}
+
+
+class GpuInfo:
+    """Algılanan aygıtlar, Vulkan ICD'leri, Mesa GL sürücüleri ve oturum"""
+
+    def __init__(self, devices: List[GpuDevice], icds: Dict[str, Path], mesa_drivers: Optional[List[str]],
+                 session: str, display: Optional[str], wayland_display: Optional[str]):
+        self.devices = devices
+        self.icds = icds
+        # None: DRI dizini bulunamadı (sürücü varlığı bilinmiyor)
+        self.mesa_drivers = mesa_drivers
+        self.session = session
+        self.display = display
+        self.wayland_display = wayland_display
+
+    def to_dict(self) -> Dict:
+        return {
+            "devices": [d.to_dict() for d in self.devices],
+            "icds": {name: str(path) for name, path in self.icds.items()},
+            "mesa_drivers": self.mesa_drivers,
+            "session": self.session,
+        }
+
+
+def _read(path: Path) -> str:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return ""
+
+
+def detect_devices(sysfs_root: Path = Path("/sys")) -> List[GpuDevice]:
+    """class/drm altındaki kartlar (card0-DP-1 gibi bağlayıcılar hariç)"""
+    drm_dir = Path(sysfs_root) / "class" / "drm"
+    devices = []
+    try:
+        entries = sorted(drm_dir.iterdir(), key=lambda p: p.name)
+    except OSError:
+        return []
+    for entry in entries:
+        name = entry.name
+        if not name.startswith("card") or not name[4:].isdigit():
+            continue
+        device_dir = entry / "device"
+        driver_link = device_dir / "driver"
+        try:
+            driver = os.path.basename(os.readlink(driver_link))
+        except OSError:
+            driver = ""
+        try:
+            pci_slot = os.path.basename(os.path.realpath(device_dir))
+        except OSError:
+            pci_slot = ""
+        devices.append(GpuDevice(name, _read(device_dir / "vendor").lower(), driver,
+                                 _read(device_dir / "boot_vga") == "1", pci_slot))
+    return devices
+
+
+def detect_icds(icd_dirs: List[Path] = None) -> Dict[str, Path]:
+    """
+    Kurulu Vulkan ICD'leri
+
+    Returns:
+        {"nvidia" / "intel" / "radeon" / "lvp"...: manifest yolu}
+    """
+    icds = {}
+    for icd_dir in icd_dirs or DEFAULT_ICD_DIRS:
+        try:
+            manifests = sorted(Path(icd_dir).glob("*.json"))
+        except OSError:
+            continue
+        for manifest in manifests:
+            # nvidia_icd.json, intel_icd.x86_64.json, radeon_icd.x86_64.json, lvp_icd.x86_64.json
+            if ".i686." in manifest.name:
+                continue
+            icds.setdefault(manifest.name.split("_icd")[0].lower(), manifest)
+    return icds
+
+
+def detect_mesa_drivers(dri_dirs: List[Path] = None) -> Optional[List[str]]:
+    """DRI dizinindeki Mesa GL sürücüleri ('iris', 'radeonsi', 'zink'...); dizin yoksa None"""
+    found = None
+    for dri_dir in dri_dirs or DEFAULT_DRI_DIRS:
+        try:
+            names = [p.name for p in Path(dri_dir).iterdir()]
+        except OSError:
+            continue
+        found = found or []
+        found += [n[:-len("_dri.so")] for n in names if n.endswith("_dri.so")]
+    return sorted(set(found)) if found is not None else None
+
+
+def detect_gpu(sysfs_root: Path = Path("/sys"), env: Dict[str, str] = None, icd_dirs: List[Path] = None,
+               dri_dirs: List[Path] = None) -> GpuInfo:
+    """
+    Grafik donanımını ve oturumu algıla
+
+    Args:
+        sysfs_root: /sys (testlerde sahte ağaç verilebilir)
+        env: Ortam değişkenleri (varsayılan os.environ)
+        icd_dirs: Vulkan ICD dizinleri
+        dri_dirs: Mesa DRI sürücü dizinleri
+    """
+    env = os.environ if env is None else env
+    session = env.get("XDG_SESSION_TYPE", "")
+    if not session:
+        session = "wayland" if env.get("WAYLAND_DISPLAY") else ("x11" if env.get("DISPLAY") else "tty")
+    return GpuInfo(detect_devices(sysfs_root), detect_icds(icd_dirs), detect_mesa_drivers(dri_dirs),
+                   session, env.get("DISPLAY"), env.get("WAYLAND_DISPLAY"))
+
+
+def _has_mesa_gl(device: GpuDevice, mesa_drivers: Optional[List[str]]) -> bool:
+    """Aygıt için Mesa OpenGL sürücüsü var mı (DRI dizini bilinmiyorsa var sayılır)"""
+    candidates = MESA_GL_DRIVERS.get(device.driver)
+    if candidates is None:
+        return False
+    if mesa_drivers is None:
+        return True
+    # Mesa 24+ tüm Gallium sürücülerini libgallium'da toplar; *_dri.so bağlantıları yine durur
+    return any(name in mesa_drivers for name in candidates)
+
+
+def _icd_for(device: GpuDevice, icds: Dict[str, Path]) -> Optional[Path]:
+    for key, drivers in _ICD_DRIVERS.items():
+        if device.driver in drivers and key in icds:
+            return icds[key]
+    return None
+
+
+class GpuProfile:
+    """Seçilen profil, ortam değişkenleri ve gerekçesi"""
+
+    def __init__(self, name: str, env: Dict[str, str], reasons: List[str], overridden: bool = False):
+        self.name = name
+        self.env = env
+        self.reasons = reasons
+        self.overridden = overridden
+
+    def explain(self) -> List[str]:
+        lines = [f"Profil: {self.name}" + (" (elle seçildi)" if self.overridden else "")]
+        lines += [f"  - {reason}" for reason in self.reasons]
+        if self.env:
+            lines += [f"  {key}={value}" for key, value in self.env.items()]
+        else:
+            lines.append("  (ek ortam değişkeni yok)")
+        return lines
+
+    def to_dict(self) -> Dict:
+        return {"name": self.name, "env": self.env, "reasons": self.reasons, "overridden": self.overridden}
+
+
+def _profile_env(name: str, info: GpuInfo, render: Optional[GpuDevice]) -> Dict[str, str]:
+    """Profilin ortam değişkenleri - yalnızca davranışı gerçekten değiştirenler"""
+    if name == PROFILE_NVIDIA:
+        return {"__GL_THREADED_OPTIMIZATIONS": "1"}
+    if name == PROFILE_HYBRID:
+        if render is None or render.is_nvidia_proprietary:
+            return {
+                "__NV_PRIME_RENDER_OFFLOAD": "1",
+                "__GLX_VENDOR_LIBRARY_NAME": "nvidia",
+                "__VK_LAYER_NV_optimus": "NVIDIA_only",
+                "__GL_THREADED_OPTIMIZATIONS": "1",
+            }
+        # Mesa PRIME: "pci-0000_03_00_0" kartı doğrudan seçer
+        slot = render.pci_slot.replace(":", "_").replace(".", "_")
+        return {"DRI_PRIME": f"pci-{slot}" if slot else "1"}
+    if name == PROFILE_ZINK:
+        env = {"MESA_LOADER_DRIVER_OVERRIDE": "zink", "GALLIUM_DRIVER": "zink"}
+        icd = _icd_for(render, info.icds) if render else None
+        if icd:
+            env["VK_ICD_FILENAMES"] = str(icd)
+        return env
+    return {}
+
+
+def select_profile(info: GpuInfo, override: str = PROFILE_AUTO, extra_env: Dict[str, str] = None) -> GpuProfile:
+    """
+    Donanıma göre profil seç
+
+    Args:
+        info: detect_gpu() sonucu
+        override: "auto" ya da PROFILES'tan biri
+        extra_env: Profilin üstüne eklenecek kullanıcı değişkenleri
+
+    Returns:
+        GpuProfile (gerekçeleriyle)
+    """
+    reasons = []
+    devices = info.devices
+    nvidia = [d for d in devices if d.is_nvidia_proprietary]
+    mesa = [d for d in devices if _has_mesa_gl(d, info.mesa_drivers)]
+    primary = next((d for d in devices if d.boot_vga), devices[0] if devices else None)
+    # Hibritte oyunu çizdirecek ayrık kart: NVIDIA ya da birincil olmayan AMD
+    discrete = nvidia[0] if nvidia else next((d for d in mesa if d is not primary and d.driver in ("amdgpu", "radeon")), None)
+
+    reasons.append(f"Oturum: {info.session}")
+    if devices:
+        reasons.append("Aygıtlar: " + "; ".join(d.describe() for d in devices))
+    else:
+        reasons.append("DRM aygıtı bulunamadı (sanal makine ya da sürücüsüz)")
+
+    if nvidia and primary is not None and not primary.is_nvidia_proprietary and len(devices) > 1:
+        name = PROFILE_HYBRID
+        reasons.append(f"Ekran {primary.vendor} kartında, NVIDIA kartına render offload")
+    elif nvidia:
+        name = PROFILE_NVIDIA
+        reasons.append("NVIDIA sürücüsü kendi GL'ini sağlar, Mesa değişkenleri gereksiz")
+    elif discrete is not None and len(mesa) > 1:
+        name = PROFILE_HYBRID
+        reasons.append(f"İki Mesa kartı: oyun {discrete.describe()} üzerinde (DRI_PRIME)")
+    elif mesa or not devices:
+        name = PROFILE_NATIVE
+        reasons.append("Mesa'nın yerel OpenGL sürücüsü kullanılıyor (zink'e göre daha hızlı)")
+    elif devices and any(_icd_for(d, info.icds) for d in devices):
+        name = PROFILE_ZINK
+        reasons.append("Kart için Mesa GL sürücüsü yok ama Vulkan ICD'si var - son çare olarak zink")
+    else:
+        name = PROFILE_NATIVE
+        reasons.append("Uygun sürücü bulunamadı, varsayılan GL yükleyicisine bırakıldı")
+
+    overridden = bool(override) and override != PROFILE_AUTO and override in PROFILES and override != name
+    if overridden:
+        reasons.append(f"Ayarlarda {override} seçili (otomatik: {name})")
+        name = override
+
+    render = discrete if name == PROFILE_HYBRID else primary
+    env = _profile_env(name, info, render)
+    if extra_env:
+        env.update(extra_env)
+        reasons.append("Ek değişkenler ayarlardan: " + ", ".join(extra_env))
+    return GpuProfile(name, env, reasons, overridden)
+
+
+def profile_for_config(config: Dict, info: GpuInfo = None) -> GpuProfile:
+    """Config'teki "gpu_profile" ve "gpu_env" ayarlarıyla profil"""
+    info = info or detect_gpu()
+    extra_env = config.get("gpu_env") or {}
+    if isinstance(extra_env, str):
+        try:
+            extra_env = json.loads(extra_env)
+        except json.JSONDecodeError:
+            extra_env = {}
+    return select_profile(info, config.get("gpu_profile", PROFILE_AUTO), extra_env)
+
+
+__all__ = [
+    'PROFILE_AUTO', 'PROFILE_NATIVE', 'PROFILE_NVIDIA', 'PROFILE_HYBRID', 'PROFILE_ZINK', 'PROFILES',
+    'GpuDevice', 'GpuInfo', 'GpuProfile', 'detect_devices', 'detect_icds', 'detect_mesa_drivers',
+    'detect_gpu', 'select_profile', 'profile_for_config'
+]
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Hang Watchdog
+Donan oyunu sezgilerle yakala (render iş parçacığının CPU'su ilerlemiyor ya
+da log sessiz ve süreç boşta), birkaç saniye arayla iş parçacığı dökümleri al
+(jcmd Thread.print, JDK yoksa SIGQUIT ile oyun loguna) ve dökümlerin hepsinde
+aynı çerçevede kalan iş parçacıklarını mod adlarıyla bul
+"""
+
+import json
+import os
+import re
+import signal
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from jfr_profiler import JDK_OWNER, KNOWN_PACKAGES, ModMap, frame_name, jvm_pid, run_jcmd
+
+HANGS_DIR = "hangs"
+ANALYSIS_FILE = "analysis.json"
+
+CHECK_INTERVAL = 5
+# Render iş parçacığı bu kadar saniye CPU harcamazsa oyun donmuştur (menüde bile kare çizilir)
+STALL_SECONDS = 30
+# Render iş parçacığı bulunamazsa: log bu kadar sessiz ve süreç CPU'su IDLE_CPU altında
+IDLE_SECONDS = 90
+IDLE_CPU = 3.0
+
+DUMP_COUNT = 3
+DUMP_INTERVAL = 5
+# Kapatma: önce SIGTERM (kapanış kancaları dünyayı kaydeder), süre dolarsa SIGKILL
+GRACEFUL_TIMEOUT = 15
+
+REASON_RENDER = "render"
+REASON_IDLE = "idle"
+REASON_MANUAL = "manual"
+
+RENDER_THREADS = ["Render thread", "Client thread"]
+MAIN_THREADS = RENDER_THREADS + ["Server thread", "main"]
+# Havuzda iş bekleyen iş parçacıkları aynı çerçevede dursa da takılı sayılmaz
+IDLE_FRAMES = (
+    "ThreadPoolExecutor.getTask", "ForkJoinPool.awaitWork", "LinkedBlockingQueue.take", "LinkedBlockingDeque.take",
+    "ArrayBlockingQueue.take", "DelayedWorkQueue.take", "SynchronousQueue", "ReferenceQueue.remove",
+    "Reference.waitForReferencePendingList", "TimerThread.mainLoop", "EPoll.wait", "SelectorImpl.select",
+    "ProcessHandleImpl.waitForProcessExit", "FileSystemWatchService", "LinuxWatchService", "InputStream.read",
+    "SocketDispatcher.read", "NioSocketImpl", "Thread.sleep",
+)
+STACK_DEPTH = 8
+
+# '"Render thread" #1 prio=5 os_prio=0 cpu=812.42ms elapsed=95.10s tid=0x... nid=0x2b0c waiting for monitor entry'
+_THREAD_RE = re.compile(r'^"(.+)"( #\d+)?')
+_CPU_RE = re.compile(r" cpu=([\d.]+)ms")
+_STATE_RE = re.compile(r"^\s+java\.lang\.Thread\.State: (\w+)")
+_FRAME_RE = re.compile(r"^\s+at (.+)$")
+_TASK_STATES = {"S": "uyuyor", "D": "disk/sürücü bekliyor", "R": "çalışıyor", "T": "durdurulmuş"}
+_WAIT_RE = re.compile(r"^\s+- (waiting to lock|parking to wait for|waiting on) <0x[0-9a-f]+> \(a (.+?)\)")
+
+
+def hang_dir(hangs_dir: Path, version_id: str) -> Path:
+    """Donma başına dökümlerin dizini"""
+    return Path(hangs_dir) / f"{version_id}_{time.strftime('%Y%m%d_%H%M%S')}"
+
+
+def render_thread_ticks(pid: int) -> Optional[Dict]:
+    """
+    Render iş parçacığının /proc durumu: {"tid", "state", "ticks"}
+
+    Minecraft ana iş parçacığına "Render thread" adını verir; JVM bu adı
+    çekirdeğe de yazar (comm), bu yüzden jcmd olmadan izlenebilir.
+    """
+    try:
+        tids = os.listdir(f"/proc/{pid}/task")
+    except OSError:
+        return None
+    for tid in tids:
+        try:
+            with open(f"/proc/{pid}/task/{tid}/comm", 'r') as f:
+                if f.read().strip() not in RENDER_THREADS:
+                    continue
+            with open(f"/proc/{pid}/task/{tid}/stat", 'r') as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        return {"tid": int(tid), "state": fields[0], "ticks": int(fields[11]) + int(fields[12])}
+    return None
+
+
+def _alive(pid: int) -> bool:
+    """Süreç var ve zombi değil"""
+    try:
+        with open(f"/proc/{pid}/stat", 'r') as f:
+            return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+    except (OSError, IndexError):
+        return False
+
+
+def jcmd_thread_dump(jcmd: str, pid: int, timeout: float = 30) -> Optional[str]:
+    """jcmd Thread.print -l (kilitlerle); başarısızsa None"""
+    # Yığınlarda "Exception" geçebildiğinden run_jcmd'nin başarı kararına değil başlığa bakılır
+    _, output = run_jcmd(jcmd, pid, "Thread.print", "-l", timeout=timeout)
+    return output if "Full thread dump" in output else None
+
+
+def sigquit_thread_dump(pid: int, log_file: Path, timeout: float = 5) -> Optional[str]:
+    """
+    SIGQUIT ile döküm (JDK gerekmez)
+
+    JVM dökümü kendi stdout'una, yani oyun loguna yazar; logun sinyalden
+    sonraki kısmından "Full thread dump" ile "JNI global refs" arası alınır.
+    """
+    log_file = Path(log_file)
+    try:
+        # -Xrs ile JVM sinyali yakalamaz; SIGQUIT süreci öldürür
+        with open(f"/proc/{pid}/cmdline", 'rb') as f:
+            if b"-Xrs" in f.read().split(b"\0"):
+                return None
+        offset = log_file.stat().st_size
+        os.kill(pid, signal.SIGQUIT)
+    except OSError:
+        return None
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(0.2)
+        try:
+            with open(log_file, 'r', errors='replace') as f:
+                f.seek(offset)
+                text = f.read()
+        except OSError:
+            return None
+        start = text.find("Full thread dump")
+        end = text.find("JNI global refs", start) if start >= 0 else -1
+        if end >= 0:
+            line_end = text.find("\n", end)
+            return text[start:line_end if line_end >= 0 else len(text)]
+    return None
+
+
+def capture_thread_dumps(pid: int, out_dir: Path, jcmd: str = None, log_file: Path = None,
+                         count: int = DUMP_COUNT, interval: float = DUMP_INTERVAL) -> List[Path]:
+    """
+    'interval' saniye arayla 'count' döküm al ve out_dir'e yaz
+
+    Returns:
+        Yazılan döküm dosyaları (hiçbiri alınamadıysa boş)
+    """
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    files = []
+    for i in range(count):
+        if i:
+            time.sleep(interval)
+        text = jcmd_thread_dump(jcmd, pid) if jcmd else None
+        if text is None and log_file:
+            text = sigquit_thread_dump(pid, log_file)
+        if text is None:
+            continue
+        path = Path(out_dir) / f"threads_{i + 1}.txt"
+        path.write_text(text)
+        files.append(path)
+    return files
+
+
+def parse_thread_dump(text: str) -> Dict:
+    """
+    Thread.print çıktısı
+
+    Returns:
+        {"threads": {anahtar: {"name", "state", "cpu_ms", "frames", "waiting"}},
+         "deadlock": kilitlenme bölümünün satırları}
+    """
+    threads = {}
+    deadlock = []
+    current = None
+    in_deadlock = False
+    for line in text.splitlines():
+        if line.startswith("Found one Java-level deadlock") or line.startswith("Found a total of"):
+            in_deadlock = True
+            current = None
+        if in_deadlock:
+            if line.strip():
+                deadlock.append(line.rstrip())
+            if re.match(r"^Found \d+ deadlocks?\.", line):
+                in_deadlock = False
+            continue
+        if line.startswith('"'):
+            match = _THREAD_RE.match(line)
+            if not match:
+                current = None
+                continue
+            name, number = match.groups()
+            cpu = _CPU_RE.search(line)
+            current = {"name": name, "state": None, "cpu_ms": float(cpu.group(1)) if cpu else None,
+                       "frames": [], "waiting": None}
+            # Aynı adlı iş parçacıkları olabilir; numara (#N) dökümler arasında sabittir
+            threads[f"{name}{number or ''}"] = current
+            continue
+        if current is None:
+            continue
+        match = _FRAME_RE.match(line)
+        if match:
+            current["frames"].append(match.group(1))
+            continue
+        match = _STATE_RE.match(line)
+        if match:
+            current["state"] = match.group(1)
+            continue
+        match = _WAIT_RE.match(line)
+        if match and current["waiting"] is None:
+            current["waiting"] = f"{match.group(1)} {match.group(2)}"
+    return {"threads": threads, "deadlock": deadlock[:40]}
+
+
+def _is_idle(frames: List[str]) -> bool:
+    top = frames[:STACK_DEPTH]
+    return any(marker in frame for frame in top for marker in IDLE_FRAMES)
+
+
+def _suspect(frames: List[str], mod_map: ModMap) -> tuple:
+    """Yığındaki ilk mod çerçevesi; mod yoksa JDK dışındaki ilk çerçeve"""
+    known = {owner for _, owner in KNOWN_PACKAGES}
+    fallback = None
+    for frame in map(frame_name, frames):
+        owner = mod_map.owner(frame)
+        if owner not in known:
+            return owner, frame
+        if fallback is None and owner != JDK_OWNER:
+            fallback = owner, frame
+    return fallback or (JDK_OWNER, frame_name(frames[0]))
+
+
+def stuck_threads(dumps: List[Dict], interval: float = DUMP_INTERVAL, mod_map: ModMap = None) -> List[Dict]:
+    """
+    Tüm dökümlerde aynı durum ve aynı üst çerçevelerle görünen iş parçacıkları
+
+    Havuzda bekleyenler atlanır (ana iş parçacıkları hariç). Sahip olarak
+    yığındaki ilk mod çerçevesi gösterilir: Minecraft'ın döngüsünü tutan
+    çoğunlukla onun çağırdığı moddur. CPU süresi
+    dökümler arasında artmışsa iş parçacığı aynı yerde dönüyordur ("spinning"),
+    artmamışsa bekliyordur. Ana iş parçacıkları önce, sonra BLOCKED gelir.
+    """
+    if len(dumps) < 2:
+        return []
+    mod_map = mod_map or ModMap()
+    first, last = dumps[0]["threads"], dumps[-1]["threads"]
+    stuck = []
+    for key, thread in last.items():
+        frames = thread["frames"][:STACK_DEPTH]
+        if not frames:
+            continue
+        same = all(key in dump["threads"] and dump["threads"][key]["state"] == thread["state"]
+                   and dump["threads"][key]["frames"][:STACK_DEPTH] == frames for dump in dumps)
+        main = thread["name"] in MAIN_THREADS
+        if not same or (not main and _is_idle(frames)):
+            continue
+        owner, owner_frame = _suspect(thread["frames"], mod_map)
+        cpu_before, cpu_after = first[key]["cpu_ms"], thread["cpu_ms"]
+        spinning = (cpu_before is not None and cpu_after is not None
+                    and cpu_after - cpu_before > (len(dumps) - 1) * interval * 1000 * 0.5)
+        stuck.append({"thread": thread["name"], "state": thread["state"], "frame": frame_name(frames[0]),
+                      "owner": owner, "owner_frame": owner_frame,
+                      "frames": frames, "waiting": thread["waiting"], "spinning": spinning, "main": main})
+    stuck.sort(key=lambda s: (not s["main"], s["state"] != "BLOCKED", not s["spinning"]))
+    return stuck
+
+
+def analyze_dumps(files: List[Path], interval: float = DUMP_INTERVAL, mods_dir: Path = None) -> Dict:
+    """Döküm dosyalarından takılı iş parçacıkları ve kilitlenmeler"""
+    dumps = []
+    for path in files:
+        try:
+            dumps.append(parse_thread_dump(Path(path).read_text(errors="replace")))
+        except OSError:
+            continue
+    mod_map = ModMap.from_dir(mods_dir) if mods_dir else None
+    deadlock = next((dump["deadlock"] for dump in dumps if dump["deadlock"]), [])
+    return {"dumps": [Path(p).name for p in files], "stuck": stuck_threads(dumps, interval, mod_map),
+            "deadlock": deadlock}
+
+
+def save_analysis(out_dir: Path, **values):
+    """Donma özetini dökümlerin yanına yaz"""
+    try:
+        with open(Path(out_dir) / ANALYSIS_FILE, 'w') as f:
+            json.dump(values, f, indent=2, ensure_ascii=False)
+    except OSError:
+        pass
+
+
+def load_analysis(out_dir: Path) -> Dict:
+    try:
+        with open(Path(out_dir) / ANALYSIS_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def graceful_kill(process, timeout: float = GRACEFUL_TIMEOUT) -> bool:
+    """
+    SIGTERM, süre dolarsa süreç grubuna SIGKILL
+
+    Donmuş oyunun kapanış kancası da takılabilir; oyun yeni oturumda
+    başlatıldığından (start_new_session) grup PID'i süreçle aynıdır.
+
+    Returns:
+        SIGTERM yettiyse True
+    """
+    process.terminate()
+    try:
+        process.wait(timeout)
+        return True
+    except subprocess.TimeoutExpired:
+        pass
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except OSError:
+        process.kill()
+    process.wait()
+    return False
+
+
+class HangWatchdog:
+    """
+    Oyun çalışırken donmayı arka planda sezen bekçi
+
+    Ölçümler zaten toplananlardan okunur (örnekleyicinin CPU serisi, log
+    takipçisinin son satır zamanı); bekçi yalnız render iş parçacığının
+    /proc sayaçlarını okur. Donma sezilince on_stall(neden) bir kez çağrılır
+    (bekçinin iş parçacığında; döküm almak birkaç saniye sürebilir). Oyun
+    yeniden ilerleyince bekçi tekrar kurulur. Bekçi kurulmasa da capture()
+    ile dökümler elle alınabilir.
+    """
+
+    def __init__(self, pid: int, on_stall: Callable[[str, str], Optional[Dict]], sampler=None,
+                 last_output: Callable[[], Optional[float]] = None, stall_seconds: float = STALL_SECONDS,
+                 idle_seconds: float = IDLE_SECONDS, interval: float = CHECK_INTERVAL):
+        self.pid = pid
+        self.on_stall = on_stall
+        self.sampler = sampler
+        self.last_output = last_output or (lambda: None)
+        self.stall_seconds = stall_seconds
+        self.idle_seconds = idle_seconds
+        self.interval = interval
+        self.java_pid: Optional[int] = None
+        # Şu an donmuş mu (oyun donmuşken kapandıysa True kalır) ve sezilen donma sayısı
+        self.stalled = False
+        self.stalls = 0
+        self.reason: Optional[str] = None
+        self._ticks = None
+        self._progress = time.monotonic()
+        self._armed_at = time.monotonic()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "HangWatchdog":
+        """Bekçiyi kur (oyun hazır olunca; tekrar çağrılırsa bir şey yapmaz)"""
+        if self._thread is None:
+            self._stop.clear()
+            self._progress = self._armed_at = time.monotonic()
+            self._thread = threading.Thread(target=self._run, name="hang-watchdog", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1)
+        self._thread = None
+
+    def capture(self, reason: str):
+        """Dökümleri elle al (bekçi kurulmamış olsa da)"""
+        return self.on_stall(REASON_MANUAL, reason)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            if not _alive(self.java_pid or self.pid):
+                # Süreç bitti: donmuş kapandıysa 'stalled' oturum sonucuna kalır
+                return
+            try:
+                reason = self.check()
+            except Exception:
+                continue
+            if reason and not self.stalled:
+                self.stalled = True
+                self.stalls += 1
+                kind, self.reason = reason
+                try:
+                    self.on_stall(kind, self.reason)
+                except Exception:
+                    pass
+                # Döküm sırasında geçen süre ilerleme sayılmasın
+                self._armed_at = time.monotonic()
+            elif not reason and self.stalled:
+                self.stalled = False
+
+    def check(self) -> Optional[tuple]:
+        """
+        Donma var mı
+
+        Returns:
+            (REASON_RENDER | REASON_IDLE, açıklama) ya da None
+        """
+        now = time.monotonic()
+        if self.java_pid is None:
+            self.java_pid = jvm_pid(self.pid)
+            if self.java_pid is None:
+                return None
+        render = render_thread_ticks(self.java_pid)
+        if render:
+            if self._ticks is None or render["ticks"] != self._ticks:
+                self._ticks = render["ticks"]
+                self._progress = now
+            still = now - self._progress
+            if still >= self.stall_seconds:
+                state = _TASK_STATES.get(render["state"], render["state"])
+                return REASON_RENDER, f"Render iş parçacığı {still:.0f} sn ilerlemedi ({state})"
+            return None
+
+        # Render iş parçacığı adı yoksa (eski sürüm, farklı JVM): log sessiz ve süreç boşta
+        last_output = self.last_output()
+        silent = now - max(last_output or self._armed_at, self._armed_at)
+        if silent < self.idle_seconds or self.sampler is None:
+            return None
+        cpu = self.sampler.stats("cpu", self.idle_seconds)
+        if cpu and cpu["max"] < IDLE_CPU:
+            return REASON_IDLE, f"Log {silent:.0f} sn sessiz, CPU en çok %{cpu['max']:.1f}"
+        return None
+
+
+__all__ = [
+    'HANGS_DIR', 'STALL_SECONDS', 'IDLE_SECONDS', 'DUMP_COUNT', 'DUMP_INTERVAL', 'GRACEFUL_TIMEOUT', 'REASON_RENDER',
+    'REASON_IDLE', 'REASON_MANUAL', 'MAIN_THREADS', 'hang_dir', 'render_thread_ticks', 'jcmd_thread_dump',
+    'sigquit_thread_dump', 'capture_thread_dumps', 'parse_thread_dump', 'stuck_threads', 'analyze_dumps',
+    'save_analysis', 'load_analysis', 'graceful_kill', 'HangWatchdog'
+]
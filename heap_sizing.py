@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Heap Sizing
+Sürüm dönemi, mod yükleyici, modlar, resource pack'ler ve boştaki belleğe
+göre -Xmx / -Xms seçimi
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional
+
+LOADER_VANILLA = "vanilla"
+LOADER_FABRIC = "fabric"
+LOADER_QUILT = "quilt"
+LOADER_FORGE = "forge"
+LOADER_NEOFORGE = "neoforge"
+
+# Sürüm dönemine göre temel heap (MB): (bu yıldan önce yayınlananlar, MB)
+ERA_BASE_MB = [
+    (2014, 1024),   # 1.7 ve öncesi
+    (2018, 1536),   # 1.8 - 1.12
+    (2021, 2048),   # 1.13 - 1.16
+    (2024, 2560),   # 1.17 - 1.20.4
+    (9999, 3072),   # 1.20.5+
+]
+
+# Yükleyicinin kendi ek yükü (MB)
+LOADER_OVERHEAD_MB = {
+    LOADER_VANILLA: 0,
+    LOADER_FABRIC: 256,
+    LOADER_QUILT: 256,
+    LOADER_FORGE: 768,
+    LOADER_NEOFORGE: 768,
+}
+
+# Mod başına sabit maliyet ve JAR boyutunun heap'e yansıma katsayısı
+MOD_COST_MB = {LOADER_FORGE: 16, LOADER_NEOFORGE: 16}
+DEFAULT_MOD_COST_MB = 10
+MOD_SIZE_FACTOR = 1.5
+RESOURCE_PACK_SIZE_FACTOR = 2.0
+
+MIN_HEAP_MB = 1024
+MAX_HEAP_MB = 16 * 1024
+# İşletim sistemi ve diğer uygulamalar için bırakılacak bellek
+SYSTEM_RESERVE_MB = 1024
+# JVM'in heap dışı kullanımı (metaspace, code cache, thread stack, native)
+NON_HEAP_FACTOR = 1.25
+
+
+def _round_up(value_mb: float, step: int = 512) -> int:
+    return int(-(-value_mb // step) * step)
+
+
+def _round_down(value_mb: float, step: int = 512) -> int:
+    return int(value_mb // step * step)
+
+
+def available_memory_mb() -> Optional[int]:
+    """Şu an kullanılabilir bellek (MemAvailable) - toplam değil"""
+    try:
+        with open("/proc/meminfo", 'r') as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def detect_loader(chain: List[Dict]) -> str:
+    """Sürüm zincirinden mod yükleyiciyi bul"""
+    if not chain:
+        return LOADER_VANILLA
+    head = chain[0]
+    text = f"{head.get('id', '')} {head.get('mainClass', '')}".lower()
+    if "neoforge" in text or "neoforged" in text:
+        return LOADER_NEOFORGE
+    if "quilt" in text:
+        return LOADER_QUILT
+    if "fabric" in text:
+        return LOADER_FABRIC
+    if "forge" in text or "modlauncher" in text or "fml" in text:
+        return LOADER_FORGE
+    return LOADER_VANILLA
+
+
+def release_year(chain: List[Dict]) -> Optional[int]:
+    """Kök (vanilla) sürümün yayın yılı"""
+    for data in reversed(chain or []):
+        match = re.match(r'(\d{4})-', data.get("releaseTime", ""))
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def scan_mods(mods_dir: Path) -> Dict:
+    """Mod klasöründeki JAR sayısı ve toplam boyutu"""
+    count, size = 0, 0
+    if mods_dir and Path(mods_dir).is_dir():
+        for jar in Path(mods_dir).glob("*.jar"):
+            try:
+                size += jar.stat().st_size
+                count += 1
+            except OSError:
+                continue
+    return {"count": count, "size_mb": size / (1024 * 1024)}
+
+
+def _pack_size(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                continue
+    return total
+
+
+def scan_resource_packs(game_dir: Path, extra_dirs: List[Path] = None) -> Dict:
+    """
+    Etkin resource pack'lerin sayısı ve toplam boyutu
+
+    options.txt varsa sadece orada etkin olanlar, yoksa klasördeki tüm
+    pack'ler sayılır.
+    """
+    game_dir = Path(game_dir)
+    packs_dir = game_dir / "resourcepacks"
+    candidates: List[Path] = []
+
+    enabled = None
+    options_file = game_dir / "options.txt"
+    if options_file.exists():
+        try:
+            with open(options_file, 'r', errors='replace') as f:
+                for line in f:
+                    if line.startswith("resourcePacks:"):
+                        enabled = re.findall(r'"file/([^"]+)"', line)
+                        break
+        except OSError:
+            enabled = None
+
+    if enabled is not None:
+        candidates = [packs_dir / name for name in enabled]
+    else:
+        for directory in [packs_dir] + list(extra_dirs or []):
+            if Path(directory).is_dir():
+                candidates.extend(Path(directory).iterdir())
+
+    count, size = 0, 0
+    for pack in candidates:
+        try:
+            if pack.exists():
+                size += _pack_size(pack)
+                count += 1
+        except OSError:
+            continue
+    return {"count": count, "size_mb": size / (1024 * 1024)}
+
+
+class HeapPlan:
+    """Seçilen heap boyutları ve gerekçeleri"""
+
+    def __init__(self, xmx_mb: int, xms_mb: int, reasons: List[str], inputs: Dict):
+        self.xmx_mb = xmx_mb
+        self.xms_mb = xms_mb
+        self.reasons = reasons
+        self.inputs = inputs
+
+    def summary(self) -> str:
+        """Kısa rapor"""
+        return f"-Xmx{self.xmx_mb}M -Xms{self.xms_mb}M"
+
+
+def plan_heap(chain: List[Dict], mods_dir: Path, game_dir: Path, available_mb: Optional[int],
+              extra_pack_dirs: List[Path] = None) -> HeapPlan:
+    """
+    Otomatik heap boyutunu hesapla
+
+    Args:
+        chain: load_version_chain çıktısı
+        mods_dir: Oyunun mod klasörü
+        game_dir: Oyun dizini (resourcepacks, options.txt)
+        available_mb: Şu an kullanılabilir bellek (MB)
+        extra_pack_dirs: Ek resource pack klasörleri
+
+    Returns:
+        HeapPlan
+    """
+    reasons = []
+    loader = detect_loader(chain)
+    year = release_year(chain)
+
+    base = ERA_BASE_MB[-1][1]
+    for before_year, era_mb in ERA_BASE_MB:
+        if year is not None and year < before_year:
+            base = era_mb
+            break
+    reasons.append(f"Sürüm dönemi ({year or 'bilinmiyor'}): {base} MB temel")
+
+    target = base + LOADER_OVERHEAD_MB[loader]
+    if loader != LOADER_VANILLA:
+        reasons.append(f"{loader} yükleyici: +{LOADER_OVERHEAD_MB[loader]} MB")
+
+    mods = scan_mods(mods_dir) if loader != LOADER_VANILLA else {"count": 0, "size_mb": 0.0}
+    if mods["count"]:
+        mod_mb = mods["count"] * MOD_COST_MB.get(loader, DEFAULT_MOD_COST_MB) + mods["size_mb"] * MOD_SIZE_FACTOR
+        target += mod_mb
+        reasons.append(f"{mods['count']} mod ({mods['size_mb']:.0f} MB): +{mod_mb:.0f} MB")
+
+    packs = scan_resource_packs(game_dir, extra_pack_dirs)
+    if packs["count"]:
+        pack_mb = packs["size_mb"] * RESOURCE_PACK_SIZE_FACTOR
+        target += pack_mb
+        reasons.append(f"{packs['count']} resource pack ({packs['size_mb']:.0f} MB): +{pack_mb:.0f} MB")
+
+    xmx = min(max(_round_up(target), MIN_HEAP_MB), MAX_HEAP_MB)
+    if xmx == MAX_HEAP_MB and target > MAX_HEAP_MB:
+        reasons.append(f"Üst sınır: {MAX_HEAP_MB} MB (daha büyük heap GC süresini uzatır)")
+
+    if available_mb is not None:
+        ceiling = _round_down((available_mb - SYSTEM_RESERVE_MB) / NON_HEAP_FACTOR)
+        if ceiling < xmx:
+            xmx = max(ceiling, MIN_HEAP_MB)
+            reasons.append(f"Boş bellek {available_mb} MB: heap {xmx} MB ile sınırlandı")
+
+    # Küçük heap'te Xms=Xmx; büyükte yarısıyla başlayıp gerektikçe büyüt
+    xms = xmx if xmx <= 4096 else max(_round_down(xmx / 2), 4096)
+    inputs = {
+        "loader": loader,
+        "release_year": year,
+        "mod_count": mods["count"],
+        "mod_size_mb": round(mods["size_mb"], 1),
+        "pack_count": packs["count"],
+        "pack_size_mb": round(packs["size_mb"], 1),
+        "available_mb": available_mb,
+        "target_mb": round(target),
+    }
+    return HeapPlan(xmx, xms, reasons, inputs)
+
+
+__all__ = [
+    'LOADER_VANILLA', 'LOADER_FABRIC', 'LOADER_QUILT', 'LOADER_FORGE', 'LOADER_NEOFORGE',
+    'available_memory_mb', 'detect_loader', 'release_year', 'scan_mods', 'scan_resource_packs',
+    'HeapPlan', 'plan_heap'
+]
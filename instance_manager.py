@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Instance Manager
+Kütüphane ve asset deposunu paylaşan, ayrı oyun dizinli adlandırılmış
+instance'lar ve çalışan oyun süreçlerinin kaydı
+"""
+
+import fcntl
+import json
+import os
+import re
+import shutil
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+INSTANCE_NAME_RE = re.compile(r'^[A-Za-z0-9][A-Za-z0-9._-]{0,63}$')
+INSTANCE_FILE = "instance.json"
+DEFAULT_INSTANCE = "default"
+
+# Yeni instance'a kopyalanabilecek ayar dosyaları
+SHARED_SETTINGS_FILES = ["options.txt", "servers.dat"]
+
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+
+class Instance:
+    """Adlandırılmış oyun dizini ve ayar geçersiz kılmaları"""
+
+    def __init__(self, root: Path, name: str, version_id: str, memory: str = None, username: str = None,
+                 created_at: float = None, wrappers: List[str] = None):
+        self.root = Path(root)
+        self.name = name
+        self.version_id = version_id
+        self.memory = memory
+        self.username = username
+        self.created_at = created_at or time.time()
+        # Başlatma sarmalayıcıları; None ise launcher ayarı
+        self.wrappers = wrappers
+
+    @property
+    def game_dir(self) -> Path:
+        """Oyunun --gameDir'i (options.txt, mods/, saves/, logs/)"""
+        return self.root / "minecraft"
+
+    def apply(self, config: Dict) -> Dict:
+        """Launcher ayarlarının bu instance için geçersiz kılınmış kopyası"""
+        merged = dict(config)
+        if self.memory:
+            merged["memory"] = self.memory
+        if self.username and self.username != config.get("username"):
+            merged["username"] = self.username
+            # UUID kullanıcı adından türetilir
+            merged.pop("uuid", None)
+        if self.wrappers is not None:
+            merged["launch_wrappers"] = list(self.wrappers)
+        return merged
+
+    def to_dict(self) -> Dict:
+        return {
+            "name": self.name,
+            "version": self.version_id,
+            "memory": self.memory,
+            "username": self.username,
+            "created_at": self.created_at,
+            "wrappers": self.wrappers,
+        }
+
+    def save(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.root / (INSTANCE_FILE + ".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp_file, self.root / INSTANCE_FILE)
+
+
+class InstanceManager:
+    """instances/<ad>/ altındaki instance'ları yönetir"""
+
+    def __init__(self, instances_dir: Path):
+        self.instances_dir = Path(instances_dir)
+
+    def list(self) -> List[Instance]:
+        """Tüm instance'lar (ada göre sıralı)"""
+        if not self.instances_dir.exists():
+            return []
+        instances = []
+        for root in sorted(self.instances_dir.iterdir()):
+            instance = self._load(root)
+            if instance:
+                instances.append(instance)
+        return instances
+
+    def get(self, name: str) -> Optional[Instance]:
+        if not INSTANCE_NAME_RE.match(name or ""):
+            return None
+        return self._load(self.instances_dir / name)
+
+    @staticmethod
+    def _load(root: Path) -> Optional[Instance]:
+        try:
+            with open(root / INSTANCE_FILE, 'r') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        return Instance(root, data.get("name", root.name), data.get("version", ""), data.get("memory"),
+                        data.get("username"), data.get("created_at"), data.get("wrappers"))
+
+    def create(self, name: str, version_id: str, memory: str = None, username: str = None,
+               copy_settings_from: Path = None) -> Instance:
+        """
+        Yeni instance oluştur
+
+        Args:
+            name: Harf, rakam, '.', '_' ve '-' (en fazla 64 karakter)
+            version_id: Başlatılacak sürüm
+            memory: Heap (GB) ya da None (launcher ayarı)
+            username: Oyuncu adı ya da None (launcher ayarı)
+            copy_settings_from: options.txt / servers.dat'ın kopyalanacağı oyun dizini
+
+        Raises:
+            ValueError: Geçersiz ya da kullanılan ad
+        """
+        if not INSTANCE_NAME_RE.match(name or ""):
+            raise ValueError(f"Geçersiz instance adı: {name!r}")
+        root = self.instances_dir / name
+        if root.exists():
+            raise ValueError(f"Instance zaten var: {name}")
+
+        instance = Instance(root, name, version_id, memory, username)
+        instance.game_dir.mkdir(parents=True, exist_ok=True)
+        if copy_settings_from:
+            for file_name in SHARED_SETTINGS_FILES:
+                source = Path(copy_settings_from) / file_name
+                if source.is_file():
+                    shutil.copy2(source, instance.game_dir / file_name)
+        instance.save()
+        return instance
+
+    def update(self, instance: Instance):
+        instance.save()
+
+    def delete(self, name: str):
+        """Instance'ı oyun dizini (dünyalar dahil) ile birlikte sil"""
+        instance = self.get(name)
+        if instance is None:
+            raise ValueError(f"Instance bulunamadı: {name}")
+        shutil.rmtree(instance.root)
+
+
+def process_start_ticks(pid: int) -> Optional[int]:
+    """Sürecin açılış zamanı (/proc/<pid>/stat alan 22) - PID yeniden kullanımını ayırt eder"""
+    try:
+        with open(f"/proc/{pid}/stat", 'r') as f:
+            stat = f.read()
+    except OSError:
+        return None
+    # comm alanı boşluk ve parantez içerebilir; son ')' sonrasından say
+    fields = stat[stat.rfind(")") + 2:].split()
+    try:
+        return int(fields[19])
+    except (IndexError, ValueError):
+        return None
+
+
+def process_stats(pid: int) -> Optional[Dict]:
+    """Sürecin RSS'i (MB) ve toplam CPU süresi (sn)"""
+    try:
+        with open(f"/proc/{pid}/stat", 'r') as f:
+            stat = f.read()
+        fields = stat[stat.rfind(")") + 2:].split()
+        cpu_seconds = (int(fields[11]) + int(fields[12])) / _CLK_TCK
+        rss_mb = 0.0
+        with open(f"/proc/{pid}/status", 'r') as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    rss_mb = int(line.split()[1]) / 1024
+                    break
+    except (OSError, IndexError, ValueError):
+        return None
+    return {"rss_mb": rss_mb, "cpu_seconds": cpu_seconds}
+
+
+class ProcessRegistry:
+    """
+    Çalışan oyun süreçlerinin kaydı
+
+    Kayıt dosyası launcher'ın tüm kopyaları (menü ve CLI) arasında paylaşılır;
+    yazma işlemleri flock ile sıralanır, kapanmış süreçler okurken temizlenir.
+    """
+
+    def __init__(self, registry_file: Path):
+        self.registry_file = Path(registry_file)
+        self.lock_file = self.registry_file.with_suffix(".lock")
+
+    @contextmanager
+    def _locked(self):
+        self.registry_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_file, 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read(self) -> Dict[str, Dict]:
+        try:
+            with open(self.registry_file, 'r') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, data: Dict[str, Dict]):
+        tmp_file = self.registry_file.with_suffix(".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_file, self.registry_file)
+
+    @staticmethod
+    def _alive(record: Dict) -> bool:
+        ticks = process_start_ticks(record["pid"])
+        return ticks is not None and ticks == record.get("start_ticks")
+
+    def register(self, pid: int, instance: str, version_id: str, game_dir: Path, log_file: Path = None):
+        """Başlatılan süreci kaydet"""
+        record = {
+            "pid": pid,
+            "start_ticks": process_start_ticks(pid),
+            "instance": instance,
+            "version": version_id,
+            "game_dir": str(game_dir),
+            "log_file": str(log_file) if log_file else None,
+            "started_at": time.time(),
+        }
+        with self._locked():
+            data = self._read()
+            data[str(pid)] = record
+            self._write(data)
+
+    def unregister(self, pid: int):
+        with self._locked():
+            data = self._read()
+            if data.pop(str(pid), None) is not None:
+                self._write(data)
+
+    def running(self) -> List[Dict]:
+        """Hâlâ çalışan süreçler (başlangıç zamanına göre)"""
+        with self._locked():
+            data = self._read()
+            alive = {pid: record for pid, record in data.items() if self._alive(record)}
+            if len(alive) != len(data):
+                self._write(alive)
+        return sorted(alive.values(), key=lambda r: r.get("started_at", 0))
+
+    def find(self, instance: str) -> Optional[Dict]:
+        """Instance'ın çalışan süreci"""
+        return next((r for r in self.running() if r.get("instance") == instance), None)
+
+    def find_game_dir(self, game_dir: Path) -> Optional[Dict]:
+        """Aynı oyun dizinini kullanan çalışan süreç"""
+        game_dir = str(game_dir)
+        return next((r for r in self.running() if r.get("game_dir") == game_dir), None)
+
+
+__all__ = [
+    'DEFAULT_INSTANCE', 'Instance', 'InstanceManager',
+    'process_start_ticks', 'process_stats', 'ProcessRegistry'
+]
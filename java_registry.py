@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Java Runtime Registry
+Kurulu JDK/JRE'leri bul, sürüm bilgisini önbelleğe al (JVM başlatmadan)
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# JDK aranacak kök dizinler (her biri altında <jdk>/bin/java beklenir)
+DEFAULT_JAVA_ROOTS = [
+    "/usr/lib/jvm",
+    "/usr/java",
+    "/opt/java",
+    "~/.sdkman/candidates/java",
+    "~/.jdks",
+]
+
+_VERSION_OUTPUT_RE = re.compile(r'version "([^"]+)"')
+_RELEASE_LINE_RE = re.compile(r'^([A-Z_]+)="?(.*?)"?$')
+
+
+def normalize_java_version(raw: str) -> Optional[Tuple[str, int]]:
+    """
+    Java sürüm string'ini "major.minor.patch" biçimine getir
+
+    Args:
+        raw: "21.0.2", "17", "1.8.0_392", "21-ea" gibi değerler
+
+    Returns:
+        (normalize sürüm, major) veya ayrıştırılamazsa None
+    """
+    if not raw:
+        return None
+    raw = raw.strip()
+
+    # Java 8 ve öncesi: 1.8.0_392
+    legacy = re.match(r'1\.(\d+)\.(\d+)(?:_(\d+))?', raw)
+    if legacy:
+        major = int(legacy.group(1))
+        return f"{major}.{legacy.group(2)}.{legacy.group(3) or 0}", major
+
+    modern = re.match(r'(\d+)(?:\.(\d+))?(?:\.(\d+))?', raw)
+    if modern:
+        major = int(modern.group(1))
+        return f"{major}.{modern.group(2) or 0}.{modern.group(3) or 0}", major
+    return None
+
+
+def parse_release_file(java_home: Path) -> Optional[Dict]:
+    """JDK'nın 'release' dosyasından sürüm ve dağıtıcı bilgisini oku"""
+    release_file = Path(java_home) / "release"
+    if not release_file.is_file():
+        return None
+
+    values = {}
+    try:
+        with open(release_file, 'r', errors='replace') as f:
+            for line in f:
+                match = _RELEASE_LINE_RE.match(line.strip())
+                if match:
+                    values[match.group(1)] = match.group(2)
+    except OSError:
+        return None
+
+    parsed = normalize_java_version(values.get("JAVA_VERSION", ""))
+    if not parsed:
+        return None
+
+    version, major = parsed
+    return {
+        "version": version,
+        "major": major,
+        "vendor": values.get("IMPLEMENTOR", "") or values.get("JAVA_VENDOR", ""),
+        "source": "release",
+    }
+
+
+def probe_java(java_path: str, timeout: int = 10) -> Optional[Dict]:
+    """'java -version' çalıştırarak sürüm bilgisini al (son çare)"""
+    try:
+        result = subprocess.run([java_path, "-version"], capture_output=True, text=True, timeout=timeout)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+
+    output = result.stderr or result.stdout
+    match = _VERSION_OUTPUT_RE.search(output)
+    parsed = normalize_java_version(match.group(1)) if match else None
+    if not parsed:
+        return None
+
+    version, major = parsed
+    lines = [line for line in output.splitlines() if line.strip()]
+    vendor = lines[1].split("(")[0].strip() if len(lines) > 1 else ""
+    return {"version": version, "major": major, "vendor": vendor, "source": "probe"}
+
+
+def _java_home(java_path: str) -> Path:
+    """bin/java yolundan JDK kök dizinini bul"""
+    return Path(java_path).parent.parent
+
+
+class JavaRegistry:
+    """
+    Java runtime kayıt defteri
+
+    Sürüm bilgisi ikili dosyanın gerçek yolu ve mtime'ına göre diskte
+    önbelleğe alınır; menü ve başlatma yolu JVM başlatmadan sürümü öğrenir.
+    """
+
+    def __init__(self, cache_file: Path, extra_roots: List[str] = None):
+        self.cache_file = Path(cache_file)
+        self.roots = DEFAULT_JAVA_ROOTS + list(extra_roots or [])
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Dict] = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Dict]:
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'r') as f:
+                    return json.load(f)
+            except (OSError, json.JSONDecodeError):
+                pass
+        return {}
+
+    def _save_cache(self):
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(self._cache, f, indent=2)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _stamp(real_path: str) -> Optional[List[float]]:
+        """Önbellek geçerlilik damgası: ikili + release dosyasının mtime'ı"""
+        try:
+            stamp = [os.stat(real_path).st_mtime]
+        except OSError:
+            return None
+        release_file = _java_home(real_path) / "release"
+        try:
+            stamp.append(release_file.stat().st_mtime)
+        except OSError:
+            stamp.append(0)
+        return stamp
+
+    def _lookup_cached(self, real_path: str, stamp: List[float]) -> Optional[Dict]:
+        with self._lock:
+            entry = self._cache.get(real_path)
+        if entry and entry.get("stamp") == stamp:
+            return entry
+        return None
+
+    def _resolve(self, real_path: str, stamp: List[float], allow_probe: bool = True) -> Optional[Dict]:
+        """Önbellekte yoksa release dosyasını oku, o da yoksa JVM'i yokla"""
+        info = parse_release_file(_java_home(real_path))
+        if info is None and allow_probe:
+            info = probe_java(real_path)
+        if info is None:
+            return None
+
+        entry = dict(info)
+        entry["stamp"] = stamp
+        entry["home"] = str(_java_home(real_path))
+        with self._lock:
+            self._cache[real_path] = entry
+        return entry
+
+    def info(self, java_path: str, allow_probe: bool = True) -> Optional[Dict]:
+        """
+        Tek bir Java ikilisinin bilgisini döndür
+
+        Returns:
+            version, major, vendor, home, path anahtarlı dict veya None
+        """
+        if not java_path:
+            return None
+        if os.path.sep not in java_path:
+            java_path = shutil.which(java_path) or java_path
+        real_path = os.path.realpath(java_path)
+        stamp = self._stamp(real_path)
+        if stamp is None:
+            return None
+
+        entry = self._lookup_cached(real_path, stamp)
+        if entry is None:
+            entry = self._resolve(real_path, stamp, allow_probe)
+            if entry is None:
+                return None
+            self._save_cache()
+
+        result = dict(entry)
+        result["path"] = java_path
+        result["real_path"] = real_path
+        return result
+
+    def version(self, java_path: str) -> Optional[str]:
+        """Sadece normalize sürüm string'ini döndür"""
+        info = self.info(java_path)
+        return info["version"] if info else None
+
+    def _candidate_binaries(self) -> List[Tuple[str, str]]:
+        """Kök dizinlerdeki ve JAVA_HOME/PATH'teki java ikilileri: (isim, yol)"""
+        candidates = []
+        java_home = os.environ.get("JAVA_HOME")
+        if java_home:
+            candidates.append((Path(java_home).name, os.path.join(java_home, "bin", "java")))
+
+        for root in self.roots:
+            root_path = Path(os.path.expanduser(root))
+            if not root_path.is_dir():
+                continue
+            try:
+                children = sorted(root_path.iterdir())
+            except OSError:
+                continue
+            for child in children:
+                # default/current gibi bağlantılar gerçek dizinle zaten bulunur
+                if child.is_symlink() or child.name == "current":
+                    continue
+                java_bin = child / "bin" / "java"
+                if java_bin.exists():
+                    candidates.append((child.name, str(java_bin)))
+
+        path_java = shutil.which("java")
+        if path_java:
+            candidates.append(("system", path_java))
+        return candidates
+
+    def discover(self) -> List[Dict]:
+        """
+        Tüm kurulu Java'ları bul
+
+        release dosyası olmayanlar paralel yoklanır; sonuç gerçek yola göre
+        tekilleştirilir ve major sürüme göre büyükten küçüğe sıralanır.
+        """
+        runtimes: Dict[str, Dict] = {}
+        pending = []
+
+        for name, java_path in self._candidate_binaries():
+            real_path = os.path.realpath(java_path)
+            if real_path in runtimes or any(p[2] == real_path for p in pending):
+                continue
+            stamp = self._stamp(real_path)
+            if stamp is None:
+                continue
+            entry = self._lookup_cached(real_path, stamp) or self._resolve(real_path, stamp, allow_probe=False)
+            if entry is None:
+                pending.append((name, java_path, real_path, stamp))
+                continue
+            runtimes[real_path] = self._runtime_record(name, java_path, real_path, entry)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                results = executor.map(lambda p: (p, self._resolve(p[2], p[3])), pending)
+                for (name, java_path, real_path, _), entry in results:
+                    if entry is not None:
+                        runtimes[real_path] = self._runtime_record(name, java_path, real_path, entry)
+
+        self._save_cache()
+        return sorted(runtimes.values(), key=lambda r: (r["major"], r["version"]), reverse=True)
+
+    @staticmethod
+    def _runtime_record(name: str, java_path: str, real_path: str, entry: Dict) -> Dict:
+        """Launcher'ın kullandığı Java kaydı biçimi"""
+        return {
+            "path": java_path,
+            "real_path": real_path,
+            "version": entry["version"],
+            "major": entry["major"],
+            "vendor": entry.get("vendor", ""),
+            "home": entry.get("home", ""),
+            "name": name,
+            "installed": True,
+        }
+
+
+__all__ = ['DEFAULT_JAVA_ROOTS', 'normalize_java_version', 'parse_release_file', 'probe_java', 'JavaRegistry']
@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Managed Java Runtimes
+Mojang'ın Java runtime manifest'inden launcher dizinine root gerektirmeden
+runtime kur: dosyalar SHA-1 ile içerik adresli depoda tutulur, bileşen
+ağaçları hardlink ile kurulur, sürüm başına runtime javaVersion'dan seçilir
+"""
+
+import json
+import os
+import platform
+import shutil
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from parallel_download import DownloadTask, DownloadReport, is_valid, fetch_json, download_file, download_all
+
+RUNTIME_INDEX_URL = ("https://launchermeta.mojang.com/v1/products/java-runtime/"
+                     "2ec0cc96c44e5a76b9c8b7c39df7210883d12871/all.json")
+INDEX_CACHE_SECONDS = 3600
+
+# javaVersion alanı olmayan (1.16 ve öncesi) sürümler
+LEGACY_COMPONENT = "jre-legacy"
+LEGACY_MAJOR = 8
+
+RUNTIME_AUTO = "auto"
+RUNTIME_SYSTEM = "system"
+
+INSTALLED_FILE = "installed.json"
+
+
+def runtime_platform() -> Optional[str]:
+    """Bu makinenin manifest'teki platform anahtarı (desteklenmiyorsa None)"""
+    if not sys.platform.startswith("linux"):
+        return None
+    machine = platform.machine().lower()
+    if machine in ("x86_64", "amd64"):
+        return "linux"
+    if machine in ("i386", "i486", "i586", "i686", "x86"):
+        return "linux-i386"
+    return None
+
+
+def runtime_requirement(version_data: Dict) -> Tuple[str, int]:
+    """
+    Sürümün istediği runtime
+
+    Args:
+        version_data: Birleştirilmiş sürüm JSON'u (merge_version_chain)
+
+    Returns:
+        (bileşen, Java ana sürümü) - javaVersion yoksa jre-legacy / 8
+    """
+    java = version_data.get("javaVersion") or {}
+    try:
+        major = int(java.get("majorVersion", LEGACY_MAJOR))
+    except (TypeError, ValueError):
+        major = LEGACY_MAJOR
+    return java.get("component") or LEGACY_COMPONENT, major
+
+
+def _safe_relative(rel: str) -> bool:
+    """Manifest yolu ağacın dışına çıkmıyor mu"""
+    parts = Path(rel).parts
+    return bool(parts) and not Path(rel).is_absolute() and ".." not in parts
+
+
+class RuntimeStore:
+    """
+    runtimes/
+        objects/<sha1[:2]>/<sha1>   paylaşılan dosyalar
+        manifests/<sha1>.json       bileşen manifest'leri
+        <bileşen>/bin/java          objects'e hardlink'li ağaç
+        installed.json              kurulu bileşenler
+
+    Aynı dosya birden çok bileşende tek kez indirilir ve diskte tek kez
+    durur; hiçbir ağacın bağlamadığı nesneler prune() ile silinir.
+    """
+
+    def __init__(self, root: Path, index_url: str = RUNTIME_INDEX_URL, cache_dir: Path = None,
+                 platform_key: str = None):
+        self.root = Path(root)
+        self.index_url = index_url
+        self.cache_file = Path(cache_dir or self.root) / "java_runtime_index.json"
+        self.platform_key = platform_key or runtime_platform()
+        self.objects_dir = self.root / "objects"
+        self.manifests_dir = self.root / "manifests"
+
+    def installed(self) -> Dict[str, Dict]:
+        """{bileşen: {"version", "manifest_sha1", "installed_at", "files"}}"""
+        installed_file = self.root / INSTALLED_FILE
+        if not installed_file.exists():
+            return {}
+        try:
+            with open(installed_file, 'r') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _save_installed(self, installed: Dict[str, Dict]):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.root / (INSTALLED_FILE + ".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(installed, f, indent=2)
+        os.replace(tmp_file, self.root / INSTALLED_FILE)
+
+    def java_path(self, component: str) -> Optional[str]:
+        """Kurulu bileşenin java ikilisi"""
+        if component not in self.installed():
+            return None
+        java_bin = self.root / component / "bin" / "java"
+        return str(java_bin) if java_bin.exists() else None
+
+    def index(self, offline: bool = False, max_age: int = INDEX_CACHE_SECONDS) -> Dict[str, List[Dict]]:
+        """
+        Bu platformun bileşenleri: {bileşen: [girdi, ...]}
+
+        Liste önbellekten okunur, eskiyse yenilenir; ağ yoksa önbellek kullanılır.
+        """
+        cached = None
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'r') as f:
+                    cached = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                cached = None
+            if cached is not None and (offline or time.time() - self.cache_file.stat().st_mtime < max_age):
+                return cached.get(self.platform_key, {})
+        if offline:
+            return (cached or {}).get(self.platform_key, {})
+
+        try:
+            data = fetch_json(self.index_url)
+        except Exception:
+            return (cached or {}).get(self.platform_key, {})
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass
+        return data.get(self.platform_key, {})
+
+    def available(self, offline: bool = False) -> Dict[str, str]:
+        """Kurulabilir bileşenler: {bileşen: sürüm adı}"""
+        result = {}
+        for component, entries in self.index(offline).items():
+            if entries:
+                result[component] = entries[0].get("version", {}).get("name", "?")
+        return result
+
+    def _entry(self, component: str) -> Dict:
+        if not self.platform_key:
+            raise ValueError(f"Mojang bu işlemci için runtime yayınlamıyor: {platform.machine()}")
+        index = self.index()
+        if not index:
+            raise ValueError("Runtime listesi alınamadı (ağ bağlantısı?)")
+        entries = index.get(component)
+        if not entries:
+            raise ValueError(f"Runtime bulunamadı: {component} ({self.platform_key})")
+        return entries[0]
+
+    def _manifest(self, entry: Dict) -> Dict:
+        """Bileşen manifest'ini indir (SHA-1 doğrulamalı) ve önbellekten oku"""
+        info = entry["manifest"]
+        manifest_path = self.manifests_dir / f"{info['sha1']}.json"
+        if not manifest_path.exists():
+            download_file(DownloadTask(info["url"], manifest_path, info.get("sha1"), info.get("size")))
+        with open(manifest_path, 'r') as f:
+            return json.load(f)
+
+    def _object_path(self, sha1: str) -> Path:
+        return self.objects_dir / sha1[:2] / sha1
+
+    def install(self, component: str, workers: int = 16, force: bool = False,
+                on_done: Callable[[DownloadTask, bool], None] = None) -> DownloadReport:
+        """
+        Bileşeni en son sürümüyle kur ya da güncelle
+
+        Depoda olmayan dosyalar paralel indirilir; ağaç yan dizinde kurulup
+        tek adımda yerine taşınır, bu sırada çalışan bir oyun etkilenmez.
+
+        Raises:
+            ValueError: Bileşen/platform yoksa ya da manifest geçersizse
+        """
+        entry = self._entry(component)
+        manifest_sha1 = entry["manifest"]["sha1"]
+        current = self.installed().get(component)
+        if current and current.get("manifest_sha1") == manifest_sha1 and self.java_path(component) and not force:
+            return DownloadReport()
+
+        files = self._manifest(entry).get("files", {})
+        tasks = []
+        seen = set()
+        for rel, info in files.items():
+            if not _safe_relative(rel):
+                raise ValueError(f"Geçersiz runtime yolu: {rel}")
+            raw = info.get("downloads", {}).get("raw") if info.get("type") == "file" else None
+            if info.get("type") == "file" and not raw:
+                raise ValueError(f"İndirme adresi yok: {rel}")
+            if raw and raw["sha1"] not in seen:
+                seen.add(raw["sha1"])
+                task = DownloadTask(raw["url"], self._object_path(raw["sha1"]), raw["sha1"], raw.get("size"), rel)
+                if force or not is_valid(task):
+                    tasks.append(task)
+
+        report = download_all(tasks, workers=workers, on_done=on_done)
+        if not report.ok:
+            return report
+
+        self._build_tree(component, files)
+        installed = self.installed()
+        installed[component] = {
+            "version": entry.get("version", {}).get("name", "?"),
+            "manifest_sha1": manifest_sha1,
+            "installed_at": time.time(),
+            "files": len(files),
+        }
+        self._save_installed(installed)
+        self.prune()
+        return report
+
+    def _build_tree(self, component: str, files: Dict[str, Dict]):
+        """Bileşen ağacını depodaki nesnelere hardlink'le kur (olmazsa kopyala)"""
+        staging = self.root / f".{component}.staging"
+        if staging.exists():
+            shutil.rmtree(staging)
+        staging.mkdir(parents=True)
+
+        # Dizinler önce, bağlantılar en son
+        order = {"directory": 0, "file": 1, "link": 2}
+        for rel, info in sorted(files.items(), key=lambda item: (order.get(item[1].get("type"), 3), item[0])):
+            target = staging / rel
+            kind = info.get("type")
+            if kind == "directory":
+                target.mkdir(parents=True, exist_ok=True)
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            if kind == "link":
+                os.symlink(info["target"], target)
+            elif kind == "file":
+                source = self._object_path(info["downloads"]["raw"]["sha1"])
+                try:
+                    os.link(source, target)
+                except OSError:
+                    # Farklı dosya sistemi ya da hardlink desteği yok
+                    shutil.copy2(source, target)
+                if info.get("executable"):
+                    os.chmod(target, 0o755)
+
+        final = self.root / component
+        old = self.root / f".{component}.old"
+        if old.exists():
+            shutil.rmtree(old)
+        if final.exists():
+            final.rename(old)
+        staging.rename(final)
+        if old.exists():
+            shutil.rmtree(old, ignore_errors=True)
+
+    def ensure(self, component: str, workers: int = 16,
+               on_done: Callable[[DownloadTask, bool], None] = None) -> Tuple[Optional[str], Optional[DownloadReport]]:
+        """
+        Kuruluysa ağa çıkmadan java yolunu döndür, değilse kur
+
+        Returns:
+            (java yolu ya da None, indirme raporu ya da None)
+        """
+        java = self.java_path(component)
+        if java:
+            return java, None
+        report = self.install(component, workers=workers, on_done=on_done)
+        return self.java_path(component), report
+
+    def verify(self, component: str) -> List[str]:
+        """Eksik ya da boyutu tutmayan dosyalar (manifest önbellekte yoksa boş)"""
+        current = self.installed().get(component)
+        if not current:
+            return []
+        manifest_path = self.manifests_dir / f"{current['manifest_sha1']}.json"
+        try:
+            with open(manifest_path, 'r') as f:
+                files = json.load(f).get("files", {})
+        except (OSError, json.JSONDecodeError):
+            return []
+        bad = []
+        for rel, info in files.items():
+            target = self.root / component / rel
+            if info.get("type") == "file":
+                try:
+                    if target.stat().st_size != info["downloads"]["raw"].get("size", target.stat().st_size):
+                        bad.append(rel)
+                except OSError:
+                    bad.append(rel)
+            elif info.get("type") == "link" and not target.is_symlink():
+                bad.append(rel)
+        return bad
+
+    def remove(self, component: str) -> int:
+        """Bileşeni kaldır; silinen depo nesnesi sayısı"""
+        target = self.root / component
+        if target.exists():
+            shutil.rmtree(target)
+        installed = self.installed()
+        if installed.pop(component, None) is not None:
+            self._save_installed(installed)
+        return self.prune()
+
+    def prune(self) -> int:
+        """Hiçbir ağacın bağlamadığı nesneleri sil"""
+        removed = 0
+        if not self.objects_dir.exists():
+            return removed
+        installed = self.installed()
+        for bucket in self.objects_dir.iterdir():
+            for obj in bucket.iterdir():
+                try:
+                    # Tek bağlantı = sadece depo; kopyayla kurulan ağaçlar depoya ihtiyaç duymaz
+                    if obj.stat().st_nlink == 1 or not installed:
+                        obj.unlink()
+                        removed += 1
+                except OSError:
+                    continue
+        live_manifests = {f"{info.get('manifest_sha1')}.json" for info in installed.values()}
+        if self.manifests_dir.exists():
+            for manifest in self.manifests_dir.glob("*.json"):
+                if manifest.name not in live_manifests:
+                    manifest.unlink()
+        return removed
+
+    def disk_usage_mb(self) -> float:
+        """Deponun diskte kapladığı alan (hardlink'ler bir kez sayılır)"""
+        seen = set()
+        total = 0
+        for directory, _, names in os.walk(self.root):
+            for name in names:
+                try:
+                    st = os.lstat(os.path.join(directory, name))
+                except OSError:
+                    continue
+                if (st.st_dev, st.st_ino) not in seen:
+                    seen.add((st.st_dev, st.st_ino))
+                    total += st.st_size
+        return total / (1024 * 1024)
+
+
+class RuntimeChoice:
+    """Bir başlatma için seçilen Java ve sebebi"""
+
+    def __init__(self, java_path: Optional[str], component: str = "", major: int = 0,
+                 managed: bool = False, reason: str = ""):
+        self.java_path = java_path
+        self.component = component
+        self.major = major
+        self.managed = managed
+        self.reason = reason
+
+    def summary(self) -> str:
+        source = f"{self.component} (yönetilen)" if self.managed else "sistem"
+        text = f"Java {self.major} → {source}"
+        return f"{text}: {self.reason}" if self.reason else text
+
+
+def select_runtime(store: RuntimeStore, version_data: Dict, config: Dict, fallback_java: Optional[str],
+                   provision: bool = True, workers: int = 16,
+                   on_done: Callable[[DownloadTask, bool], None] = None) -> RuntimeChoice:
+    """
+    Sürüm için Java seç
+
+    "java_runtime" ayarı "auto" (varsayılan) ise javaVersion'daki bileşen
+    kullanılır ve gerekirse kurulur; "system" ise ya da kurulum mümkün
+    değilse fallback_java (config'teki java_path / find_java) döner.
+
+    Args:
+        version_data: Birleştirilmiş sürüm JSON'u
+        fallback_java: Sistem Java'sı
+        provision: Kurulu değilse indir
+    """
+    component, major = runtime_requirement(version_data)
+    if config.get("java_runtime", RUNTIME_AUTO) == RUNTIME_SYSTEM:
+        return RuntimeChoice(fallback_java, component, major, reason="ayar: sistem Java'sı")
+
+    java = store.java_path(component)
+    if java:
+        return RuntimeChoice(java, component, major, managed=True)
+    if not provision:
+        return RuntimeChoice(fallback_java, component, major, reason=f"{component} kurulu değil")
+
+    try:
+        java, report = store.ensure(component, workers=workers, on_done=on_done)
+    except (OSError, ValueError) as e:
+        return RuntimeChoice(fallback_java, component, major, reason=str(e))
+    if not java:
+        failed = len(report.failed) if report else 0
+        return RuntimeChoice(fallback_java, component, major, reason=f"{component} indirilemedi ({failed} dosya)")
+    return RuntimeChoice(java, component, major, managed=True, reason="yeni kuruldu")
+
+
+__all__ = [
+    'RUNTIME_INDEX_URL', 'LEGACY_COMPONENT', 'LEGACY_MAJOR', 'RUNTIME_AUTO', 'RUNTIME_SYSTEM',
+    'runtime_platform', 'runtime_requirement', 'RuntimeStore', 'RuntimeChoice', 'select_runtime'
+]
@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - JFR Profiler
+Java Flight Recorder kaydı başlat (açılışta -XX:StartFlightRecording ya da
+çalışan oyuna jcmd JFR.start), kaydı JDK'nın jfr aracıyla akış halinde okuyup
+sıcak metotları, ayırma noktalarını, GC/safepoint duraklamalarını ve kilit
+çekişmesini mod adlarıyla özetle
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+PROFILES_DIR = "profiles"
+
+# JDK ile gelen şablonlar; .jfc yolu da verilebilir
+TEMPLATES = {
+    "default": "Düşük ek yük (~%1), uzun oturumlar için",
+    "profile": "Sık örnekleme, ayırma ve kilit olayları (~%2)",
+}
+DEFAULT_TEMPLATE = "profile"
+DEFAULT_DURATION = 60
+RECORDING_NAME = "berke"
+
+# OpenJDK'da JFR ve -XX:StartFlightRecording 11'den beri ücretsiz ve kilitsiz
+MIN_JAVA_JFR = 11
+
+TOP_N = 10
+
+# Yığının ilk uygulama çerçevesini bulmaya yetecek derinlik (fazlası jfr print çıktısını büyütür)
+STACK_DEPTH = 12
+
+SUMMARY_EVENTS = [
+    "jdk.ExecutionSample", "jdk.ObjectAllocationSample", "jdk.ObjectAllocationInNewTLAB",
+    "jdk.ObjectAllocationOutsideTLAB", "jdk.GarbageCollection", "jdk.SafepointBegin", "jdk.JavaMonitorEnter",
+]
+
+# Paket öneki -> sahibi (mod JAR'larında bulunmayan platform ve kütüphane paketleri)
+JDK_OWNER = "JDK"
+MINECRAFT_OWNER = "Minecraft"
+KNOWN_PACKAGES = [
+    ("java.", JDK_OWNER), ("javax.", JDK_OWNER), ("jdk.", JDK_OWNER), ("sun.", JDK_OWNER), ("com.sun.", JDK_OWNER),
+    ("net.minecraft.", MINECRAFT_OWNER), ("com.mojang.", MINECRAFT_OWNER),
+    ("org.lwjgl.", "LWJGL"), ("io.netty.", "Netty"), ("it.unimi.dsi.fastutil.", "fastutil"),
+    ("com.google.", "Guava/Gson"), ("org.spongepowered.asm.", "Mixin"), ("org.apache.logging.", "Log4j"),
+    ("net.fabricmc.", "Fabric"), ("org.quiltmc.", "Quilt"), ("net.minecraftforge.", "Forge"),
+    ("cpw.mods.", "Forge"), ("net.neoforged.", "NeoForge"),
+]
+
+# Mixin'in hedef sınıfa eklediği metotlar: handler$zza000$sodium$onRender
+_MIXIN_METHOD_RE = re.compile(r"^(?:handler|redirect|modify\w*|wrapOperation|wrapWithCondition|localvar|constant)\$\w+?\$(\w+)\$")
+_EVENT_START_RE = re.compile(r"^(jdk\.\w+) \{$")
+_FIELD_RE = re.compile(r"^  (\w+) = (.*)$")
+_QUANTITY_RE = re.compile(r"^(-?[\d.,]+)\s*([a-zA-Zµ]+)?")
+
+_DURATION_MS = {"ns": 1e-6, "us": 1e-3, "µs": 1e-3, "ms": 1.0, "s": 1000.0, "m": 60000.0, "min": 60000.0,
+                "h": 3600000.0}
+_BYTES = {"byte": 1, "bytes": 1, "kB": 1024, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3, "TB": 1024 ** 4}
+
+
+def parse_duration_ms(text: str) -> Optional[float]:
+    """'12.5 ms', '1.20 s', '850 us' -> ms"""
+    match = _QUANTITY_RE.match(text.strip())
+    if not match or (match.group(2) or "ms") not in _DURATION_MS:
+        return None
+    return float(match.group(1).replace(",", "")) * _DURATION_MS[match.group(2) or "ms"]
+
+
+def parse_bytes(text: str) -> Optional[int]:
+    """'1.2 MB', '512 bytes' -> bayt"""
+    match = _QUANTITY_RE.match(text.strip())
+    if not match or (match.group(2) or "bytes") not in _BYTES:
+        return None
+    return int(float(match.group(1).replace(",", "")) * _BYTES[match.group(2) or "bytes"])
+
+
+def recording_path(profiles_dir: Path, version_id: str) -> Path:
+    return Path(profiles_dir) / f"{version_id}_{time.strftime('%Y%m%d_%H%M%S')}.jfr"
+
+
+def jfr_start_args(recording: Path, template: str, java_major: int) -> List[str]:
+    """
+    Açılıştan itibaren kayıt için JVM argümanı (oyun kapanınca dosyaya yazılır)
+
+    Java 11'den eski sürümlerde boş liste.
+    """
+    if java_major < MIN_JAVA_JFR:
+        return []
+    return [f"-XX:StartFlightRecording=name={RECORDING_NAME},settings={template},filename={recording},dumponexit=true"]
+
+
+def find_jdk_tool(name: str, java_paths: List[str]) -> Optional[str]:
+    """
+    jcmd/jfr aracını bul
+
+    Önce oyunu çalıştıran Java'nın yanına (yönetilen runtime'lar JRE olduğundan
+    çoğu zaman yoktur), sonra JAVA_HOME'a, PATH'e ve diğer kurulu Java'lara bakılır.
+    """
+    candidates = [Path(os.path.realpath(p)).parent / name for p in java_paths if p]
+    if os.environ.get("JAVA_HOME"):
+        candidates.insert(1, Path(os.environ["JAVA_HOME"]) / "bin" / name)
+    for candidate in candidates:
+        if candidate.is_file() and os.access(candidate, os.X_OK):
+            return str(candidate)
+    return shutil.which(name)
+
+
+def _is_java(pid: int) -> bool:
+    try:
+        with open(f"/proc/{pid}/cmdline", 'rb') as f:
+            executable = f.read().split(b"\0", 1)[0]
+    except OSError:
+        return False
+    return os.path.basename(executable.decode(errors="replace")) == "java"
+
+
+def jvm_pid(pid: int) -> Optional[int]:
+    """
+    Oyun sürecinin JVM'i
+
+    Sarmalayıcılar (gamemoderun, prime-run, systemd-run) kullanıldıysa kayıtlı
+    PID sarmalayıcınınkidir; jcmd'nin bağlanacağı java alt süreçlerde aranır.
+    """
+    if _is_java(pid):
+        return pid
+    children: Dict[int, List[int]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", 'r') as f:
+                stat = f.read()
+            parent = int(stat[stat.rfind(")") + 2:].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(parent, []).append(int(entry))
+    queue = list(children.get(pid, []))
+    while queue:
+        child = queue.pop(0)
+        if _is_java(child):
+            return child
+        queue += children.get(child, [])
+    return None
+
+
+def run_jcmd(jcmd: str, pid: int, *command: str, timeout: float = 30) -> Tuple[bool, str]:
+    """jcmd komutunu çalıştır; (başarılı mı, çıktı)"""
+    try:
+        result = subprocess.run([jcmd, str(pid)] + list(command), capture_output=True, text=True, timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        return False, str(e)
+    output = (result.stdout + result.stderr).strip()
+    # jcmd bağlanamayınca da 0 dönebilir; hata metni çıktıdadır
+    failed = result.returncode != 0 or "Exception" in output or "Could not" in output
+    return not failed, output
+
+
+def start_recording(jcmd: str, pid: int, recording: Path, template: str = DEFAULT_TEMPLATE,
+                    duration: int = DEFAULT_DURATION) -> Tuple[bool, str]:
+    """
+    Çalışan JVM'de süreli kayıt başlat (süre dolunca dosyaya yazılır)
+
+    Returns:
+        (başarılı mı, jcmd çıktısı)
+    """
+    Path(recording).parent.mkdir(parents=True, exist_ok=True)
+    # Oyun süre dolmadan kapanırsa o ana kadarki kayıt yine yazılır
+    return run_jcmd(jcmd, pid, "JFR.start", f"name={RECORDING_NAME}", f"settings={template}",
+                 f"duration={int(duration)}s", f"filename={recording}", "dumponexit=true")
+
+
+def stop_recording(jcmd: str, pid: int, recording: Path) -> Tuple[bool, str]:
+    """Kaydı süresinden önce durdur ve dosyaya yaz"""
+    return run_jcmd(jcmd, pid, "JFR.stop", f"name={RECORDING_NAME}", f"filename={recording}")
+
+
+class ModMap:
+    """
+    Java çerçevesinin sahibi: mod, Minecraft, yükleyici ya da JDK
+
+    Mod JAR'larındaki .class paketleri mod adına eşlenir; JAR içine gömülü
+    kütüphaneler (META-INF/jars) sayılmaz. Mixin ile vanilla sınıflarına
+    eklenen metotlar adlarındaki mod kimliğinden tanınır.
+    """
+
+    def __init__(self):
+        self.packages: Dict[str, str] = {}
+        self.mod_ids: Dict[str, str] = {}
+
+    @classmethod
+    def from_dir(cls, mods_dir: Path) -> "ModMap":
+        mod_map = cls()
+        try:
+            jars = sorted(Path(mods_dir).glob("*.jar"))
+        except OSError:
+            jars = []
+        for jar in jars:
+            mod_map.add_jar(jar)
+        return mod_map
+
+    def add_jar(self, jar: Path):
+        try:
+            with zipfile.ZipFile(jar) as archive:
+                names = archive.namelist()
+                mod_id, mod_name = _mod_identity(archive, names)
+        except (OSError, zipfile.BadZipFile, ValueError):
+            return
+        mod_name = mod_name or mod_id or jar.stem
+        if mod_id:
+            self.mod_ids[mod_id] = mod_name
+        for name in names:
+            if name.endswith(".class") and "/" in name and not name.startswith("META-INF/"):
+                self.packages.setdefault(name.rsplit("/", 1)[0].replace("/", "."), mod_name)
+
+    def owner(self, frame: str) -> str:
+        """'paket.Sınıf.metot' çerçevesinin sahibi"""
+        qualified_class, _, method = frame.rpartition(".")
+        match = _MIXIN_METHOD_RE.match(method)
+        if match and match.group(1) in self.mod_ids:
+            return self.mod_ids[match.group(1)]
+        return self.class_owner(qualified_class)
+
+    def class_owner(self, qualified_class: str) -> str:
+        """'paket.Sınıf' sınıfının sahibi (dizi türleri öğe türüne göre)"""
+        if qualified_class.startswith("["):
+            element = qualified_class.lstrip("[")
+            if len(element) == 1:
+                # İlkel diziler: [B, [I...
+                return JDK_OWNER
+            qualified_class = element[1:].rstrip(";")
+        package = qualified_class.rpartition(".")[0]
+        if not package:
+            # Karıştırılmış vanilla sınıfları paketsizdir (ör. 'ead')
+            return MINECRAFT_OWNER
+        for prefix, owner in KNOWN_PACKAGES:
+            if qualified_class.startswith(prefix):
+                return owner
+        while package:
+            if package in self.packages:
+                return self.packages[package]
+            package = package.rpartition(".")[0]
+        return "?"
+
+
+def _mod_identity(archive: zipfile.ZipFile, names: List[str]) -> Tuple[Optional[str], Optional[str]]:
+    """Fabric/Quilt/Forge/NeoForge meta dosyasından (mod kimliği, görünen ad)"""
+    if "fabric.mod.json" in names:
+        data = json.loads(archive.read("fabric.mod.json").decode("utf-8", errors="replace"), strict=False)
+        return data.get("id"), data.get("name")
+    if "quilt.mod.json" in names:
+        loader = json.loads(archive.read("quilt.mod.json").decode("utf-8", errors="replace")).get("quilt_loader", {})
+        return loader.get("id"), loader.get("metadata", {}).get("name")
+    for meta in ("META-INF/neoforge.mods.toml", "META-INF/mods.toml"):
+        if meta in names:
+            text = archive.read(meta).decode("utf-8", errors="replace")
+            mod_id = re.search(r'^\s*modId\s*=\s*"([^"]+)"', text, re.MULTILINE)
+            name = re.search(r'^\s*displayName\s*=\s*"([^"]+)"', text, re.MULTILINE)
+            return mod_id.group(1) if mod_id else None, name.group(1) if name else None
+    return None, None
+
+
+def frame_name(line: str) -> str:
+    """'a.b.C.m(int, String) line: 12' -> 'a.b.C.m'"""
+    return line.strip().split("(", 1)[0]
+
+
+def short_frame(frame: str) -> str:
+    """'net.minecraft.client.Main.run' -> 'n.m.c.Main.run'"""
+    parts = frame.split(".")
+    if len(parts) <= 2:
+        return frame
+    return ".".join([p[:1] for p in parts[:-2]] + parts[-2:])
+
+
+class JfrSummaryBuilder:
+    """
+    'jfr print' metin çıktısını satır satır özetle
+
+    Olaylar tek tek tutulmaz; yalnız çerçeve/sebep başına sayaçlar büyür,
+    bu yüzden bellek kaydın boyutuna değil farklı çerçeve sayısına bağlıdır.
+    """
+
+    def __init__(self, mod_map: ModMap = None):
+        self.mod_map = mod_map or ModMap()
+        self.samples = 0
+        self.hot: Dict[str, int] = {}
+        self.owners: Dict[str, int] = {}
+        self.allocated_bytes = 0
+        self.alloc_sites: Dict[str, int] = {}
+        self.alloc_classes: Dict[str, int] = {}
+        self.gc = {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "names": {}}
+        self.safepoints = {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+        self.locks: Dict[str, Dict] = {}
+        self._owner_cache: Dict[str, str] = {}
+        self._event: Optional[str] = None
+        self._fields: Dict[str, str] = {}
+        self._stack: Optional[List[str]] = None
+        self._depth = 0
+
+    def _owner(self, frame: str) -> str:
+        owner = self._owner_cache.get(frame)
+        if owner is None:
+            owner = self._owner_cache[frame] = self.mod_map.owner(frame)
+        return owner
+
+    def _app_frame(self, stack: List[str]) -> Tuple[Optional[str], str]:
+        """JDK dışındaki ilk çerçeve ve sahibi (hepsi JDK ise en üstteki)"""
+        for frame in stack:
+            owner = self._owner(frame)
+            if owner != JDK_OWNER:
+                return frame, owner
+        return (stack[0], JDK_OWNER) if stack else (None, "?")
+
+    def feed(self, line: str):
+        line = line.rstrip("\n")
+        if self._event is None:
+            match = _EVENT_START_RE.match(line)
+            if match:
+                self._event, self._fields, self._stack, self._depth = match.group(1), {}, None, 1
+            return
+        if self._stack is not None:
+            if line.strip() == "]":
+                self._fields["stackTrace"] = self._stack
+                self._stack = None
+            elif line.strip() != "...":
+                self._stack.append(frame_name(line))
+            return
+        if line == "}":
+            self._finish(self._event, self._fields)
+            self._event = None
+            return
+        # İç içe yapılar (ör. çok satırlı iş parçacığı) atlanır
+        if line.endswith("{"):
+            self._depth += 1
+            return
+        if line.strip() == "}":
+            self._depth -= 1
+            return
+        if self._depth != 1:
+            return
+        match = _FIELD_RE.match(line)
+        if match:
+            if match.group(2) == "[":
+                self._stack = []
+            else:
+                self._fields[match.group(1)] = match.group(2)
+
+    def _finish(self, event: str, fields: Dict):
+        # 'stackTrace = null' metin olarak gelir
+        stack = fields.get("stackTrace")
+        stack = stack if isinstance(stack, list) else []
+        if event == "jdk.ExecutionSample":
+            if not stack:
+                return
+            self.samples += 1
+            self.hot[stack[0]] = self.hot.get(stack[0], 0) + 1
+            _, owner = self._app_frame(stack)
+            self.owners[owner] = self.owners.get(owner, 0) + 1
+        elif event.startswith("jdk.ObjectAllocation"):
+            size = parse_bytes(fields.get("weight") or fields.get("tlabSize") or fields.get("allocationSize") or "")
+            if not size:
+                return
+            self.allocated_bytes += size
+            site, _ = self._app_frame(stack)
+            if site:
+                self.alloc_sites[site] = self.alloc_sites.get(site, 0) + size
+            object_class = fields.get("objectClass", "?").split(" (", 1)[0]
+            self.alloc_classes[object_class] = self.alloc_classes.get(object_class, 0) + size
+        elif event == "jdk.GarbageCollection":
+            total = parse_duration_ms(fields.get("sumOfPauses", "")) or 0.0
+            longest = parse_duration_ms(fields.get("longestPause", "")) or total
+            self.gc["count"] += 1
+            self.gc["total_ms"] += total
+            self.gc["max_ms"] = max(self.gc["max_ms"], longest)
+            name = fields.get("name", "?").strip('"')
+            self.gc["names"][name] = self.gc["names"].get(name, 0) + 1
+        elif event == "jdk.SafepointBegin":
+            duration = parse_duration_ms(fields.get("duration", "")) or 0.0
+            self.safepoints["count"] += 1
+            self.safepoints["total_ms"] += duration
+            self.safepoints["max_ms"] = max(self.safepoints["max_ms"], duration)
+        elif event == "jdk.JavaMonitorEnter":
+            duration = parse_duration_ms(fields.get("duration", "")) or 0.0
+            site, owner = self._app_frame(stack)
+            lock = self.locks.setdefault(site or "?", {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "owner": owner,
+                                                       "monitor": fields.get("monitorClass", "?").split(" (", 1)[0]})
+            lock["count"] += 1
+            lock["total_ms"] += duration
+            lock["max_ms"] = max(lock["max_ms"], duration)
+
+    def summary(self, top: int = TOP_N) -> Dict:
+        def ranked(counts: Dict[str, float]):
+            return sorted(counts.items(), key=lambda item: -item[1])[:top]
+
+        samples = self.samples or 1
+        return {
+            "samples": self.samples,
+            "hot_methods": [{"frame": frame, "owner": self._owner(frame), "count": count, "pct": count / samples * 100}
+                            for frame, count in ranked(self.hot)],
+            "owners": [{"owner": owner, "count": count, "pct": count / samples * 100} for owner, count in ranked(self.owners)],
+            "allocated_bytes": self.allocated_bytes,
+            "alloc_sites": [{"frame": frame, "owner": self._owner(frame), "bytes": size}
+                            for frame, size in ranked(self.alloc_sites)],
+            "alloc_classes": [{"class": name, "bytes": size} for name, size in ranked(self.alloc_classes)],
+            "gc": dict(self.gc, names=dict(ranked(self.gc["names"]))),
+            "safepoints": dict(self.safepoints),
+            "locks": [dict(lock, frame=frame)
+                      for frame, lock in sorted(self.locks.items(), key=lambda item: -item[1]["total_ms"])[:top]],
+        }
+
+
+def summarize(recording: Path, jfr_tool: str, mod_map: ModMap = None, top: int = TOP_N, timeout: float = 600) -> Dict:
+    """
+    Kaydı 'jfr print' ile akış halinde oku ve özetle
+
+    Raises:
+        OSError: jfr çalıştırılamadı ya da kayıt okunamadı
+    """
+    builder = JfrSummaryBuilder(mod_map)
+    command = [jfr_tool, "print", "--events", ",".join(SUMMARY_EVENTS), "--stack-depth", str(STACK_DEPTH), str(recording)]
+    started = time.monotonic()
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors="replace")
+    try:
+        for line in process.stdout:
+            builder.feed(line)
+            if time.monotonic() - started > timeout:
+                process.kill()
+                raise OSError(f"jfr print {timeout:.0f} sn içinde bitmedi")
+        error = process.stderr.read()
+        if process.wait() != 0:
+            raise OSError(error.strip() or f"jfr print çıkış kodu {process.returncode}")
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.stdout.close()
+        process.stderr.close()
+    summary = builder.summary(top)
+    summary["seconds"] = round(time.monotonic() - started, 1)
+    return summary
+
+
+def _meta_file(recording: Path) -> Path:
+    return Path(recording).with_suffix(".json")
+
+
+def save_meta(recording: Path, **values):
+    """Kaydın yanındaki <kayıt>.json'u güncelle (sürüm, instance, özet...)"""
+    meta = load_meta(recording)
+    meta.update(values)
+    meta_file = _meta_file(recording)
+    tmp_file = meta_file.with_name(meta_file.name + ".tmp")
+    try:
+        meta_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, 'w') as f:
+            json.dump(meta, f, indent=2, ensure_ascii=False)
+        tmp_file.replace(meta_file)
+    except OSError:
+        pass
+
+
+def load_meta(recording: Path) -> Dict:
+    try:
+        with open(_meta_file(recording), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def list_recordings(profiles_dir: Path) -> List[Dict]:
+    """Kayıtlar (en yeni önce): {"path", "size_mb", "mtime", "meta"}; henüz yazılmamış kayıtlar meta'dan"""
+    recordings = {}
+    try:
+        files = list(Path(profiles_dir).glob("*.jfr")) + list(Path(profiles_dir).glob("*.json"))
+    except OSError:
+        return []
+    for path in files:
+        recording = path.with_suffix(".jfr")
+        if recording in recordings:
+            continue
+        try:
+            stat = recording.stat()
+            size_mb, mtime = stat.st_size / (1024 * 1024), stat.st_mtime
+        except OSError:
+            size_mb, mtime = None, path.stat().st_mtime
+        recordings[recording] = {"path": recording, "size_mb": size_mb, "mtime": mtime, "meta": load_meta(recording)}
+    return sorted(recordings.values(), key=lambda r: -r["mtime"])
+
+
+__all__ = [
+    'PROFILES_DIR', 'TEMPLATES', 'DEFAULT_TEMPLATE', 'DEFAULT_DURATION', 'MIN_JAVA_JFR', 'TOP_N', 'SUMMARY_EVENTS',
+    'parse_duration_ms', 'parse_bytes', 'recording_path', 'jfr_start_args', 'find_jdk_tool', 'jvm_pid', 'run_jcmd',
+    'start_recording', 'stop_recording', 'ModMap', 'frame_name', 'short_frame', 'JfrSummaryBuilder', 'summarize',
+    'save_meta', 'load_meta', 'list_recordings'
+]
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - JVM Flag Compiler
+Java sürümü, heap boyutu, çekirdek sayısı ve huge page desteğine göre
+minimal ve tekilleştirilmiş JVM bayrakları üret
+"""
+
+import json
+import os
+import re
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# PrintFlagsFinal satırı: "bool UseZGC   = false   {product} {default}"
+_FLAG_LINE_RE = re.compile(r'^\s*\S+\s+(\w+)\s+:?=\s+.*?\{([^}]*)\}')
+_XX_FLAG_RE = re.compile(r'^-XX:[+-]?(\w+)')
+
+# Bu boyuttan (MB) büyük heap'lerde Java 21+ için ZGC seçilir
+ZGC_MIN_HEAP_MB = 8 * 1024
+# Bu boyuttan büyük heap'lerde AlwaysPreTouch başlatmayı belirgin yavaşlatır
+PRETOUCH_MAX_HEAP_MB = 4 * 1024
+
+_UNLOCK_FLAGS = {
+    "experimental": "-XX:+UnlockExperimentalVMOptions",
+    "diagnostic": "-XX:+UnlockDiagnosticVMOptions",
+}
+
+
+def xx_flag_name(arg: str) -> Optional[str]:
+    """'-XX:+UseZGC' / '-XX:G1HeapRegionSize=8M' → 'UseZGC' / 'G1HeapRegionSize'"""
+    match = _XX_FLAG_RE.match(arg)
+    return match.group(1) if match else None
+
+
+def _arg_key(arg: str) -> str:
+    """Tekilleştirme anahtarı - aynı anahtarlı argümanlardan sonuncusu geçerlidir"""
+    if arg.startswith("-D"):
+        return "-D" + arg[2:].split("=", 1)[0]
+    name = xx_flag_name(arg)
+    if name:
+        return "-XX:" + name
+    for prefix in ("-Xmx", "-Xms", "-Xss", "-Xmn"):
+        if arg.startswith(prefix):
+            return prefix
+    return arg
+
+
+def dedupe_jvm_args(args: List[str]) -> List[str]:
+    """
+    Tekrarlanan -D, -XX ve -Xm* argümanlarını tekilleştir
+
+    JVM'de olduğu gibi son değer kazanır; argüman ilk görüldüğü sırada kalır.
+    """
+    values: Dict[str, str] = {}
+    order: List[str] = []
+    for arg in args:
+        key = _arg_key(arg)
+        if key not in values:
+            order.append(key)
+        values[key] = arg
+    return [values[key] for key in order]
+
+
+def detect_huge_pages() -> Optional[str]:
+    """
+    Kullanılabilir huge page türünü bul
+
+    Returns:
+        "thp" (transparent huge pages), "explicit" (hugetlbfs) veya None
+    """
+    try:
+        with open("/sys/kernel/mm/transparent_hugepage/enabled", 'r') as f:
+            thp = f.read()
+        if "[always]" in thp or "[madvise]" in thp:
+            return "thp"
+    except OSError:
+        pass
+
+    try:
+        with open("/proc/meminfo", 'r') as f:
+            for line in f:
+                if line.startswith("HugePages_Free:") and int(line.split()[1]) > 0:
+                    return "explicit"
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+class JvmFlagProbe:
+    """
+    Bir Java runtime'ının desteklediği -XX bayraklarını bulur
+
+    'java -XX:+PrintFlagsFinal -version' çıktısı ikilinin gerçek yolu ve
+    mtime'ına göre diskte önbelleğe alınır.
+    """
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = Path(cache_file)
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Dict] = {}
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'r') as f:
+                    self._cache = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._cache = {}
+
+    def _save(self):
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(self._cache, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass
+
+    def supported_flags(self, java_path: str) -> Optional[Dict[str, str]]:
+        """
+        Desteklenen bayraklar
+
+        Returns:
+            {bayrak adı: kategori ("product", "experimental"...)} veya
+            runtime yoklanamazsa None
+        """
+        real_path = os.path.realpath(java_path)
+        try:
+            mtime = os.stat(real_path).st_mtime
+        except OSError:
+            return None
+
+        with self._lock:
+            entry = self._cache.get(real_path)
+        if entry and entry.get("mtime") == mtime:
+            return entry["flags"]
+
+        flags = self._probe(real_path)
+        if flags is None:
+            return None
+        with self._lock:
+            self._cache[real_path] = {"mtime": mtime, "flags": flags}
+        self._save()
+        return flags
+
+    @staticmethod
+    def _probe(java_path: str) -> Optional[Dict[str, str]]:
+        try:
+            result = subprocess.run(
+                [java_path, "-XX:+UnlockExperimentalVMOptions", "-XX:+UnlockDiagnosticVMOptions",
+                 "-XX:+PrintFlagsFinal", "-version"],
+                capture_output=True, text=True, timeout=20
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        if result.returncode != 0:
+            return None
+
+        flags = {}
+        for line in result.stdout.splitlines():
+            match = _FLAG_LINE_RE.match(line)
+            if not match:
+                continue
+            kinds = match.group(2)
+            if "experimental" in kinds:
+                category = "experimental"
+            elif "diagnostic" in kinds:
+                category = "diagnostic"
+            else:
+                category = "product"
+            flags[match.group(1)] = category
+        return flags or None
+
+
+class JvmFlagPlan:
+    """Derlenen bayraklar ve seçimlerin açıklaması"""
+
+    def __init__(self):
+        self.args: List[str] = []
+        self.gc = ""
+        self.notes: List[str] = []
+        self.dropped: List[str] = []
+
+    def summary(self) -> str:
+        """Kısa rapor"""
+        text = f"{self.gc}, {len(self.args)} bayrak"
+        if self.dropped:
+            text += f", {len(self.dropped)} desteklenmeyen bayrak atlandı"
+        return text
+
+
+def _gc_threads(cores: int) -> int:
+    """Paralel GC thread sayısı - oyun thread'lerine pay bırak"""
+    if cores <= 2:
+        return 1
+    if cores <= 8:
+        return cores - 1
+    # JVM'in kendi formülü: 8 + (n - 8) * 5/8
+    return 8 + (cores - 8) * 5 // 8
+
+
+def compile_jvm_flags(java_major: int, heap_mb: int, cores: int, min_heap_mb: int = None,
+                      huge_pages: Optional[str] = None) -> JvmFlagPlan:
+    """
+    GC ve tuning bayraklarını seç
+
+    Args:
+        java_major: Java ana sürümü (8, 17, 21...)
+        heap_mb: -Xmx (MB)
+        cores: Mantıksal çekirdek sayısı
+        min_heap_mb: -Xms (MB); None ise heap boyutuna göre seçilir
+        huge_pages: detect_huge_pages() sonucu
+
+    Returns:
+        JvmFlagPlan (argümanlar henüz runtime'a göre filtrelenmemiştir)
+    """
+    plan = JvmFlagPlan()
+    cores = max(1, cores)
+
+    if min_heap_mb is None:
+        # Küçük heap'te Xms=Xmx yeniden boyutlandırmayı önler; büyükte başlatmayı yavaşlatır
+        min_heap_mb = heap_mb if heap_mb <= PRETOUCH_MAX_HEAP_MB else heap_mb // 2
+    min_heap_mb = min(min_heap_mb, heap_mb)
+    args = [f"-Xmx{heap_mb}M", f"-Xms{min_heap_mb}M"]
+
+    if java_major >= 21 and heap_mb >= ZGC_MIN_HEAP_MB and cores >= 4:
+        plan.gc = "ZGC (generational)"
+        args += ["-XX:+UseZGC", "-XX:+ZGenerational"]
+        plan.notes.append(f"Java {java_major} ve {heap_mb // 1024} GB heap: düşük duraklamalı generational ZGC")
+    else:
+        plan.gc = "G1"
+        large = heap_mb >= 12 * 1024
+        region_mb = 16 if large else (8 if heap_mb > 2048 else 4)
+        args += [
+            "-XX:+UseG1GC",
+            "-XX:+ParallelRefProcEnabled",
+            "-XX:MaxGCPauseMillis=100",
+            "-XX:+UnlockExperimentalVMOptions",
+            f"-XX:G1NewSizePercent={40 if large else 30}",
+            f"-XX:G1MaxNewSizePercent={50 if large else 40}",
+            f"-XX:G1HeapRegionSize={region_mb}M",
+            f"-XX:G1ReservePercent={20 if large else 15}",
+            "-XX:G1HeapWastePercent=5",
+            f"-XX:InitiatingHeapOccupancyPercent={20 if large else 15}",
+        ]
+        parallel = _gc_threads(cores)
+        concurrent = max(1, (parallel + 2) // 4)
+        args += [f"-XX:ParallelGCThreads={parallel}", f"-XX:ConcGCThreads={concurrent}"]
+        plan.notes.append(f"G1: {region_mb}M bölge, {parallel} paralel / {concurrent} eşzamanlı GC thread ({cores} çekirdek)")
+
+    args.append("-XX:+DisableExplicitGC")
+
+    if min_heap_mb == heap_mb and heap_mb <= PRETOUCH_MAX_HEAP_MB:
+        args.append("-XX:+AlwaysPreTouch")
+        plan.notes.append("Küçük heap: bellek önceden ayrılıyor (AlwaysPreTouch)")
+
+    if huge_pages == "thp":
+        args.append("-XX:+UseTransparentHugePages")
+        plan.notes.append("Transparent huge pages etkin")
+    elif huge_pages == "explicit":
+        args.append("-XX:+UseLargePages")
+        plan.notes.append("hugetlbfs sayfaları kullanılıyor")
+
+    args.append("-XX:ReservedCodeCacheSize=400M")
+
+    plan.args = dedupe_jvm_args(args)
+    return plan
+
+
+def filter_supported(args: List[str], supported: Optional[Dict[str, str]]) -> Tuple[List[str], List[str]]:
+    """
+    Runtime'ın tanımadığı -XX bayraklarını at, gereken kilit açıcıları ekle
+
+    Returns:
+        (kalan argümanlar, atılan argümanlar)
+    """
+    if supported is None:
+        return list(args), []
+
+    kept, dropped = [], []
+    needed_unlocks = set()
+    for arg in args:
+        name = xx_flag_name(arg)
+        if name is None:
+            kept.append(arg)
+            continue
+        if name in ("UnlockExperimentalVMOptions", "UnlockDiagnosticVMOptions"):
+            continue
+        category = supported.get(name)
+        if category is None:
+            dropped.append(arg)
+            continue
+        if category in _UNLOCK_FLAGS:
+            needed_unlocks.add(category)
+        kept.append(arg)
+
+    # Kilit açıcılar ilgili bayraklardan önce gelmeli
+    unlocks = [_UNLOCK_FLAGS[c] for c in ("experimental", "diagnostic") if c in needed_unlocks]
+    return unlocks + kept, dropped
+
+
+__all__ = [
+    'ZGC_MIN_HEAP_MB', 'PRETOUCH_MAX_HEAP_MB',
+    'xx_flag_name', 'dedupe_jvm_args', 'detect_huge_pages',
+    'JvmFlagProbe', 'JvmFlagPlan', 'compile_jvm_flags', 'filter_supported'
+]
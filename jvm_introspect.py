@@ -0,0 +1,426 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - JVM Introspection
+Çalışan oyunun JVM'ini jcmd ile yokla: heap (GC.heap_info), metaspace
+(VM.metaspace) ve code cache (Compiler.codecache) arka planda, sınıf
+histogramı (GC.class_histogram) istek üzerine. Ardışık histogramlarda örnek
+sayısı her seferinde artan sınıflar sızıntı şüphelisi olarak mod adlarıyla
+işaretlenir. İsteğe bağlı OOM heap dökümleri boyutu sınırlı bir dizinde tutulur
+"""
+
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from jfr_profiler import ModMap, jvm_pid, parse_bytes, run_jcmd
+from metrics_sampler import RingBuffer, window_stats
+
+HEAP_DUMPS_DIR = "heapdumps"
+# Dökümler heap boyutundadır; dizin bu sınırı aşarsa en eskiler silinir
+HEAP_DUMP_CAP_MB = 8192
+
+# Arka plan yoklaması: her yoklama tek jcmd (bir JVM açılışı) çalıştırır
+POLL_INTERVAL = 30
+POLL_COMMANDS = ["GC.heap_info", "Compiler.codecache", "VM.metaspace"]
+# Art arda bu kadar bağlanılamazsa yoklama durur (attach kapalı, başka kullanıcı...)
+MAX_FAILURES = 3
+SERIES_CAPACITY = 240
+JVM_METRICS = ["heap_used_mb", "heap_committed_mb", "metaspace_used_mb", "metaspace_committed_mb",
+               "codecache_used_mb", "class_loaders", "classes"]
+
+# Histogram başına saklanan satır (bayt sırasıyla) ve karşılaştırılan son histogram sayısı
+HISTOGRAM_ROWS = 1000
+HISTOGRAM_KEEP = 6
+# Şüpheli: en az LEAK_MIN_HISTOGRAMS histogramda her seferinde artmış, toplamda
+# en az LEAK_MIN_INSTANCES örnek ve LEAK_MIN_GROWTH oranında büyümüş
+LEAK_MIN_HISTOGRAMS = 3
+LEAK_MIN_INSTANCES = 1000
+LEAK_MIN_GROWTH = 0.10
+TOP_SUSPECTS = 10
+
+_UNIT_MB = {"K": 1 / 1024, "M": 1.0, "G": 1024.0}
+# G1/Parallel/Serial: " garbage-first heap   total 262144K, used 120000K [0x..."
+_HEAP_TOTAL_RE = re.compile(r"^\s*[a-zA-Z][\w -]*?\s+total (\d+)([KMG]), used (\d+)([KMG])", re.M)
+# Shenandoah: " 4194304K max, 4194304K soft max, 262144K committed, 55808K used"
+_SHENANDOAH_RE = re.compile(r"(\d+)([KMG]) committed, (\d+)([KMG]) used")
+# ZGC: " ZHeap           used 70M, capacity 256M, max capacity 4096M"
+_ZHEAP_RE = re.compile(r"ZHeap\s+used (\d+)([KMG]), capacity (\d+)([KMG])")
+# " Metaspace       used 45000K, committed 46000K, reserved 1097728K" (Java 8: capacity da var)
+_METASPACE_RE = re.compile(r"^\s*Metaspace\s+used (\d+)([KMG]),.*?committed (\d+)([KMG])", re.M)
+# VM.metaspace: "Total Usage - 1234 loaders, 23456 classes (1234 shared):"
+_LOADERS_RE = re.compile(r"Total Usage - (\d+) loaders, (\d+) classes")
+# "Both: 6000 chunks, 110.00 MB capacity, 109.00 MB ( 99%) committed, 107.00 MB ( 97%) used, ..."
+_BOTH_RE = re.compile(r"^\s*Both:.*?([\d.]+ (?:[KMG]B|bytes)) \([^)]*\) committed,\s+([\d.]+ (?:[KMG]B|bytes)) \([^)]*\) used", re.M)
+# "CodeHeap 'non-profiled nmethods': size=120032Kb used=5432Kb max_used=5432Kb free=114599Kb"
+_CODEHEAP_RE = re.compile(r"size=(\d+)Kb used=(\d+)Kb max_used=(\d+)Kb")
+# "   1:        123456       12345678  [B (java.base@17.0.8)"
+_HISTOGRAM_ROW_RE = re.compile(r"^\s*\d+:\s+(\d+)\s+(\d+)\s+(\S+)", re.M)
+
+
+def _mb(value: str, unit: str) -> float:
+    return int(value) * _UNIT_MB[unit]
+
+
+def parse_heap_info(text: str) -> Dict[str, float]:
+    """GC.heap_info çıktısı: heap ve metaspace kullanımı (MB)"""
+    result = {}
+    # Parallel/Serial kuşakları ayrı satırlardır, toplanır
+    totals = [(_mb(total, tu), _mb(used, uu)) for total, tu, used, uu in _HEAP_TOTAL_RE.findall(text)]
+    if totals:
+        result["heap_committed_mb"] = sum(total for total, _ in totals)
+        result["heap_used_mb"] = sum(used for _, used in totals)
+    else:
+        match = _SHENANDOAH_RE.search(text)
+        if match:
+            result["heap_committed_mb"] = _mb(*match.group(1, 2))
+            result["heap_used_mb"] = _mb(*match.group(3, 4))
+        match = _ZHEAP_RE.search(text)
+        if match:
+            result["heap_used_mb"] = _mb(*match.group(1, 2))
+            result["heap_committed_mb"] = _mb(*match.group(3, 4))
+    match = _METASPACE_RE.search(text)
+    if match:
+        result["metaspace_used_mb"] = _mb(*match.group(1, 2))
+        result["metaspace_committed_mb"] = _mb(*match.group(3, 4))
+    return result
+
+
+def parse_metaspace(text: str) -> Dict[str, float]:
+    """VM.metaspace çıktısı: sınıf yükleyici/sınıf sayısı ve toplam kullanım"""
+    result = {}
+    match = _LOADERS_RE.search(text)
+    if match:
+        result["class_loaders"] = int(match.group(1))
+        result["classes"] = int(match.group(2))
+    match = _BOTH_RE.search(text)
+    if match:
+        committed, used = parse_bytes(match.group(1)), parse_bytes(match.group(2))
+        if committed is not None and used is not None:
+            result["metaspace_committed_mb"] = committed / (1024 * 1024)
+            result["metaspace_used_mb"] = used / (1024 * 1024)
+    return result
+
+
+def parse_codecache(text: str) -> Dict:
+    """
+    Compiler.codecache çıktısı: tüm kod yığınlarının toplamı (MB)
+
+    "compilation: disabled" JIT'in code cache dolduğu için durduğunu gösterir;
+    oyun yorumlanan koda düşer ve FPS kalıcı olarak çöker.
+    """
+    heaps = _CODEHEAP_RE.findall(text)
+    if not heaps:
+        return {}
+    return {
+        "codecache_size_mb": sum(int(size) for size, _, _ in heaps) / 1024,
+        "codecache_used_mb": sum(int(used) for _, used, _ in heaps) / 1024,
+        "codecache_max_used_mb": sum(int(max_used) for _, _, max_used in heaps) / 1024,
+        "compilation_disabled": "compilation: disabled" in text,
+    }
+
+
+def parse_class_histogram(text: str, rows: int = HISTOGRAM_ROWS) -> Dict[str, Tuple[int, int]]:
+    """GC.class_histogram çıktısı: sınıf -> (örnek sayısı, bayt), en büyük 'rows' sınıf"""
+    histogram = {}
+    for instances, size, name in _HISTOGRAM_ROW_RE.findall(text):
+        histogram[name] = (int(instances), int(size))
+        if len(histogram) >= rows:
+            break
+    return histogram
+
+
+def heap_dump_args(dumps_dir: Path) -> List[str]:
+    """OOM'da heap dökümü; yol dizinse JVM içine java_pid<PID>.hprof yazar"""
+    return ["-XX:+HeapDumpOnOutOfMemoryError", f"-XX:HeapDumpPath={dumps_dir}"]
+
+
+def list_heap_dumps(dumps_dir: Path) -> List[Dict]:
+    """Dökümler, yeniden eskiye: {"path", "size_mb", "mtime"}"""
+    dumps = []
+    try:
+        files = list(Path(dumps_dir).glob("*.hprof"))
+    except OSError:
+        return []
+    for path in files:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        dumps.append({"path": path, "size_mb": stat.st_size / (1024 * 1024), "mtime": stat.st_mtime})
+    return sorted(dumps, key=lambda d: -d["mtime"])
+
+
+def prune_heap_dumps(dumps_dir: Path, cap_mb: float = HEAP_DUMP_CAP_MB, reserve_mb: float = 0) -> List[Path]:
+    """
+    En eski dökümleri sil, toplam + reserve_mb sınırı aşmasın
+
+    Başlatmadan önce reserve_mb olarak heap boyutu verilir: bir sonraki döküm
+    de sınırın içinde kalır. En yeni döküm hiçbir zaman silinmez.
+
+    Returns:
+        Silinen dosyalar
+    """
+    dumps = list_heap_dumps(dumps_dir)
+    total = sum(d["size_mb"] for d in dumps) + reserve_mb
+    removed = []
+    for dump in reversed(dumps[1:]):
+        if total <= cap_mb:
+            break
+        try:
+            dump["path"].unlink()
+        except OSError:
+            continue
+        total -= dump["size_mb"]
+        removed.append(dump["path"])
+    return removed
+
+
+def prepare_heap_dumps(dumps_dir: Path, cap_mb: float = HEAP_DUMP_CAP_MB, reserve_mb: float = 0) -> List[Path]:
+    """Dizini oyundan önce oluştur (yoksa JVM yolu dosya adı sayar) ve sınıra göre buda"""
+    Path(dumps_dir).mkdir(parents=True, exist_ok=True)
+    return prune_heap_dumps(dumps_dir, cap_mb, reserve_mb)
+
+
+def new_heap_dump(dumps_dir: Path, since: float) -> Optional[Path]:
+    """'since' zamanından sonra yazılmış en yeni döküm"""
+    dumps = [d for d in list_heap_dumps(dumps_dir) if d["mtime"] >= since]
+    return dumps[0]["path"] if dumps else None
+
+
+class HistogramTracker:
+    """
+    Ardışık sınıf histogramları ve sızıntı şüphelileri
+
+    Histogram canlı nesneleri sayar (jcmd önce tam GC yapar), bu yüzden artış
+    çöp değil tutulan nesnedir. Sahip, mod JAR'larının paketlerinden bulunur;
+    mod haritası ilk şüpheli sorgusunda bir kez kurulur.
+    """
+
+    def __init__(self, mods_dir: Path = None, keep: int = HISTOGRAM_KEEP):
+        self.mods_dir = mods_dir
+        self.keep = max(2, keep)
+        self.snapshots: List[Tuple[float, Dict[str, Tuple[int, int]]]] = []
+        self._mod_map: Optional[ModMap] = None
+
+    def add(self, histogram: Dict[str, Tuple[int, int]], taken_at: float = None):
+        if not histogram:
+            return
+        self.snapshots.append((taken_at or time.time(), histogram))
+        del self.snapshots[:-self.keep]
+
+    def _owner(self, name: str) -> str:
+        if self._mod_map is None:
+            self._mod_map = ModMap.from_dir(self.mods_dir) if self.mods_dir else ModMap()
+        return self._mod_map.class_owner(name)
+
+    def changes(self, top: int = TOP_SUSPECTS) -> List[Dict]:
+        """Son iki histogram arasında en çok büyüyen sınıflar (bayt)"""
+        if len(self.snapshots) < 2:
+            return []
+        (_, previous), (_, latest) = self.snapshots[-2:]
+        changes = []
+        for name, (instances, size) in latest.items():
+            before = previous.get(name, (0, 0))
+            if size > before[1]:
+                changes.append({"class": name, "instances": instances, "instance_change": instances - before[0],
+                                "bytes_change": size - before[1]})
+        changes.sort(key=lambda c: -c["bytes_change"])
+        for change in changes[:top]:
+            change["owner"] = self._owner(change["class"])
+        return changes[:top]
+
+    def suspects(self, min_histograms: int = LEAK_MIN_HISTOGRAMS, top: int = TOP_SUSPECTS) -> List[Dict]:
+        """
+        Örnek sayısı her histogramda artan sınıflar, büyüme (bayt) sırasıyla
+
+        Returns:
+            [{"class", "owner", "instances", "growth", "growth_mb", "per_min"}]
+        """
+        if len(self.snapshots) < min_histograms:
+            return []
+        first_time, first = self.snapshots[0]
+        last_time, latest = self.snapshots[-1]
+        minutes = max((last_time - first_time) / 60, 1e-6)
+        suspects = []
+        for name, (instances, size) in latest.items():
+            counts = [snapshot.get(name, (0, 0))[0] for _, snapshot in self.snapshots]
+            if not all(b > a for a, b in zip(counts, counts[1:])):
+                continue
+            growth = counts[-1] - counts[0]
+            if growth < LEAK_MIN_INSTANCES or (counts[0] and growth / counts[0] < LEAK_MIN_GROWTH):
+                continue
+            growth_bytes = size - first.get(name, (0, 0))[1]
+            suspects.append({"class": name, "instances": instances, "growth": growth,
+                             "growth_mb": growth_bytes / (1024 * 1024), "per_min": growth / minutes})
+        suspects.sort(key=lambda s: -s["growth_mb"])
+        for suspect in suspects[:top]:
+            suspect["owner"] = self._owner(suspect["class"])
+        return suspects[:top]
+
+
+class JvmIntrospector:
+    """
+    Oyun JVM'inin arka plan yoklayıcısı
+
+    Komutlar tek jcmd çağrısında (-f) çalışır; JVM'in desteklemediği bir komut
+    (ör. Java 8'de GC.heap_info) bir kez ayıklanır. Sarmalayıcı kullanıldıysa
+    java alt süreci her yoklamada yeniden aranır, bulunana kadar. Ekranlar ve
+    oturum kaydı yalnız tampondan okur, hiçbiri jcmd'yi beklemez.
+    """
+
+    def __init__(self, jcmd: str, pid: int, interval: float = POLL_INTERVAL, mods_dir: Path = None):
+        self.jcmd = jcmd
+        self.pid = pid
+        self.interval = max(5.0, interval)
+        self.java_pid: Optional[int] = None
+        self.commands = list(POLL_COMMANDS)
+        self.latest: Dict = {}
+        self.peaks: Dict[str, float] = {}
+        self.polls = 0
+        self.failures = 0
+        self.error: Optional[str] = None
+        self.histograms = HistogramTracker(mods_dir)
+        self._series = {name: RingBuffer(SERIES_CAPACITY) for name in JVM_METRICS}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._command_file: Optional[Path] = None
+
+    def start(self) -> "JvmIntrospector":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="jvm-introspect", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=1)
+            self._thread = None
+        if self._command_file:
+            try:
+                self._command_file.unlink()
+            except OSError:
+                pass
+            self._command_file = None
+
+    def _run(self):
+        # İlk yoklama açılışı yavaşlatmasın diye bir aralık sonra
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+            except Exception as e:
+                self.error = str(e)
+            if self.failures >= MAX_FAILURES:
+                return
+
+    def _resolve(self) -> Optional[int]:
+        if self.java_pid is None:
+            self.java_pid = jvm_pid(self.pid)
+        return self.java_pid
+
+    def _run_commands(self, java_pid: int) -> Tuple[bool, str]:
+        if len(self.commands) == 1:
+            return run_jcmd(self.jcmd, java_pid, self.commands[0])
+        if self._command_file is None:
+            with tempfile.NamedTemporaryFile("w", prefix="berke-jcmd-", suffix=".txt", delete=False) as f:
+                f.write("\n".join(self.commands) + "\n")
+            self._command_file = Path(f.name)
+        return run_jcmd(self.jcmd, java_pid, "-f", str(self._command_file))
+
+    def poll(self) -> Dict:
+        """Tek yoklama; ölçülenleri döndür (başarısızsa boş)"""
+        java_pid = self._resolve()
+        if not java_pid:
+            return {}
+        ok, output = self._run_commands(java_pid)
+        if not ok and "Unknown diagnostic command" in output:
+            # -f ilk hatada durur: desteklenenleri tek tek bul
+            self.commands = [c for c in self.commands if run_jcmd(self.jcmd, java_pid, c)[0]]
+            if self._command_file:
+                self._command_file.unlink()
+                self._command_file = None
+            if not self.commands:
+                self.failures = MAX_FAILURES
+                self.error = "JVM bu tanılama komutlarını desteklemiyor"
+                return {}
+            ok, output = self._run_commands(java_pid)
+        row = {}
+        row.update(parse_heap_info(output))
+        row.update(parse_codecache(output))
+        # VM.metaspace toplamı heap_info'nunkinden ayrıntılı (sınıf alanı dahil)
+        row.update(parse_metaspace(output))
+        if not row:
+            self.failures += 1
+            self.error = output.splitlines()[-1] if output else "jcmd yanıt vermedi"
+            return {}
+        self.failures = 0
+        self.error = None
+        row["time"] = time.time()
+        with self._lock:
+            self.polls += 1
+            self.latest = row
+            for name, series in self._series.items():
+                series.append(row.get(name))
+                if row.get(name) is not None:
+                    self.peaks[name] = max(self.peaks.get(name, 0), row[name])
+        return row
+
+    @property
+    def active(self) -> bool:
+        return self._thread is not None and self.failures < MAX_FAILURES
+
+    def window(self, name: str, seconds: float) -> List[float]:
+        """Son 'seconds' saniyenin yoklamaları (eskiden yeniye)"""
+        with self._lock:
+            return self._series[name].values(max(1, int(round(seconds / self.interval))))
+
+    def stats(self, name: str, seconds: float) -> Optional[Dict[str, float]]:
+        return window_stats(self.window(name, seconds))
+
+    def take_histogram(self, timeout: float = 120) -> Tuple[bool, str]:
+        """
+        Sınıf histogramı al ve izleyiciye ekle (çağıranı bekletir)
+
+        jcmd canlı nesneleri saymak için tam GC yapar: oyun kısa süre donar.
+
+        Returns:
+            (başarılı mı, hata metni ya da "")
+        """
+        java_pid = self._resolve()
+        if not java_pid:
+            return False, f"PID {self.pid} altında çalışan bir JVM yok"
+        ok, output = run_jcmd(self.jcmd, java_pid, "GC.class_histogram", timeout=timeout)
+        histogram = parse_class_histogram(output)
+        if not histogram:
+            return False, output.splitlines()[-1] if output else "jcmd yanıt vermedi"
+        self.histograms.add(histogram)
+        return True, ""
+
+    def summary(self) -> Dict:
+        """Oturum kaydı için: tepe değerler, code cache durumu, sızıntı şüphelileri"""
+        with self._lock:
+            peaks = dict(self.peaks)
+            compilation_disabled = bool(self.latest.get("compilation_disabled"))
+        suspects = [{"class": s["class"], "owner": s["owner"], "growth": s["growth"], "growth_mb": round(s["growth_mb"], 1)}
+                    for s in self.histograms.suspects()]
+        return {
+            "heap_peak_mb": peaks.get("heap_used_mb"),
+            "metaspace_peak_mb": peaks.get("metaspace_used_mb"),
+            "codecache_peak_mb": peaks.get("codecache_used_mb"),
+            "class_loaders": peaks.get("class_loaders"),
+            "codecache_full": compilation_disabled or None,
+            "leak_suspects": suspects or None,
+        }
+
+
+__all__ = [
+    'HEAP_DUMPS_DIR', 'HEAP_DUMP_CAP_MB', 'POLL_INTERVAL', 'POLL_COMMANDS', 'JVM_METRICS', 'LEAK_MIN_HISTOGRAMS',
+    'parse_heap_info', 'parse_metaspace', 'parse_codecache', 'parse_class_histogram', 'heap_dump_args',
+    'list_heap_dumps', 'prune_heap_dumps', 'prepare_heap_dumps', 'new_heap_dump', 'HistogramTracker',
+    'JvmIntrospector'
+]
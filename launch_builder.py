@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Launch Builder
+Arayüzden bağımsız başlatma komutu ve ortam değişkenleri; hem menülü
+launcher hem de betiklenebilir CLI aynı komutu üretir
+"""
+
+import json
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from classpath_builder import ClasspathBuilder, load_version_chain, merge_version_chain
+from heap_sizing import plan_heap, available_memory_mb
+from jvm_flags import compile_jvm_flags, dedupe_jvm_args, filter_supported, detect_huge_pages
+from launch_fingerprint import install_fingerprint
+from launch_wrappers import WrapperChain, resolve_chain
+from gpu_profile import profile_for_config
+from appcds import CdsPlan, CdsStore, drop_pretouch
+from gc_log import gc_log_args, gc_log_path, pause_target_ms
+from jfr_profiler import PROFILES_DIR, MIN_JAVA_JFR, jfr_start_args, recording_path
+from jvm_introspect import HEAP_DUMPS_DIR, heap_dump_args
+
+VERSION_MANIFEST_URL = "https://launchermeta.mojang.com/mc/game/version_manifest.json"
+ASSETS_URL = "https://resources.download.minecraft.net"
+
+DEFAULT_CONFIG = {
+    "username": "BerkePlayer",
+    "memory": "auto",
+    "java_args": [],
+    "current_skin": "default",
+    "window_width": 1280,
+    "window_height": 720,
+    "fullscreen": False,
+    "optimize_graphics": True,
+    "enable_mods": False,
+    "mod_loader": "none"
+}
+
+# Java arama sırası (Minecraft uyumlu sürümler önce)
+JAVA_CANDIDATES = [
+    "/usr/lib/jvm/java-21-openjdk/bin/java",
+    "/usr/lib/jvm/java-17-openjdk/bin/java",
+    "/usr/lib/jvm/java-25-openjdk/bin/java",
+    "/usr/lib/jvm/java-22-openjdk/bin/java",
+    "/usr/lib/jvm/java-23-openjdk/bin/java",
+    "/usr/lib/jvm/java-24-openjdk/bin/java",
+    "/usr/lib/jvm/default/bin/java",
+    "/usr/bin/java",
+    "java"
+]
+
+
+class LauncherPaths:
+    """Launcher'ın kullandığı dizinler"""
+
+    def __init__(self, home_dir: Path = None):
+        self.home_dir = Path(home_dir) if home_dir else Path.home()
+        self.minecraft_dir = self.home_dir / ".minecraft"
+        self.launcher_dir = self.home_dir / ".berke_minecraft_launcher"
+        self.versions_dir = self.launcher_dir / "versions"
+        self.skins_dir = self.launcher_dir / "skins"
+        self.cache_dir = self.launcher_dir / "cache"
+        self.logs_dir = self.launcher_dir / "logs"
+        self.libraries_dir = self.launcher_dir / "libraries"
+        self.natives_dir = self.libraries_dir / "natives" / "linux" / "x64"
+        self.runtimes_dir = self.launcher_dir / "runtimes"
+        self.assets_dir = self.minecraft_dir / "assets"
+        self.config_file = self.launcher_dir / "config.json"
+
+    def version_search_dirs(self) -> List[Path]:
+        """Sürüm JSON'larının arandığı dizinler (launcher önce)"""
+        return [self.versions_dir, self.minecraft_dir / "versions"]
+
+    def ensure(self):
+        """Temel dizinleri oluştur"""
+        for directory in (self.minecraft_dir, self.launcher_dir, self.versions_dir, self.skins_dir, self.cache_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+
+def load_config(config_file: Path, create: bool = True) -> Dict:
+    """Config'i varsayılanlarla tamamlayarak yükle"""
+    config_file = Path(config_file)
+    if config_file.exists():
+        try:
+            with open(config_file, 'r') as f:
+                config = json.load(f)
+            for key, value in DEFAULT_CONFIG.items():
+                config.setdefault(key, value)
+            return config
+        except json.JSONDecodeError:
+            return dict(DEFAULT_CONFIG)
+    config = dict(DEFAULT_CONFIG)
+    if create:
+        save_config(config_file, config)
+    return config
+
+
+def save_config(config_file: Path, config: Dict):
+    """Config'i kaydet"""
+    with open(config_file, 'w') as f:
+        json.dump(config, f, indent=2)
+
+
+def find_java() -> Optional[str]:
+    """JAVA_HOME, ardından bilinen yollar ve PATH üzerinden Java'yı bul"""
+    if os.environ.get('JAVA_HOME'):
+        java_home_bin = os.path.join(os.environ['JAVA_HOME'], 'bin', 'java')
+        if os.path.exists(java_home_bin):
+            return java_home_bin
+    for java_path in JAVA_CANDIDATES:
+        if java_path.startswith("/"):
+            if os.path.exists(java_path):
+                return java_path
+        elif shutil.which(java_path):
+            return shutil.which(java_path)
+    return None
+
+
+def cpu_cores() -> int:
+    """Bu sürecin kullanabileceği çekirdek sayısı"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 4
+
+
+def system_properties(natives_dir: Path) -> List[str]:
+    """Her başlatmada verilen -D sistem özellikleri"""
+    return [
+        # Network (Online Server için)
+        "-Djava.net.preferIPv4Stack=true",
+        "-Djava.net.preferIPv6Addresses=false",
+        "-Dhttp.agent=BerkeMinecraftLauncher/2.3.0",
+
+        # SSL Certificate Trust - Fix authentication issues
+        "-Dcom.sun.net.ssl.checkRevocation=false",
+        "-Dtrust_all_cert=true",
+        "-Djavax.net.ssl.trustStoreType=JKS",
+        "-Djavax.net.ssl.trustStore=",
+
+        # Java2D / AWT (Wayland/Hyprland - X11 üzerinden)
+        "-Dsun.java2d.opengl=false",
+        "-Dsun.java2d.d3d=false",
+        "-Dsun.java2d.xrender=true",
+        "-Dsun.java2d.pmoffscreen=false",
+        "-Dsun.java2d.noddraw=true",
+        "-Dsun.java2d.accthreshold=0",
+        "-Dsun.java2d.ddoffscreen=false",
+        "-Dsun.java2d.gdiblend=false",
+        "-Dsun.java2d.pisces=false",
+        "-Djava.awt.headless=false",
+        "-Djava.awt.graphicsenv=sun.awt.X11GraphicsEnvironment",
+        "-Dawt.useSystemAAFontSettings=on",
+        "-Dswing.aatext=true",
+        "-Djava.awt.Window.locationByPlatform=true",
+        "-Djava.awt.syncLWRequests=true",
+        "-Djava.awt.keepWorkingSetOnMinimize=true",
+        "-Djava.awt.smartInvalidate=true",
+        "-Djava.awt.doublebuffered=true",
+
+        # LWJGL Native Library Path
+        f"-Dorg.lwjgl.librarypath={natives_dir}",
+        f"-Djava.library.path={natives_dir}",
+        "-Dorg.lwjgl.util.Debug=false",
+        "-Dorg.lwjgl.util.DebugLoader=false",
+        "-Dorg.lwjgl.opengl.Display.allowSoftwareOpenGL=false",
+        "-Dorg.lwjgl.opengl.Display.swapInterval=0",
+
+        # Minecraft
+        "-Dminecraft.client.jar=client.jar",
+        "-Dminecraft.launcher.brand=berke-ultra-launcher",
+        "-Dminecraft.launcher.version=2.4.0",
+        "-Dfml.ignoreInvalidMinecraftCertificates=true",
+        "-Dfml.ignorePatchDiscrepancies=true",
+        "-Dfile.encoding=UTF-8",
+        "-Duser.language=en",
+        "-Duser.country=US",
+
+        # I/O (Netty)
+        "-Dio.netty.allocator.type=pooled",
+        "-Dio.netty.leakDetection.level=disabled",
+        "-Dio.netty.recycler.maxCapacityPerThread=0",
+    ]
+
+
+def launch_environment(base_env: Dict[str, str], display_env: Dict[str, str], config: Dict,
+                       wrapper_env: Dict[str, str] = None) -> Tuple[Dict[str, str], bool]:
+    """
+    Oyun sürecinin environment'ı
+
+    display_env GPU profilinin değişkenleridir; sarmalayıcıların değişkenleri
+    en son uygulanır.
+
+    Returns:
+        (environment, Wayland oturumunda XWayland'e geçildi mi)
+    """
+    env = dict(base_env)
+    env.update(display_env)
+
+    # Wayland oturumunda GLFW'yi XWayland'e yönlendir
+    xwayland = base_env.get("XDG_SESSION_TYPE") == "wayland" and config.get("wayland_support", True)
+    if xwayland:
+        env.pop("WAYLAND_DISPLAY", None)
+        env["_JAVA_AWT_WM_NONREPARENTING"] = "1"
+        if not env.get("DISPLAY"):
+            env["DISPLAY"] = ":0"
+
+    env["JAVA_TOOL_OPTIONS"] = "-Djava.awt.headless=false"
+    if config.get("debug", False):
+        env["JAVA_TOOL_OPTIONS"] += " -Djava.util.logging.config.file=logging.properties"
+    if wrapper_env:
+        env.update(wrapper_env)
+    return env, xwayland
+
+
+def load_chain(paths: LauncherPaths, version_id: str) -> List[Dict]:
+    """Sürüm JSON'unu inheritsFrom zinciriyle birlikte yükle (loader → vanilla)"""
+    return load_version_chain(version_id, paths.version_search_dirs())
+
+
+def resolve_classpath(paths: LauncherPaths, version_id: str, version_chain: List[Dict]):
+    """Sürüm için tekilleştirilmiş classpath'i çöz"""
+    builder = ClasspathBuilder(paths.libraries_dir)
+    builder.add_chain(version_chain)
+
+    # Client JAR: önce sürümün kendisi, yoksa zincirdeki ebeveynin JAR'ı
+    for data in version_chain:
+        chain_id = data.get("id", version_id)
+        client_jar = paths.versions_dir / chain_id / f"{chain_id}.jar"
+        if client_jar.exists():
+            builder.add_jar(client_jar)
+            break
+    else:
+        builder.add_jar(paths.versions_dir / version_id / f"{version_id}.jar")
+
+    return builder.build()
+
+
+def plan_version_heap(paths: LauncherPaths, version_id: str, version_chain: List[Dict], game_dir: Path = None):
+    """Otomatik bellek modeli ile -Xmx/-Xms hesapla"""
+    game_dir = Path(game_dir) if game_dir else paths.minecraft_dir
+    return plan_heap(
+        version_chain,
+        game_dir / "mods",
+        game_dir,
+        available_memory_mb(),
+        extra_pack_dirs=[paths.versions_dir / version_id / "resourcepacks"]
+    )
+
+
+def compile_jvm_args(paths: LauncherPaths, config: Dict, java_path: str, java_registry, flag_probe,
+                     heap_mb: int, min_heap_mb: int = None):
+    """Bu Java runtime'ı için GC/tuning bayraklarını ve sistem özelliklerini derle"""
+    java_info = java_registry.info(java_path) or {}
+    plan = compile_jvm_flags(java_info.get("major", 17), heap_mb, cpu_cores(), min_heap_mb, detect_huge_pages())
+
+    # Özel JVM argümanları en sonda - aynı bayrakta kullanıcının değeri kazanır
+    args = dedupe_jvm_args(plan.args + system_properties(paths.natives_dir) + config.get("custom_jvm_args", []))
+    supported = flag_probe.supported_flags(java_path)
+    plan.args, plan.dropped = filter_supported(args, supported)
+    return plan
+
+
+def fingerprint_version(paths: LauncherPaths, version_id: str, java_path: Optional[str], config: Dict,
+                        generation: int) -> Optional[str]:
+    """Sürüm, kütüphaneler, asset deposu, Java ve ayarların parmak izi"""
+    try:
+        version_chain = load_chain(paths, version_id)
+        classpath_result = resolve_classpath(paths, version_id, version_chain)
+    except (OSError, ValueError):
+        return None
+
+    version_dirs = []
+    for data in version_chain:
+        chain_id = data.get("id", version_id)
+        base = paths.versions_dir if (paths.versions_dir / chain_id).exists() else paths.minecraft_dir / "versions"
+        version_dirs.append(base / chain_id)
+    asset_index = merge_version_chain(version_chain).get("assetIndex", {}).get("id")
+
+    return install_fingerprint(
+        version_dirs,
+        classpath_result.entries + classpath_result.missing,
+        paths.assets_dir,
+        asset_index,
+        java_path,
+        config,
+        generation
+    )
+
+
+class LaunchSpec:
+    """Başlatma komutu ve onu oluştururken verilen kararlar"""
+
+    def __init__(self):
+        self.command: List[str] = []
+        self.display_env: Dict[str, str] = {}
+        self.gpu_profile = None
+        self.version_data: Dict = {}
+        self.classpath = None
+        self.heap_plan = None
+        self.flag_plan = None
+        self.cds_plan = CdsPlan()
+        # Birleşik GC logu (config "gc_logging"): yol ve MaxGCPauseMillis hedefi
+        self.gc_log: Optional[Path] = None
+        self.gc_pause_target: Optional[float] = None
+        # Açılıştan itibaren Flight Recorder kaydı (config "jfr_template"): oyun kapanınca yazılır
+        self.jfr_recording: Optional[Path] = None
+        # İstenen JFR kaydı eklenemediyse nedeni
+        self.jfr_skipped: Optional[str] = None
+        # OOM heap dökümlerinin dizini (config "heap_dump_on_oom"); oyundan önce hazırlanıp budanır
+        self.heap_dump_dir: Optional[Path] = None
+        self.max_heap_mb = 0
+        self.java_major: Optional[int] = None
+        self.player_uuid = ""
+        self.uuid_generated = False
+        # Java'nın önüne eklenen sarmalayıcılar (gamemoderun, nice...)
+        self.wrapper_chain = WrapperChain()
+        # İndirilmesi gereken asset index: {"id", "url", "path"} veya None
+        self.missing_asset_index: Optional[Dict] = None
+
+
+def build_launch_command(paths: LauncherPaths, config: Dict, version_id: str, java_path: str,
+                         java_registry, flag_probe, version_chain: List[Dict] = None,
+                         game_dir: Path = None) -> LaunchSpec:
+    """
+    Oyun başlatma komutunu oluştur
+
+    Args:
+        paths: Launcher dizinleri
+        config: Launcher ayarları (username, memory, pencere boyutu...)
+        version_id: Başlatılacak sürüm
+        java_path: Java ikilisi
+        java_registry: JavaRegistry (Java ana sürümü için)
+        flag_probe: JvmFlagProbe (desteklenmeyen bayrakları atmak için)
+        version_chain: Önceden yüklenmiş sürüm zinciri
+        game_dir: Oyun dizini (instance); None ise ~/.minecraft
+
+    Returns:
+        LaunchSpec (yan etkisiz - UUID kaydı ve asset index indirme çağırana kalır)
+    """
+    if not java_path:
+        raise Exception("Java bulunamadı! Lütfen Java'yı yükleyin.")
+
+    version_json_path = paths.versions_dir / version_id / f"{version_id}.json"
+    if not version_json_path.exists():
+        raise Exception(f"Sürüm JSON'u bulunamadı: {version_id}")
+
+    spec = LaunchSpec()
+    game_dir = Path(game_dir) if game_dir else paths.minecraft_dir
+    game_dir.mkdir(parents=True, exist_ok=True)
+
+    # Loader sürümleri için inheritsFrom zincirini birleştir
+    if version_chain is None:
+        version_chain = load_chain(paths, version_id)
+    version_data = merge_version_chain(version_chain)
+    spec.version_data = version_data
+
+    # Heap boyutu: "auto" ise sürüm, yükleyici, modlar ve boş belleğe göre
+    if config["memory"] == "auto":
+        spec.heap_plan = plan_version_heap(paths, version_id, version_chain, game_dir)
+        max_heap_mb, min_heap_mb = spec.heap_plan.xmx_mb, spec.heap_plan.xms_mb
+    else:
+        max_heap_mb, min_heap_mb = int(config["memory"]) * 1024, None
+
+    spec.max_heap_mb = max_heap_mb
+    # Donanıma göre en az değişkenli grafik profili (config ile geçersiz kılınabilir)
+    spec.gpu_profile = profile_for_config(config)
+    spec.display_env = spec.gpu_profile.env
+
+    # JVM bayrakları: Java sürümü, heap, çekirdek sayısı ve huge page'e göre derlenir
+    spec.flag_plan = compile_jvm_args(paths, config, java_path, java_registry, flag_probe, max_heap_mb, min_heap_mb)
+    spec.java_major = (java_registry.info(java_path) or {}).get("major")
+
+    main_class = version_data.get("mainClass", "net.minecraft.client.main.Main")
+
+    # Classpath oluştur (Maven koordinatına göre tekilleştirilmiş)
+    spec.classpath = resolve_classpath(paths, version_id, version_chain)
+
+    # Hızlı açılış: sürüm + Java başına AppCDS arşivi
+    java_major = spec.java_major or 17
+    if config.get("cds_fast_start", False):
+        spec.cds_plan = CdsStore(paths.cache_dir / "cds").plan(version_id, java_path, java_major,
+                                                               spec.classpath.entries, spec.flag_plan.gc)
+        pretouch_args = spec.flag_plan.args
+        spec.flag_plan.args = drop_pretouch(pretouch_args, max_heap_mb) + spec.cds_plan.args
+        if len(spec.flag_plan.args) - len(spec.cds_plan.args) < len(pretouch_args):
+            spec.flag_plan.notes.append("Hızlı açılış: AlwaysPreTouch kaldırıldı")
+
+    # GC logu: oyun çalışırken ayrıştırılır (duraklama histogramı, p99, ek yük)
+    if config.get("gc_logging", False):
+        log_path = gc_log_path(paths.logs_dir, version_id)
+        log_args = gc_log_args(log_path, java_major)
+        if log_args:
+            spec.gc_log = log_path
+            spec.gc_pause_target = pause_target_ms(spec.flag_plan.args)
+            spec.flag_plan.args = spec.flag_plan.args + log_args
+        else:
+            spec.flag_plan.notes.append(f"GC logu: Java {java_major} birleşik loglamayı desteklemiyor (9+)")
+
+    if config.get("jfr_template"):
+        recording = recording_path(paths.launcher_dir / PROFILES_DIR, version_id)
+        jfr_args = jfr_start_args(recording, config["jfr_template"], java_major)
+        if jfr_args:
+            spec.jfr_recording = recording
+            spec.flag_plan.args = spec.flag_plan.args + jfr_args
+        else:
+            spec.jfr_skipped = f"Java {java_major} desteklemiyor ({MIN_JAVA_JFR}+)"
+            spec.flag_plan.notes.append(f"JFR: {spec.jfr_skipped}")
+
+    if config.get("heap_dump_on_oom", False):
+        spec.heap_dump_dir = paths.launcher_dir / HEAP_DUMPS_DIR
+        spec.flag_plan.args = spec.flag_plan.args + heap_dump_args(spec.heap_dump_dir)
+    jvm_args = [java_path] + spec.flag_plan.args
+
+    skin_path = paths.skins_dir / f"{config['current_skin']}.png"
+
+    # UUID generation (online sunucu desteği için)
+    player_uuid = config.get("uuid")
+    if not player_uuid:
+        # Username'den deterministic UUID oluştur (online sunucular için)
+        player_uuid = str(uuid.uuid5(uuid.NAMESPACE_DNS, config["username"]))
+        spec.uuid_generated = True
+    spec.player_uuid = player_uuid
+
+    # Minecraft argümanları (eski sürüm uyumluluğu)
+    minecraft_args = [
+        "-cp", spec.classpath.as_string(":"),
+        main_class,
+        "--username", config["username"],
+        "--version", version_id,
+        "--gameDir", str(game_dir),
+        "--assetsDir", str(paths.assets_dir),
+    ]
+
+    # Asset index (eski sürümlerde olmayabilir)
+    if "assetIndex" in version_data:
+        asset_index_id = version_data["assetIndex"]["id"]
+        minecraft_args.extend(["--assetIndex", asset_index_id])
+        asset_index_path = paths.assets_dir / "indexes" / f"{asset_index_id}.json"
+        if not asset_index_path.exists():
+            spec.missing_asset_index = {"id": asset_index_id, "url": version_data["assetIndex"]["url"],
+                                        "path": asset_index_path}
+    else:
+        # Eski sürümler için fallback
+        minecraft_args.extend(["--assetIndex", "legacy"])
+
+    # Online sunucu desteği (modern sürümler için)
+    minecraft_args.extend([
+        "--uuid", player_uuid,  # UUID ekle (online sunucu desteği)
+        "--accessToken", "null",
+        "--userType", "mojang",  # legacy yerine mojang (daha iyi uyumluluk)
+        "--versionType", "release",
+    ])
+
+    # Pencere boyutu
+    minecraft_args.extend([
+        "--width", str(config["window_width"]),
+        "--height", str(config["window_height"])
+    ])
+
+    # Skin varsa ekle
+    if skin_path.exists():
+        minecraft_args.extend(["--skin", str(skin_path)])
+
+    spec.wrapper_chain = resolve_chain(config)
+    spec.command = spec.wrapper_chain.apply(jvm_args + minecraft_args)
+    return spec
+
+
+__all__ = [
+    'VERSION_MANIFEST_URL', 'ASSETS_URL', 'DEFAULT_CONFIG', 'LauncherPaths',
+    'load_config', 'save_config', 'find_java', 'cpu_cores', 'system_properties',
+    'launch_environment', 'load_chain', 'resolve_classpath',
+    'plan_version_heap', 'compile_jvm_args', 'fingerprint_version', 'LaunchSpec', 'build_launch_command'
+]
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Launch Fingerprint
+Kurulumun parmak izi: hiçbir şey değişmediyse başlatma kontrollerini atla
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Başlatmayı etkilemeyen config anahtarları
+VOLATILE_CONFIG_KEYS = {"last_version"}
+
+
+def _stat_token(path) -> Optional[List[int]]:
+    """Dosya/dizin için [boyut, mtime_ns]; yoksa None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+class GenerationCounter:
+    """
+    İndirme/onarım sayacı
+
+    Kurulumu değiştiren her işlem sayacı artırır; parmak izi böylece
+    dosya zaman damgalarının kaçırabileceği değişiklikleri de yakalar.
+    """
+
+    def __init__(self, counter_file: Path):
+        self.counter_file = Path(counter_file)
+        self._lock = threading.Lock()
+        self._values: Dict[str, int] = {}
+        if self.counter_file.exists():
+            try:
+                with open(self.counter_file, 'r') as f:
+                    self._values = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._values = {}
+
+    def get(self, name: str = "install") -> int:
+        with self._lock:
+            return self._values.get(name, 0)
+
+    def bump(self, name: str = "install") -> int:
+        """Sayacı artır ve diske yaz"""
+        with self._lock:
+            self._values[name] = self._values.get(name, 0) + 1
+            value = self._values[name]
+            try:
+                self.counter_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.counter_file.with_suffix(".tmp")
+                with open(tmp_file, 'w') as f:
+                    json.dump(self._values, f)
+                os.replace(tmp_file, self.counter_file)
+            except OSError:
+                pass
+        return value
+
+
+def install_fingerprint(version_dirs: List[Path], classpath: List[str], assets_dir: Path,
+                        asset_index_id: Optional[str], java_path: Optional[str],
+                        config: Dict, generation: int) -> str:
+    """
+    Başlatma kontrollerinin sonucunu belirleyen her şeyin özeti
+
+    Args:
+        version_dirs: Sürüm zincirindeki dizinler (loader → vanilla)
+        classpath: Classpath'teki JAR yolları
+        assets_dir: Asset deposu (indexes/, objects/)
+        asset_index_id: Sürümün asset index'i
+        java_path: Java ikilisi
+        config: Launcher ayarları
+        generation: GenerationCounter değeri
+
+    Returns:
+        SHA-1 hex özet
+    """
+    parts: Dict = {"generation": generation}
+
+    parts["versions"] = []
+    for version_dir in version_dirs:
+        version_dir = Path(version_dir)
+        name = version_dir.name
+        parts["versions"].append([
+            name,
+            _stat_token(version_dir),
+            _stat_token(version_dir / f"{name}.json"),
+            _stat_token(version_dir / f"{name}.jar"),
+        ])
+
+    parts["classpath"] = [[path, _stat_token(path)] for path in classpath]
+
+    # Asset deposu: dizin mtime'ları (dosya eklenip silindiğinde değişir)
+    assets_dir = Path(assets_dir)
+    objects_dir = assets_dir / "objects"
+    parts["assets"] = {
+        "index": _stat_token(assets_dir / "indexes" / f"{asset_index_id}.json") if asset_index_id else None,
+        "objects": _stat_token(objects_dir),
+        "buckets": [_stat_token(objects_dir / f"{i:02x}") for i in range(256)],
+    }
+
+    if java_path:
+        real_path = os.path.realpath(java_path)
+        parts["java"] = [real_path, _stat_token(real_path)]
+
+    parts["config"] = {k: v for k, v in config.items() if k not in VOLATILE_CONFIG_KEYS}
+
+    payload = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha1(payload).hexdigest()
+
+
+def classpath_fingerprint(classpath: List[str], java_path: str, extra: Dict = None) -> str:
+    """
+    Classpath JAR'ları ve Java ikilisinin özeti (install_fingerprint'ten dar)
+
+    Sınıf listesine bağlı önbellekler (CDS arşivi gibi) için; asset'ler ve
+    launcher ayarları bu özete girmez.
+    """
+    real_path = os.path.realpath(java_path)
+    parts = {
+        "classpath": [[path, _stat_token(path)] for path in classpath],
+        "java": [real_path, _stat_token(real_path)],
+        "extra": extra or {},
+    }
+    payload = json.dumps(parts, sort_keys=True, default=str).encode()
+    return hashlib.sha1(payload).hexdigest()
+
+
+class FingerprintStore:
+    """Sürüm başına son başarılı başlatmanın parmak izi"""
+
+    def __init__(self, store_file: Path):
+        self.store_file = Path(store_file)
+        self._lock = threading.Lock()
+
+    def _read(self) -> Dict:
+        if not self.store_file.exists():
+            return {}
+        try:
+            with open(self.store_file, 'r') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _write(self, data: Dict):
+        try:
+            self.store_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.store_file.with_suffix(".tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_file, self.store_file)
+        except OSError:
+            pass
+
+    def get(self, version_id: str) -> Optional[str]:
+        with self._lock:
+            entry = self._read().get(version_id)
+        return entry.get("fingerprint") if entry else None
+
+    def set(self, version_id: str, fingerprint: str):
+        """Başarılı başlatmanın parmak izini kaydet"""
+        with self._lock:
+            data = self._read()
+            data[version_id] = {"fingerprint": fingerprint, "time": time.time()}
+            self._write(data)
+
+    def invalidate(self, version_id: str = None):
+        """Bir sürümün (veya tümünün) kaydını sil - sonraki başlatma tam kontrol yapar"""
+        with self._lock:
+            data = self._read() if version_id else {}
+            data.pop(version_id, None)
+            self._write(data)
+
+
+__all__ = ['VOLATILE_CONFIG_KEYS', 'GenerationCounter', 'install_fingerprint', 'classpath_fingerprint', 'FingerprintStore']
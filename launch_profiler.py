@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Launch Profiler
+Başlatma aşamalarının ve oyun içi açılış kilometre taşlarının zaman çizelgesi
+"""
+
+import json
+import re
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Oyun logundaki açılış kilometre taşları: (ad, regex, mod)
+# mod "first": ilk eşleşme, "last": main_menu görülene kadar son eşleşme
+MILESTONE_PATTERNS = [
+    ("lwjgl_init", r"Backend library: LWJGL version|LWJGL Version: ", "first"),
+    ("resource_reload_start", r"Reloading ResourceManager", "first"),
+    ("sound_engine", r"Sound engine started|OpenAL initialized", "first"),
+    ("resource_reload_done", r"Created: \d+x\d+x\d+ minecraft:textures/atlas/", "last"),
+    ("main_menu", r"Realms Notification Availability checker|Could not authorize you against Realms server|Loading Realms", "first"),
+]
+
+# Tabloda gösterilecek sıralama
+PHASE_ORDER = ["java_check", "pre_launch_check", "asset_verify", "build_command", "spawn", "startup_wait"]
+MILESTONE_ORDER = ["first_output"] + [name for name, _, _ in MILESTONE_PATTERNS]
+
+
+class LaunchTimeline:
+    """Tek bir başlatmanın monoton saatle ölçülen zaman çizelgesi"""
+
+    def __init__(self, version_id: str):
+        self.version_id = version_id
+        self.started_at = time.time()
+        self._t0 = time.monotonic()
+        self.phases: Dict[str, float] = {}
+        self.milestones: Dict[str, float] = {}
+        self.meta: Dict = {}
+        self._lock = threading.Lock()
+
+    def elapsed_ms(self) -> float:
+        """Başlangıçtan bu yana geçen süre (ms)"""
+        return (time.monotonic() - self._t0) * 1000
+
+    @contextmanager
+    def phase(self, name: str):
+        """Bir launcher aşamasını ölç"""
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.phases[name] = self.phases.get(name, 0.0) + (time.monotonic() - start) * 1000
+
+    def mark(self, name: str, overwrite: bool = False):
+        """Kilometre taşını şu an olarak işaretle"""
+        with self._lock:
+            if overwrite or name not in self.milestones:
+                self.milestones[name] = self.elapsed_ms()
+
+    def set(self, key: str, value):
+        """Zaman çizelgesine ek bilgi ekle (java sürümü, log dosyası, çıkış kodu...)"""
+        with self._lock:
+            self.meta[key] = value
+
+    def to_dict(self) -> Dict:
+        """JSON'a yazılabilir kayıt"""
+        with self._lock:
+            return {
+                "version": self.version_id,
+                "started_at": self.started_at,
+                "phases_ms": {k: round(v, 1) for k, v in self.phases.items()},
+                "milestones_ms": {k: round(v, 1) for k, v in self.milestones.items()},
+                "meta": dict(self.meta),
+            }
+
+
+class MilestoneTracker:
+    """
+    Log satırlarından kilometre taşlarını zaman çizelgesine işler
+
+    Satırlar LogFollower aboneliğiyle gelir; ana menüye ulaşıldığında ya da
+    log bittiğinde on_finish bir kez çağrılır.
+    """
+
+    def __init__(self, timeline: LaunchTimeline, patterns=None, on_finish: Callable = None):
+        self.timeline = timeline
+        self.patterns = [(name, re.compile(regex), mode) for name, regex, mode in (patterns or MILESTONE_PATTERNS)]
+        self.on_finish = on_finish
+        self._finished = False
+        self._lock = threading.Lock()
+
+    def feed(self, line: str):
+        """Tek log satırını işle"""
+        if self._finished:
+            return
+        if "first_output" not in self.timeline.milestones:
+            self.timeline.mark("first_output")
+
+        for name, regex, mode in self.patterns:
+            if regex.search(line):
+                self.timeline.mark(name, overwrite=(mode == "last"))
+
+        if self.is_complete():
+            self.finish()
+
+    def is_complete(self) -> bool:
+        """Son kilometre taşına (ana menü) ulaşıldı mı"""
+        return "main_menu" in self.timeline.milestones
+
+    def finish(self):
+        """Takibi bitir ve on_finish'i (bir kez) çağır"""
+        with self._lock:
+            if self._finished:
+                return
+            self._finished = True
+        if self.on_finish:
+            self.on_finish()
+
+
+class LaunchHistory:
+    """Başlatma zaman çizelgelerinin JSONL geçmişi"""
+
+    def __init__(self, history_file: Path, max_entries: int = 1000):
+        self.history_file = Path(history_file)
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    def append(self, record: Dict):
+        """Kaydı geçmişe ekle, sınır aşıldıysa eski kayıtları buda"""
+        with self._lock:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.history_file, 'a') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+            records = self._read_all()
+            if len(records) > self.max_entries:
+                with open(self.history_file, 'w') as f:
+                    for item in records[-self.max_entries:]:
+                        f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    def update(self, record: Dict):
+        """
+        Aynı başlatmanın (sürüm + başlangıç zamanı) kaydını yenisiyle değiştir, yoksa ekle
+
+        Açılış kaydı ana menüde yazılır; oyun kapanınca çıkış kodu ve oyun
+        içi hatalarla yeniden yazılır.
+        """
+        with self._lock:
+            records = self._read_all()
+            key = (record["version"], record["started_at"])
+            for i in range(len(records) - 1, -1, -1):
+                if (records[i].get("version"), records[i].get("started_at")) == key:
+                    records[i] = record
+                    break
+            else:
+                records.append(record)
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.history_file, 'w') as f:
+                for item in records[-self.max_entries:]:
+                    f.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+    def _read_all(self) -> List[Dict]:
+        records = []
+        if not self.history_file.exists():
+            return records
+        with open(self.history_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return records
+
+    def load(self, version_id: Optional[str] = None, limit: int = 10) -> List[Dict]:
+        """Son N kaydı (isteğe bağlı sürüme göre) eskiden yeniye döndür"""
+        with self._lock:
+            records = self._read_all()
+        if version_id:
+            records = [r for r in records if r.get("version") == version_id]
+        return records[-limit:] if limit else records
+
+    def versions(self) -> List[str]:
+        """Geçmişte bulunan sürümler (en son başlatılan önce)"""
+        seen = []
+        for record in reversed(self.load(limit=0)):
+            version = record.get("version")
+            if version and version not in seen:
+                seen.append(version)
+        return seen
+
+
+def time_to_play_ms(record: Dict) -> Optional[float]:
+    """Kayıttan 'oynanabilir' süresini çıkar (ana menü, yoksa son kilometre taşı)"""
+    milestones = record.get("milestones_ms", {})
+    if "main_menu" in milestones:
+        return milestones["main_menu"]
+    if milestones:
+        return max(milestones.values())
+    return None
+
+
+__all__ = [
+    'MILESTONE_PATTERNS', 'PHASE_ORDER', 'MILESTONE_ORDER',
+    'LaunchTimeline', 'MilestoneTracker', 'LaunchHistory', 'time_to_play_ms'
+]
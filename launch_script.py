@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Launch Script Export
+Çözülmüş başlatma komutunu Python'suz çalışan bir POSIX sh betiğine ve
+.desktop dosyasına yaz; betik kurulumun parmak izini kendisi denetler
+"""
+
+import os
+import shlex
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Betik ve dışa aktarma anında aynı komutla hesaplanır (GNU/busybox stat)
+FINGERPRINT_COMMAND = 'stat -c "%n %s %Y" -- "$@" 2>&1 | cksum'
+
+# Kullanıcının oturumuna ait, betiğe gömülmemesi gereken değişkenler
+SESSION_ENV_KEYS = {
+    "DBUS_SESSION_BUS_ADDRESS", "XDG_RUNTIME_DIR", "XDG_SESSION_ID", "XAUTHORITY", "SSH_AUTH_SOCK",
+    "SSH_CONNECTION", "SSH_CLIENT", "SSH_TTY", "PWD", "OLDPWD", "SHLVL", "_", "TERM", "COLORTERM",
+    "HOME", "USER", "LOGNAME", "PATH", "SHELL", "LANG", "LC_ALL",
+}
+
+
+def fingerprint_files(paths, version_id: str, classpath: List[str], java_path: str) -> List[str]:
+    """Betiğin denetleyeceği dosyalar: sürüm JSON/JAR'ları, classpath, native'ler ve Java"""
+    from launch_builder import load_chain
+
+    files = []
+    for data in load_chain(paths, version_id):
+        chain_id = data.get("id", version_id)
+        version_dir = paths.versions_dir / chain_id
+        for name in (f"{chain_id}.json", f"{chain_id}.jar"):
+            if (version_dir / name).exists():
+                files.append(str(version_dir / name))
+    files += [entry for entry in classpath if entry not in files]
+    files.append(str(paths.natives_dir))
+    files.append(os.path.realpath(java_path))
+    return files
+
+
+def compute_fingerprint(files: List[str]) -> str:
+    """Betikteki denetimle aynı sonucu veren cksum çıktısı"""
+    result = subprocess.run(["sh", "-c", FINGERPRINT_COMMAND, "sh"] + list(files),
+                            capture_output=True, text=True, timeout=30)
+    return result.stdout.strip()
+
+
+def env_changes(base_env: Dict[str, str], launch_env: Dict[str, str]) -> Dict[str, Optional[str]]:
+    """
+    Launcher'ın ortama yaptığı değişiklikler
+
+    Returns:
+        {ad: değer} (None = kaldırılan değişken); oturuma özgü anahtarlar hariç
+    """
+    changes: Dict[str, Optional[str]] = {}
+    for key, value in launch_env.items():
+        if key not in SESSION_ENV_KEYS and base_env.get(key) != value:
+            changes[key] = value
+    for key in base_env:
+        if key not in launch_env and key not in SESSION_ENV_KEYS:
+            changes[key] = None
+    return changes
+
+
+def render_script(command: List[str], env: Dict[str, Optional[str]], game_dir: Path, files: List[str],
+                  fingerprint: str, regenerate: List[str], title: str) -> str:
+    """
+    POSIX sh betiği
+
+    Args:
+        command: Tam argv (sarmalayıcılar dahil)
+        env: env_changes() sonucu
+        game_dir: Çalışma dizini
+        files: Parmak izi dosyaları
+        fingerprint: Dışa aktarma anındaki compute_fingerprint() sonucu
+        regenerate: Betiği yeniden üreten komut (betik yolu sonuna eklenir)
+        title: Başlık yorumu
+    """
+    q = shlex.quote
+    lines = [
+        "#!/bin/sh",
+        f"# {title}",
+        f"# berkemc export ile {time.strftime('%Y-%m-%d %H:%M')} tarihinde oluşturuldu; elle düzenlemeyin.",
+        "# Kurulum değişirse betik kendini yeniden oluşturur (BERKEMC_NO_REGENERATE=1 ile yalnız uyarır).",
+        "",
+        f"EXPECTED_FINGERPRINT={q(fingerprint)}",
+        "",
+        "berkemc_fingerprint() {",
+        f"    {FINGERPRINT_COMMAND}",
+        "}",
+        "",
+        "CURRENT_FINGERPRINT=$(berkemc_fingerprint \\",
+    ]
+    lines += [f"    {q(path)} \\" for path in files]
+    lines[-1] = lines[-1][:-2] + ")"
+    lines += [
+        "",
+        'if [ "$CURRENT_FINGERPRINT" != "$EXPECTED_FINGERPRINT" ]; then',
+        '    if [ -z "$BERKEMC_NO_REGENERATE" ] && [ -z "$BERKEMC_REGENERATED" ] && command -v berkemc >/dev/null 2>&1; then',
+        '        echo "berkemc: kurulum değişmiş, betik yeniden oluşturuluyor..." >&2',
+        f'        if {" ".join(q(arg) for arg in regenerate)} "$0" >&2; then',
+        '            BERKEMC_REGENERATED=1 exec "$0" "$@"',
+        "        fi",
+        "    fi",
+        '    echo "berkemc: uyarı - kütüphaneler ya da sürüm JSON\'u bu betik oluşturulduktan sonra değişmiş" >&2',
+        "fi",
+        "",
+        f"cd {q(str(game_dir))} || exit 1",
+        "",
+    ]
+    for key in sorted(env):
+        value = env[key]
+        if value is None:
+            lines.append(f"unset {key}")
+        else:
+            lines.append(f"export {key}={q(value)}")
+    lines.append("")
+    lines.append(f"exec {q(command[0])} \\")
+    lines += [f"    {q(arg)} \\" for arg in command[1:]]
+    lines.append('    "$@"')
+    return "\n".join(lines) + "\n"
+
+
+def render_desktop(script_path: Path, name: str, comment: str) -> str:
+    """Betiği çalıştıran .desktop girdisi"""
+    # Desktop Entry Exec alanında boşluk ve özel karakterler çift tırnakla korunur
+    exec_path = str(script_path).replace("\\", "\\\\").replace('"', '\\"')
+    return "\n".join([
+        "[Desktop Entry]",
+        "Type=Application",
+        f"Name={name}",
+        f"Comment={comment}",
+        f'Exec="{exec_path}"',
+        "Icon=berkemc",
+        "Terminal=false",
+        "Categories=Game;",
+        "StartupNotify=true",
+    ]) + "\n"
+
+
+def write_executable(path: Path, content: str):
+    """Atomik yaz, çalıştırılabilir yap"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = path.with_name(path.name + ".tmp")
+    with open(tmp_file, 'w') as f:
+        f.write(content)
+    os.chmod(tmp_file, 0o755)
+    os.replace(tmp_file, path)
+
+
+def export_launch_script(paths, spec, launch_env: Dict[str, str], base_env: Dict[str, str], version_id: str,
+                         java_path: str, game_dir: Path, output: Path, instance_name: str = None,
+                         desktop_file: Path = None, explicit_java: bool = False) -> Dict:
+    """
+    Başlatma betiğini (ve istenirse .desktop dosyasını) yaz
+
+    Args:
+        spec: build_launch_command() sonucu
+        launch_env: launch_environment() sonucu
+        base_env: Ortamın launcher öncesi hali (fark betiğe yazılır)
+        output: Betik yolu
+        instance_name: Instance (yeniden oluşturma komutu için)
+        desktop_file: .desktop yolu ya da None
+        explicit_java: Java elle seçildi (--java); yeniden oluşturma komutu da aynı Java'yı kullanır
+
+    Returns:
+        {"script", "desktop", "fingerprint", "files"}
+    """
+    files = fingerprint_files(paths, version_id, spec.classpath.entries, java_path)
+    fingerprint = compute_fingerprint(files)
+    regenerate = ["berkemc", "export", version_id]
+    if instance_name:
+        regenerate += ["--instance", instance_name]
+    if explicit_java:
+        # Otomatik seçim başka bir JVM bulursa parmak izi tutmaz
+        regenerate += ["--java", java_path]
+    regenerate += ["--output"]
+    label = f"{version_id} ({instance_name})" if instance_name else version_id
+    # Java 13-18'de kayıt bayrağı her açılışta arşivi yeniden yazardı; betik yalnız hazır arşivi kullanır.
+    # GC logu oturuma özgü dosyaya yazılır ve launcher'ın izleme ekranı için; betikte anlamı yok
+    command = [arg for arg in spec.command
+               if not arg.startswith("-XX:ArchiveClassesAtExit=") and not arg.startswith("-Xlog:gc*:file=")]
+    script = render_script(command, env_changes(base_env, launch_env), game_dir, files, fingerprint,
+                           regenerate, f"Minecraft {label}")
+    write_executable(output, script)
+
+    result = {"script": Path(output), "desktop": None, "fingerprint": fingerprint, "files": len(files)}
+    if desktop_file:
+        desktop_file = Path(desktop_file)
+        desktop_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(desktop_file, 'w') as f:
+            f.write(render_desktop(Path(output).resolve(), f"Minecraft {label}", "BerkeMC ile dışa aktarılan başlatıcı"))
+        result["desktop"] = desktop_file
+    return result
+
+
+def default_export_paths(paths, version_id: str, instance_name: str = None):
+    """(betik yolu, .desktop yolu)"""
+    slug = f"{instance_name}-{version_id}" if instance_name else version_id
+    script = paths.launcher_dir / "exports" / f"minecraft-{slug}.sh"
+    data_home = Path(os.environ.get("XDG_DATA_HOME", Path.home() / ".local" / "share"))
+    desktop = data_home / "applications" / f"berkemc-{slug}.desktop"
+    return script, desktop
+
+
+__all__ = [
+    'FINGERPRINT_COMMAND', 'fingerprint_files', 'compute_fingerprint', 'env_changes', 'render_script',
+    'render_desktop', 'export_launch_script', 'default_export_paths'
+]
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Launch Wrappers
+Java komutunun önüne eklenen sarmalayıcı zinciri (gamemoderun, prime-run,
+mangohud, nice, taskset ve özel komutlar): algılama, doğrulama, ortam
+değişkenleri ve ek başlatma maliyetinin ölçümü
+"""
+
+import json
+import os
+import re
+import shlex
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from cgroup_governor import parse_cpu_list
+
+WRAPPER_AUTO = "auto"
+
+# Bilinen sarmalayıcılar; "{arg}" yer tutucusu "ad:değer" biçimindeki değerle doldurulur
+KNOWN_WRAPPERS = {
+    "gamemode": {
+        "binary": "gamemoderun",
+        "args": [],
+        "env": {},
+        "description": "Feral GameMode (CPU governor, G/Ç önceliği)",
+    },
+    "prime-run": {
+        "binary": "prime-run",
+        "args": [],
+        # prime-run yoksa aynı değişkenlerle NVIDIA render offload yapılır
+        "env": {
+            "__NV_PRIME_RENDER_OFFLOAD": "1",
+            "__GLX_VENDOR_LIBRARY_NAME": "nvidia",
+            "__VK_LAYER_NV_optimus": "NVIDIA_only",
+        },
+        "binary_optional": True,
+        "description": "NVIDIA PRIME render offload",
+    },
+    "mangohud": {
+        "binary": "mangohud",
+        # LWJGL OpenGL'i dlsym ile yüklediği için --dlsym gerekir
+        "args": ["--dlsym"],
+        "env": {},
+        "description": "MangoHud FPS/frametime katmanı",
+    },
+    "nice": {
+        "binary": "nice",
+        "args": ["-n", "{arg}"],
+        "env": {},
+        "default_arg": "5",
+        "description": "CPU önceliği (nice:-5 gibi; negatif değer yetki ister)",
+    },
+    "taskset": {
+        "binary": "taskset",
+        "args": ["-c", "{arg}"],
+        "env": {},
+        "description": "CPU çekirdeği sabitleme (taskset:0-3 gibi)",
+    },
+}
+
+# Kullanılabilirse otomatik eklenenler (sırayla)
+AUTO_WRAPPERS = ["gamemode"]
+
+_ENV_ASSIGN_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*=')
+
+
+class Wrapper:
+    """Zincirdeki tek sarmalayıcı"""
+
+    def __init__(self, spec: str, name: str, argv: List[str], env: Dict[str, str] = None):
+        self.spec = spec
+        self.name = name
+        self.argv = argv
+        self.env = env or {}
+
+    def to_dict(self) -> Dict:
+        return {"spec": self.spec, "name": self.name, "argv": self.argv, "env": self.env}
+
+
+class WrapperChain:
+    """Doğrulanmış sarmalayıcılar ve atlananlar (sebepleriyle)"""
+
+    def __init__(self, wrappers: List[Wrapper] = None, skipped: List[Tuple[str, str]] = None):
+        self.wrappers = wrappers or []
+        self.skipped = skipped or []
+
+    def apply(self, command: List[str]) -> List[str]:
+        """Komutu zincirle sar - listedeki ilk sarmalayıcı en dışta"""
+        prefix = []
+        for wrapper in self.wrappers:
+            prefix += wrapper.argv
+        return prefix + list(command)
+
+    def environment(self) -> Dict[str, str]:
+        """Sarmalayıcıların eklediği ortam değişkenleri (sonraki öncekini ezer)"""
+        env = {}
+        for wrapper in self.wrappers:
+            env.update(wrapper.env)
+        return env
+
+    def names(self) -> List[str]:
+        return [wrapper.spec for wrapper in self.wrappers]
+
+    def key(self) -> str:
+        """Zaman çizelgesinde karşılaştırma anahtarı"""
+        return "+".join(self.names()) or "-"
+
+    def __bool__(self) -> bool:
+        return bool(self.wrappers)
+
+
+def parse_wrapper(spec: str) -> Wrapper:
+    """
+    Sarmalayıcı tanımını çöz
+
+    "gamemode", "nice:-5", "taskset:0-3" bilinen sarmalayıcılardır; diğer
+    her şey özel komut sayılır ve başındaki "AD=değer" sözcükleri ortam
+    değişkeni olur ("DXVK_HUD=1 obs-gamecapture").
+
+    Raises:
+        ValueError: Boş ya da çözümlenemeyen tanım
+    """
+    spec = (spec or "").strip()
+    if not spec:
+        raise ValueError("Boş sarmalayıcı")
+
+    name, _, arg = spec.partition(":")
+    known = KNOWN_WRAPPERS.get(name)
+    if known and " " not in spec:
+        arg = arg or known.get("default_arg", "")
+        if "{arg}" in " ".join(known["args"]) and not arg:
+            raise ValueError(f"{name} için değer gerekli ({name}:<değer>)")
+        argv = [known["binary"]] + [a.replace("{arg}", arg) for a in known["args"]]
+        return Wrapper(spec, name, argv, dict(known["env"]))
+
+    try:
+        words = shlex.split(spec)
+    except ValueError as e:
+        raise ValueError(f"Sarmalayıcı çözümlenemedi: {e}")
+    env = {}
+    while words and _ENV_ASSIGN_RE.match(words[0]):
+        key, _, value = words.pop(0).partition("=")
+        env[key] = value
+    if not words:
+        raise ValueError(f"Sarmalayıcıda komut yok: {spec}")
+    return Wrapper(spec, "custom", words, env)
+
+
+def _nice_allowed(level: int) -> bool:
+    """Bu kullanıcı nice değerini bu seviyeye indirebilir mi"""
+    if level >= os.nice(0):
+        return True
+    if os.geteuid() == 0:
+        return True
+    try:
+        import resource
+        soft, _ = resource.getrlimit(resource.RLIMIT_NICE)
+    except (ImportError, AttributeError, ValueError, OSError):
+        return False
+    # RLIMIT_NICE tavanı 20 - rlim olarak ifade edilir
+    return soft == resource.RLIM_INFINITY or level >= 20 - soft
+
+
+def validate_wrapper(wrapper: Wrapper) -> Optional[str]:
+    """
+    Sarmalayıcı bu sistemde çalışır mı
+
+    Returns:
+        Sorun yoksa None, varsa sebep
+    """
+    known = KNOWN_WRAPPERS.get(wrapper.name, {})
+    binary = wrapper.argv[0]
+    resolved = shutil.which(binary)
+    if not resolved:
+        if known.get("binary_optional"):
+            # Sadece ortam değişkenleriyle uygulanır
+            wrapper.argv = []
+            return None
+        return f"{binary} bulunamadı"
+
+    if wrapper.name == "nice":
+        try:
+            level = int(wrapper.argv[2])
+        except (IndexError, ValueError):
+            return f"geçersiz nice değeri: {wrapper.spec}"
+        if not -20 <= level <= 19:
+            return f"nice değeri -20..19 aralığında olmalı: {level}"
+        if not _nice_allowed(level):
+            return f"nice {level} için yetki yok (RLIMIT_NICE)"
+    elif wrapper.name == "taskset":
+        try:
+            cpus = parse_cpu_list(wrapper.argv[2])
+        except (IndexError, ValueError):
+            return f"geçersiz CPU listesi: {wrapper.spec}"
+        allowed = os.sched_getaffinity(0) if hasattr(os, "sched_getaffinity") else set(cpus)
+        if not cpus or not set(cpus) <= allowed:
+            return f"CPU listesi kullanılamaz: {wrapper.argv[2]}"
+    return None
+
+
+def detect_wrappers() -> Dict[str, bool]:
+    """Bilinen sarmalayıcılardan hangileri kurulu"""
+    return {name: bool(shutil.which(info["binary"])) for name, info in KNOWN_WRAPPERS.items()}
+
+
+def wrapper_specs(config: Dict) -> List[str]:
+    """Config'teki sarmalayıcı listesi; "auto" ise kurulu olan AUTO_WRAPPERS"""
+    specs = config.get("launch_wrappers", WRAPPER_AUTO)
+    if specs == WRAPPER_AUTO:
+        available = detect_wrappers()
+        return [name for name in AUTO_WRAPPERS if available.get(name)]
+    return list(specs or [])
+
+
+def resolve_chain(config: Dict) -> WrapperChain:
+    """Config'teki sarmalayıcıları çöz ve doğrula; geçersizler sebebiyle atlanır"""
+    chain = WrapperChain()
+    for spec in wrapper_specs(config):
+        try:
+            wrapper = parse_wrapper(spec)
+        except ValueError as e:
+            chain.skipped.append((spec, str(e)))
+            continue
+        problem = validate_wrapper(wrapper)
+        if problem:
+            chain.skipped.append((spec, problem))
+        else:
+            chain.wrappers.append(wrapper)
+    return chain
+
+
+class WrapperProbe:
+    """
+    Sarmalayıcı zincirinin kendi başlatma maliyeti
+
+    Zincir 'true' komutuyla çalıştırılıp doğrudan 'true' ile karşılaştırılır;
+    sonuç zincirin argv'si ve ikililerin mtime'ına göre önbelleğe alınır.
+    """
+
+    RUNS = 3
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = Path(cache_file)
+        self._cache: Dict[str, Dict] = {}
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, 'r') as f:
+                    self._cache = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._cache = {}
+
+    def _save(self):
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, 'w') as f:
+                json.dump(self._cache, f)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _stamp(chain: WrapperChain) -> List:
+        stamp = []
+        for wrapper in chain.wrappers:
+            if not wrapper.argv:
+                continue
+            path = shutil.which(wrapper.argv[0])
+            try:
+                stamp.append([path, os.stat(path).st_mtime])
+            except (OSError, TypeError):
+                stamp.append([wrapper.argv[0], None])
+        return stamp
+
+    def _run_ms(self, command: List[str], env: Dict[str, str]) -> Optional[float]:
+        best = None
+        for _ in range(self.RUNS):
+            start = time.perf_counter()
+            try:
+                subprocess.run(command, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
+            except (OSError, subprocess.SubprocessError):
+                return None
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best
+
+    def overhead_ms(self, chain: WrapperChain, refresh: bool = False) -> Optional[float]:
+        """
+        Zincirin 'true' üzerine eklediği süre (ms)
+
+        Returns:
+            Boş zincirde 0, ölçülemezse None
+        """
+        if not any(wrapper.argv for wrapper in chain.wrappers):
+            return 0.0
+        true_path = shutil.which("true")
+        if not true_path:
+            return None
+
+        key = " ".join(chain.apply([]))
+        stamp = self._stamp(chain)
+        entry = self._cache.get(key)
+        if entry and entry.get("stamp") == stamp and not refresh:
+            return entry["overhead_ms"]
+
+        env = dict(os.environ)
+        env.update(chain.environment())
+        baseline = self._run_ms([true_path], env)
+        wrapped = self._run_ms(chain.apply([true_path]), env)
+        if baseline is None or wrapped is None:
+            return None
+        overhead = round(max(0.0, wrapped - baseline), 1)
+        self._cache[key] = {"stamp": stamp, "overhead_ms": overhead, "measured_at": time.time()}
+        self._save()
+        return overhead
+
+
+__all__ = [
+    'WRAPPER_AUTO', 'KNOWN_WRAPPERS', 'AUTO_WRAPPERS', 'Wrapper', 'WrapperChain', 'parse_wrapper',
+    'validate_wrapper', 'detect_wrappers', 'wrapper_specs', 'resolve_chain', 'WrapperProbe'
+]
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Log Classifier
+error_rules.json'daki kuralları sabit parça taraması + tek birleşik regex
+olarak derle; oyun logunu LogFollower'dan blok blok alıp sınıflandırmaları
+oyun çalışırken olay olarak bildir
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+RULES_FILE = "error_rules.json"
+
+# Kural başına saklanan örnek satır sayısı ve uzunluğu - bellek logun boyutundan bağımsız
+MAX_EXAMPLES = 3
+MAX_EXAMPLE_LENGTH = 500
+
+READ_BLOCK_SIZE = 64 * 1024
+
+# Hata ekranında gösterilen log sonu
+TAIL_BYTES = 256 * 1024
+
+SEVERITY_ORDER = {"fatal": 0, "error": 1, "warning": 2}
+
+
+class ErrorRule:
+    """Tek sınıflandırma kuralı"""
+
+    def __init__(self, rule_id: str, pattern: str, message: str, category: str = "", severity: str = "error",
+                 solutions: List[str] = None):
+        self.id = rule_id
+        self.pattern = pattern
+        self.message = message
+        self.category = category
+        self.severity = severity
+        self.solutions = solutions or []
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ErrorRule":
+        return cls(data["id"], data["pattern"], data.get("message", data["id"]), data.get("category", ""),
+                   data.get("severity", "error"), data.get("solutions"))
+
+
+def rule_files(user_dir: Path = None) -> List[Path]:
+    """
+    Kural dosyaları, yüklenme sırasıyla
+
+    Modülün yanındaki (ya da kurulumda share/ altına kopyalanan) dosya önce,
+    kullanıcının ~/.berke_minecraft_launcher/error_rules.json dosyası sonra
+    okunur; aynı id'li kural sonrakiyle değişir.
+    """
+    files = []
+    bundled = Path(__file__).with_name(RULES_FILE)
+    installed = Path(sys.prefix) / "share" / "berke-minecraft-launcher" / RULES_FILE
+    files.append(bundled if bundled.exists() else installed)
+    if user_dir:
+        files.append(Path(user_dir) / RULES_FILE)
+    return files
+
+
+def load_rules(files: List[Path]) -> List[ErrorRule]:
+    """
+    Kuralları yükle
+
+    Okunamayan dosyalar ve derlenemeyen kalıplar atlanır; tek bir bozuk
+    kullanıcı kuralı sınıflandırıcıyı durdurmasın.
+    """
+    rules: Dict[str, ErrorRule] = {}
+    for path in files:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue
+        for entry in data.get("rules", []):
+            try:
+                rule = ErrorRule.from_dict(entry)
+                re.compile(rule.pattern)
+            except (KeyError, TypeError, re.error):
+                continue
+            rules[rule.id] = rule
+    return list(rules.values())
+
+
+def required_literals(pattern: str) -> Optional[List[str]]:
+    """
+    Kalıbın eşleştiği her satırda bulunması gereken sabit parçalar
+
+    Yalnız düz metin, kaçışlı noktalama ('\\.'), '.', '.*', '.+' ve üst düzey '|'
+    içeren kalıplar çözülür: her daldan en uzun sabit parça alınır. Başka
+    regex sözdizimi varsa None (kural her satırda regex ile denenir).
+    """
+    keywords = []
+    for branch in _split_branches(pattern):
+        if branch is None:
+            return None
+        longest = max(branch, key=len, default="")
+        if not longest:
+            return None
+        if longest.lower() not in keywords:
+            keywords.append(longest.lower())
+    return keywords or None
+
+
+def _split_branches(pattern: str):
+    """'a.*b|c' -> [['a', 'b'], ['c']]; desteklenmeyen sözdiziminde dal yerine None"""
+    branches = []
+    pieces, current = [], ""
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == "\\":
+            if i + 1 >= len(pattern) or pattern[i + 1].isalnum():
+                return [None]
+            current += pattern[i + 1]
+            i += 2
+            continue
+        if char == "|":
+            branches.append(pieces + [current])
+            pieces, current = [], ""
+        elif char == ".":
+            pieces.append(current)
+            current = ""
+            if i + 1 < len(pattern) and pattern[i + 1] in "*+":
+                i += 1
+        elif char in "^$*+?{}[]()":
+            return [None]
+        else:
+            current += char
+        i += 1
+    branches.append(pieces + [current])
+    return branches
+
+
+def compile_rules(rules: List[ErrorRule]):
+    """
+    Tüm kuralları tek regex'e derle: (?P<r0>...)|(?P<r1>...)|...
+
+    Returns:
+        (derlenmiş regex ya da kural yoksa None, grup adı -> kural)
+    """
+    if not rules:
+        return None, {}
+    by_group = {f"r{i}": rule for i, rule in enumerate(rules)}
+    combined = "|".join(f"(?P<{group}>{rule.pattern})" for group, rule in by_group.items())
+    return re.compile(combined, re.IGNORECASE), by_group
+
+
+class LogClassifier:
+    """
+    Satır ya da blok halinde beslenen çok kalıplı sınıflandırıcı
+
+    İki aşama: kuralların sabit parçaları küçük harfe çevrilmiş blokta
+    str.find ile aranır (C hızında, satır başına Python çağrısı yok); yalnız
+    aday satırlar birleşik regex'ten geçer. Sabit parçası çıkarılamayan
+    kurallar blok üzerinde kendi regex'leriyle aranır. Eşleşmeler dinleyicilere
+    anında olay olarak gider; kural başına sayaç ve birkaç örnek satır
+    tutulur, bu yüzden bellek logun boyutuyla büyümez.
+    """
+
+    def __init__(self, rules: List[ErrorRule] = None):
+        self.rules = rules if rules is not None else load_rules(rule_files())
+        self._regex, self._by_group = compile_rules(self.rules)
+        self._keywords: List[str] = []
+        unindexed = []
+        for rule in self.rules:
+            literals = required_literals(rule.pattern)
+            if literals is None:
+                unindexed.append(rule.pattern)
+            else:
+                self._keywords += [k for k in literals if k not in self._keywords]
+        self._unindexed = re.compile("|".join(f"(?:{p})" for p in unindexed), re.IGNORECASE) if unindexed else None
+        self.lines = 0
+        self._counts: Dict[str, int] = {}
+        self._first_line: Dict[str, int] = {}
+        self._examples: Dict[str, List[str]] = {}
+        self._listeners: List[Callable[[Dict], None]] = []
+        self._lock = threading.Lock()
+
+    def add_listener(self, callback: Callable[[Dict], None]):
+        """Kural ilk kez eşleştiğinde olayla çağrılır: {"rule", "message", "severity", "category", "line", "line_no"}"""
+        self._listeners.append(callback)
+
+    def feed(self, line: str):
+        """Tek satırı sınıflandır (LogFollower.subscribe)"""
+        self.feed_block(line)
+
+    def feed_block(self, text: str):
+        """'\\n' ile ayrılmış satırları sınıflandır (LogFollower.subscribe_block)"""
+        base = self.lines
+        self.lines += text.count("\n") + 1
+        if self._regex is None:
+            return
+        lowered = text.lower()
+        positions = []
+        for keyword in self._keywords:
+            start = lowered.find(keyword)
+            while start >= 0:
+                positions.append(start)
+                # Aynı satırda tekrar aramaya gerek yok
+                line_end = lowered.find("\n", start)
+                if line_end < 0:
+                    break
+                start = lowered.find(keyword, line_end)
+        if self._unindexed:
+            positions += [match.start() for match in self._unindexed.finditer(lowered)]
+        if not positions:
+            return
+
+        # Aday konumları satır numarasına çevir (bloğu tek geçişte sayarak)
+        candidates = []
+        line_index, counted_to = 0, 0
+        for position in sorted(positions):
+            line_index += lowered.count("\n", counted_to, position)
+            counted_to = position
+            if not candidates or candidates[-1] != line_index:
+                candidates.append(line_index)
+        # lower() bazı karakterlerin uzunluğunu değiştirebilir (ör. 'İ'); satırlar asıl metinden alınır
+        lines = text.split("\n")
+        for index in candidates:
+            line = lines[index].rstrip("\r")
+            matched = []
+            for match in self._regex.finditer(line):
+                rule = self._by_group[match.lastgroup]
+                if rule not in matched:
+                    matched.append(rule)
+            if matched:
+                self._record(matched, line, base + index + 1)
+
+    def _record(self, rules: List[ErrorRule], line: str, line_no: int):
+        new_rules = []
+        with self._lock:
+            for rule in rules:
+                count = self._counts.get(rule.id, 0)
+                self._counts[rule.id] = count + 1
+                if not count:
+                    self._first_line[rule.id] = line_no
+                    new_rules.append(rule)
+                examples = self._examples.setdefault(rule.id, [])
+                if len(examples) < MAX_EXAMPLES:
+                    examples.append(line[:MAX_EXAMPLE_LENGTH])
+        for rule in new_rules:
+            event = {"rule": rule.id, "message": rule.message, "severity": rule.severity, "category": rule.category,
+                     "line": line[:MAX_EXAMPLE_LENGTH], "line_no": line_no}
+            for callback in self._listeners:
+                try:
+                    callback(event)
+                except Exception:
+                    pass
+
+    def detections(self) -> List[Dict]:
+        """Eşleşen kurallar (önem ve ilk görülme sırasına göre)"""
+        with self._lock:
+            found = [{"rule": rule, "count": self._counts[rule.id], "first_line": self._first_line[rule.id],
+                      "examples": list(self._examples.get(rule.id, []))}
+                     for rule in self.rules if rule.id in self._counts]
+        found.sort(key=lambda d: (SEVERITY_ORDER.get(d["rule"].severity, 3), d["first_line"]))
+        return found
+
+    def messages(self) -> List[str]:
+        return [d["rule"].message for d in self.detections()]
+
+    def solutions(self, limit: int = 8) -> List[str]:
+        """Eşleşen kuralların çözüm önerileri (tekrarsız)"""
+        result = []
+        for detection in self.detections():
+            for solution in detection["rule"].solutions:
+                if solution not in result:
+                    result.append(solution)
+        return result[:limit]
+
+    def counts(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._counts)
+
+
+def classify_file(log_path: Path, classifier: LogClassifier = None) -> LogClassifier:
+    """Logu satır satır (sabit bellekle) sınıflandır"""
+    classifier = classifier or LogClassifier()
+    with open(log_path, 'r', errors='replace') as f:
+        partial = ""
+        while True:
+            block = f.read(READ_BLOCK_SIZE)
+            if not block:
+                break
+            block = partial + block
+            end = block.rfind("\n")
+            if end < 0:
+                partial = block
+                continue
+            classifier.feed_block(block[:end])
+            partial = block[end + 1:]
+        if partial:
+            classifier.feed_block(partial)
+    return classifier
+
+
+def read_tail(log_path: Path, max_bytes: int = TAIL_BYTES) -> str:
+    """Logun son max_bytes baytı (ilk yarım satır atılır)"""
+    with open(log_path, 'rb') as f:
+        size = f.seek(0, os.SEEK_END)
+        start = max(0, size - max_bytes)
+        f.seek(start)
+        data = f.read()
+    if start:
+        data = data.split(b"\n", 1)[-1]
+    return data.decode('utf-8', errors='replace')
+
+
+__all__ = [
+    'RULES_FILE', 'MAX_EXAMPLES', 'TAIL_BYTES', 'ErrorRule', 'rule_files', 'load_rules', 'required_literals',
+    'compile_rules',
+    'LogClassifier', 'classify_file', 'read_tail'
+]
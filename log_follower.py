@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Log Follower
+Oyun logunu inotify ile artımlı takip et, satırları abonelere dağıt ve
+başlatma durumunu (hazır / hata / kapandı) olay olarak bildir
+"""
+
+import ctypes
+import ctypes.util
+import os
+import re
+import select
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+# inotify sabitleri (linux/inotify.h)
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+
+# Tek satır için üst sınır - satır sonu gelmezse bellek sabit kalsın
+MAX_LINE_LENGTH = 1024 * 1024
+READ_CHUNK_SIZE = 64 * 1024
+
+# Oyunun hazır olduğunu gösteren satırlar
+READY_PATTERNS = [
+    r"Backend library: LWJGL version",
+    r"LWJGL Version: ",
+    r"Sound engine started",
+    r"OpenAL initialized",
+    r"Created: \d+x\d+x\d+ minecraft:textures/atlas/",
+]
+
+# Başlatmanın başarısız olduğunu gösteren satırlar
+FAILURE_PATTERNS = [
+    r"Error: Could not create the Java Virtual Machine",
+    r"Error: Could not find or load main class",
+    r"Error: A JNI error has occurred",
+    r"Exception in thread \"main\"",
+    r"UnsupportedClassVersionError",
+    r"A fatal error has been detected by the Java Runtime Environment",
+    r"java\.lang\.OutOfMemoryError",
+    r"---- Minecraft Crash Report ----",
+    r"Failed to start the minecraft server",
+    r"Invalid maximum heap size",
+    r"Unrecognized VM option",
+]
+
+# Başlatma durumları
+STATE_STARTING = "starting"
+STATE_READY = "ready"
+STATE_FAILED = "failed"
+STATE_EXITED = "exited"
+STATE_TIMEOUT = "timeout"
+
+
+class _Inotify:
+    """libc inotify için küçük ctypes sarmalayıcı"""
+
+    def __init__(self, path: Path):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc bulunamadı")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 başarısız")
+        watch = libc.inotify_add_watch(self.fd, os.fsencode(str(path)), _IN_MODIFY | _IN_CLOSE_WRITE)
+        if watch < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch başarısız")
+
+    def wait(self, timeout: float) -> bool:
+        """Dosya değişene ya da süre dolana kadar bekle"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            # Olayların içeriği önemli değil, kuyruğu boşalt
+            while os.read(self.fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self):
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+class LogFollower:
+    """
+    Log dosyasını sabit bellekle takip eder
+
+    Linux'ta inotify kullanılır, olmazsa kısa aralıklı yoklamaya düşülür.
+    Süreç kapandığında dosyanın kalanı okunup takip sonlandırılır.
+    """
+
+    def __init__(self, log_path: Path, is_alive: Callable[[], bool] = None, poll_interval: float = 0.25):
+        self.log_path = Path(log_path)
+        self.is_alive = is_alive or (lambda: True)
+        self.poll_interval = poll_interval
+        self.lines_read = 0
+        self.last_line_at: Optional[float] = None
+        self.using_inotify = False
+        self._subscribers: List[Callable[[str], None]] = []
+        self._block_subscribers: List[Callable[[str], None]] = []
+        self._eof_callbacks: List[Callable[[], None]] = []
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[str], None]):
+        """Her yeni satır için çağrılacak fonksiyonu ekle"""
+        with self._lock:
+            self._subscribers.append(callback)
+
+    def subscribe_block(self, callback: Callable[[str], None]):
+        """
+        Tamamlanmış satırları okunan blok halinde alacak fonksiyonu ekle
+
+        Metin "\n" ile ayrılmış bir ya da daha çok satırdır (sonda satır sonu
+        yok); büyük loglarda satır başına çağrı maliyetinden kaçınılır.
+        """
+        with self._lock:
+            self._block_subscribers.append(callback)
+
+    def on_eof(self, callback: Callable[[], None]):
+        """Süreç kapanıp log bittiğinde çağrılacak fonksiyonu ekle"""
+        with self._lock:
+            self._eof_callbacks.append(callback)
+
+    def start(self):
+        """Takibi arka planda başlat"""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Takibi durdur"""
+        self._stop.set()
+
+    def join(self, timeout: float = None):
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _dispatch(self, text: str):
+        """Bir ya da daha çok satırı (\n ile ayrılmış) abonelere dağıt"""
+        self.lines_read += text.count("\n") + 1
+        self.last_line_at = time.monotonic()
+        with self._lock:
+            subscribers = list(self._subscribers)
+            block_subscribers = list(self._block_subscribers)
+        if subscribers:
+            for line in text.split("\n"):
+                line = line.rstrip("\r")
+                for callback in subscribers:
+                    try:
+                        callback(line)
+                    except Exception:
+                        # Bir abonenin hatası diğerlerini durdurmasın
+                        pass
+        for callback in block_subscribers:
+            try:
+                callback(text)
+            except Exception:
+                pass
+
+    def _run(self):
+        notifier = None
+        try:
+            notifier = _Inotify(self.log_path)
+            self.using_inotify = True
+        except (OSError, AttributeError):
+            notifier = None
+
+        partial = b""
+        try:
+            with open(self.log_path, 'rb') as f:
+                while not self._stop.is_set():
+                    chunk = f.read(READ_CHUNK_SIZE)
+                    if chunk:
+                        partial = self._consume(partial + chunk)
+                        continue
+
+                    # Dosyanın sonundayız: süreç kapandıysa son kez oku ve çık
+                    if not self.is_alive():
+                        chunk = f.read()
+                        partial = self._consume(partial + chunk) if chunk else partial
+                        break
+
+                    if notifier:
+                        notifier.wait(self.poll_interval)
+                    else:
+                        time.sleep(self.poll_interval)
+
+            if partial:
+                self._dispatch(partial.decode('utf-8', errors='replace'))
+        except OSError:
+            pass
+        finally:
+            if notifier:
+                notifier.close()
+            with self._lock:
+                callbacks = list(self._eof_callbacks)
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception:
+                    pass
+
+    def _consume(self, data: bytes) -> bytes:
+        """Tamamlanmış satırları dağıt, yarım kalan kısmı döndür"""
+        end = data.rfind(b"\n")
+        if end >= 0:
+            # Blok satır sonunda bölündüğü için UTF-8 karakteri ikiye ayrılmaz
+            self._dispatch(data[:end].decode('utf-8', errors='replace'))
+        partial = data[end + 1:]
+        if len(partial) > MAX_LINE_LENGTH:
+            self._dispatch(partial.decode('utf-8', errors='replace'))
+            partial = b""
+        return partial
+
+
+class LaunchStateWatcher:
+    """Log satırları ve süreç çıkışından başlatma durumunu çıkarır"""
+
+    def __init__(self, process, ready_patterns: List[str] = None, failure_patterns: List[str] = None):
+        self.process = process
+        self.state = STATE_STARTING
+        self.reason = ""
+        self.exit_code: Optional[int] = None
+        self._ready_re = re.compile("|".join(ready_patterns or READY_PATTERNS))
+        self._failure_re = re.compile("|".join(failure_patterns or FAILURE_PATTERNS))
+        self._changed = threading.Event()
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[str, str], None]] = []
+
+        # Süreç çıkışını anında yakala
+        threading.Thread(target=self._wait_process, daemon=True).start()
+
+    def add_listener(self, callback: Callable[[str, str], None]):
+        """Durum değiştiğinde (durum, sebep) ile çağrılır"""
+        self._listeners.append(callback)
+
+    def _set_state(self, state: str, reason: str):
+        with self._lock:
+            # Hata ve çıkış, hazır durumunun üzerine yazılabilir; tersi olmaz.
+            # Süreç çıktıktan sonra okunan hata satırı yine de sebep olarak alınır.
+            if self.state == STATE_FAILED:
+                return
+            if self.state == STATE_EXITED and state != STATE_FAILED:
+                return
+            if self.state == STATE_READY and state == STATE_READY:
+                return
+            self.state = state
+            self.reason = reason
+        self._changed.set()
+        for callback in list(self._listeners):
+            try:
+                callback(state, reason)
+            except Exception:
+                pass
+
+    def _wait_process(self):
+        self.exit_code = self.process.wait()
+        self._set_state(STATE_EXITED, f"Süreç kapandı (kod: {self.exit_code})")
+
+    def feed(self, line: str):
+        """Log satırını değerlendir"""
+        if self.state == STATE_FAILED:
+            return
+        if self._failure_re.search(line):
+            self._set_state(STATE_FAILED, line.strip()[:200])
+        elif self.state == STATE_STARTING and self._ready_re.search(line):
+            self._set_state(STATE_READY, line.strip()[:200])
+
+    def wait(self, timeout: float) -> str:
+        """
+        Durum belli olana kadar bekle
+
+        Returns:
+            ready, failed, exited ya da timeout
+        """
+        if self._changed.wait(timeout):
+            return self.state
+        return STATE_TIMEOUT
+
+    def wait_for_exit(self, timeout: float) -> Optional[int]:
+        """Hata sonrası logun yazılması için sürecin kapanmasını kısa süre bekle"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and self.process.poll() is None:
+            time.sleep(0.05)
+        return self.process.poll()
+
+
+__all__ = [
+    'READY_PATTERNS', 'FAILURE_PATTERNS',
+    'STATE_STARTING', 'STATE_READY', 'STATE_FAILED', 'STATE_EXITED', 'STATE_TIMEOUT',
+    'LogFollower', 'LaunchStateWatcher'
+]
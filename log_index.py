@@ -0,0 +1,614 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Log Index
+Başlatma logları ve crash-reports/ altındaki çökme raporları için artımlı
+SQLite FTS5 dizini: metin satır blokları halinde, sürüm/yükleyici/tarih/çıkış
+kodu/Java/mod sayısı ayrı tabloda; arama önce metadata ile süzülür
+"""
+
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from classpath_builder import load_version_chain
+from heap_sizing import detect_loader
+
+INDEX_FILE = "log_index.sqlite"
+SCHEMA_VERSION = 1
+
+KIND_LOG = "log"
+KIND_CRASH = "crash"
+
+# FTS satırı başına log satırı/bayt sınırı: küçük bloklar eşleşen satırı hızlı bulur
+CHUNK_LINES = 50
+CHUNK_BYTES = 16 * 1024
+READ_BLOCK_SIZE = 1024 * 1024
+
+# Dosya başına dizinlenen en çok bayt (çok büyük loglar diski doldurmasın)
+MAX_INDEX_BYTES = 64 * 1024 * 1024
+
+# Son yarım satır, dosya bu kadar süredir değişmediyse dizine alınır
+SETTLE_SECONDS = 60
+
+DEFAULT_INTERVAL = 30.0
+
+# Eşleşmeleri satır içinde işaretlemek için (logda bulunmayan) kontrol karakterleri
+_MARK_OPEN = "\x02"
+_MARK_CLOSE = "\x03"
+
+_LOG_NAME_RE = re.compile(r'^minecraft_(.+)_(\d{8}_\d{6})\.log$')
+_CRASH_NAME_RE = re.compile(r'^crash-(\d{4}-\d{2}-\d{2}_\d{2}\.\d{2}\.\d{2})')
+_GAME_VERSION_RE = re.compile(r'\d+\.\d+(?:\.\d+)?(?:-(?:pre|rc)\d+)?|\d{2}w\d{2}[a-z]')
+_FTS_SYNTAX_RE = re.compile(r'"|\*|\^|\b(?:AND|OR|NOT|NEAR)\b')
+_RELATIVE_TIME_RE = re.compile(r'^(\d+)\s*([hdwm])$')
+
+_CRASH_FIELDS = {
+    "Minecraft Version": "game_version",
+    "Java Version": "java_version",
+}
+_BRAND_RE = re.compile(r"brand changed to '([^']+)'", re.IGNORECASE)
+
+METADATA_COLUMNS = ["version", "game_version", "loader", "instance", "started_at", "exit_code", "java_version",
+                    "mod_count"]
+
+_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS documents (
+        id INTEGER PRIMARY KEY,
+        path TEXT NOT NULL UNIQUE,
+        kind TEXT NOT NULL,
+        version TEXT,
+        game_version TEXT,
+        loader TEXT,
+        instance TEXT,
+        started_at REAL,
+        exit_code INTEGER,
+        java_version TEXT,
+        mod_count INTEGER,
+        size INTEGER NOT NULL DEFAULT 0,
+        mtime REAL NOT NULL DEFAULT 0,
+        indexed_bytes INTEGER NOT NULL DEFAULT 0,
+        lines INTEGER NOT NULL DEFAULT 0,
+        chunk_count INTEGER NOT NULL DEFAULT 0
+    )""",
+    "CREATE INDEX IF NOT EXISTS documents_game_version ON documents (game_version, loader, started_at)",
+    "CREATE INDEX IF NOT EXISTS documents_started_at ON documents (started_at)",
+    # rowid = doc_id << 32 | blok no: belgenin blokları rowid aralığıyla silinir/bulunur
+    "CREATE VIRTUAL TABLE IF NOT EXISTS chunks USING fts5(content, first_line UNINDEXED)",
+]
+
+
+def fts_available() -> bool:
+    """SQLite FTS5 ile derlenmiş mi"""
+    try:
+        with sqlite3.connect(":memory:") as conn:
+            conn.execute("CREATE VIRTUAL TABLE t USING fts5(x)")
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def fts_query(text: str) -> str:
+    """
+    Kullanıcı sorgusunu FTS5 sorgusuna çevir
+
+    Tırnak, *, AND/OR/NOT/NEAR içeren sorgular olduğu gibi geçer; yoksa her
+    kelime tırnaklanır (java.lang.OutOfMemoryError tek ifade olarak aranır,
+    kelimeler arasında VE).
+    """
+    text = text.strip()
+    if _FTS_SYNTAX_RE.search(text):
+        return text
+    return " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
+
+
+def parse_time(text: str, now: float = None) -> float:
+    """
+    '30d', '2w', '12h', '3m' (ay = 30 gün) ya da 'YYYY-MM-DD' -> epoch saniye
+
+    Raises:
+        ValueError: Tanınmayan biçim
+    """
+    now = time.time() if now is None else now
+    text = text.strip().lower()
+    match = _RELATIVE_TIME_RE.match(text)
+    if match:
+        unit = {"h": 3600, "d": 86400, "w": 7 * 86400, "m": 30 * 86400}[match.group(2)]
+        return now - int(match.group(1)) * unit
+    try:
+        return time.mktime(time.strptime(text, "%Y-%m-%d"))
+    except ValueError:
+        raise ValueError(f"Tarih anlaşılamadı: {text} (30d, 2w, 12h ya da YYYY-AA-GG)")
+
+
+def version_resolver(search_dirs: List[Path]) -> Callable[[str], Optional[Tuple[str, str]]]:
+    """
+    Sürüm kimliği -> (oyun sürümü, yükleyici)
+
+    Kurulu sürümün inheritsFrom zinciri kullanılır; JSON'u yoksa (sürüm
+    silinmiş) kimlikten tahmin edilir. Sonuçlar önbellekte tutulur.
+    """
+    cache: Dict[str, Optional[Tuple[str, str]]] = {}
+
+    def resolve(version_id: str) -> Optional[Tuple[str, str]]:
+        if version_id not in cache:
+            try:
+                chain = load_version_chain(version_id, search_dirs)
+                cache[version_id] = (chain[-1].get("id", version_id), detect_loader(chain))
+            except (OSError, ValueError):
+                cache[version_id] = None
+        return cache[version_id]
+
+    return resolve
+
+
+def guess_version(version_id: str) -> Tuple[Optional[str], str]:
+    """Kurulu olmayan sürüm kimliğinden (oyun sürümü, yükleyici) tahmini"""
+    # fabric-loader-0.15.0-1.20.1 gibi kimliklerde yükleyici sürümü de eşleşir; 1.x tercih edilir
+    found = _GAME_VERSION_RE.findall(version_id)
+    game_version = next((v for v in found if v.startswith("1.")), found[0] if found else None)
+    return game_version, detect_loader([{"id": version_id}])
+
+
+def log_sources(logs_dir: Path, game_dirs: Dict[str, Path]) -> List[Tuple[Path, str, Optional[str]]]:
+    """
+    Dizinlenecek dosyalar: (yol, tür, instance)
+
+    Args:
+        logs_dir: Launcher'ın minecraft_<sürüm>_<zaman>.log dosyaları
+        game_dirs: instance adı -> oyun dizini (crash-reports/ burada aranır)
+    """
+    sources = []
+    logs_dir = Path(logs_dir)
+    if logs_dir.is_dir():
+        sources += [(path, KIND_LOG, None) for path in sorted(logs_dir.glob("minecraft_*.log"))]
+    for instance, game_dir in game_dirs.items():
+        crash_dir = Path(game_dir) / "crash-reports"
+        if crash_dir.is_dir():
+            sources += [(path, KIND_CRASH, instance) for path in sorted(crash_dir.glob("crash-*.txt"))]
+    return sources
+
+
+def parse_crash_header(text: str) -> Dict:
+    """Çökme raporunun sistem bölümünden sürüm, Java, yükleyici ve mod sayısı"""
+    meta: Dict = {}
+    mod_count = None
+    counting = False
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if counting:
+            # Mod listesi iki sekme girintili satırlardan oluşur
+            if line.startswith("\t\t") and stripped:
+                mod_count += 1
+                continue
+            counting = False
+        key, _, value = stripped.partition(":")
+        if key in _CRASH_FIELDS and value.strip() and _CRASH_FIELDS[key] not in meta:
+            value = value.strip()
+            meta[_CRASH_FIELDS[key]] = value.split(",")[0].strip() if key == "Java Version" else value
+        elif key in ("Fabric Mods", "Mod List") and mod_count is None:
+            mod_count, counting = 0, True
+        elif key == "Is Modded" and "loader" not in meta:
+            brand = _BRAND_RE.search(value)
+            if brand:
+                meta["loader"] = detect_loader([{"id": brand.group(1)}])
+            elif value.strip().lower().startswith("probably not"):
+                meta["loader"] = detect_loader([])
+    if mod_count is not None:
+        meta["mod_count"] = mod_count
+    if meta.get("game_version"):
+        meta["version"] = meta["game_version"]
+    return meta
+
+
+def _marked_line(highlighted: str, first_line: int) -> Tuple[int, str, List[Tuple[int, int]]]:
+    """highlight() çıktısından ilk eşleşen satır: (satır no, metin, [(başlangıç, bitiş)])"""
+    start = highlighted.find(_MARK_OPEN)
+    if start < 0:
+        return first_line, highlighted.split("\n", 1)[0], []
+    line_start = highlighted.rfind("\n", 0, start) + 1
+    line_end = highlighted.find("\n", start)
+    raw = highlighted[line_start:] if line_end < 0 else highlighted[line_start:line_end]
+    line_no = first_line + highlighted.count("\n", 0, line_start)
+    text, spans, open_at = "", [], None
+    for char in raw:
+        if char == _MARK_OPEN:
+            open_at = len(text)
+        elif char == _MARK_CLOSE:
+            if open_at is not None:
+                spans.append((open_at, len(text)))
+            open_at = None
+        else:
+            text += char
+    return line_no, text.rstrip("\r"), spans
+
+
+class LogIndex:
+    """
+    Log ve çökme raporlarının tam metin dizini
+
+    Her dosya kaldığı bayttan devam edilerek dizinlenir; küçülen ya da
+    yeniden yazılan dosya baştan alınır, silinen dosyanın kayıtları düşer.
+    Metadata başlatma geçmişinden (log_file eşleşmesi), yoksa dosya adından
+    ve sürüm zincirinden gelir. Okuma ve yazma ayrı bağlantılarla yapılır
+    (WAL), arka plan dizinleyici aramaları bekletmez.
+    """
+
+    def __init__(self, db_path: Path, history=None, resolver: Callable[[str], Optional[Tuple[str, str]]] = None):
+        self.db_path = Path(db_path)
+        self.history = history
+        self.resolver = resolver or (lambda version_id: None)
+        self._history_stamp = None
+        self._history_by_log: Dict[str, Dict] = {}
+        self._update_lock = threading.Lock()
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.row_factory = sqlite3.Row
+        if not self._ready:
+            self._create_schema(conn)
+            self._ready = True
+        return conn
+
+    def _create_schema(self, conn: sqlite3.Connection):
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            conn.execute("DROP TABLE IF EXISTS chunks")
+            conn.execute("DROP TABLE IF EXISTS documents")
+        conn.execute("PRAGMA journal_mode=WAL")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        conn.commit()
+
+    def _history_meta(self) -> Dict[str, Dict]:
+        """log_file -> başlatma kaydının meta'sı (geçmiş dosyası değiştiyse yeniden okunur)"""
+        if self.history is None:
+            return {}
+        try:
+            stat = self.history.history_file.stat()
+            stamp = (stat.st_size, stat.st_mtime)
+        except OSError:
+            return {}
+        if stamp != self._history_stamp:
+            by_log = {}
+            for record in self.history.load(limit=0):
+                meta = record.get("meta", {})
+                if meta.get("log_file"):
+                    by_log[meta["log_file"]] = dict(meta, version=record.get("version"),
+                                                    started_at=record.get("started_at"))
+            self._history_by_log = by_log
+            self._history_stamp = stamp
+        return self._history_by_log
+
+    def _log_metadata(self, path: Path, history: Dict[str, Dict]) -> Dict:
+        """Launcher logunun metadata'sı: önce geçmiş kaydı, sonra dosya adı"""
+        meta: Dict = {}
+        match = _LOG_NAME_RE.match(path.name)
+        if match:
+            try:
+                meta["started_at"] = time.mktime(time.strptime(match.group(2), "%Y%m%d_%H%M%S"))
+            except ValueError:
+                pass
+            name = match.group(1)
+            meta["version"] = name
+            # minecraft_<instance>_<sürüm>_...: sürüm olarak çözülen ilk son ek
+            if not self.resolver(name):
+                for i, char in enumerate(name):
+                    if char == "_" and self.resolver(name[i + 1:]):
+                        meta["instance"], meta["version"] = name[:i], name[i + 1:]
+                        break
+
+        record = history.get(str(path))
+        if record:
+            for key in ("version", "instance", "started_at", "exit_code", "java_version", "mod_count"):
+                if record.get(key) is not None:
+                    meta[key] = record[key]
+
+        if meta.get("version"):
+            resolved = self.resolver(meta["version"]) or guess_version(meta["version"])
+            meta["game_version"], meta["loader"] = resolved
+        return meta
+
+    def update(self, sources: List[Tuple[Path, str, Optional[str]]]) -> Dict:
+        """
+        Dizini dosyalarla eşitle
+
+        Returns:
+            {"files": dizinlenen dosya, "bytes": okunan bayt, "removed": düşen belge, "seconds": süre}
+        """
+        started = time.monotonic()
+        report = {"files": 0, "bytes": 0, "removed": 0}
+        with self._update_lock:
+            history = self._history_meta()
+            conn = self._connect()
+            try:
+                known = {row["path"]: row for row in conn.execute("SELECT * FROM documents")}
+                seen = set()
+                for path, kind, instance in sources:
+                    key = str(path)
+                    seen.add(key)
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    row = known.get(key)
+                    meta = self._log_metadata(path, history) if kind == KIND_LOG else {}
+                    if instance and not meta.get("instance"):
+                        meta["instance"] = instance
+                    if row is not None:
+                        self._merge_metadata(conn, row, meta)
+                        # Boyut değişmese de bekletilen son satır dosya durulunca eklenir
+                        if row["indexed_bytes"] >= min(stat.st_size, MAX_INDEX_BYTES):
+                            continue
+                    read = self._index_file(conn, path, kind, stat, row, meta)
+                    if read is not None:
+                        report["files"] += 1
+                        report["bytes"] += read
+                    conn.commit()
+
+                for key, row in known.items():
+                    if key not in seen:
+                        self._delete(conn, row["id"])
+                        report["removed"] += 1
+                conn.commit()
+            finally:
+                conn.close()
+        report["seconds"] = time.monotonic() - started
+        return report
+
+    def _merge_metadata(self, conn: sqlite3.Connection, row, meta: Dict):
+        """Yeni bilinen alanları yaz (geçmiş kaydı logdan sonra eklenebilir; bilinen değer silinmez)"""
+        changes = {k: v for k, v in meta.items() if k in METADATA_COLUMNS and v is not None and row[k] != v}
+        if changes:
+            assignments = ", ".join(f"{column} = ?" for column in changes)
+            conn.execute(f"UPDATE documents SET {assignments} WHERE id = ?", list(changes.values()) + [row["id"]])
+
+    def _delete(self, conn: sqlite3.Connection, doc_id: int):
+        conn.execute("DELETE FROM chunks WHERE rowid BETWEEN ? AND ?", (doc_id << 32, (doc_id << 32) | 0xFFFFFFFF))
+        conn.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+
+    def _index_file(self, conn: sqlite3.Connection, path: Path, kind: str, stat, row, meta: Dict) -> Optional[int]:
+        """Dosyanın yeni kısmını bloklara bölüp ekle; okunan bayt sayısı"""
+        if row is not None and stat.st_size < row["indexed_bytes"]:
+            # Kısaldı ya da yeniden yazıldı
+            self._delete(conn, row["id"])
+            row = None
+
+        offset = row["indexed_bytes"] if row else 0
+        line_no = row["lines"] if row else 0
+        chunk_no = row["chunk_count"] if row else 0
+        limit = min(stat.st_size, MAX_INDEX_BYTES)
+        settled = time.time() - stat.st_mtime >= SETTLE_SECONDS
+
+        try:
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                data = f.read(max(0, limit - offset))
+        except OSError:
+            return None
+        if not settled and offset + len(data) < MAX_INDEX_BYTES:
+            # Yazılmakta olan son satır bir sonraki güncellemeye kalır
+            data = data[:data.rfind(b"\n") + 1]
+
+        if row is None:
+            if kind == KIND_CRASH:
+                meta = dict(parse_crash_header(data[:64 * 1024].decode('utf-8', errors='replace')), **meta)
+                match = _CRASH_NAME_RE.match(path.name)
+                if match:
+                    meta.setdefault("started_at", time.mktime(time.strptime(match.group(1), "%Y-%m-%d_%H.%M.%S")))
+            meta.setdefault("started_at", stat.st_mtime)
+            columns = [c for c in METADATA_COLUMNS if meta.get(c) is not None]
+            cursor = conn.execute(
+                f"INSERT INTO documents (path, kind{''.join(', ' + c for c in columns)}) "
+                f"VALUES (?, ?{', ?' * len(columns)})", [str(path), kind] + [meta[c] for c in columns])
+            doc_id = cursor.lastrowid
+        else:
+            doc_id = row["id"]
+
+        rows = []
+        start = 0
+        while start < len(data):
+            block = data[start:start + READ_BLOCK_SIZE]
+            if start + len(block) < len(data):
+                # Blok sınırında satır (ve UTF-8 karakteri) bölünmesin
+                block = block[:block.rfind(b"\n") + 1 or len(block)]
+            rows += self._chunk_rows(block.decode('utf-8', errors='replace'), doc_id, chunk_no + len(rows), line_no)
+            line_no += block.count(b"\n")
+            start += len(block)
+        if rows:
+            conn.executemany("INSERT INTO chunks (rowid, content, first_line) VALUES (?, ?, ?)", rows)
+
+        conn.execute("UPDATE documents SET size = ?, mtime = ?, indexed_bytes = ?, lines = ?, chunk_count = ? WHERE id = ?",
+                     (stat.st_size, stat.st_mtime, offset + len(data), line_no, chunk_no + len(rows), doc_id))
+        return len(data)
+
+    @staticmethod
+    def _chunk_rows(text: str, doc_id: int, chunk_no: int, line_no: int) -> List[Tuple[int, str, int]]:
+        rows = []
+        lines = text.split("\n")
+        if lines and lines[-1] == "":
+            lines.pop()
+        start, size = 0, 0
+        for i, line in enumerate(lines):
+            size += len(line) + 1
+            if i + 1 - start >= CHUNK_LINES or size >= CHUNK_BYTES or i == len(lines) - 1:
+                rows.append(((doc_id << 32) | (chunk_no + len(rows)), "\n".join(lines[start:i + 1]), line_no + start + 1))
+                start, size = i + 1, 0
+        return rows
+
+    def annotate(self, path: Path, **meta):
+        """Belgeye sonradan öğrenilen metadata'yı yaz (ör. oyun kapanınca çıkış kodu)"""
+        meta = {k: v for k, v in meta.items() if k in METADATA_COLUMNS and v is not None}
+        if not meta:
+            return
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT * FROM documents WHERE path = ?", (str(path),)).fetchone()
+            if row is not None:
+                self._merge_metadata(conn, row, meta)
+            else:
+                columns = list(meta)
+                conn.execute(f"INSERT INTO documents (path, kind, {', '.join(columns)}) VALUES (?, ?{', ?' * len(columns)})",
+                             [str(path), KIND_LOG] + [meta[c] for c in columns])
+            conn.commit()
+        finally:
+            conn.close()
+
+    def search(self, query: str, version: str = None, loader: str = None, kind: str = None, since: float = None,
+               until: float = None, exit_code: int = None, limit: int = 50) -> List[Dict]:
+        """
+        Sorguyla eşleşen belgeler, yeniden eskiye
+
+        Args:
+            query: Kelimeler ya da FTS5 sorgusu (bkz. fts_query)
+            version: Sürüm kimliği ya da oyun sürümü (1.20.1)
+            loader: vanilla, fabric, quilt, forge, neoforge
+            since, until: epoch saniye aralığı
+            exit_code: Yalnız bu çıkış koduyla kapananlar
+
+        Returns:
+            Belge metadata'sı + "hits" (eşleşen blok), "line_no", "line", "spans"
+            (ilk eşleşen satır ve içindeki eşleşme aralıkları)
+
+        Raises:
+            ValueError: Geçersiz FTS5 sorgusu
+        """
+        match = fts_query(query)
+        if not match:
+            return []
+        where, params = ["chunks MATCH ?"], [match]
+        if version:
+            where.append("(d.game_version = ? OR d.version = ?)")
+            params += [version, version]
+        if loader:
+            where.append("d.loader = ?")
+            params.append(loader.lower())
+        if kind:
+            where.append("d.kind = ?")
+            params.append(kind)
+        if since is not None:
+            where.append("d.started_at >= ?")
+            params.append(since)
+        if until is not None:
+            where.append("d.started_at < ?")
+            params.append(until)
+        if exit_code is not None:
+            where.append("d.exit_code = ?")
+            params.append(exit_code)
+
+        conn = self._connect()
+        try:
+            try:
+                rows = conn.execute(
+                    "SELECT d.*, count(*) AS hits, min(chunks.rowid) AS first_rowid "
+                    "FROM chunks JOIN documents d ON d.id = (chunks.rowid >> 32) "
+                    f"WHERE {' AND '.join(where)} GROUP BY d.id ORDER BY d.started_at DESC LIMIT ?",
+                    params + [limit]).fetchall()
+                results = []
+                for row in rows:
+                    chunk = conn.execute(
+                        "SELECT first_line, highlight(chunks, 0, ?, ?) AS marked FROM chunks "
+                        "WHERE chunks MATCH ? AND rowid = ?",
+                        (_MARK_OPEN, _MARK_CLOSE, match, row["first_rowid"])).fetchone()
+                    result = {key: row[key] for key in row.keys() if key != "first_rowid"}
+                    if chunk:
+                        result["line_no"], result["line"], result["spans"] = _marked_line(chunk["marked"], chunk["first_line"])
+                    results.append(result)
+                return results
+            except sqlite3.OperationalError as e:
+                raise ValueError(f"Geçersiz sorgu: {query} ({e})")
+        finally:
+            conn.close()
+
+    def stats(self) -> Dict:
+        """Dizindeki belge, satır ve disk boyutu"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT count(*) AS documents, coalesce(sum(lines), 0) AS lines, "
+                               "coalesce(sum(kind = ?), 0) AS crashes, max(started_at) AS newest FROM documents",
+                               (KIND_CRASH,)).fetchone()
+            result = dict(row)
+        finally:
+            conn.close()
+        result["size_mb"] = sum(p.stat().st_size for p in self.db_path.parent.glob(self.db_path.name + "*")) / (1024 * 1024)
+        return result
+
+    def facets(self) -> Dict[str, List[str]]:
+        """Filtre seçenekleri: dizindeki oyun sürümleri ve yükleyiciler"""
+        conn = self._connect()
+        try:
+            versions = [r[0] for r in conn.execute(
+                "SELECT game_version FROM documents WHERE game_version IS NOT NULL "
+                "GROUP BY game_version ORDER BY max(started_at) DESC")]
+            loaders = [r[0] for r in conn.execute(
+                "SELECT DISTINCT loader FROM documents WHERE loader IS NOT NULL ORDER BY loader")]
+        finally:
+            conn.close()
+        return {"versions": versions, "loaders": loaders}
+
+    def clear(self):
+        """Dizini sil (sonraki güncelleme baştan kurar)"""
+        with self._update_lock:
+            for path in self.db_path.parent.glob(self.db_path.name + "*"):
+                path.unlink()
+            self._ready = False
+
+
+class LogIndexer:
+    """
+    Dizini arka planda güncel tutan iş parçacığı
+
+    Her aralıkta kaynak listesini yeniden toplar ve yalnız boyutu/zamanı
+    değişen dosyaları okur; trigger() beklemeden güncelletir (ör. oyun
+    kapandığında).
+    """
+
+    def __init__(self, index: LogIndex, sources: Callable[[], List[Tuple[Path, str, Optional[str]]]],
+                 interval: float = DEFAULT_INTERVAL):
+        self.index = index
+        self.sources = sources
+        self.interval = interval
+        self.last_report: Optional[Dict] = None
+        self.last_error: Optional[str] = None
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "LogIndexer":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="log-indexer", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def trigger(self):
+        self._wake.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.last_report = self.index.update(self.sources())
+                self.last_error = None
+            except (OSError, sqlite3.Error) as e:
+                self.last_error = str(e)
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+
+__all__ = [
+    'INDEX_FILE', 'KIND_LOG', 'KIND_CRASH', 'CHUNK_LINES', 'MAX_INDEX_BYTES', 'DEFAULT_INTERVAL',
+    'fts_available', 'fts_query', 'parse_time', 'version_resolver', 'guess_version', 'log_sources',
+    'parse_crash_header', 'LogIndex', 'LogIndexer'
+]
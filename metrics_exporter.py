@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Metrics Exporter
+Oyun süreci, GC, indirme ve başlatma ölçümlerini yerel bir HTTP uç noktasından
+OpenMetrics metni olarak sun (Prometheus ile izlenen makineler için)
+"""
+
+import math
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 9477
+METRICS_PATH = "/metrics"
+
+# Ölçümler bu aralıkla arka planda yeniden hesaplanır; istekler hazır metni alır
+DEFAULT_REFRESH = 5.0
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+PREFIX = "berke_"
+
+COUNTER = "counter"
+GAUGE = "gauge"
+HISTOGRAM = "histogram"
+
+
+class MetricFamily:
+    """Aynı ada ve türe sahip örnekler"""
+
+    def __init__(self, name: str, kind: str, help_text: str):
+        self.name = PREFIX + name
+        self.kind = kind
+        self.help = help_text
+        self.samples: List[tuple] = []
+
+    def add(self, value: Optional[float], labels: Dict[str, str] = None, suffix: str = None):
+        """
+        Örnek ekle (None değerler atlanır)
+
+        Args:
+            suffix: Örnek adının eki; verilmezse sayaçlarda '_total', diğerlerinde yok
+        """
+        if value is None:
+            return
+        if suffix is None:
+            suffix = "_total" if self.kind == COUNTER else ""
+        self.samples.append((self.name + suffix, labels or {}, value))
+
+    def add_histogram(self, bounds: List[float], buckets: List[int], total: float, labels: Dict[str, str] = None):
+        """
+        Kova sayımlarından (son kova sınırsız, birikimsiz) histogram örnekleri ekle
+        """
+        labels = labels or {}
+        cumulative = 0
+        for bound, count in zip(bounds + [math.inf], buckets):
+            cumulative += count
+            self.add(cumulative, dict(labels, le=bound), "_bucket")
+        self.add(cumulative, labels, "_count")
+        self.add(total, labels, "_sum")
+
+
+def _format_value(value) -> str:
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int):
+        return str(value)
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value) -> str:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _format_value(float(value))
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def render(families: List[MetricFamily]) -> str:
+    """OpenMetrics metin biçimi (boş aileler yazılmaz, '# EOF' ile biter)"""
+    lines = []
+    seen = set()
+    for family in families:
+        if not family.samples or family.name in seen:
+            continue
+        seen.add(family.name)
+        lines.append(f"# TYPE {family.name} {family.kind}")
+        lines.append(f"# HELP {family.name} {_escape(family.help)}")
+        for name, labels, value in family.samples:
+            label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+            lines.append(f"{name}{{{label_text}}} {_format_value(value)}" if label_text else f"{name} {_format_value(value)}")
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def process_families(sampler, labels: Dict[str, str] = None) -> List[MetricFamily]:
+    """
+    İzlenen oyun sürecinin son örneği (MetricsSampler)
+
+    Süreç yoksa ya da kapandıysa yalnız berke_game_up 0 yazılır.
+    """
+    labels = labels or {}
+    up = MetricFamily("game_up", GAUGE, "Oyun süreci çalışıyor mu")
+    up.add(1 if sampler is not None and sampler.process_alive else 0, labels)
+    families = [up]
+    if sampler is None or not sampler.process_alive:
+        return families
+
+    def latest(name, scale=1.0):
+        value = sampler.latest(name)
+        return value * scale if value is not None else None
+
+    for name, metric, help_text, scale in (
+        ("game_cpu_percent", "cpu", "Oyunun CPU kullanımı (bir çekirdeğin tamamı = 100)", 1.0),
+        ("game_resident_memory_bytes", "rss_mb", "Oyunun yerleşik bellek kullanımı", 1024 * 1024),
+        ("game_threads", "threads", "Oyunun iş parçacığı sayısı", 1.0),
+        ("game_open_fds", "fds", "Oyunun açık dosya tanıtıcı sayısı", 1.0),
+        ("game_io_read_bytes_per_second", "io_read_kbs", "Oyunun diskten okuma hızı", 1024),
+        ("game_io_write_bytes_per_second", "io_write_kbs", "Oyunun diske yazma hızı", 1024),
+        ("game_context_switches_per_second", "ctx_switches", "Oyunun bağlam geçişi hızı", 1.0),
+        ("system_cpu_percent", "sys_cpu", "Sistemin toplam CPU kullanımı", 1.0),
+        ("system_memory_available_bytes", "mem_available_mb", "Sistemde kullanılabilir bellek", 1024 * 1024),
+    ):
+        family = MetricFamily(name, GAUGE, help_text)
+        family.add(latest(metric, scale), {} if name.startswith("system_") else labels)
+        families.append(family)
+    return families
+
+
+def gc_families(summary: Optional[Dict], bounds_ms: List[float], labels: Dict[str, str] = None) -> List[MetricFamily]:
+    """GcLogParser.summary() özetinden duraklama histogramı ve heap ölçümleri"""
+    if not summary:
+        return []
+    labels = labels or {}
+    pauses = MetricFamily("game_gc_pause_seconds", HISTOGRAM, "GC duraklama süreleri (birleşik GC logundan)")
+    pauses.add_histogram([bound / 1000 for bound in bounds_ms], summary["histogram"], summary["total_pause_ms"] / 1000, labels)
+    causes = MetricFamily("game_gc_pauses_by_cause", COUNTER, "Sebebe göre GC duraklamaları")
+    for cause, count in summary.get("causes", {}).items():
+        causes.add(count, dict(labels, cause=cause))
+    heap_used = MetricFamily("game_gc_heap_after_bytes", GAUGE, "Son GC'den sonra kullanılan heap")
+    heap_total = MetricFamily("game_gc_heap_committed_bytes", GAUGE, "Son GC'deki toplam heap")
+    alloc_rate = MetricFamily("game_gc_allocation_rate_bytes_per_second", GAUGE, "GC'ler arasından hesaplanan ayırma hızı")
+    for family, key in ((heap_used, "heap_after_mb"), (heap_total, "heap_total_mb"), (alloc_rate, "alloc_rate_mbs")):
+        if summary.get(key) is not None:
+            family.add(summary[key] * 1024 * 1024, labels)
+    return [pauses, causes, heap_used, heap_total, alloc_rate]
+
+
+def download_families(snapshot: Dict[str, Dict], bounds_s: List[float]) -> List[MetricFamily]:
+    """DownloadStats.snapshot() sayaçları, sunucu etiketiyle"""
+    files = MetricFamily("download_files", COUNTER, "İndirilen dosyalar")
+    size = MetricFamily("download_bytes", COUNTER, "İndirilen baytlar")
+    errors = MetricFamily("download_errors", COUNTER, "Başarısız indirme denemeleri")
+    latency = MetricFamily("download_latency_seconds", HISTOGRAM, "İstekten yanıt başlıklarına kadar geçen süre")
+    for host, stats in sorted(snapshot.items()):
+        labels = {"host": host}
+        files.add(stats["files"], labels)
+        size.add(stats["bytes"], labels)
+        errors.add(stats["errors"], labels)
+        if stats["latency_count"]:
+            latency.add_histogram(bounds_s, stats["latency_buckets"], stats["latency_sum"], labels)
+    return [files, size, errors, latency]
+
+
+class LaunchHistoryCollector:
+    """
+    Her sürümün son başlatmasının süreleri
+
+    Geçmiş dosyası yalnız değiştiğinde yeniden okunur.
+    """
+
+    def __init__(self, history, time_to_play: Callable[[Dict], Optional[float]]):
+        self.history = history
+        self.time_to_play = time_to_play
+        self._stamp = None
+        self._latest: Dict[str, Dict] = {}
+
+    def _refresh(self):
+        try:
+            stat = Path(self.history.history_file).stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        if stamp == self._stamp:
+            return
+        latest = {}
+        for record in self.history.load(limit=0) if stamp else []:
+            if record.get("version"):
+                latest[record["version"]] = record
+        self._latest = latest
+        self._stamp = stamp
+
+    def families(self) -> List[MetricFamily]:
+        self._refresh()
+        play = MetricFamily("launch_time_to_play_seconds", GAUGE, "Son başlatmada ana menüye kadar geçen süre")
+        phases = MetricFamily("launch_phase_seconds", GAUGE, "Son başlatmanın aşama süreleri")
+        started = MetricFamily("launch_last_timestamp_seconds", GAUGE, "Son başlatmanın zamanı")
+        for version, record in sorted(self._latest.items()):
+            labels = {"version": version}
+            play_ms = self.time_to_play(record)
+            play.add(play_ms / 1000 if play_ms is not None else None, labels)
+            for phase, value in record.get("phases_ms", {}).items():
+                phases.add(value / 1000, dict(labels, phase=phase))
+            started.add(record.get("started_at"), labels)
+        return [play, phases, started]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "BerkeMetrics/1.0"
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == METRICS_PATH:
+            body, content_type = self.server.exporter.body(), CONTENT_TYPE
+        elif path == "/":
+            body, content_type = f"Berke Minecraft Launcher ölçümleri: {METRICS_PATH}\n".encode("utf-8"), "text/plain; charset=utf-8"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # TUI ekranına istek logu basılmasın
+        pass
+
+
+class MetricsExporter:
+    """
+    OpenMetrics HTTP uç noktası
+
+    collect() arka plandaki yenileme iş parçacığında çağrılır ve sonuç hazır
+    metin olarak saklanır; HTTP istekleri yalnız bu metni kopyalar. Böylece
+    ne kazıma ne de yavaş bir ölçüm kaynağı TUI'yi ya da diğerini bekletir.
+    """
+
+    def __init__(self, collect: Callable[[], List[MetricFamily]], host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 refresh: float = DEFAULT_REFRESH):
+        self.collect = collect
+        self.host = host
+        self.port = port
+        self.refresh_interval = max(0.5, refresh)
+        self.refreshes = 0
+        self.errors = 0
+        self.last_error: Optional[str] = None
+        self._body = render([]).encode("utf-8")
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}{METRICS_PATH}"
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    def body(self) -> bytes:
+        return self._body
+
+    def refresh(self):
+        """Ölçümleri şimdi topla (hata olursa önceki metin kalır)"""
+        started = time.monotonic()
+        try:
+            families = list(self.collect())
+        except Exception as e:
+            self.errors += 1
+            self.last_error = str(e)
+            return
+        self.refreshes += 1
+        duration = MetricFamily("exporter_refresh_seconds", GAUGE, "Son ölçüm toplama süresi")
+        duration.add(time.monotonic() - started)
+        errors = MetricFamily("exporter_refresh_errors", COUNTER, "Başarısız ölçüm toplamaları")
+        errors.add(self.errors)
+        self._body = render(families + [duration, errors]).encode("utf-8")
+
+    def start(self) -> "MetricsExporter":
+        """
+        Portu dinlemeye başla
+
+        Raises:
+            OSError: Port kullanımdaysa ya da adres bağlanamıyorsa
+        """
+        if self._server:
+            return self
+        server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        server.daemon_threads = True
+        server.exporter = self
+        # Port 0 verildiyse çekirdeğin seçtiği port
+        self.port = server.server_address[1]
+        self._server = server
+        self._stop.clear()
+        self.refresh()
+        self._threads = [
+            threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.5}, name="metrics-http", daemon=True),
+            threading.Thread(target=self._run, name="metrics-refresh", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for thread in self._threads:
+            thread.join(timeout=self.refresh_interval + 1)
+        self._threads = []
+
+    def _run(self):
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh()
+
+
+__all__ = [
+    'DEFAULT_HOST', 'DEFAULT_PORT', 'METRICS_PATH', 'DEFAULT_REFRESH', 'CONTENT_TYPE', 'COUNTER', 'GAUGE', 'HISTOGRAM',
+    'MetricFamily', 'render', 'process_families', 'gc_families', 'download_families', 'LaunchHistoryCollector',
+    'MetricsExporter'
+]
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Metrics Sampler
+Tek arka plan iş parçacığı sabit aralıkla süreç ve sistem ölçümlerini
+/proc'tan okur ve array tabanlı halka tamponlara yazar; izleme ekranları
+tamponları beklemeden okur
+"""
+
+import math
+import os
+import threading
+import time
+from array import array
+from typing import Callable, Dict, List, Optional
+
+_CLK_TCK = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+DEFAULT_INTERVAL = 1.0
+
+# İzleme ekranındaki pencereler (saniye); tamponlar en uzununu tutar
+WINDOWS = {"1": 60, "5": 300, "15": 900}
+
+# Süreç ölçümleri
+PROCESS_METRICS = ["cpu", "rss_mb", "threads", "fds", "io_read_kbs", "io_write_kbs", "ctx_switches"]
+# Sistem ölçümleri (çekirdek başına yük ayrıca "core0", "core1"... olarak tutulur)
+SYSTEM_METRICS = ["sys_cpu", "mem_available_mb", "swap_used_mb"]
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+
+class RingBuffer:
+    """Sabit boyutlu, array('d') üstünde dairesel seri (ölçülmeyen örnek NaN)"""
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._data = array('d', [math.nan]) * self.capacity
+        self._head = 0
+        self._count = 0
+
+    def append(self, value: Optional[float]):
+        self._data[self._head] = math.nan if value is None else float(value)
+        self._head = (self._head + 1) % self.capacity
+        self._count = min(self._count + 1, self.capacity)
+
+    def values(self, last: int = None) -> List[float]:
+        """Eskiden yeniye son 'last' örnek (NaN'lar dahil)"""
+        count = self._count if last is None else min(last, self._count)
+        start = (self._head - count) % self.capacity
+        if start + count <= self.capacity:
+            return self._data[start:start + count].tolist()
+        return self._data[start:].tolist() + self._data[:(start + count) % self.capacity].tolist()
+
+    def latest(self) -> Optional[float]:
+        if not self._count:
+            return None
+        value = self._data[(self._head - 1) % self.capacity]
+        return None if math.isnan(value) else value
+
+    def clear(self):
+        for i in range(self.capacity):
+            self._data[i] = math.nan
+        self._head = self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+
+def window_stats(values: List[float]) -> Optional[Dict[str, float]]:
+    """min/avg/max (NaN'lar atlanır; hiç ölçüm yoksa None)"""
+    measured = [v for v in values if not math.isnan(v)]
+    if not measured:
+        return None
+    return {"min": min(measured), "avg": sum(measured) / len(measured), "max": max(measured)}
+
+
+def sparkline(values: List[float], width: int = 40, low: float = None, high: float = None) -> str:
+    """
+    Seriyi blok karakterlerle çiz
+
+    Seri genişlikten uzunsa gruplar ortalanır; ölçülmeyen noktalar boşluk olur.
+
+    Args:
+        low, high: Ölçek (verilmezse serinin min/max'ı)
+    """
+    if not values:
+        return ""
+    if len(values) > width:
+        step = len(values) / width
+        buckets = []
+        for i in range(width):
+            group = [v for v in values[int(i * step):int((i + 1) * step)] if not math.isnan(v)]
+            buckets.append(sum(group) / len(group) if group else math.nan)
+        values = buckets
+
+    measured = [v for v in values if not math.isnan(v)]
+    if not measured:
+        return " " * len(values)
+    low = min(measured) if low is None else low
+    high = max(measured) if high is None else high
+    span = high - low
+    chars = []
+    for v in values:
+        if math.isnan(v):
+            chars.append(" ")
+        elif span <= 0:
+            chars.append(SPARK_CHARS[0])
+        else:
+            level = int((min(max(v, low), high) - low) / span * (len(SPARK_CHARS) - 1) + 0.5)
+            chars.append(SPARK_CHARS[level])
+    return "".join(chars)
+
+
+def _read_cpu_times() -> List[List[int]]:
+    """/proc/stat: [toplam, cpu0, cpu1, ...] için [meşgul, toplam] jiffy"""
+    result = []
+    with open("/proc/stat", 'r') as f:
+        for line in f:
+            if not line.startswith("cpu"):
+                break
+            fields = [int(x) for x in line.split()[1:]]
+            # idle + iowait boşta sayılır
+            idle = fields[3] + (fields[4] if len(fields) > 4 else 0)
+            total = sum(fields[:8])
+            result.append([total - idle, total])
+    return result
+
+
+def _read_meminfo() -> Dict[str, int]:
+    """/proc/meminfo (kB)"""
+    values = {}
+    with open("/proc/meminfo", 'r') as f:
+        for line in f:
+            key, _, rest = line.partition(":")
+            if key in ("MemTotal", "MemAvailable", "SwapTotal", "SwapFree"):
+                values[key] = int(rest.split()[0])
+    return values
+
+
+def _read_process(pid: int) -> Optional[Dict[str, float]]:
+    """Sürecin sayaçları: CPU jiffy, RSS, iş parçacığı, FD, G/Ç baytı, bağlam geçişi"""
+    try:
+        with open(f"/proc/{pid}/stat", 'r') as f:
+            stat = f.read()
+        fields = stat[stat.rfind(")") + 2:].split()
+        counters = {"cpu_ticks": int(fields[11]) + int(fields[12]), "threads": int(fields[17])}
+        with open(f"/proc/{pid}/status", 'r') as f:
+            ctx = 0
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    counters["rss_mb"] = int(line.split()[1]) / 1024
+                elif line.startswith(("voluntary_ctxt_switches:", "nonvoluntary_ctxt_switches:")):
+                    ctx += int(line.split()[1])
+            counters["ctx"] = ctx
+    except (OSError, IndexError, ValueError):
+        return None
+
+    try:
+        counters["fds"] = len(os.listdir(f"/proc/{pid}/fd"))
+    except OSError:
+        counters["fds"] = None
+    try:
+        with open(f"/proc/{pid}/io", 'r') as f:
+            for line in f:
+                key, _, value = line.partition(":")
+                if key in ("read_bytes", "write_bytes"):
+                    counters[key] = int(value)
+    except (OSError, ValueError):
+        pass
+    return counters
+
+
+class MetricsSampler:
+    """
+    Arka planda sabit aralıkla örnekleyen ölçüm toplayıcı
+
+    Oranlar (CPU %, G/Ç, bağlam geçişi) iki örnek arasındaki farktan
+    hesaplanır; okuyucular hiçbir zaman ölçüm aralığı kadar beklemez.
+    """
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL, capacity: int = None):
+        self.interval = max(0.1, interval)
+        capacity = capacity or int(max(WINDOWS.values()) / self.interval)
+        self.capacity = capacity
+        self.pid: Optional[int] = None
+        self.process_alive = False
+        self.cores = len(_read_cpu_times()) - 1 if os.path.exists("/proc/stat") else 0
+        self.mem_total_mb = 0.0
+        self._series: Dict[str, RingBuffer] = {}
+        for name in ["time"] + PROCESS_METRICS + SYSTEM_METRICS + [f"core{i}" for i in range(self.cores)]:
+            self._series[name] = RingBuffer(capacity)
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[Dict], None]] = []
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._prev_cpu = None
+        self._prev_proc = None
+        # _prev_proc'un okunduğu süreç (watch() arada değişirse oranlar karışmasın)
+        self._prev_pid = None
+        self._prev_time = None
+
+    def watch(self, pid: Optional[int]):
+        """İzlenen süreci değiştir (süreç serileri sıfırlanır)"""
+        with self._lock:
+            self.pid = pid
+            self._prev_proc = None
+            for name in PROCESS_METRICS:
+                self._series[name].clear()
+
+    def add_listener(self, callback: Callable[[Dict], None]):
+        """Her örnekten sonra ölçüm satırıyla çağrılır (örnekleyici iş parçacığında)"""
+        self._listeners.append(callback)
+
+    def start(self) -> "MetricsSampler":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="metrics-sampler", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.sample()
+            except Exception:
+                pass
+            # Örnekleme süresi aralıktan düşülür, sapma birikmez
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def sample(self):
+        """Tek örnek al (iş parçacığı dışında test/ilk değer için de çağrılabilir)"""
+        now = time.monotonic()
+        cpu_times = _read_cpu_times()
+        meminfo = _read_meminfo()
+        pid = self.pid
+        counters = _read_process(pid) if pid else None
+        elapsed = now - self._prev_time if self._prev_time else None
+
+        row: Dict[str, Optional[float]] = {"time": time.time()}
+        cores = []
+        if self._prev_cpu and len(self._prev_cpu) == len(cpu_times):
+            for (busy, total), (prev_busy, prev_total) in zip(cpu_times, self._prev_cpu):
+                delta = total - prev_total
+                cores.append((busy - prev_busy) / delta * 100 if delta > 0 else 0.0)
+        row["sys_cpu"] = cores[0] if cores else None
+        for i in range(self.cores):
+            row[f"core{i}"] = cores[i + 1] if len(cores) > i + 1 else None
+
+        self.mem_total_mb = meminfo.get("MemTotal", 0) / 1024
+        row["mem_available_mb"] = meminfo.get("MemAvailable", 0) / 1024
+        row["swap_used_mb"] = (meminfo.get("SwapTotal", 0) - meminfo.get("SwapFree", 0)) / 1024
+
+        if counters:
+            row["rss_mb"] = counters.get("rss_mb")
+            row["threads"] = counters["threads"]
+            row["fds"] = counters["fds"]
+            prev = self._prev_proc if self._prev_pid == pid else None
+            if prev and elapsed:
+                # top gibi: bir çekirdeğin tamamı = %100
+                row["cpu"] = (counters["cpu_ticks"] - prev["cpu_ticks"]) / _CLK_TCK / elapsed * 100
+                row["ctx_switches"] = (counters["ctx"] - prev["ctx"]) / elapsed
+                for key, name in (("read_bytes", "io_read_kbs"), ("write_bytes", "io_write_kbs")):
+                    if key in counters and key in prev:
+                        row[name] = (counters[key] - prev[key]) / 1024 / elapsed
+
+        with self._lock:
+            if self.pid != pid:
+                # Örnek alınırken watch() süreci değiştirdi: bu sayaçlar eski sürecin
+                counters = None
+                for name in PROCESS_METRICS:
+                    row.pop(name, None)
+            self.process_alive = counters is not None
+            for name, series in self._series.items():
+                series.append(row.get(name))
+            self._prev_cpu = cpu_times
+            self._prev_proc = counters
+            self._prev_pid = pid if counters else None
+            self._prev_time = now
+        for callback in self._listeners:
+            try:
+                callback(row)
+            except Exception:
+                pass
+
+    def names(self) -> List[str]:
+        return [name for name in self._series if name != "time"]
+
+    def latest(self, name: str) -> Optional[float]:
+        with self._lock:
+            return self._series[name].latest()
+
+    def window(self, name: str, seconds: float) -> List[float]:
+        """Son 'seconds' saniyenin örnekleri (eskiden yeniye)"""
+        samples = max(1, int(round(seconds / self.interval)))
+        with self._lock:
+            return self._series[name].values(samples)
+
+    def stats(self, name: str, seconds: float) -> Optional[Dict[str, float]]:
+        return window_stats(self.window(name, seconds))
+
+    def samples(self) -> int:
+        with self._lock:
+            return len(self._series["time"])
+
+
+__all__ = [
+    'DEFAULT_INTERVAL', 'WINDOWS', 'PROCESS_METRICS', 'SYSTEM_METRICS',
+    'RingBuffer', 'window_stats', 'sparkline', 'MetricsSampler'
+]
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Page Cache Prewarm
+Oyun başlamadan önce client JAR, kütüphaneler ve native dosyaları arka
+planda sayfa önbelleğine al; önbellekte olma oranını ölç
+"""
+
+import ctypes
+import ctypes.util
+import mmap
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from heap_sizing import available_memory_mb
+
+# Ön ısıtma bu kadar boş bellek kalana kadar sürer (MB)
+MIN_AVAILABLE_MB = 1024
+# /proc/pressure/memory "some avg10" bu değeri aşarsa durulur
+MAX_MEMORY_PRESSURE = 10.0
+
+# WILLNEED okuması eşzamansızdır: önbelleğe girişi en çok bu kadar bekle (sn), ilk aralık
+READAHEAD_WAIT = 0.1
+READAHEAD_POLL = 0.002
+
+# Başlatma anındaki önbellek oranına göre sınıflandırma
+WARM_RATIO = 0.9
+COLD_RATIO = 0.2
+
+_PROT_READ = 0x1
+_MAP_SHARED = 0x01
+_MAP_FAILED = ctypes.c_void_p(-1).value
+
+_libc = None
+
+
+def _get_libc():
+    global _libc
+    if _libc is None:
+        name = ctypes.util.find_library("c")
+        if not name:
+            return None
+        lib = ctypes.CDLL(name, use_errno=True)
+        lib.mmap.restype = ctypes.c_void_p
+        lib.mmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_long]
+        lib.munmap.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+        lib.mincore.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_char_p]
+        _libc = lib
+    return _libc
+
+
+def resident_pages(path: str) -> Optional[Tuple[int, int]]:
+    """
+    Dosyanın sayfa önbelleğindeki sayfa sayısı (mincore)
+
+    Returns:
+        (önbellekteki sayfa, toplam sayfa) veya ölçülemezse None
+    """
+    libc = _get_libc()
+    if libc is None:
+        return None
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return None
+    if size == 0:
+        return 0, 0
+
+    page_size = mmap.PAGESIZE
+    pages = (size + page_size - 1) // page_size
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        addr = libc.mmap(None, size, _PROT_READ, _MAP_SHARED, fd, 0)
+        if addr is None or addr == _MAP_FAILED:
+            return None
+        try:
+            vec = ctypes.create_string_buffer(pages)
+            if libc.mincore(addr, size, vec) != 0:
+                return None
+            resident = sum(1 for b in vec.raw if b & 1)
+        finally:
+            libc.munmap(addr, size)
+    finally:
+        os.close(fd)
+    return resident, pages
+
+
+def resident_ratio(paths: List[str]) -> Optional[float]:
+    """Dosya kümesinin önbellekte olma oranı (0-1)"""
+    resident_total, pages_total = 0, 0
+    for path in paths:
+        result = resident_pages(path)
+        if result is None:
+            continue
+        resident_total += result[0]
+        pages_total += result[1]
+    if pages_total == 0:
+        return None
+    return resident_total / pages_total
+
+
+def classify_ratio(ratio: Optional[float]) -> str:
+    """Önbellek oranını warm / partial / cold olarak adlandır"""
+    if ratio is None:
+        return "unknown"
+    if ratio >= WARM_RATIO:
+        return "warm"
+    if ratio <= COLD_RATIO:
+        return "cold"
+    return "partial"
+
+
+def _memory_pressure() -> Optional[float]:
+    """PSI 'some avg10' değeri (çekirdek desteklemiyorsa None)"""
+    try:
+        with open("/proc/pressure/memory", 'r') as f:
+            for line in f:
+                if line.startswith("some"):
+                    for field in line.split():
+                        if field.startswith("avg10="):
+                            return float(field[6:])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _warm_file(path: str) -> int:
+    """
+    Dosyayı önbelleğe al; okunan bayt sayısını döndür
+
+    Önce posix_fadvise(WILLNEED) ile çekirdeğe bildirilir. Okuma arka planda
+    sürdüğünden mincore artan aralıklarla yoklanır; başlamış okuma durursa
+    ya da süre dolarsa (çekirdek ipucunu yok saydı) dosya sırayla okunur.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, size, os.POSIX_FADV_WILLNEED)
+            delay, waited, previous = READAHEAD_POLL, 0.0, -1
+            while True:
+                resident = resident_pages(path)
+                if not resident or resident[0] >= resident[1] * WARM_RATIO:
+                    # mincore yoksa ipucuna güvenilir
+                    return size
+                if (previous > 0 and resident[0] <= previous) or waited >= READAHEAD_WAIT:
+                    break
+                previous = resident[0]
+                time.sleep(delay)
+                waited += delay
+                delay *= 2
+        while os.read(fd, 1024 * 1024):
+            pass
+        return size
+    finally:
+        os.close(fd)
+
+
+class PageCachePrewarmer:
+    """
+    Bir sürümün dosyalarını arka planda önbelleğe alır
+
+    Dosyalar JVM'in okuyacağı sırada işlenir; bellek azaldığında ya da
+    bellek baskısı yükseldiğinde erken durur.
+    """
+
+    def __init__(self, key: str, paths: List[str], min_available_mb: int = MIN_AVAILABLE_MB):
+        self.key = key
+        self.paths = [p for p in dict.fromkeys(str(p) for p in paths) if os.path.isfile(p)]
+        self.min_available_mb = min_available_mb
+        self.ratio_before: Optional[float] = None
+        self.files_done = 0
+        self.bytes_done = 0
+        self.duration_ms = 0.0
+        self.stopped_reason = ""
+        self.finished = threading.Event()
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Ön ısıtmayı arka planda başlat"""
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Ön ısıtmayı durdur"""
+        self._cancel.set()
+
+    def _should_stop(self) -> Optional[str]:
+        available = available_memory_mb()
+        if available is not None and available < self.min_available_mb:
+            return f"boş bellek {available} MB"
+        pressure = _memory_pressure()
+        if pressure is not None and pressure > MAX_MEMORY_PRESSURE:
+            return f"bellek baskısı %{pressure:.0f}"
+        return None
+
+    def _run(self):
+        start = time.monotonic()
+        try:
+            self.ratio_before = resident_ratio(self.paths)
+            for path in self.paths:
+                if self._cancel.is_set():
+                    self.stopped_reason = "iptal"
+                    break
+                reason = self._should_stop()
+                if reason:
+                    self.stopped_reason = reason
+                    break
+                try:
+                    self.bytes_done += _warm_file(path)
+                    self.files_done += 1
+                except OSError:
+                    continue
+        finally:
+            self.duration_ms = (time.monotonic() - start) * 1000
+            self.finished.set()
+
+    def report(self) -> Dict:
+        """Zaman çizelgesine yazılacak özet"""
+        return {
+            "key": self.key,
+            "files": self.files_done,
+            "total_files": len(self.paths),
+            "mb": round(self.bytes_done / (1024 * 1024), 1),
+            "duration_ms": round(self.duration_ms, 1),
+            "finished": self.finished.is_set(),
+            "ratio_before": None if self.ratio_before is None else round(self.ratio_before, 3),
+            "stopped_reason": self.stopped_reason,
+        }
+
+
+__all__ = [
+    'MIN_AVAILABLE_MB', 'WARM_RATIO', 'COLD_RATIO',
+    'resident_pages', 'resident_ratio', 'classify_ratio', 'PageCachePrewarmer'
+]
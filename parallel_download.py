@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Parallel Download
+Sadece standart kütüphaneyle paralel, SHA-1 doğrulamalı ve atomik indirme
+(ilerleme çubuğu yok - CLI ve arka plan işleri için)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlsplit
+
+USER_AGENT = "BerkeMinecraftLauncher/2.3.0"
+CHUNK_SIZE = 256 * 1024
+
+# Sunucu başına yanıt gecikmesi histogramı kova üst sınırları (saniye); son kova sınırsız
+LATENCY_BOUNDS_S = [0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+
+
+class DownloadTask:
+    """İndirilecek tek dosya"""
+
+    def __init__(self, url: str, path: Path, sha1: str = None, size: int = None, name: str = None):
+        self.url = url
+        self.path = Path(path)
+        self.sha1 = sha1
+        self.size = size
+        self.name = name or self.path.name
+
+
+class DownloadReport:
+    """Toplu indirmenin sonucu"""
+
+    def __init__(self):
+        self.done = 0
+        self.bytes = 0
+        self.failed: List[Dict] = []
+        self.elapsed = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed
+
+    def summary(self) -> str:
+        """Kısa rapor"""
+        text = f"{self.done} dosya, {self.bytes / (1024 * 1024):.1f} MB, {self.elapsed:.1f}s"
+        if self.failed:
+            text += f", {len(self.failed)} başarısız"
+        return text
+
+
+class DownloadStats:
+    """
+    Süreç boyunca tüm indirmelerin sayaçları (ölçüm dışa aktarımı için)
+
+    Gecikme, isteğin gönderilmesinden yanıt başlıklarının gelmesine kadar
+    geçen süredir; indirme süresi dosya boyutuna bağlı olduğu için sayılmaz.
+    """
+
+    def __init__(self):
+        self._hosts: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def record(self, url: str, size: int = 0, latency: float = None, ok: bool = True):
+        """Tek isteğin sonucunu ekle (hatalı istekler dosya sayılmaz)"""
+        host = urlsplit(url).hostname or "-"
+        with self._lock:
+            stats = self._hosts.get(host)
+            if stats is None:
+                stats = self._hosts[host] = {"files": 0, "bytes": 0, "errors": 0, "latency_count": 0,
+                                             "latency_sum": 0.0, "latency_buckets": [0] * (len(LATENCY_BOUNDS_S) + 1)}
+            if ok:
+                stats["files"] += 1
+                stats["bytes"] += size
+            else:
+                stats["errors"] += 1
+            if latency is not None:
+                bucket = next((i for i, bound in enumerate(LATENCY_BOUNDS_S) if latency <= bound), len(LATENCY_BOUNDS_S))
+                stats["latency_buckets"][bucket] += 1
+                stats["latency_count"] += 1
+                stats["latency_sum"] += latency
+
+    def snapshot(self) -> Dict[str, Dict]:
+        """Sunucu adı -> sayaçların kopyası"""
+        with self._lock:
+            return {host: dict(stats, latency_buckets=list(stats["latency_buckets"])) for host, stats in self._hosts.items()}
+
+
+# Launcher'ın tüm indirme yolları aynı sayaçlara yazar
+STATS = DownloadStats()
+
+
+def file_sha1(path: Path) -> Optional[str]:
+    """Dosyanın SHA-1 özeti (okunamazsa None)"""
+    digest = hashlib.sha1()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def is_valid(task: DownloadTask, check_hash: bool = False) -> bool:
+    """Dosya var mı; boyut ve (istenirse) SHA-1 beklenenle aynı mı"""
+    try:
+        size = task.path.stat().st_size
+    except OSError:
+        return False
+    if task.size is not None and size != task.size:
+        return False
+    if check_hash and task.sha1:
+        return file_sha1(task.path) == task.sha1
+    return True
+
+
+def _open(url: str, timeout: float):
+    # urllib ağır bir modül; sadece gerçekten indirme yapılacaksa yüklenir
+    import urllib.request
+    request = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
+    return urllib.request.urlopen(request, timeout=timeout)
+
+
+def fetch_json(url: str, timeout: float = 10) -> Dict:
+    """URL'deki JSON'u oku"""
+    started = time.monotonic()
+    try:
+        with _open(url, timeout) as response:
+            latency = time.monotonic() - started
+            data = response.read()
+    except OSError:
+        STATS.record(url, ok=False)
+        raise
+    STATS.record(url, len(data), latency)
+    return json.loads(data.decode("utf-8"))
+
+
+def download_file(task: DownloadTask, timeout: float = 30) -> int:
+    """
+    Dosyayı geçici isimle indir, SHA-1 tutuyorsa yerine taşı
+
+    Returns:
+        İndirilen bayt sayısı (hata durumunda OSError/ValueError)
+    """
+    task.path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = task.path.with_name(task.path.name + ".part")
+    digest = hashlib.sha1()
+    written = 0
+    started = time.monotonic()
+    latency = None
+    try:
+        with _open(task.url, timeout) as response, open(tmp_path, 'wb') as f:
+            latency = time.monotonic() - started
+            while True:
+                chunk = response.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                f.write(chunk)
+                digest.update(chunk)
+                written += len(chunk)
+        if task.sha1 and digest.hexdigest() != task.sha1:
+            raise ValueError(f"SHA-1 uyuşmuyor: {task.name}")
+        os.replace(tmp_path, task.path)
+    except (OSError, ValueError):
+        STATS.record(task.url, latency=latency, ok=False)
+        raise
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    STATS.record(task.url, written, latency)
+    return written
+
+
+def download_all(tasks: List[DownloadTask], workers: int = 16, retries: int = 2,
+                 on_done: Callable[[DownloadTask, bool], None] = None) -> DownloadReport:
+    """
+    Görevleri paralel indir
+
+    Args:
+        tasks: İndirilecek dosyalar
+        workers: Eşzamanlı bağlantı sayısı
+        retries: Başarısız dosya için ek deneme sayısı
+        on_done: Her dosya bittiğinde (görev, başarılı mı) ile çağrılır
+
+    Returns:
+        DownloadReport
+    """
+    report = DownloadReport()
+    start = time.monotonic()
+
+    def run(task):
+        last_error = None
+        for _ in range(retries + 1):
+            try:
+                return download_file(task), None
+            except Exception as e:
+                last_error = e
+        return 0, last_error
+
+    if tasks:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {executor.submit(run, task): task for task in tasks}
+            for future in as_completed(futures):
+                task = futures[future]
+                size, error = future.result()
+                if error is None:
+                    report.done += 1
+                    report.bytes += size
+                else:
+                    report.failed.append({"name": task.name, "url": task.url, "error": str(error)})
+                if on_done:
+                    on_done(task, error is None)
+
+    report.elapsed = time.monotonic() - start
+    return report
+
+
+__all__ = [
+    'LATENCY_BOUNDS_S', 'DownloadTask', 'DownloadReport', 'DownloadStats', 'STATS', 'file_sha1', 'is_valid',
+    'fetch_json', 'download_file', 'download_all'
+]
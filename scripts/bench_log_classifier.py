@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Log sınıflandırıcı karşılaştırması
+
+Eski _analyze_errors (tüm log belleğe, her satırda .lower() ve 'in' zinciri)
+ile LogFollower + LogClassifier (artımlı blok okuma, sabit parça taraması ve
+birleşik regex) aynı yapay log üzerinde ölçülür: süre, satır/sn ve en yüksek
+bellek.
+
+Kullanım: python3 scripts/bench_log_classifier.py [--lines 2000000] [--error-every 1000] [--log DOSYA]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from log_classifier import LogClassifier  # noqa: E402
+from log_follower import LogFollower  # noqa: E402
+
+NORMAL_LINES = [
+    "[12:00:01] [Render thread/INFO]: Loaded 1234 recipes",
+    "[12:00:01] [Server thread/INFO]: Preparing spawn area: 42%",
+    "[12:00:02] [Render thread/INFO]: Reloading ResourceManager: vanilla, fabric",
+    "[12:00:02] [Worker-Main-3/INFO]: Created: 1024x512x4 minecraft:textures/atlas/blocks.png-atlas",
+    "[12:00:03] [Render thread/WARN]: Missing sound for event: minecraft:item.goat_horn.play",
+    "[12:00:03] [Server thread/INFO]: BerkePlayer joined the game",
+    "[12:00:04] [Render thread/INFO]: [CHAT] <BerkePlayer> selam",
+    "\tat net.minecraft.client.main.Main.main(Main.java:218) ~[client-intermediary.jar:?]",
+]
+
+ERROR_LINES = [
+    "Exception in thread \"main\" java.lang.UnsupportedClassVersionError: net/minecraft/client/main/Main",
+    "[12:00:05] [Render thread/ERROR]: LWJGL failed to load library liblwjgl.so",
+    "java.lang.OutOfMemoryError: Java heap space",
+    "[12:00:06] [Render thread/ERROR]: OpenGL error 1282 in render",
+    "io.netty.channel.ConnectTimeoutException: connection timed out: timeout 30000ms",
+    "javax.net.ssl.SSLHandshakeException: PKIX path building failed: certificate unknown",
+]
+
+
+def legacy_analyze(error_lines):
+    """berke_minecraft_launcher._analyze_errors'ın değiştirilmeden önceki hali"""
+    errors = []
+    for line in error_lines:
+        line_lower = line.lower()
+        if "unsupportedclassversionerror" in line_lower:
+            errors.append("🚫 Java Sürüm Uyumsuzluğu: Minecraft Java 21+ gerektiriyor")
+        elif "could not create the java virtual machine" in line_lower:
+            errors.append("🚫 Java Virtual Machine oluşturulamadı")
+        elif "linkageerror" in line_lower:
+            errors.append("🔗 Java Sınıf Bağlantı Hatası")
+        elif "lwjgl" in line_lower and "failed to load" in line_lower:
+            errors.append("📦 LWJGL Native Library Hatası")
+        elif "liblwjgl.so" in line_lower:
+            errors.append("📦 LWJGL Native Library Bulunamadı")
+        elif "ssl" in line_lower and "handshake" in line_lower:
+            errors.append("🔒 SSL Sertifika Hatası")
+        elif "certificate" in line_lower:
+            errors.append("🔒 Sertifika Doğrulama Hatası")
+        elif "outofmemoryerror" in line_lower:
+            errors.append("💾 Bellek Yetersizliği")
+        elif "heap space" in line_lower:
+            errors.append("💾 Heap Space Hatası")
+        elif "opengl" in line_lower and "error" in line_lower:
+            errors.append("🖥️ OpenGL Hatası")
+        elif "graphics" in line_lower and "error" in line_lower:
+            errors.append("🖥️ Grafik Sürücü Hatası")
+        elif "asset" in line_lower and "not found" in line_lower:
+            errors.append("📁 Asset Dosyası Bulunamadı")
+        elif "connection" in line_lower and "refused" in line_lower:
+            errors.append("🌐 Bağlantı Reddedildi")
+        elif "timeout" in line_lower:
+            errors.append("⏱️ Bağlantı Zaman Aşımı")
+    return list(set(errors))
+
+
+def write_log(path: Path, lines: int, error_every: int):
+    rng = random.Random(42)
+    with open(path, 'w') as f:
+        for i in range(lines):
+            if error_every and i % error_every == error_every - 1:
+                f.write(rng.choice(ERROR_LINES) + "\n")
+            else:
+                f.write(rng.choice(NORMAL_LINES) + "\n")
+
+
+def run_legacy(path: Path):
+    # Eski akış: _show_launch_failure logu bütünüyle okur, _show_fullscreen_error_menu böler
+    with open(path, 'r', errors='replace') as f:
+        content = f.read()
+    return set(legacy_analyze(content.split('\n')))
+
+
+def run_streaming(path: Path):
+    classifier = LogClassifier()
+    follower = LogFollower(path, is_alive=lambda: False)
+    follower.subscribe_block(classifier.feed_block)
+    follower.start()
+    follower.join()
+    return set(classifier.messages())
+
+
+def measure(name: str, func, path: Path, lines: int):
+    started = time.perf_counter()
+    result = func(path)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    func(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:12} {elapsed:8.2f} s  {lines / elapsed / 1e6:6.2f} M satır/sn  en yüksek bellek {peak / (1024 * 1024):8.1f} MB")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Log sınıflandırıcı karşılaştırması")
+    parser.add_argument("--lines", type=int, default=2_000_000, help="Yapay log satır sayısı")
+    parser.add_argument("--error-every", type=int, default=1000, help="Her N satırda bir hata satırı")
+    parser.add_argument("--log", type=Path, help="Yapay log yerine bu dosyayı kullan")
+    args = parser.parse_args()
+
+    tmp_dir = None
+    if args.log:
+        path = args.log
+        with open(path, 'rb') as f:
+            lines = sum(1 for _ in f)
+    else:
+        tmp_dir = tempfile.TemporaryDirectory()
+        path = Path(tmp_dir.name) / "bench.log"
+        lines = args.lines
+        write_log(path, lines, args.error_every)
+
+    print(f"Log: {path} ({os.path.getsize(path) / (1024 * 1024):.0f} MB, {lines} satır)")
+    legacy = measure("eski", run_legacy, path, lines)
+    streaming = measure("artımlı", run_streaming, path, lines)
+
+    if legacy - streaming:
+        print(f"Uyarı: yalnız eski yöntemin bulduğu: {sorted(legacy - streaming)}")
+    extra = streaming - legacy
+    print(f"Aynı sonuç: {len(legacy & streaming)} sınıf" + (f", ek olarak {len(extra)} sınıf (eski zincir satır başına ilk eşleşmede duruyordu)" if extra else ""))
+    if tmp_dir:
+        tmp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Session History
+Her başlatma için tek satırlık oturum kaydı (açılış süresi, tepe RAM, ortalama
+CPU, JVM heap/metaspace/code cache tepeleri, sızıntı şüphelileri, süre, sonuç,
+o anki ayarlar) ve isteğe bağlı seyreltilmiş CPU/RAM serisi; sürüm/instance
+başına eğilimler ve ayar değişiklikleri
+"""
+
+import json
+import sqlite3
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+SESSIONS_FILE = "sessions.sqlite"
+SCHEMA_VERSION = 3
+
+OUTCOME_CLEAN = "clean"
+OUTCOME_CRASH = "crash"
+OUTCOME_KILLED = "killed"
+OUTCOME_FAILED = "failed"
+OUTCOME_HUNG = "hung"
+
+# Oturum başına saklanan en çok seri noktası (uzun oturumda aralık büyür)
+MAX_SERIES_POINTS = 240
+# Serisi tutulan son oturum sayısı (özet satırları silinmez)
+SERIES_KEEP = 300
+
+# Açılış/tepe RAM önceki N oturumun medyanından bu oran kadar kötüyse gerileme
+BASELINE_SESSIONS = 5
+REGRESSION_RATIO = 1.25
+
+# Bu log kuralları eşleştiyse çıkış kodu ne olursa olsun çökme sayılır
+CRASH_RULES = ("crash_report", "jvm_fatal")
+
+SETTING_LABELS = {
+    "memory": "Bellek ayarı",
+    "max_heap_mb": "Heap",
+    "java": "Java",
+    "gpu_profile": "GPU profili",
+    "cds": "CDS",
+    "gc_log": "GC logu",
+    "wrappers": "Sarmalayıcılar",
+}
+
+_SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS sessions (
+        id INTEGER PRIMARY KEY,
+        version TEXT NOT NULL,
+        instance TEXT NOT NULL,
+        source TEXT,
+        log_file TEXT,
+        pid INTEGER,
+        started_at REAL NOT NULL,
+        ended_at REAL,
+        startup_ms REAL,
+        exit_code INTEGER,
+        outcome TEXT,
+        peak_rss_mb REAL,
+        avg_rss_mb REAL,
+        avg_cpu REAL,
+        max_cpu REAL,
+        gc_p99_ms REAL,
+        gc_overhead_pct REAL,
+        settings TEXT NOT NULL DEFAULT '{}',
+        heap_peak_mb REAL,
+        metaspace_peak_mb REAL,
+        codecache_peak_mb REAL,
+        class_loaders INTEGER,
+        codecache_full INTEGER,
+        leak_suspects TEXT,
+        heap_dump TEXT,
+        hang_dir TEXT,
+        hang_reason TEXT,
+        stuck_threads TEXT
+    )""",
+    "CREATE INDEX IF NOT EXISTS sessions_group ON sessions (version, instance, started_at)",
+    """CREATE TABLE IF NOT EXISTS samples (
+        session_id INTEGER NOT NULL,
+        t REAL NOT NULL,
+        cpu REAL,
+        rss_mb REAL
+    )""",
+    "CREATE INDEX IF NOT EXISTS samples_session ON samples (session_id, t)",
+]
+
+# Eski şemadan yükseltme (geçmiş silinmez): hedef sürüm -> ifadeler
+_MIGRATIONS = {
+    2: [f"ALTER TABLE sessions ADD COLUMN {column}" for column in (
+        "heap_peak_mb REAL", "metaspace_peak_mb REAL", "codecache_peak_mb REAL", "class_loaders INTEGER",
+        "codecache_full INTEGER", "leak_suspects TEXT", "heap_dump TEXT")],
+    3: [f"ALTER TABLE sessions ADD COLUMN {column}" for column in (
+        "hang_dir TEXT", "hang_reason TEXT", "stuck_threads TEXT")],
+}
+
+
+def outcome_for(exit_code: Optional[int], ready: bool, log_errors: Dict[str, int] = None, hung: bool = False) -> str:
+    """
+    Oturumun sonucu
+
+    Donmuşken (toparlanmadan) temiz olmayan şekilde kapanan oturum 'hung';
+    hazır olmadan kapanan 'failed'; hazır olduktan sonra 0 'clean', sinyal
+    (negatif kod, 128+) 'killed', diğerleri ya da çökme raporu 'crash'.
+    """
+    if hung and exit_code != 0:
+        return OUTCOME_HUNG
+    if any((log_errors or {}).get(rule) for rule in CRASH_RULES):
+        return OUTCOME_CRASH if ready else OUTCOME_FAILED
+    if not ready:
+        return OUTCOME_FAILED
+    if exit_code == 0:
+        return OUTCOME_CLEAN
+    if exit_code is not None and (exit_code < 0 or exit_code in (130, 137, 143)):
+        return OUTCOME_KILLED
+    return OUTCOME_CRASH
+
+
+def settings_snapshot(config: Dict, spec=None, game_dir: Path = None) -> Dict:
+    """
+    Başlatmayı etkileyen ayarlar ve mod listesi
+
+    Args:
+        config: Başlatmada kullanılan (instance'a uygulanmış) ayarlar
+        spec: LaunchSpec (gerçek heap, Java ana sürümü, GPU profili, CDS, GC logu, sarmalayıcılar)
+        game_dir: Oyun dizini; mods/ altındaki jar'lar listelenir
+    """
+    snapshot = {"memory": str(config.get("memory"))}
+    if spec is not None:
+        snapshot.update({
+            "max_heap_mb": spec.max_heap_mb,
+            "gpu_profile": spec.gpu_profile.name if spec.gpu_profile else None,
+            "cds": spec.cds_plan.mode,
+            "gc_log": bool(spec.gc_log),
+            "wrappers": spec.wrapper_chain.key() if spec.wrapper_chain else "-",
+        })
+        if spec.java_major:
+            snapshot["java"] = spec.java_major
+    mods_dir = Path(game_dir) / "mods" if game_dir else None
+    if mods_dir and mods_dir.is_dir():
+        snapshot["mods"] = sorted(p.name for p in mods_dir.glob("*.jar"))
+    return snapshot
+
+
+def settings_changes(previous: Dict, current: Dict) -> List[str]:
+    """İki oturum arasındaki ayar ve mod farkları (okunur metin)"""
+    if not previous:
+        return []
+    changes = []
+    for key, label in SETTING_LABELS.items():
+        before, after = previous.get(key), current.get(key)
+        if before != after and before is not None and after is not None:
+            changes.append(f"{label} {before} → {after}")
+    before_mods, after_mods = set(previous.get("mods", [])), set(current.get("mods", []))
+    added, removed = sorted(after_mods - before_mods), sorted(before_mods - after_mods)
+    for sign, mods in (("+", added), ("-", removed)):
+        if len(mods) > 2:
+            changes.append(f"{sign}{len(mods)} mod")
+        else:
+            changes += [f"{sign}{name}" for name in mods]
+    return changes
+
+
+class SessionRecorder:
+    """
+    MetricsSampler satırlarından oturum özeti ve seyreltilmiş seri
+
+    Özet (tepe/ortalama) tüm oturumu kapsar; seri en çok max_points noktadır:
+    dolunca komşu noktalar birleştirilip kova genişliği ikiye katlanır, bu
+    yüzden bellek oturum süresinden bağımsızdır.
+    """
+
+    def __init__(self, max_points: int = MAX_SERIES_POINTS):
+        self.max_points = max(2, max_points)
+        self.started = None
+        self.count = 0
+        self.cpu_count = 0
+        self.cpu_sum = 0.0
+        self.cpu_max = None
+        self.rss_count = 0
+        self.rss_sum = 0.0
+        self.rss_max = None
+        self._points: List[List[float]] = []
+        self._bucket_size = 1
+        self._bucket: List = []
+
+    def feed(self, row: Dict):
+        """MetricsSampler.add_listener ile çağrılır"""
+        cpu, rss = row.get("cpu"), row.get("rss_mb")
+        if cpu is None and rss is None:
+            return
+        now = row.get("time") or time.time()
+        if self.started is None:
+            self.started = now
+        self.count += 1
+        if cpu is not None:
+            self.cpu_count += 1
+            self.cpu_sum += cpu
+            self.cpu_max = cpu if self.cpu_max is None else max(self.cpu_max, cpu)
+        if rss is not None:
+            self.rss_count += 1
+            self.rss_sum += rss
+            self.rss_max = rss if self.rss_max is None else max(self.rss_max, rss)
+
+        self._bucket.append((now - self.started, cpu, rss))
+        if len(self._bucket) >= self._bucket_size:
+            self._points.append(self._merge(self._bucket))
+            self._bucket = []
+            if len(self._points) > self.max_points:
+                self._points = [self._merge(self._points[i:i + 2]) for i in range(0, len(self._points), 2)]
+                self._bucket_size *= 2
+
+    @staticmethod
+    def _merge(items) -> List:
+        """Kova: ilk zaman, ortalama CPU, en yüksek RSS"""
+        cpus = [item[1] for item in items if item[1] is not None]
+        rsss = [item[2] for item in items if item[2] is not None]
+        return [items[0][0], sum(cpus) / len(cpus) if cpus else None, max(rsss) if rsss else None]
+
+    def summary(self) -> Dict:
+        return {
+            "peak_rss_mb": self.rss_max,
+            "avg_rss_mb": self.rss_sum / self.rss_count if self.rss_count else None,
+            "avg_cpu": self.cpu_sum / self.cpu_count if self.cpu_count else None,
+            "max_cpu": self.cpu_max,
+        }
+
+    def series(self) -> List[Tuple[float, Optional[float], Optional[float]]]:
+        points = self._points + ([self._merge(self._bucket)] if self._bucket else [])
+        return [tuple(point) for point in points]
+
+
+class SessionStore:
+    """
+    Oturumların SQLite deposu
+
+    begin() oyun başlarken satırı açar, update() açılış süresini, finish()
+    çıkış kodunu, sonucu, ölçüm özetini ve seriyi yazar. Launcher'ın kapanışını
+    görmediği oturumlar (komut satırından hazır olunca çıkılan) açık kalır.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.row_factory = sqlite3.Row
+        if not self._ready:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if 0 < version < SCHEMA_VERSION:
+                for target in range(version + 1, SCHEMA_VERSION + 1):
+                    for statement in _MIGRATIONS[target]:
+                        conn.execute(statement)
+            elif version not in (0, SCHEMA_VERSION):
+                conn.execute("DROP TABLE IF EXISTS samples")
+                conn.execute("DROP TABLE IF EXISTS sessions")
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.commit()
+            self._ready = True
+        return conn
+
+    def begin(self, version: str, instance: str, settings: Dict, started_at: float = None, log_file: Path = None,
+              pid: int = None, source: str = "tui") -> Optional[int]:
+        """Oturumu aç; kimliğini döndür (yazılamazsa None)"""
+        try:
+            conn = self._connect()
+            try:
+                cursor = conn.execute(
+                    "INSERT INTO sessions (version, instance, source, log_file, pid, started_at, settings) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (version, instance, source, str(log_file) if log_file else None, pid,
+                     started_at or time.time(), json.dumps(settings, ensure_ascii=False)))
+                conn.commit()
+                return cursor.lastrowid
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+
+    def update(self, session_id: Optional[int], **fields):
+        """Oturum sütunlarını güncelle (ör. startup_ms)"""
+        fields = {k: v for k, v in fields.items() if v is not None}
+        if session_id is None or not fields:
+            return
+        conn = self._connect()
+        try:
+            assignments = ", ".join(f"{column} = ?" for column in fields)
+            conn.execute(f"UPDATE sessions SET {assignments} WHERE id = ?", list(fields.values()) + [session_id])
+            conn.commit()
+        finally:
+            conn.close()
+
+    def record_hang(self, session_id: Optional[int], hang_dir: Path, reason: str, stuck: List[Dict]):
+        """Donma dökümlerinin dizini, sezilme nedeni ve takılı iş parçacıkları"""
+        self.update(session_id, hang_dir=str(hang_dir), hang_reason=reason,
+                    stuck_threads=json.dumps(stuck, ensure_ascii=False))
+
+    def finish(self, session_id: Optional[int], exit_code: Optional[int], outcome: str,
+               recorder: SessionRecorder = None, gc_summary: Dict = None, ended_at: float = None,
+               jvm_summary: Dict = None):
+        """Oturumu kapat: sonuç, ölçüm özeti, JVM özeti (JvmIntrospector.summary) ve (varsa) seri"""
+        if session_id is None:
+            return
+        fields = {"ended_at": ended_at or time.time(), "exit_code": exit_code, "outcome": outcome}
+        if recorder is not None:
+            fields.update(recorder.summary())
+        if gc_summary and gc_summary.get("pauses"):
+            fields["gc_p99_ms"] = gc_summary.get("p99_ms")
+            fields["gc_overhead_pct"] = gc_summary.get("overhead_pct")
+        if jvm_summary:
+            fields.update(jvm_summary)
+            if fields.get("leak_suspects"):
+                fields["leak_suspects"] = json.dumps(fields["leak_suspects"], ensure_ascii=False)
+            if fields.get("heap_dump"):
+                fields["heap_dump"] = str(fields["heap_dump"])
+        self.update(session_id, **fields)
+        if recorder is None:
+            return
+        conn = self._connect()
+        try:
+            conn.executemany("INSERT INTO samples (session_id, t, cpu, rss_mb) VALUES (?, ?, ?, ?)",
+                             [(session_id, t, cpu, rss) for t, cpu, rss in recorder.series()])
+            # Eski oturumların serileri düşer, özet satırları kalır
+            conn.execute("DELETE FROM samples WHERE session_id <= "
+                         "(SELECT id FROM sessions ORDER BY id DESC LIMIT 1 OFFSET ?)", (SERIES_KEEP,))
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _row(row: sqlite3.Row) -> Dict:
+        record = dict(row)
+        try:
+            record["settings"] = json.loads(record.get("settings") or "{}")
+        except ValueError:
+            record["settings"] = {}
+        try:
+            record["leak_suspects"] = json.loads(record.get("leak_suspects") or "[]")
+        except ValueError:
+            record["leak_suspects"] = []
+        try:
+            record["stuck_threads"] = json.loads(record.get("stuck_threads") or "[]")
+        except ValueError:
+            record["stuck_threads"] = []
+        if record.get("ended_at"):
+            record["duration_s"] = record["ended_at"] - record["started_at"]
+        return record
+
+    def sessions(self, version: str = None, instance: str = None, limit: int = 50) -> List[Dict]:
+        """Oturumlar, eskiden yeniye (son 'limit' tanesi; 0 = hepsi)"""
+        where, params = [], []
+        if version:
+            where.append("version = ?")
+            params.append(version)
+        if instance:
+            where.append("instance = ?")
+            params.append(instance)
+        sql = "SELECT * FROM sessions" + (f" WHERE {' AND '.join(where)}" if where else "") + " ORDER BY started_at DESC"
+        if limit:
+            sql += f" LIMIT {int(limit)}"
+        conn = self._connect()
+        try:
+            rows = [self._row(row) for row in conn.execute(sql, params)]
+        finally:
+            conn.close()
+        return list(reversed(rows))
+
+    def groups(self) -> List[Dict]:
+        """Sürüm + instance grupları (en son oynanan önce)"""
+        conn = self._connect()
+        try:
+            return [dict(row) for row in conn.execute(
+                "SELECT version, instance, count(*) AS sessions, max(started_at) AS last_started "
+                "FROM sessions GROUP BY version, instance ORDER BY last_started DESC")]
+        finally:
+            conn.close()
+
+    def series(self, session_id: int) -> List[Tuple[float, Optional[float], Optional[float]]]:
+        conn = self._connect()
+        try:
+            return [(row["t"], row["cpu"], row["rss_mb"]) for row in conn.execute(
+                "SELECT t, cpu, rss_mb FROM samples WHERE session_id = ? ORDER BY t", (session_id,))]
+        finally:
+            conn.close()
+
+    def trends(self, version: str, instance: str, limit: int = 30) -> List[Dict]:
+        """
+        Grubun oturumları, eğilim bilgisiyle
+
+        Her oturuma eklenenler: "changes" (önceki oturuma göre ayar/mod
+        farkları), "startup_change" ve "rss_change" (önceki en çok
+        BASELINE_SESSIONS başarılı oturumun medyanına oran), "regression"
+        (oran REGRESSION_RATIO'yu aşan ölçümlerin adları).
+        """
+        records = self.sessions(version, instance, limit=limit + BASELINE_SESSIONS)
+        previous_settings = None
+        baseline: Dict[str, List[float]] = {"startup_ms": [], "peak_rss_mb": []}
+        for record in records:
+            record["changes"] = settings_changes(previous_settings, record["settings"])
+            previous_settings = record["settings"]
+            record["regression"] = []
+            for key, change in (("startup_ms", "startup_change"), ("peak_rss_mb", "rss_change")):
+                window = baseline[key][-BASELINE_SESSIONS:]
+                value = record.get(key)
+                record[change] = value / statistics.median(window) if value and window else None
+                if record[change] and record[change] >= REGRESSION_RATIO:
+                    record["regression"].append(key)
+            if record.get("outcome") != OUTCOME_FAILED:
+                for key in baseline:
+                    if record.get(key):
+                        baseline[key].append(record[key])
+        return records[-limit:]
+
+
+__all__ = [
+    'SESSIONS_FILE', 'OUTCOME_CLEAN', 'OUTCOME_CRASH', 'OUTCOME_KILLED', 'OUTCOME_FAILED', 'OUTCOME_HUNG',
+    'MAX_SERIES_POINTS', 'BASELINE_SESSIONS', 'REGRESSION_RATIO', 'outcome_for', 'settings_snapshot', 'settings_changes',
+    'SessionRecorder', 'SessionStore'
+]
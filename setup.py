@@ -29,7 +29,7 @@ setup(
     url=__url__,
     license=__license__,
     packages=find_packages(),
-    py_modules=["berke_minecraft_launcher", "i18n", "version"],
+    py_modules=["berke_minecraft_launcher", "i18n", "version", "classpath_builder", "launch_profiler", "java_registry", "log_follower", "jvm_flags", "heap_sizing", "page_cache", "launch_fingerprint", "launch_builder", "parallel_download", "version_installer", "berkemc_cli", "instance_manager", "cgroup_governor", "launch_wrappers", "gpu_profile", "appcds", "launch_script", "java_runtimes", "metrics_sampler", "gc_log", "log_classifier", "log_index", "session_history", "metrics_exporter", "jfr_profiler", "jvm_introspect", "hang_watchdog"],
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: End Users/Desktop",
@@ -50,9 +50,10 @@ setup(
     entry_points={
         "console_scripts": [
             "berke-minecraft-launcher=berke_minecraft_launcher:main",
-            "berkemc=berke_minecraft_launcher:main",
+            "berkemc=berkemc_cli:main",
         ],
     },
+    data_files=[("share/berke-minecraft-launcher", ["error_rules.json"])],
     include_package_data=True,
     zip_safe=False,
 )
\ No newline at end of file
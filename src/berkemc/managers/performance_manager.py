@@ -20,12 +20,15 @@ class PerformanceManager:
         self.console = console
         self.monitoring = False
         self.monitor_thread = None
+        # Prime the counter: later interval=None calls return usage since the
+        # previous call instead of blocking
+        psutil.cpu_percent(interval=None)
         
     def get_system_info(self) -> Dict:
         """Get comprehensive system information"""
         try:
-            # CPU info
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # CPU info (non-blocking, since the previous call)
+            cpu_percent = psutil.cpu_percent(interval=None)
             cpu_count = psutil.cpu_count()
             cpu_freq = psutil.cpu_freq()
             
@@ -181,10 +184,10 @@ class PerformanceManager:
                     
                     live.update(layout)
                     
-                    # Check for key press (non-blocking)
+                    # Key wait also paces the refresh (refresh_per_second=2)
                     import select
                     import sys
-                    if select.select([sys.stdin], [], [], 0.1)[0]:
+                    if select.select([sys.stdin], [], [], 0.5)[0]:
                         break
                         
         except KeyboardInterrupt:
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Berke Minecraft Launcher - Version Installer
+Sürüm JSON'undan indirilecek dosyaları çıkar, kur ve doğrula (arayüzsüz)
+"""
+
+import json
+import time
+import zipfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from classpath_builder import library_allowed, parse_maven_coordinate, maven_path, merge_version_chain
+from launch_builder import LauncherPaths, VERSION_MANIFEST_URL, ASSETS_URL, load_chain
+from parallel_download import DownloadTask, DownloadReport, is_valid, fetch_json, download_file, download_all
+
+MANIFEST_CACHE_SECONDS = 3600
+NATIVE_SUFFIXES = ('.so', '.dll', '.dylib')
+
+
+def manifest_versions(paths: LauncherPaths, offline: bool = False, max_age: int = MANIFEST_CACHE_SECONDS) -> List[Dict]:
+    """Mojang sürüm listesi - launcher ile aynı önbellek dosyasını kullanır"""
+    cache_file = paths.cache_dir / "versions_manifest.json"
+    cached = None
+    if cache_file.exists():
+        try:
+            with open(cache_file, 'r') as f:
+                cached = json.load(f).get("versions", [])
+        except (OSError, json.JSONDecodeError):
+            cached = None
+        if cached is not None and (offline or time.time() - cache_file.stat().st_mtime < max_age):
+            return cached
+    if offline:
+        return cached or []
+
+    try:
+        data = fetch_json(VERSION_MANIFEST_URL)
+    except Exception:
+        return cached or []
+    paths.cache_dir.mkdir(parents=True, exist_ok=True)
+    with open(cache_file, 'w') as f:
+        json.dump(data, f)
+    return data.get("versions", [])
+
+
+def installed_versions(paths: LauncherPaths) -> List[str]:
+    """JSON'u olan sürümler (vanilla ve loader)"""
+    if not paths.versions_dir.exists():
+        return []
+    return sorted((d.name for d in paths.versions_dir.iterdir()
+                   if (d / f"{d.name}.json").exists()), reverse=True)
+
+
+def _native_classifier(lib: Dict) -> Optional[Dict]:
+    """Eski formatta Linux native classifier'ı"""
+    classifiers = lib.get("downloads", {}).get("classifiers", {})
+    key = lib.get("natives", {}).get("linux", "natives-linux").replace("${arch}", "64")
+    return classifiers.get(key) or classifiers.get("natives-linux")
+
+
+def library_tasks(paths: LauncherPaths, libraries: List[Dict]) -> List[DownloadTask]:
+    """Kütüphane ve native JAR'larının indirme görevleri"""
+    tasks = []
+    for lib in libraries:
+        if not library_allowed(lib):
+            continue
+        downloads = lib.get("downloads", {})
+        artifact = downloads.get("artifact")
+        if artifact and artifact.get("path") and artifact.get("url"):
+            tasks.append(DownloadTask(artifact["url"], paths.libraries_dir / artifact["path"],
+                                      artifact.get("sha1"), artifact.get("size"), lib.get("name")))
+        elif not downloads and lib.get("name"):
+            # Maven deposu verilmiş eski/loader formatı
+            coord = parse_maven_coordinate(lib["name"])
+            if coord:
+                base = lib.get("url", "https://libraries.minecraft.net/")
+                rel = maven_path(coord)
+                tasks.append(DownloadTask(base.rstrip("/") + "/" + rel, paths.libraries_dir / rel,
+                                          lib.get("sha1"), lib.get("size"), lib["name"]))
+        if "natives" in lib:
+            native = _native_classifier(lib)
+            if native and native.get("path"):
+                tasks.append(DownloadTask(native["url"], paths.libraries_dir / native["path"],
+                                          native.get("sha1"), native.get("size"), f"{lib.get('name')} (native)"))
+    return tasks
+
+
+def client_task(paths: LauncherPaths, version_data: Dict) -> Optional[DownloadTask]:
+    """Client JAR görevi"""
+    client = version_data.get("downloads", {}).get("client")
+    if not client:
+        return None
+    version_id = version_data["id"]
+    return DownloadTask(client["url"], paths.versions_dir / version_id / f"{version_id}.jar",
+                        client.get("sha1"), client.get("size"), f"{version_id}.jar")
+
+
+def asset_tasks(paths: LauncherPaths, asset_index: Dict) -> List[DownloadTask]:
+    """Asset index'teki nesnelerin görevleri"""
+    objects_dir = paths.assets_dir / "objects"
+    tasks = []
+    for name, info in asset_index.get("objects", {}).items():
+        asset_hash = info["hash"]
+        tasks.append(DownloadTask(f"{ASSETS_URL}/{asset_hash[:2]}/{asset_hash}",
+                                  objects_dir / asset_hash[:2] / asset_hash, asset_hash, info.get("size"), name))
+    return tasks
+
+
+def load_asset_index(paths: LauncherPaths, version_data: Dict, download: bool = True) -> Optional[Dict]:
+    """Asset index'i diskten oku; yoksa (izin verildiyse) indir"""
+    index_info = version_data.get("assetIndex")
+    if not index_info:
+        return None
+    index_path = paths.assets_dir / "indexes" / f"{index_info['id']}.json"
+    task = DownloadTask(index_info["url"], index_path, index_info.get("sha1"), index_info.get("size"))
+    if not index_path.exists():
+        if not download:
+            return None
+        download_file(task)
+    with open(index_path, 'r') as f:
+        return json.load(f)
+
+
+def extract_natives(paths: LauncherPaths, libraries: List[Dict]) -> int:
+    """Linux native JAR'larındaki .so dosyalarını natives dizinine düz olarak çıkar"""
+    paths.natives_dir.mkdir(parents=True, exist_ok=True)
+    jars = []
+    for task in library_tasks(paths, libraries):
+        if "natives-linux" in task.path.name and task.path.exists():
+            jars.append(task.path)
+
+    extracted = 0
+    for jar in jars:
+        try:
+            with zipfile.ZipFile(jar, 'r') as zip_ref:
+                for info in zip_ref.infolist():
+                    if info.is_dir() or not info.filename.endswith(NATIVE_SUFFIXES):
+                        continue
+                    target = paths.natives_dir / Path(info.filename).name
+                    if target.exists() and target.stat().st_size == info.file_size:
+                        continue
+                    with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                        dst.write(src.read())
+                    extracted += 1
+        except (OSError, zipfile.BadZipFile):
+            continue
+    return extracted
+
+
+def version_tasks(paths: LauncherPaths, version_id: str, with_assets: bool = True,
+                  download_index: bool = True) -> List[DownloadTask]:
+    """Kurulu bir sürümün (zinciriyle) ihtiyaç duyduğu tüm dosyalar"""
+    chain = load_chain(paths, version_id)
+    version_data = merge_version_chain(chain)
+    tasks = []
+    for data in chain:
+        task = client_task(paths, data)
+        if task:
+            tasks.append(task)
+    tasks.extend(library_tasks(paths, version_data["libraries"]))
+    if with_assets:
+        asset_index = load_asset_index(paths, version_data, download_index)
+        if asset_index:
+            tasks.extend(asset_tasks(paths, asset_index))
+    return tasks
+
+
+def verify_version(paths: LauncherPaths, version_id: str, deep: bool = False) -> List[DownloadTask]:
+    """
+    Eksik ya da bozuk dosyaları bul
+
+    Args:
+        deep: SHA-1 özetlerini de kontrol et (yavaş)
+
+    Returns:
+        Yeniden indirilmesi gereken görevler
+    """
+    return [task for task in version_tasks(paths, version_id) if not is_valid(task, check_hash=deep)]
+
+
+def install_version(paths: LauncherPaths, version_id: str, workers: int = 16,
+                    on_done=None) -> DownloadReport:
+    """
+    Sürümü Mojang manifest'inden kur (JSON, client, kütüphaneler, native'ler, asset'ler)
+
+    Raises:
+        ValueError: Sürüm manifest'te yoksa
+    """
+    entry = next((v for v in manifest_versions(paths) if v["id"] == version_id), None)
+    version_json = paths.versions_dir / version_id / f"{version_id}.json"
+    if entry is None and not version_json.exists():
+        raise ValueError(f"Sürüm bulunamadı: {version_id}")
+    if entry is not None:
+        download_file(DownloadTask(entry["url"], version_json, entry.get("sha1")))
+
+    tasks = [task for task in version_tasks(paths, version_id) if not is_valid(task)]
+    report = download_all(tasks, workers=workers, on_done=on_done)
+    chain = load_chain(paths, version_id)
+    extract_natives(paths, merge_version_chain(chain)["libraries"])
+    return report
+
+
+__all__ = [
+    'manifest_versions', 'installed_versions', 'library_tasks', 'client_task', 'asset_tasks',
+    'load_asset_index', 'extract_natives', 'version_tasks', 'verify_version', 'install_version'
+]